@@ -102,6 +102,23 @@ class AnacondaSection(Section):
         """
         return self._get_option("optional_modules").split()
 
+    @property
+    def lazy_modules(self):
+        """List of Anaconda DBus modules that are started on demand.
+
+        The installer doesn't wait for them during the startup. They
+        are started in the background or on the first call of their
+        DBus API.
+
+        Supported patterns:
+
+            MODULE.PREFIX.*
+            MODULE.NAME
+
+        :return: a list of patterns
+        """
+        return self._get_option("lazy_modules").split()
+
 
 class AnacondaConfiguration(Configuration):
     """Representation of the Anaconda configuration."""
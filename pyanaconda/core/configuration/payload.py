@@ -126,6 +126,52 @@ class PayloadSection(Section):
 
         return tuple(value)
 
+    @property
+    def flatpak_blob_cache(self):
+        """Directory of the on-disk cache of Flatpak blobs.
+
+        Blobs downloaded from remote static sources are stored there
+        by their sha256 digest, so repeated installations from the same
+        source don't download them again.
+
+        :return: a path to the directory or an empty string
+        """
+        return self._get_option("flatpak_blob_cache", str)
+
+    @property
+    def dnf_metadata_cache(self):
+        """Directory of the persistent cache of repository metadata.
+
+        Metadata of enabled repositories are stored there by the hash
+        of their repomd.xml file, so repeated installations from the
+        same repositories load the prebuilt solv files.
+
+        :return: a path to the directory or an empty string
+        """
+        return self._get_option("dnf_metadata_cache", str)
+
+    @property
+    def package_prefetch_location(self):
+        """Directory for a speculative download of packages.
+
+        Resolved packages are downloaded into the anaconda-prefetch
+        subdirectory in the background as soon as the software selection
+        is validated. The installation moves them to the download location
+        instead of downloading them again.
+
+        :return: a path to the directory or an empty string
+        """
+        return self._get_option("package_prefetch_location", str)
+
+    @property
+    def pipelined_installation(self):
+        """Download the side payload during the installation of the main payload.
+
+        The download of the Flatpak content runs at the same time as
+        the installation of the packages instead of after it. Both
+        downloads have to fit into the available space at once.
+        """
+        return self._get_option("pipelined_installation", bool)
 
     @property
     def verify_ssl(self):
@@ -142,3 +188,23 @@ class PayloadSection(Section):
     def default_rpm_gpg_keys(self):
         """List of GPG keys to import into RPM database at end of installation."""
         return self._get_option("default_rpm_gpg_keys", str).split()
+
+    @property
+    def native_tar_extraction(self):
+        """Install live tarballs with the native streaming extraction.
+
+        The tarball is extracted in one pass by a pool of parallel writers
+        instead of the tar tool. The same pass collects the kernel versions
+        and reports the progress from the processed size of the tarball.
+        """
+        return self._get_option("native_tar_extraction", bool)
+
+    @property
+    def native_image_copy(self):
+        """Install mounted live images with the native tree copier.
+
+        The image is copied in one pass by a pool of parallel workers
+        instead of several runs of the rsync tool. The file data are
+        cloned or copied in the kernel if the target file system allows.
+        """
+        return self._get_option("native_image_copy", bool)
@@ -39,3 +39,14 @@ class SecuritySection(Section):
             raise ValueError("Invalid value: {}".format(value))
 
         return value
+
+    @property
+    def incremental_relabel(self):
+        """Relabel only files changed after the installation of the DNF payload.
+
+        RPM labels the installed files, so only the files created or
+        modified later (for example, by %post scripts) are visited.
+        Files written by the installer before the payload installation
+        are relabeled as well.
+        """
+        return self._get_option("incremental_relabel", bool)
@@ -100,6 +100,27 @@ GRAPHICAL_TARGET = 'graphical.target'
 # See: https://3.python-requests.org/user/advanced/#timeouts
 NETWORK_CONNECTION_TIMEOUT = 46  # in seconds
 NETWORK_CONNECTED_CHECK_INTERVAL = 0.1  # in seconds
+# The fallback check of the network state while waiting for its signals.
+NETWORK_STATE_CHECK_INTERVAL = 1  # in seconds
+
+# Download of remote images.
+IMAGE_DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # in bytes
+IMAGE_DOWNLOAD_SEGMENTS = 4
+IMAGE_DOWNLOAD_MIN_SEGMENT_SIZE = 64 * 1024 * 1024  # in bytes
+IMAGE_DOWNLOAD_RETRIES = 3
+IMAGE_CHECKSUM_BLOCK_SIZE = 8 * 1024 * 1024  # in bytes
+
+# Extraction of live tarballs.
+IMAGE_EXTRACTION_WORKERS = 4
+IMAGE_EXTRACTION_BUFFER_SIZE = 1024 * 1024  # in bytes
+IMAGE_EXTRACTION_MAX_PENDING = 64
+
+# Copying of mounted live images.
+IMAGE_COPY_WORKERS = 4
+IMAGE_COPY_CHUNK_SIZE = 64 * 1024 * 1024  # in bytes
+
+# Minimal interval between two reports of the image installation progress.
+INSTALLATION_PROGRESS_INTERVAL = 0.5  # in seconds
 
 NETWORK_CAPABILITY_TEAM = 1
 
@@ -113,6 +134,7 @@ THREAD_STORAGE_WATCHER = "AnaStorageWatcher"
 THREAD_WAIT_FOR_CONNECTING_NM = "AnaWaitForConnectingNMThread"
 THREAD_PAYLOAD = "AnaPayloadThread"
 THREAD_PAYLOAD_RESTART = "AnaPayloadRestartThread"
+THREAD_PACKAGE_PREFETCH = "AnaPackagePrefetchThread"
 THREAD_EXCEPTION_HANDLING_TEST = "AnaExceptionHandlingTest"
 THREAD_LIVE_PROGRESS = "AnaLiveProgressThread"
 THREAD_SOFTWARE_WATCHER = "AnaSoftwareWatcher"
@@ -198,3 +198,79 @@ def sync_call_glib(context, async_call, async_call_finish, timeout, *call_args):
         context.pop_thread_default()
 
     return result
+
+
+def sync_call_glib_many(context, calls, timeout):
+    """Call GLib asynchronous methods concurrently and wait for all of them.
+
+    All methods are called at once and their results are collected in
+    one blocking loop, so the calls wait for each other only as long as
+    the slowest of them.
+
+    :param context: context for the new loop in which the methods will be called
+    :type context: GMainContext
+    :param calls: a list of tuples of an asynchronous GLib method, its finish
+                  method and positional arguments preceding the cancellable
+                  argument
+    :type calls: list((GLib method, GLib method, tuple))
+    :param timeout: timeout for all the calls in seconds
+    :type timeout: int
+    :return: results of the calls in the order of the calls
+    :rtype: list(GLibCallResult)
+    """
+    results = [GLibCallResult() for _call in calls]
+    pending = set(range(len(calls)))
+
+    if not pending:
+        return results
+
+    loop = create_main_loop(context)
+    cancellable = Cancellable()
+
+    def _timeout_cb(user_data=None):
+        log.debug("sync_call_glib_many: timeout of %d calls", len(pending))
+
+        for index in pending:
+            results[index].timeout = True
+
+        cancellable.cancel()
+        return False
+
+    timeout_source = timeout_source_new(int(timeout * 1000))
+    timeout_source.set_callback(_timeout_cb)
+    timeout_source.attach(context)
+
+    def _get_finish_cb(index, async_call_finish):
+        def _finish_cb(_source_object, async_result):
+            log.debug("sync_call_glib_many[%s]: call %s",
+                      index,
+                      async_call_finish.get_symbol())
+            try:
+                results[index].received_data = async_call_finish(async_result)
+            except Exception as e:  # pylint: disable=broad-except
+                results[index].error_message = str(e)
+            finally:
+                pending.discard(index)
+
+                if not pending:
+                    loop.quit()
+
+        return _finish_cb
+
+    context.push_thread_default()
+
+    try:
+        for index, (async_call, async_call_finish, call_args) in enumerate(calls):
+            log.debug("sync_call_glib_many[%s]: call %s", index, async_call.get_symbol())
+            async_call(
+                *call_args,
+                cancellable=cancellable,
+                callback=_get_finish_cb(index, async_call_finish)
+            )
+
+        loop.run()
+    finally:
+        timeout_source.destroy()
+        context.pop_thread_default()
+
+    return results
@@ -940,7 +940,7 @@ def get_os_release_value(name, sysroot="/"):
     return None
 
 
-def restorecon(paths, root, skip_nonexistent=False):
+def restorecon(paths, root, skip_nonexistent=False, recursive=True):
     """Try to restore contexts for a list of paths.
 
     Do not fail if the program does not exist because it was not in the payload, just say so.
@@ -948,12 +948,18 @@ def restorecon(paths, root, skip_nonexistent=False):
     :param [str] paths: list of paths to restore
     :param str root: root to run in; mandatory because we restore contexts only on the new system
     :param bool skip_nonexistent: optionally, do not fail if some of the paths do not exist
+    :param bool recursive: optionally, do not descend into directories
     :return bool: did anything run at all
     """
+    flags = ""
+
     if skip_nonexistent:
-        opts = ["-ir"]
-    else:
-        opts = ["-r"]
+        flags += "i"
+
+    if recursive:
+        flags += "r"
+
+    opts = ["-" + flags] if flags else []
 
     try:
         execWithRedirect("restorecon", opts + paths, root=root)
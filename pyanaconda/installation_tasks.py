@@ -18,7 +18,9 @@
 # Red Hat, Inc.
 #
 import sys
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from dasbus.error import DBusError
 
@@ -33,17 +35,90 @@ from pyanaconda.modules.common.task import sync_run_task
 
 log = get_module_logger(__name__)
 
+# Signals of tasks in parallel queues are emitted from different threads.
+_signal_lock = threading.RLock()
+
+# Signals of an item of a parallel queue are buffered in its thread.
+_thread_data = threading.local()
+
+
+def _get_signal_buffer():
+    """Get the signal buffer of the current thread.
+
+    :return: an instance of _SignalBuffer or None
+    """
+    return getattr(_thread_data, "signal_buffer", None)
+
+
+def _emit_callback(buffer, callback, *args):
+    """Call the callback now or buffer it for later.
+
+    :param buffer: an instance of _SignalBuffer or None
+    :param callback: a callback to call
+    :param args: arguments of the callback
+    """
+    if buffer is not None:
+        buffer.add(callback, *args)
+        return
+
+    with _signal_lock:
+        callback(*args)
+
+
+class _SignalBuffer:
+    """A buffer of signals emitted by an item of a parallel queue.
+
+    The signals are held back until the buffer is flushed. It allows
+    to report the items of the parallel queue in the order of the queue.
+    The buffer is flushed once the previous items are reported, so the
+    signals of the first unreported item are reported right away.
+    """
+
+    def __init__(self, parent=None):
+        """Create a new buffer.
+
+        :param parent: a buffer of the parent queue or None
+        """
+        self._parent = parent
+        self._lock = threading.Lock()
+        self._callbacks = []
+        self._flushed = False
+
+    def add(self, callback, *args):
+        """Add a callback to the buffer."""
+        with self._lock:
+            if not self._flushed:
+                self._callbacks.append((callback, args))
+                return
+
+        _emit_callback(self._parent, callback, *args)
+
+    def flush(self):
+        """Call the buffered callbacks and stop buffering."""
+        with self._lock:
+            for callback, args in self._callbacks:
+                _emit_callback(self._parent, callback, *args)
+
+            self._callbacks = []
+            self._flushed = True
+
 
 class BaseTask:
     """A base class for Task and TaskQueue.
 
     It holds shared methods, properties and signals.
+
+    A task can require and provide resource tags, for example "sysroot"
+    or "timezone". In a parallel task queue, the task waits for all previous
+    items of the queue that provide a tag it requires.
     """
 
-    def __init__(self, name):
+    def __init__(self, name, requires=None, provides=None):
         self._name = name
         self._parent = None
         self._elapsed_time = None
+        self._requires = frozenset(requires or ())
+        self._provides = frozenset(provides or ())
         self.started = Signal()
         self.completed = Signal()
 
@@ -61,6 +136,22 @@ class BaseTask:
         """Elapsed time since the task has been started in milliseconds."""
         return self._elapsed_time
 
+    @property
+    def requires(self):
+        """Resource tags required by the task.
+
+        :return: a frozen set of tags
+        """
+        return self._requires
+
+    @property
+    def provides(self):
+        """Resource tags provided by the task.
+
+        :return: a frozen set of tags
+        """
+        return self._provides
+
     @property
     def summary(self):
         """A description of the task - to be overridden by subclasses."""
@@ -73,9 +164,20 @@ class BaseTask:
     def start(self):
         """Start the task."""
         # trigger the "started" signal
-        self.started.emit(self)
+        self._emit(self.started)
 
         # run the task
+        self._execute()
+
+        # trigger the "completed" signal
+        self._emit(self.completed)
+
+    def _emit(self, signal):
+        """Emit the signal of the task."""
+        _emit_callback(_get_signal_buffer(), signal.emit, self)
+
+    def _execute(self):
+        """Run the task and measure the elapsed time."""
         start_timestamp = time.time()
 
         self._run()
@@ -83,9 +185,6 @@ class BaseTask:
         done_timestamp = time.time()
         self._elapsed_time = done_timestamp - start_timestamp
 
-        # trigger the "completed" signal
-        self.completed.emit(self)
-
     def _run(self):
         """Run the task - to be overridden by sub-classes."""
         raise NotImplementedError
@@ -95,12 +194,24 @@ class TaskQueue(BaseTask):
     """TaskQueue represents a queue of TaskQueues or Tasks.
 
     TaskQueues and Tasks can be mixed in a single TaskQueue.
+
+    Items of a parallel TaskQueue run at the same time unless they depend
+    on each other. An item depends on all previous items that provide
+    a resource tag the item requires. Tags that are not provided by any
+    previous item are expected to be provided outside of the queue.
+
+    An item of a parallel queue is started as soon as all its dependencies
+    are finished, so it doesn't wait for unrelated items that precede it.
+    Signals and progress of the items, including the nested ones, are
+    always reported in the order of the queue.
     """
 
-    def __init__(self, name, status_message=None, task_category=None):
-        super().__init__(name)
+    def __init__(self, name, status_message=None, task_category=None,
+                 parallel=False, requires=None, provides=None):
+        super().__init__(name, requires=requires, provides=provides)
         self._task_category = task_category
         self._status_message = status_message
+        self._parallel = parallel
         # the list backing this TaskQueue instance
         self._queue = []
         # triggered if a TaskQueue contained in this one was started/completed
@@ -138,6 +249,14 @@ class TaskQueue(BaseTask):
         """
         return self._status_message
 
+    @property
+    def parallel(self):
+        """Can the items of the queue run at the same time?
+
+        :return: True or False
+        """
+        return self._parallel
+
     @property
     def items(self):
         """Task and queues contained in this queue.
@@ -204,12 +323,109 @@ class TaskQueue(BaseTask):
 
     def _run(self):
         """Run the task queue."""
+        if self._parallel and len(self._queue) > 1:
+            self._run_in_parallel()
+            return
+
         for item in self._queue:
             # start the item (TaskQueue/Task)
             item.start()
 
-    # implement the Python list "interface" and make sure parent is always
-    # set to a correct value
+    def _get_dependencies(self, item):
+        """Get previous items of the queue the given item depends on.
+
+        :param item: an item of the queue
+        :return: a list of items
+        """
+        index = self._queue.index(item)
+
+        return [
+            other for other in self._queue[:index]
+            if other.provides & item.requires
+        ]
+
+    def _run_in_parallel(self):
+        """Run independent items of the task queue at the same time."""
+        dependencies = [
+            {self._queue.index(dependency) for dependency in self._get_dependencies(item)}
+            for item in self._queue
+        ]
+        parent_buffer = _get_signal_buffer()
+        buffers = [_SignalBuffer(parent_buffer) for _ in self._queue]
+        futures = {}
+        finished = set()
+        reported = 0
+
+        # report signals of the first item right away
+        buffers[0].flush()
+
+        with ThreadPoolExecutor(max_workers=len(self._queue)) as executor:
+            try:
+                while reported < len(self._queue):
+                    # start all items with finished dependencies
+                    for index, item in enumerate(self._queue):
+                        if index in futures or not dependencies[index] <= finished:
+                            continue
+
+                        futures[index] = executor.submit(
+                            self._execute_item, item, buffers[index]
+                        )
+
+                    # wait for any of the running items
+                    running = [f for i, f in futures.items() if i not in finished]
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                    for index, future in futures.items():
+                        if future in done:
+                            # raise an exception of the item if any
+                            future.result()
+                            finished.add(index)
+
+                    reported = self._report_completed_items(futures, buffers, reported)
+            except BaseException:
+                # report what has been buffered so far in the queue order
+                for buffer in buffers:
+                    buffer.flush()
+
+                raise
+
+    @staticmethod
+    def _execute_item(item, buffer):
+        """Run the item of a parallel queue with buffered signals.
+
+        :param item: an item of the queue
+        :param buffer: a signal buffer of the item
+        """
+        _thread_data.signal_buffer = buffer
+
+        try:
+            item._emit(item.started)
+            item._execute()
+        finally:
+            _thread_data.signal_buffer = None
+
+    def _report_completed_items(self, futures, buffers, reported):
+        """Report completed items in the order of the queue.
+
+        :param futures: a dictionary of queue indexes and futures of started items
+        :param buffers: a list of signal buffers of the items
+        :param reported: a number of already reported items
+        :return: a new number of reported items
+        """
+        while reported in futures and futures[reported].done():
+            # raise an exception of the item if any
+            futures[reported].result()
+
+            item = self._queue[reported]
+            item._emit(item.completed)
+            reported += 1
+
+            # report signals of the next item
+            if reported < len(self._queue):
+                buffers[reported].flush()
+
+        return reported
+
     def append(self, item):
         item.started.connect(self.task_started.emit)
         item.completed.connect(self.task_completed.emit)
@@ -245,8 +461,9 @@ class Task(BaseTask):
     the task_args and task_kwargs options.
     """
 
-    def __init__(self, task_name, task_cb, task_args=None, task_kwargs=None):
-        super().__init__(task_name)
+    def __init__(self, task_name, task_cb, task_args=None, task_kwargs=None,
+                 requires=None, provides=None):
+        super().__init__(task_name, requires=requires, provides=provides)
         self._task_cb = task_cb
         self._task_args = task_args or []
         self._task_kwargs = task_kwargs or {}
@@ -294,8 +511,12 @@ class DBusTask(BaseTask):
     def _run(self):
         """Run the DBus task."""
         try:
-            # Report the progress messages.
-            self._task_proxy.ProgressChanged.connect(self._progress_cb)
+            # Report the progress messages. They are delivered in
+            # a different thread, so use the signal buffer of this one.
+            buffer = _get_signal_buffer()
+            self._task_proxy.ProgressChanged.connect(
+                lambda step, message: _emit_callback(buffer, self._progress_cb, step, message)
+            )
 
             # Run the task.
             sync_run_task(self._task_proxy)
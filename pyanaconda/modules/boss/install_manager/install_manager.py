@@ -47,7 +47,7 @@ class InstallManager:
         requirements = []
 
         for observer in self._module_observers:
-            if not observer.is_service_available:
+            if not observer.is_service_reachable:
                 log.warning("Module %s not available!", observer.service_name)
                 continue
 
@@ -109,7 +109,7 @@ class InstallManager:
             # FIXME: This check is here for testing purposes only.
             # Normally, all given modules should be available once
             # we start the installation.
-            if not observer.is_service_available:
+            if not observer.is_service_reachable:
                 log.error("Module %s is not available!", observer.service_name)
                 continue
 
@@ -18,6 +18,9 @@
 import glob
 import os.path
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from stat import S_ISDIR
 
 from pykickstart.constants import (
     KS_SCRIPT_POST,
@@ -245,15 +248,54 @@ class SetContextsTask(InstallationTask):
     - ostree payloads, where all of the labeling of /var is the installer's responsibility
       (see https://github.com/ostreedev/ostree/pull/872 )
     - OSTree variants of the traditional mounts if present
+
+    The directories are split into shards that are relabeled by a pool
+    of workers. If a timestamp is specified, only files changed since
+    that time and the explicitly listed files are relabeled.
     """
-    def __init__(self, sysroot):
+
+    dirs_to_relabel = [
+        "/boot",
+        "/dev",
+        "/etc",
+        "/lib64",
+        "/root",
+        "/usr/lib",
+        "/usr/lib64",
+        "/var/cache/yum",
+        "/var/home",
+        "/var/lib",
+        "/var/lock",
+        "/var/log",
+        "/var/media",
+        "/var/mnt",
+        "/var/opt",
+        "/var/roothome",
+        "/var/run",
+        "/var/spool",
+        "/var/srv"
+    ]
+
+    # The maximal number of paths passed to one run of restorecon.
+    paths_limit = 500
+
+    def __init__(self, sysroot, changed_since=None, extra_paths=None, workers=None):
         """Create a new task.
 
         :param sysroot: a path to the root of installed system
         :type sysroot: str
+        :param changed_since: relabel only files changed since this time or None
+        :type changed_since: float or None
+        :param extra_paths: paths to relabel also if only changed files are relabeled
+        :type extra_paths: list of str or None
+        :param workers: a number of parallel workers or None for all CPUs
+        :type workers: int or None
         """
         super().__init__()
         self._sysroot = sysroot
+        self._changed_since = changed_since
+        self._extra_paths = sorted(extra_paths or [])
+        self._workers = workers or os.cpu_count() or 1
 
     @property
     def name(self):
@@ -264,31 +306,138 @@ class SetContextsTask(InstallationTask):
 
         Do not fail if the executable is not present.
         """
-        dirs_to_relabel = [
-            "/boot",
-            "/dev",
-            "/etc",
-            "/lib64",
-            "/root",
-            "/usr/lib",
-            "/usr/lib64",
-            "/var/cache/yum",
-            "/var/home",
-            "/var/lib",
-            "/var/lock",
-            "/var/log",
-            "/var/media",
-            "/var/mnt",
-            "/var/opt",
-            "/var/roothome",
-            "/var/run",
-            "/var/spool",
-            "/var/srv"
-        ]
-
         log.info("Restoring SELinux contexts.")
-        if not restorecon(dirs_to_relabel, root=self._sysroot, skip_nonexistent=True):
+        start = time.perf_counter()
+
+        # Relabel the directories. It also checks the executable.
+        if not restorecon(self.dirs_to_relabel, root=self._sysroot,
+                          skip_nonexistent=True, recursive=False):
             log.warning("Cannot restore contexts because restorecon was not installed.")
+            return
+
+        # Relabel the content of the directories in parallel.
+        jobs = [
+            (directory, shard)
+            for directory in self.dirs_to_relabel
+            for shard in self._get_shards(directory)
+        ]
+
+        timings = dict.fromkeys(self.dirs_to_relabel, 0.0)
+
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            futures = [(d, executor.submit(self._relabel_shard, s)) for d, s in jobs]
+
+            for directory, future in futures:
+                timings[directory] += future.result()
+
+        for directory, duration in timings.items():
+            if duration:
+                log.debug("Relabeled %s in %.2f s.", directory, duration)
+
+        # Relabel the listed files even if they are not changed.
+        if self._changed_since is not None and self._extra_paths:
+            log.debug(
+                "Relabeled %d listed files in %.2f s.",
+                len(self._extra_paths), self._relabel_paths(self._extra_paths)
+            )
+
+        log.info(
+            "Restored SELinux contexts in %.2f s with %d workers.",
+            time.perf_counter() - start, self._workers
+        )
+
+    def _get_shards(self, directory):
+        """Split the content of the directory into shards.
+
+        :param str directory: a path to the directory in the installed system
+        :return [[str]]: a list of shards with paths in the installed system
+        """
+        path = join_paths(self._sysroot, directory)
+
+        # Don't follow symlinks like /var/run.
+        if os.path.islink(path) or not os.path.isdir(path):
+            return []
+
+        paths = [
+            join_paths(directory, name)
+            for name in sorted(os.listdir(path))
+        ]
+
+        shards = [paths[i::self._workers] for i in range(self._workers)]
+        return [shard for shard in shards if shard]
+
+    def _relabel_shard(self, paths):
+        """Relabel the given shard.
+
+        :param [str] paths: a list of paths in the installed system
+        :return float: the duration of the relabeling
+        """
+        if self._changed_since is None:
+            start = time.perf_counter()
+            restorecon(paths, root=self._sysroot, skip_nonexistent=True)
+            return time.perf_counter() - start
+
+        return self._relabel_paths(self._find_files(paths, self._changed_since))
+
+    def _relabel_paths(self, paths):
+        """Relabel the given paths without their content.
+
+        :param [str] paths: a list of paths in the installed system
+        :return float: the duration of the relabeling
+        """
+        start = time.perf_counter()
+
+        for i in range(0, len(paths), self.paths_limit):
+            restorecon(
+                paths[i:i + self.paths_limit],
+                root=self._sysroot,
+                skip_nonexistent=True,
+                recursive=False
+            )
+
+        return time.perf_counter() - start
+
+    def find_files(self):
+        """Find all files in the directories to relabel.
+
+        Symlinks to directories are not followed.
+
+        :return [str]: a list of paths in the installed system
+        """
+        return sorted(self._find_files(self.dirs_to_relabel))
+
+    def _find_files(self, paths, changed_since=None):
+        """Find files in the given paths.
+
+        :param [str] paths: a list of paths in the installed system
+        :param changed_since: find only files changed since this time or None
+        :return [str]: a list of found paths in the installed system
+        """
+        prefix = len(self._sysroot.rstrip("/"))
+        found = []
+        stack = [join_paths(self._sysroot, p) for p in paths]
+
+        while stack:
+            path = stack.pop()
+
+            try:
+                stat = os.lstat(path)
+            except OSError:
+                continue
+
+            if changed_since is None or stat.st_ctime >= changed_since:
+                found.append(path[prefix:])
+
+            if not S_ISDIR(stat.st_mode):
+                continue
+
+            try:
+                with os.scandir(path) as entries:
+                    stack.extend(entry.path for entry in entries)
+            except OSError as e:
+                log.debug("Cannot list %s: %s", path, e)
+
+        return found
 
 
 class RunInstallationTask(InstallationTask):
@@ -300,6 +449,8 @@ class RunInstallationTask(InstallationTask):
         super().__init__()
         self._total_steps = 0
         self._install_manager = install_manager
+        self._payload_installed_time = None
+        self._paths_before_payload = None
 
     @property
     def name(self):
@@ -321,6 +472,10 @@ class RunInstallationTask(InstallationTask):
 
     def _queue_started_cb(self, task):
         """The installation queue was started."""
+        if not task.task_category and not task.status_message:
+            # Nested queues of parallel queues don't change the status.
+            return
+
         self.report_category(task.task_category)
         self.report_progress(task.status_message)
 
@@ -362,42 +517,59 @@ class RunInstallationTask(InstallationTask):
             configuration_queue.append(certificates_import)
 
         # schedule the execute methods of ksdata that require an installed system to be present
+        # - tasks of different modules run at the same time unless they depend on each other
         os_config = TaskQueue(
             "Installed system configuration",
             _("Configuring installed system"),
-            CATEGORY_SYSTEM
+            CATEGORY_SYSTEM,
+            parallel=True
         )
 
         # add installation tasks for the Security DBus module
         if is_module_available(SECURITY):
+            security_config = TaskQueue("Security configuration")
             security_proxy = SECURITY.get_proxy()
             security_dbus_tasks = security_proxy.InstallWithTasks()
-            os_config.append_dbus_tasks(SECURITY, security_dbus_tasks)
+            security_config.append_dbus_tasks(SECURITY, security_dbus_tasks)
+            os_config.append(security_config)
 
         # add installation tasks for the Timezone DBus module
         # run these tasks before tasks of the Services module
         if is_module_available(TIMEZONE):
+            timezone_config = TaskQueue("Timezone configuration", provides=["timezone"])
             timezone_proxy = TIMEZONE.get_proxy()
             timezone_dbus_tasks = timezone_proxy.InstallWithTasks()
-            os_config.append_dbus_tasks(TIMEZONE, timezone_dbus_tasks)
+            timezone_config.append_dbus_tasks(TIMEZONE, timezone_dbus_tasks)
+            os_config.append(timezone_config)
 
         # add installation tasks for the Services DBus module
         if is_module_available(SERVICES):
+            services_config = TaskQueue(
+                "Services configuration",
+                requires=["timezone"],
+                provides=["services"]
+            )
             services_proxy = SERVICES.get_proxy()
             services_dbus_tasks = services_proxy.InstallWithTasks()
-            os_config.append_dbus_tasks(SERVICES, services_dbus_tasks)
+            services_config.append_dbus_tasks(SERVICES, services_dbus_tasks)
+            os_config.append(services_config)
 
         # add installation tasks for the Localization DBus module
         if is_module_available(LOCALIZATION):
+            localization_config = TaskQueue("Localization configuration")
             localization_proxy = LOCALIZATION.get_proxy()
             localization_dbus_tasks = localization_proxy.InstallWithTasks()
-            os_config.append_dbus_tasks(LOCALIZATION, localization_dbus_tasks)
+            localization_config.append_dbus_tasks(LOCALIZATION, localization_dbus_tasks)
+            os_config.append(localization_config)
 
         # add the Firewall configuration task
+        # run it after the Services module, because it can enable or disable firewalld
         if conf.target.can_configure_network:
+            firewall_config = TaskQueue("Firewall configuration", requires=["services"])
             firewall_proxy = NETWORK.get_proxy(FIREWALL)
             firewall_dbus_task = firewall_proxy.InstallWithTask()
-            os_config.append_dbus_tasks(NETWORK, [firewall_dbus_task])
+            firewall_config.append_dbus_tasks(NETWORK, [firewall_dbus_task])
+            os_config.append(firewall_config)
 
         configuration_queue.append(os_config)
 
@@ -548,7 +720,7 @@ class RunInstallationTask(InstallationTask):
         ))
         configuration_queue.append(Task(
             "Set file contexts",
-            SetContextsTask(conf.target.system_root).run
+            self._set_file_contexts
         ))
 
         return configuration_queue
@@ -629,18 +801,32 @@ class RunInstallationTask(InstallationTask):
         # Do various pre-installation tasks
         # - try to discover a realm (if any)
         # - check for possibly needed additional packages.
+        # The realm discovery runs at the same time as the other tasks.
         pre_install = TaskQueue(
             "Pre install tasks",
             _("Running pre-installation tasks"),
-            CATEGORY_SOFTWARE
+            CATEGORY_SOFTWARE,
+            parallel=True
         )
 
+        if is_module_available(SECURITY):
+            security_proxy = SECURITY.get_proxy()
+
+            # Discover a realm.
+            realm_discovery = TaskQueue("Realm discovery")
+            realm_discovery.append_dbus_tasks(SECURITY, [
+                security_proxy.DiscoverRealmWithTask()
+            ])
+            pre_install.append(realm_discovery)
+
+        payload_setup = TaskQueue("Payload installation setup")
+
         # Make name resolution work for rpm scripts in chroot.
         # Also make sure dns resolution works in %post scripts
         # when systemd-resolved is not available.
         if conf.system.provides_resolver_config and \
                 not is_service_installed("systemd-resolved.service"):
-            pre_install.append(Task(
+            payload_setup.append(Task(
                 "Copy resolv.conf to sysroot",
                 network.copy_resolv_conf_to_root,
                 (conf.target.system_root, )
@@ -649,19 +835,17 @@ class RunInstallationTask(InstallationTask):
         if is_module_available(SECURITY):
             security_proxy = SECURITY.get_proxy()
 
-            # Discover a realm.
-            pre_install.append_dbus_tasks(SECURITY, [
-                security_proxy.DiscoverRealmWithTask()
-            ])
-
             # Set up FIPS for the payload installation.
             fips_task = security_proxy.PreconfigureFIPSWithTask(payload_proxy.Type)
-            pre_install.append_dbus_tasks(SECURITY, [fips_task])
+            payload_setup.append_dbus_tasks(SECURITY, [fips_task])
 
             # Import certificates so they are available for rpm scripts
             certificates_proxy = SECURITY.get_proxy(CERTIFICATES)
             certificates_task = certificates_proxy.PreInstallWithTask(payload_proxy.Type)
-            pre_install.append_dbus_tasks(SECURITY, [certificates_task])
+            payload_setup.append_dbus_tasks(SECURITY, [certificates_task])
+
+        if payload_setup.items:
+            pre_install.append(payload_setup)
 
         installation_queue.append(pre_install)
 
@@ -676,6 +860,13 @@ class RunInstallationTask(InstallationTask):
 
         installation_queue.append(payload_install)
 
+        # RPM labels the installed files, so it is enough to relabel
+        # only files that are changed after the payload installation
+        # and files written by the installer before the payload.
+        if payload_proxy.Type == PAYLOAD_TYPE_DNF and conf.security.incremental_relabel:
+            payload_install.started.connect(self._payload_started_cb)
+            payload_install.completed.connect(self._payload_installed_cb)
+
         # for some payloads storage is configured after the payload is installed
         if payload_proxy.Type != PAYLOAD_TYPE_DNF:
             late_storage = TaskQueue(
@@ -745,6 +936,30 @@ class RunInstallationTask(InstallationTask):
 
         return installation_queue
 
+    def _payload_started_cb(self, queue):
+        """Remember files written before the payload installation.
+
+        RPM doesn't label files that were written by the installer, for
+        example the resolv.conf file, imported certificates, the FIPS
+        configuration or the output of %pre-install scripts.
+        """
+        task = SetContextsTask(conf.target.system_root)
+        self._paths_before_payload = task.find_files()
+
+    def _payload_installed_cb(self, queue):
+        """Remember the time of the finished payload installation."""
+        # File timestamps are set from a coarse clock, so keep a margin.
+        self._payload_installed_time = time.time() - 1
+
+    def _set_file_contexts(self):
+        """Set file contexts on the target system."""
+        task = SetContextsTask(
+            conf.target.system_root,
+            changed_since=self._payload_installed_time,
+            extra_paths=self._paths_before_payload
+        )
+        task.run()
+
     def _run_installation(self):
         """Run the complete installation."""
         queue = TaskQueue("Complete installation queue")
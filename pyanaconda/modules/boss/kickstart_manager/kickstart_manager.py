@@ -16,6 +16,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from pykickstart.errors import KickstartError
 from pykickstart.version import makeVersion
 
@@ -40,6 +43,7 @@ class KickstartManager:
 
     def __init__(self):
         self._module_observers = []
+        self._handled_kickstart = {}
 
     @property
     def module_observers(self):
@@ -78,23 +82,27 @@ class KickstartManager:
         return parser.split(path)
 
     def _distribute_to_modules(self, elements):
-        """Distribute split kickstart to modules synchronously.
+        """Distribute split kickstart to modules.
+
+        The modules read their kickstart data at the same time.
 
         :returns: list of (Line number, Message) errors reported by modules when
                   distributing kickstart
         :rtype: list of kickstart reports
         """
-        reports = []
+        requests = []
+        observers = []
 
         for observer in self._module_observers:
-            if not observer.is_service_available:
+            if not observer.is_service_reachable:
                 log.warning("Module %s not available!", observer.service_name)
                 continue
 
-            commands = observer.proxy.KickstartCommands
-            sections = observer.proxy.KickstartSections
-            addons = observer.proxy.KickstartAddons
+            observers.append(observer)
+
+        handled_kickstart = self._get_all_handled_kickstart(observers)
 
+        for observer, (commands, sections, addons) in zip(observers, handled_kickstart):
             log.info("%s handles commands %s sections %s addons %s.",
                      observer.service_name, commands, sections, addons)
 
@@ -112,9 +120,21 @@ class KickstartManager:
                 log.info("There are no kickstart data for %s.", observer.service_name)
                 continue
 
-            module_report = KickstartReport.from_structure(
-                observer.proxy.ReadKickstart(module_kickstart)
-            )
+            requests.append((observer, module_elements, module_kickstart))
+
+        if not requests:
+            return []
+
+        with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+            futures = [
+                executor.submit(self._read_module_kickstart, observer, module_kickstart)
+                for observer, _module_elements, module_kickstart in requests
+            ]
+
+        reports = []
+
+        for (observer, module_elements, _module_kickstart), future in zip(requests, futures):
+            module_report = future.result()
 
             line_references = elements.get_references_from_elements(
                 module_elements
@@ -130,11 +150,65 @@ class KickstartManager:
 
         return reports
 
+    def _get_all_handled_kickstart(self, observers):
+        """Get the kickstart commands, sections and addons of modules.
+
+        The data are requested from the modules at the same time, so
+        lazy modules that are not running yet are started in parallel.
+
+        :param observers: a list of module observers
+        :return: a list of tuples of lists of commands, sections and addons
+        """
+        unknown = [o for o in observers if o.service_name not in self._handled_kickstart]
+
+        if len(unknown) > 1:
+            with ThreadPoolExecutor(max_workers=len(unknown)) as executor:
+                list(executor.map(self._get_handled_kickstart, unknown))
+
+        return [self._get_handled_kickstart(o) for o in observers]
+
+    def _get_handled_kickstart(self, observer):
+        """Get the kickstart commands, sections and addons of a module.
+
+        :param observer: a module observer
+        :return: a tuple of lists of commands, sections and addons
+        """
+        name = observer.service_name
+
+        if name not in self._handled_kickstart:
+            self._handled_kickstart[name] = (
+                observer.proxy.KickstartCommands,
+                observer.proxy.KickstartSections,
+                observer.proxy.KickstartAddons,
+            )
+
+        return self._handled_kickstart[name]
+
+    def _read_module_kickstart(self, observer, kickstart):
+        """Let a module read its kickstart data.
+
+        :param observer: a module observer
+        :param kickstart: a kickstart string
+        :return: a kickstart report of the module
+        """
+        start = time.perf_counter()
+
+        module_report = KickstartReport.from_structure(
+            observer.proxy.ReadKickstart(kickstart)
+        )
+
+        parse_time = time.perf_counter() - start
+        module_report.parse_times = {observer.service_name: parse_time}
+        log.debug("%s has read the kickstart in %.3f s.", observer.service_name, parse_time)
+
+        return module_report
+
     def _merge_module_reports(self, report, module_reports):
         """Merge the module reports into the final report."""
         for module_report in module_reports:
             report.error_messages.extend(module_report.error_messages)
             report.warning_messages.extend(module_report.warning_messages)
+            report.parse_times.update(module_report.parse_times)
 
     def generate_kickstart(self):
         """Return a kickstart representation of modules.
@@ -152,7 +226,7 @@ class KickstartManager:
         result = {}
 
         for observer in self._module_observers:
-            if not observer.is_service_available:
+            if not observer.is_service_reachable:
                 log.warning("Module %s not available!", observer.service_name)
                 continue
 
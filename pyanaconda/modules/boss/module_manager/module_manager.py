@@ -20,7 +20,10 @@ from pyanaconda.anaconda_loggers import get_module_logger
 from pyanaconda.core.configuration.anaconda import conf
 from pyanaconda.core.dbus import DBus
 from pyanaconda.core.signal import Signal
-from pyanaconda.modules.boss.module_manager.start_modules import StartModulesTask
+from pyanaconda.modules.boss.module_manager.start_modules import (
+    StartModulesTask,
+    WarmUpModulesTask,
+)
 
 log = get_module_logger(__name__)
 
@@ -30,6 +33,7 @@ class ModuleManager:
 
     def __init__(self):
         self._module_observers = []
+        self._locale = None
         self.module_observers_changed = Signal()
 
     @property
@@ -49,12 +53,66 @@ class ModuleManager:
             activatable=conf.anaconda.activatable_modules,
             forbidden=conf.anaconda.forbidden_modules,
             optional=conf.anaconda.optional_modules,
+            lazy=conf.anaconda.lazy_modules,
         )
         task.succeeded_signal.connect(
-            lambda: self.set_module_observers(task.get_result())
+            lambda: self._modules_started_callback(task.get_result())
         )
         return task
 
+    def _modules_started_callback(self, observers):
+        """Set the module observers and warm up the lazy modules."""
+        self.set_module_observers(observers)
+
+        lazy_observers = [o for o in observers if o.is_lazy]
+
+        if not lazy_observers:
+            return
+
+        for observer in lazy_observers:
+            observer.service_available.connect(self._lazy_module_available_callback)
+
+        task = WarmUpModulesTask(
+            message_bus=DBus,
+            module_observers=lazy_observers,
+            optional=conf.anaconda.optional_modules,
+        )
+        task.succeeded_signal.connect(
+            lambda: self._modules_warmed_up_callback(lazy_observers, task.get_result())
+        )
+        task.failed_signal.connect(
+            lambda: self._modules_warm_up_failed_callback(lazy_observers)
+        )
+        task.start()
+
+    def _lazy_module_available_callback(self, observer):
+        """Set the locale of a lazy module once it is available."""
+        if not self._locale:
+            return
+
+        log.debug("Setting locale of %s to %s.", observer, self._locale)
+        observer.proxy.SetLocale(self._locale)
+
+    def _modules_warmed_up_callback(self, lazy_observers, available_observers):
+        """Remove the lazy modules that have failed to start."""
+        failed_observers = [o for o in lazy_observers if o not in available_observers]
+
+        if not failed_observers:
+            return
+
+        self.set_module_observers([
+            o for o in self.module_observers if o not in failed_observers
+        ])
+
+    def _modules_warm_up_failed_callback(self, lazy_observers):
+        """Remove the lazy modules that are not available after a failed warm-up."""
+        log.error("Failed to start the lazy modules.")
+
+        self._modules_warmed_up_callback(
+            lazy_observers,
+            [o for o in lazy_observers if o.is_service_available]
+        )
+
     def get_service_names(self):
         """Get service names of running modules.
 
@@ -63,7 +121,7 @@ class ModuleManager:
         names = []
 
         for observer in self.module_observers:
-            if not observer.is_service_available:
+            if not observer.is_service_reachable:
                 continue
 
             names.append(observer.service_name)
@@ -73,11 +131,20 @@ class ModuleManager:
     def set_modules_locale(self, locale):
         """Set locale of all modules.
 
+        Lazy modules that are not available yet are not started
+        by this call. They will set the locale once they are up.
+
         :param str locale: locale to set
         """
         log.info("Setting locale of all modules to %s.", locale)
+        self._locale = locale
+
         for observer in self.module_observers:
-            if not observer.is_service_available:
+            if observer.is_lazy and not observer.is_service_available:
+                log.debug("%s will set the locale once it is available.", observer)
+                continue
+
+            if not observer.is_service_reachable:
                 log.warning("%s is not available when setting locale", observer)
                 continue
             observer.proxy.SetLocale(locale)
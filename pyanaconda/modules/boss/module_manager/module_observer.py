@@ -26,14 +26,16 @@ log = get_module_logger(__name__)
 class ModuleObserver(DBusObserver):
     """Observer of an Anaconda module."""
 
-    def __init__(self, message_bus, service_name):
+    def __init__(self, message_bus, service_name, is_lazy=False):
         """Creates a module observer.
 
         :param message_bus: a message bus
         :param service_name: a DBus name of a service
+        :param is_lazy: is the module started on demand?
         """
         super().__init__(message_bus, service_name)
         self._proxy = None
+        self._is_lazy = is_lazy
         self._is_addon = service_name.startswith(get_dbus_name(*ADDONS_NAMESPACE))
         self._namespace = get_namespace_from_name(service_name)
         self._object_path = get_dbus_path(*self._namespace)
@@ -46,10 +48,29 @@ class ModuleObserver(DBusObserver):
         """
         return self._is_addon
 
+    @property
+    def is_lazy(self):
+        """Is the observed module started on demand?
+
+        :return: True or False
+        """
+        return self._is_lazy
+
+    @property
+    def is_service_reachable(self):
+        """Can the observed service be called?
+
+        The message bus starts a lazy module on the first call,
+        so it can be called even if it isn't available yet.
+
+        :return: True or False
+        """
+        return self._is_service_available or self._is_lazy
+
     @property
     def proxy(self):
         """Returns a proxy of the remote object."""
-        if not self._is_service_available:
+        if not self.is_service_reachable:
             raise DBusObserverError("Service {} is not available."
                                     .format(self._service_name))
 
@@ -16,6 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
+import time
 from functools import partial
 from queue import SimpleQueue
 
@@ -28,7 +29,7 @@ from pyanaconda.modules.common.task import Task
 
 log = get_module_logger(__name__)
 
-__all__ = ["StartModulesTask"]
+__all__ = ["StartModulesTask", "WarmUpModulesTask"]
 
 
 class StartModulesTask(Task):
@@ -39,24 +40,31 @@ class StartModulesTask(Task):
     method StartServiceByName is called.
     """
 
-    def __init__(self, message_bus, activatable, forbidden, optional):
+    def __init__(self, message_bus, activatable, forbidden, optional, lazy=None):
         """Create a new task.
 
         Anaconda modules are specified by their full DBus name or a prefix
         of their DBus name that ends with '*'.
 
+        The lazy modules are not started by this task. They are returned
+        with other modules, but they are available only after they are
+        started on demand.
+
         :param message_bus: a message bus
         :param activatable: a list of modules that can be activated.
         :param forbidden: a list of modules that are are not allowed to run
         :param optional: a list of modules that are optional
+        :param lazy: a list of modules that are started on demand
         """
         super().__init__()
         self._message_bus = message_bus
         self._activatable = activatable
         self._forbidden = forbidden
         self._optional = optional
+        self._lazy = lazy or []
         self._module_observers = []
         self._callbacks = SimpleQueue()
+        self._start_time = None
 
     @property
     def name(self):
@@ -69,15 +77,35 @@ class StartModulesTask(Task):
         :return: a list of observers
         """
         # Collect the modules.
-        self._module_observers = self._find_modules()
+        module_observers = self._find_modules()
+        self._module_observers = self._select_modules(module_observers)
+        skipped = [o for o in module_observers if o not in self._module_observers]
 
         # Asynchronously start the modules.
+        self._start_time = time.perf_counter()
         self._start_modules(self._module_observers)
 
         # Process the callbacks of the asynchronous calls.
         self._process_callbacks(self._module_observers)
 
-        return self._module_observers
+        log.debug(
+            "Started %s modules in %.2f s.",
+            len(self._module_observers), time.perf_counter() - self._start_time
+        )
+
+        # Keep the order of the found modules.
+        return [
+            o for o in module_observers
+            if o in self._module_observers or o in skipped
+        ]
+
+    def _select_modules(self, module_observers):
+        """Select modules to start.
+
+        :param module_observers: a list of found module observers
+        :return: a list of module observers to start
+        """
+        return [o for o in module_observers if not o.is_lazy]
 
     @staticmethod
     def _match_module(name, patterns):
@@ -114,10 +142,21 @@ class StartModulesTask(Task):
                 )
                 continue
 
-            log.debug("Found %s.", service_name)
+            # Lazy modules are started on demand.
+            is_lazy = self._match_module(service_name, self._lazy)
+
+            if is_lazy:
+                log.debug(
+                    "Found %s. The module will be started on demand.",
+                    service_name
+                )
+            else:
+                log.debug("Found %s.", service_name)
+
             modules.append(ModuleObserver(
                 self._message_bus,
                 service_name,
+                is_lazy=is_lazy,
             ))
 
         return modules
@@ -165,7 +204,10 @@ class StartModulesTask(Task):
 
     def _service_available_handler(self, observer):
         """Handler for the service_available signal."""
-        log.debug("%s is available.", observer)
+        log.debug(
+            "%s is available in %.2f s.",
+            observer, time.perf_counter() - self._start_time
+        )
         observer.proxy.Ping()
         return True
 
@@ -197,19 +239,77 @@ class StartModulesTask(Task):
                 if not is_available:
                     continue
 
-            except UnavailableModuleError:
-                # The failure of a required module is fatal.
-                if not self._match_module(observer.service_name, self._optional):
-                    raise
-
-                # The failure of an optional module is not fatal. Remove
-                # it from the list of available modules and continue.
-                log.debug(
-                    "Skip %s. The optional module has failed to start, "
-                    "so it won't be available during the installation.",
-                    observer.service_name
-                )
+            except UnavailableModuleError as error:
+                self._handle_failed_module(observer, error)
                 available.remove(observer)
 
             # The module is processed.
             unprocessed.discard(observer)
+
+
+    def _handle_failed_module(self, observer, error):
+        """Handle a module that has failed to start.
+
+        The failure of a required module is fatal. The failure of
+        an optional module is not fatal. It is removed from the list
+        of available modules.
+
+        :param observer: a module observer
+        :param error: an instance of UnavailableModuleError
+        """
+        if not self._match_module(observer.service_name, self._optional):
+            raise error
+
+        log.debug(
+            "Skip %s. The optional module has failed to start, "
+            "so it won't be available during the installation.",
+            observer.service_name
+        )
+
+
+class WarmUpModulesTask(StartModulesTask):
+    """A task for starting lazy DBus modules in the background."""
+
+    def __init__(self, message_bus, module_observers, optional):
+        """Create a new task.
+
+        :param message_bus: a message bus
+        :param module_observers: a list of observers of lazy modules
+        :param optional: a list of modules that are optional
+        """
+        super().__init__(message_bus, [], [], optional)
+        self._lazy_observers = list(module_observers)
+
+    @property
+    def name(self):
+        """Name of the task."""
+        return "Warm up the modules"
+
+    def _find_modules(self):
+        """Find modules to start."""
+        return list(self._lazy_observers)
+
+    def _select_modules(self, module_observers):
+        """Select modules to start."""
+        return list(module_observers)
+
+    def _handle_failed_module(self, observer, error):
+        """Handle a module that has failed to start.
+
+        Lazy modules are started in the background, so the failure
+        isn't fatal even for a required module. The module is removed
+        from the list of available modules and the other modules are
+        still started.
+
+        :param observer: a module observer
+        :param error: an instance of UnavailableModuleError
+        """
+        if self._match_module(observer.service_name, self._optional):
+            super()._handle_failed_module(observer, error)
+            return
+
+        log.error(
+            "The required module %s has failed to start, so it "
+            "won't be available during the installation: %s",
+            observer.service_name, error
+        )
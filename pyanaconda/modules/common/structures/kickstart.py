@@ -114,6 +114,7 @@ class KickstartReport(DBusData):
     def __init__(self):
         self._error_messages = []
         self._warning_messages = []
+        self._parse_times = {}
 
     def is_valid(self):
         """Is the kickstart valid?
@@ -152,3 +153,15 @@ class KickstartReport(DBusData):
     @warning_messages.setter
     def warning_messages(self, messages: List[KickstartMessage]):
         self._warning_messages = list(messages)
+
+    @property
+    def parse_times(self) -> Dict[Str, Double]:
+        """Times of the kickstart parsing.
+
+        :return: a dictionary of DBus names of modules and times in seconds
+        """
+        return self._parse_times
+
+    @parse_times.setter
+    def parse_times(self, times: Dict[Str, Double]):
+        self._parse_times = dict(times)
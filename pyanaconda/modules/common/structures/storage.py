@@ -19,7 +19,7 @@
 from dasbus.structure import DBusData
 from dasbus.typing import *  # pylint: disable=wildcard-import
 
-__all__ = ["DeviceActionData", "DeviceData", "DeviceFormatData", "OSData"]
+__all__ = ["DeviceActionData", "DeviceData", "DeviceFormatData", "DeviceTreeData", "OSData"]
 
 
 class DeviceData(DBusData):
@@ -315,6 +315,40 @@ class DeviceFormatData(DBusData):
         self._description = text
 
 
+class DeviceTreeData(DBusData):
+    """Snapshot of data of all devices in the device tree."""
+
+    def __init__(self):
+        self._devices = []
+        self._formats = []
+
+    @property
+    def devices(self) -> List[DeviceData]:
+        """Data of all devices in the device tree.
+
+        :return: a list of device data
+        """
+        return self._devices
+
+    @devices.setter
+    def devices(self, devices: List[DeviceData]):
+        self._devices = devices
+
+    @property
+    def formats(self) -> List[DeviceFormatData]:
+        """Data of formats of all devices in the device tree.
+
+        The formats are in the same order as the devices.
+
+        :return: a list of format data
+        """
+        return self._formats
+
+    @formats.setter
+    def formats(self, formats: List[DeviceFormatData]):
+        self._formats = formats
+
+
 class DeviceActionData(DBusData):
     """Device action data."""
 
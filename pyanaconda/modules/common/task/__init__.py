@@ -16,8 +16,11 @@
 # Red Hat, Inc.
 #
 import math
+import threading
 from time import perf_counter, sleep
 
+from pyanaconda.core.glib import create_main_loop, create_new_context, timeout_source_new
+from pyanaconda.core.threads import thread_manager
 from pyanaconda.modules.common.task.task import AbstractTask, Task, ValidationTask
 from pyanaconda.modules.common.task.task_interface import TaskInterface
 
@@ -31,6 +34,15 @@ __all__ = [
     "wait_for_task",
 ]
 
+# The interval of callbacks of running tasks in seconds.
+TASK_CALLBACK_INTERVAL = 0.1
+
+# The interval of checks of running tasks in seconds.
+TASK_CHECK_INTERVAL = 1
+
+# Private main contexts of threads.
+_contexts = threading.local()
+
 
 def sync_run_task(task_proxy, callback=None):
     """Run a remote task synchronously.
@@ -41,14 +53,11 @@ def sync_run_task(task_proxy, callback=None):
     :param callback: a callback
     :raise: a remote error
     """
-    task_proxy.Start()
-
-    while task_proxy.IsRunning:
-
-        if callback:
-            callback(task_proxy)
-
-        sleep(0.1)
+    if thread_manager.in_main_thread():
+        task_proxy.Start()
+        _poll_task(task_proxy, callback=callback)
+    else:
+        _wait_for_stopped(task_proxy, start=True, callback=callback)
 
     task_proxy.Finish()
 
@@ -89,13 +98,116 @@ def wait_for_task(task_proxy, timeout=math.inf):
     :param float timeout: stop waiting after this time in seconds
     :raise TimeoutError: when the task did not finish before timeout
     """
-    start = perf_counter()
-    end = start + timeout
-
-    while task_proxy.IsRunning and perf_counter() <= end:
-        sleep(0.1)
+    if thread_manager.in_main_thread():
+        _poll_task(task_proxy, timeout=timeout)
+    else:
+        _wait_for_stopped(task_proxy, timeout=timeout)
 
     if task_proxy.IsRunning:
         raise TimeoutError()
 
     task_proxy.Finish()
+
+
+def _poll_task(task_proxy, callback=None, timeout=math.inf):
+    """Poll the remote task until it stops.
+
+    The main thread can't wait for signals, because they might be
+    emitted only from its main loop.
+
+    :param task_proxy: a proxy of the remote task
+    :param callback: a callback called every iteration
+    :param float timeout: stop waiting after this time in seconds
+    """
+    end = perf_counter() + timeout
+
+    while task_proxy.IsRunning and perf_counter() <= end:
+
+        if callback:
+            callback(task_proxy)
+
+        sleep(TASK_CALLBACK_INTERVAL)
+
+
+def _wait_for_stopped(task_proxy, start=False, callback=None, timeout=math.inf):
+    """Wait for the Stopped signal of the remote task.
+
+    Run a loop of a private main context of the current thread until
+    the task stops. New subscriptions of DBus signals are delivered to
+    this context, the signals of local tasks to the main loop of the
+    process. The state of the task is still checked once per second
+    in case the signal is delivered to a context that doesn't run.
+
+    :param task_proxy: a proxy of the remote task
+    :param start: start the task before waiting
+    :param callback: a callback called every iteration
+    :param float timeout: stop waiting after this time in seconds
+    """
+    context = _get_private_context()
+    loop = create_main_loop(context)
+    sources = []
+
+    def _add_timeout(interval, function):
+        source = timeout_source_new(int(interval * 1000))
+        source.set_callback(function)
+        source.attach(context)
+        sources.append(source)
+
+    def _quit(*args):
+        loop.quit()
+        return False
+
+    def _on_stopped(*args):
+        # The loop might not run yet, so quit it from its context.
+        _add_timeout(0, _quit)
+
+    def _check_task(*args):
+        if task_proxy.IsRunning:
+            return True
+
+        return _quit()
+
+    def _call_callback(*args):
+        callback(task_proxy)
+        return True
+
+    context.push_thread_default()
+
+    try:
+        task_proxy.Stopped.connect(_on_stopped)
+
+        if start:
+            task_proxy.Start()
+        elif not task_proxy.IsRunning:
+            return
+
+        _add_timeout(TASK_CHECK_INTERVAL, _check_task)
+
+        if callback:
+            _add_timeout(TASK_CALLBACK_INTERVAL, _call_callback)
+
+        if timeout != math.inf:
+            _add_timeout(timeout, _quit)
+
+        loop.run()
+    finally:
+        task_proxy.Stopped.disconnect(_on_stopped)
+
+        for source in sources:
+            source.destroy()
+
+        context.pop_thread_default()
+
+
+def _get_private_context():
+    """Get a private main context of the current thread.
+
+    The context is reused, so DBus signals subscribed during
+    previous waits in the same thread are still delivered.
+
+    :return: an instance of GLib.MainContext
+    """
+    if not hasattr(_contexts, "context"):
+        _contexts.context = create_new_context()
+
+    return _contexts.context
@@ -0,0 +1,218 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 31 Milk Street #960789 Boston, MA
+# 02196 USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import os
+import time
+
+from pyanaconda.anaconda_loggers import get_module_logger
+from pyanaconda.localization import (
+    _build_layout_infos,
+    _get_layout_variant_description,
+    get_available_translations,
+    get_common_keyboard_layouts,
+    get_common_languages,
+    get_english_name,
+    get_language_id,
+    get_language_locales,
+    get_native_name,
+    layout_supports_ascii,
+)
+from pyanaconda.modules.common.structures.keyboard_layout import KeyboardLayout
+from pyanaconda.modules.common.structures.language import LanguageData, LocaleData
+
+log = get_module_logger(__name__)
+
+__all__ = ["LocalizationIndex"]
+
+# Environment variables that choose the language of translations.
+TRANSLATION_VARIABLES = ("LANGUAGE", "LC_ALL", "LC_MESSAGES", "LANG")
+
+
+class LocalizationIndex:
+    """Index of data about languages, locales and keyboard layouts.
+
+    The data are collected from langtable, the XKB registry and the
+    available translations on the first use and then served from
+    memory. Translated descriptions of keyboard layouts are indexed
+    per language of translations.
+    """
+
+    def __init__(self, localedir=None):
+        """Create a new index.
+
+        :param localedir: a directory with translations or None
+        """
+        self._localedir = localedir
+        self._languages = None
+        self._language_data = {}
+        self._language_locales = {}
+        self._locale_data = {}
+        self._layout_infos = None
+        self._layouts = None
+        self._descriptions = {}
+
+    @property
+    def languages(self):
+        """Languages with available translations.
+
+        :return: a list of language ids
+        """
+        if self._languages is None:
+            self._languages = list(get_available_translations(self._localedir))
+
+        return list(self._languages)
+
+    def get_language_data(self, language_id):
+        """Get data about the specified language.
+
+        :param language_id: a language id (for example, "en")
+        :return: an instance of LanguageData
+        """
+        if language_id not in self._language_data:
+            self._language_data[language_id] = (
+                get_english_name(language_id),
+                get_native_name(language_id),
+                language_id in get_common_languages(),
+            )
+
+        english_name, native_name, is_common = self._language_data[language_id]
+
+        data = LanguageData()
+        data.english_name = english_name
+        data.is_common = is_common
+        data.language_id = language_id
+        data.native_name = native_name
+        return data
+
+    def get_language_locales(self, language_id):
+        """Get locales available for the specified language.
+
+        :param language_id: a language id (for example, "en")
+        :return: a list of locale ids
+        """
+        if language_id not in self._language_locales:
+            self._language_locales[language_id] = get_language_locales(language_id)
+
+        return list(self._language_locales[language_id])
+
+    def get_locale_data(self, locale_id):
+        """Get data about the specified locale.
+
+        :param locale_id: a locale id (for example, "en_US.UTF-8")
+        :return: an instance of LocaleData
+        """
+        if locale_id not in self._locale_data:
+            self._locale_data[locale_id] = (
+                get_english_name(locale_id),
+                get_language_id(locale_id),
+                get_native_name(locale_id),
+            )
+
+        english_name, language_id, native_name = self._locale_data[locale_id]
+
+        data = LocaleData()
+        data.english_name = english_name
+        data.language_id = language_id
+        data.locale_id = locale_id
+        data.native_name = native_name
+        return data
+
+    @property
+    def layout_infos(self):
+        """Information about keyboard layouts.
+
+        :return: a dictionary of layout-variants and their LayoutInfo
+        """
+        if self._layout_infos is None:
+            start = time.perf_counter()
+            self._layout_infos = _build_layout_infos()
+            log.debug(
+                "Indexed %d keyboard layouts in %.2f s.",
+                len(self._layout_infos), time.perf_counter() - start
+            )
+
+        return self._layout_infos
+
+    def get_layout_variant_description(self, layout_variant, with_lang=True, xlated=True):
+        """Get a description of the given layout-variant.
+
+        :param layout_variant: a layout-variant identifier (e.g., 'cz (qwerty)')
+        :param with_lang: include the language in the description if available
+        :param xlated: return a translated version of the description if True
+        :return: a formatted layout description
+        """
+        key = (layout_variant, with_lang, xlated)
+
+        if xlated:
+            key += tuple(os.environ.get(name) for name in TRANSLATION_VARIABLES)
+
+        if key not in self._descriptions:
+            self._descriptions[key] = _get_layout_variant_description(
+                layout_variant, self.layout_infos, with_lang, xlated
+            )
+
+        return self._descriptions[key]
+
+    def get_keyboard_layouts(self):
+        """Get localized keyboard layouts.
+
+        :return: a list of KeyboardLayout instances
+        """
+        layouts = []
+
+        for name, langs, is_common, supports_ascii in self._get_layouts():
+            layout = KeyboardLayout()
+            layout.layout_id = name
+            layout.description = self.get_layout_variant_description(name)
+            layout.is_common = is_common
+            layout.langs = list(langs)
+            layout.supports_ascii = supports_ascii
+            layouts.append(layout)
+
+        return layouts
+
+    def _get_layouts(self):
+        """Get data about keyboard layouts that don't need translations.
+
+        :return: a list of tuples with the name, languages, the common
+                 flag and the ASCII support flag of the layout
+        """
+        if self._layouts is not None:
+            return self._layouts
+
+        # rxkb_context.layouts lists all XKB layouts, including variants and less common options,
+        # while langtable.list_keyboards filters for the most relevant layouts.
+        common_keyboards = set(get_common_keyboard_layouts())
+        common_languages = {
+            self.get_language_data(lang).english_name
+            for lang in get_common_languages()
+        }
+
+        self._layouts = []
+
+        for name, info in self.layout_infos.items():
+            if not name:
+                continue
+
+            is_common_lang = any(
+                entry.split('; ')[0] in common_languages for entry in info.langs
+            )
+            is_common = name.replace(" ", "") in common_keyboards and is_common_lang
+            supports_ascii = layout_supports_ascii(name.replace(" ", ""))
+            self._layouts.append((name, tuple(info.langs), is_common, supports_ascii))
+
+        return self._layouts
@@ -25,24 +25,11 @@ from pyanaconda.core.constants import DEFAULT_KEYBOARD
 from pyanaconda.core.dbus import DBus
 from pyanaconda.core.signal import Signal
 from pyanaconda.keyboard import can_configure_keyboard, normalize_layout_variant
-from pyanaconda.localization import (
-    _build_layout_infos,
-    _get_layout_variant_description,
-    get_available_translations,
-    get_common_keyboard_layouts,
-    get_common_languages,
-    get_english_name,
-    get_language_id,
-    get_language_locales,
-    get_locale_keyboards,
-    get_native_name,
-    layout_supports_ascii,
-)
+from pyanaconda.localization import get_language_id, get_locale_keyboards
 from pyanaconda.modules.common.base import KickstartService
 from pyanaconda.modules.common.constants.services import LOCALIZATION
 from pyanaconda.modules.common.containers import TaskContainer
-from pyanaconda.modules.common.structures.keyboard_layout import KeyboardLayout
-from pyanaconda.modules.common.structures.language import LanguageData, LocaleData
+from pyanaconda.modules.localization.index import LocalizationIndex
 from pyanaconda.modules.localization.installation import (
     KeyboardInstallationTask,
     LanguageInstallationTask,
@@ -90,7 +77,7 @@ class LocalizationService(KickstartService):
         self.compositor_selected_layout_changed = Signal()
         self.compositor_layouts_changed = Signal()
 
-        self._layout_infos = _build_layout_infos()
+        self._index = LocalizationIndex()
 
         self._localed_wrapper = None
         self._localed_compositor_wrapper = None
@@ -142,7 +129,7 @@ class LocalizationService(KickstartService):
 
         :return: a list of language ids
         """
-        return get_available_translations()
+        return self._index.languages
 
     def get_language_data(self, language_id):
         """Get data about the specified language.
@@ -150,13 +137,27 @@ class LocalizationService(KickstartService):
         :param: a language id (for example, "en")
         :return: a language data
         """
-        tdata = LanguageData()
-        tdata.english_name = get_english_name(language_id)
-        tdata.is_common = language_id in get_common_languages()
-        tdata.language_id = language_id
-        tdata.native_name = get_native_name(language_id)
+        return self._index.get_language_data(language_id)
+
+    def get_languages_data(self):
+        """Get data about all languages with available translations.
+
+        :return: a list of language data
+        """
+        return [self._index.get_language_data(lang) for lang in self._index.languages]
 
-        return tdata
+    def get_locales_data(self):
+        """Get data about locales of all languages with available translations.
+
+        :return: a dictionary of language ids and lists of locale data
+        """
+        return {
+            lang: [
+                self._index.get_locale_data(locale)
+                for locale in self._index.get_language_locales(lang)
+            ]
+            for lang in self._index.languages
+        }
 
     def get_locales(self, language_id):
         """Get locales available for the specified language.
@@ -165,7 +166,7 @@ class LocalizationService(KickstartService):
 
         :return: a list of locale ids
         """
-        return get_language_locales(language_id)
+        return self._index.get_language_locales(language_id)
 
     def get_common_locales(self):
         """Get a list of the most commonly used locales.
@@ -182,13 +183,7 @@ class LocalizationService(KickstartService):
         :param: a locale id (for example, "en_US.UTF-8")
         :return: a locale data
         """
-        tdata = LocaleData()
-        tdata.english_name = get_english_name(locale_id)
-        tdata.language_id = get_language_id(locale_id)
-        tdata.locale_id = locale_id
-        tdata.native_name = get_native_name(locale_id)
-
-        return tdata
+        return self._index.get_locale_data(locale_id)
 
     def get_layout_variant_description(self, layout_variant, with_lang=True, xlated=True):
         """
@@ -199,33 +194,14 @@ class LocalizationService(KickstartService):
         :param xlated: Return a translated version of the description if True
         :return: Formatted layout description
         """
-
-        return _get_layout_variant_description(layout_variant, self._layout_infos, with_lang, xlated)
+        return self._index.get_layout_variant_description(layout_variant, with_lang, xlated)
 
     def get_keyboard_layouts(self):
         """Get localized keyboard layouts
 
         :return: list of dictionaries with keyboard layout information
         """
-        # rxkb_context.layouts lists all XKB layouts, including variants and less common options,
-        # while langtable.list_keyboards filters for the most relevant layouts.
-        keyboards = self._layout_infos.items()
-        common_langtable_keyboards = get_common_keyboard_layouts()
-        common_languages = [self.get_language_data(lang).english_name for lang in get_common_languages()]
-
-        layouts = []
-        for name, info in keyboards:
-            if name:
-                is_common_lang = any(entry.split('; ')[0] in common_languages for entry in info.langs)
-                layout = KeyboardLayout()
-                layout.layout_id = name
-                layout.description = self.get_layout_variant_description(name, with_lang=True, xlated=True)
-                layout.is_common = name.replace(" ", "") in common_langtable_keyboards and is_common_lang
-                layout.langs = info.langs
-                layout.supports_ascii = layout_supports_ascii(name.replace(" ", ""))
-                layouts.append(layout)
-
-        return layouts
+        return self._index.get_keyboard_layouts()
 
     @property
     def language(self):
@@ -435,7 +411,7 @@ class LocalizationService(KickstartService):
         # remove all X layouts that are not valid X layouts (unsupported)
         valid_layouts = []
         for layout in x_layouts:
-            if layout in self._layout_infos:
+            if layout in self._index.layout_infos:
                 valid_layouts.append(layout)
         self.set_x_layouts(valid_layouts)
 
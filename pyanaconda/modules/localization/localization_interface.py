@@ -80,6 +80,18 @@ class LocalizationInterface(KickstartModuleInterface):
         language_data = self.implementation.get_language_data(language_id)
         return LanguageData.to_structure(language_data)
 
+    def GetLanguagesData(self) -> List[Structure]:
+        """Get data about all languages with available translations.
+
+        It is the same as calling GetLanguageData for every
+        language returned by GetLanguages.
+
+        :return: a list of language data
+        """
+        return LanguageData.to_structure_list(
+            self.implementation.get_languages_data()
+        )
+
     def GetLocales(self, language_id: Str) -> List[Str]:
         """Get locales available for the specified language.
 
@@ -89,6 +101,22 @@ class LocalizationInterface(KickstartModuleInterface):
         """
         return self.implementation.get_locales(language_id)
 
+    def GetLocalesData(self) -> Dict[Str, List[Structure]]:
+        """Get data about locales of all languages with available translations.
+
+        It is the same as calling GetLocaleData for every locale
+        returned by GetLocales for every language returned by
+        GetLanguages.
+
+        For example: {"de": [<de_DE.UTF-8>, <de_AT.UTF-8>, ...], ...}
+
+        :return: a dictionary of language ids and lists of locale data
+        """
+        return {
+            language_id: LocaleData.to_structure_list(locales)
+            for language_id, locales in self.implementation.get_locales_data().items()
+        }
+
     def GetCommonLocales(self) -> List[Str]:
         """Get a list of the most commonly used locales.
 
@@ -16,11 +16,13 @@
 # Red Hat, Inc.
 #
 import re
+import time
 
 from pyanaconda.anaconda_loggers import get_module_logger
 from pyanaconda.core.constants import NETWORK_CAPABILITY_TEAM
 from pyanaconda.core.regexes import NM_MAC_INITRAMFS_CONNECTION
 from pyanaconda.modules.common.task import Task
+from pyanaconda.modules.network.constants import NM_CONNECTION_TYPE_VLAN
 from pyanaconda.modules.network.device_configuration import (
     supported_wired_device_types,
     virtual_device_types,
@@ -29,8 +31,10 @@ from pyanaconda.modules.network.network_interface import (
     NetworkInitializationTaskInterface,
 )
 from pyanaconda.modules.network.nm_client import (
-    add_connection_from_ksdata,
+    activate_connection,
     commit_changes_with_autoconnection_blocked,
+    commit_connections_sync,
+    create_connections_from_ksdata,
     get_config_file_connection_of_device,
     get_device_name_from_network_data,
     get_iface_from_hwaddr,
@@ -45,6 +49,10 @@ from pyanaconda.modules.network.utils import (
 
 log = get_module_logger(__name__)
 
+# Kinds of changes of connections applied from kickstart.
+ADD_CONNECTION = "add"
+UPDATE_CONNECTION = "update"
+
 
 class ApplyKickstartTask(Task):
     """Task for application of kickstart network configuration."""
@@ -100,6 +108,9 @@ class ApplyKickstartTask(Task):
             log.debug("%s: No NetworkManager available.", self.name)
             return applied_devices
 
+        # Connections to add or update in the order of the kickstart.
+        connections = []
+
         for network_data in self._network_data:
             # Wireless is not supported
             if network_data.essid:
@@ -135,25 +146,106 @@ class ApplyKickstartTask(Task):
                     connection,
                     network_data,
                     device_name,
-                    ifname_option_values=self._ifname_option_values
+                    ifname_option_values=self._ifname_option_values,
+                    commit=False
                 )
-                if network_data.activate:
-                    device = nm_client.get_device_by_iface(device_name)
-                    nm_client.activate_connection_async(connection, device, None, None)
-                    log.debug("%s: activating updated connection %s with device %s",
-                              self.name, connection.get_uuid(), device_name)
+                connections.append((
+                    UPDATE_CONNECTION, device_name, connection, device_name,
+                    network_data.activate
+                ))
             else:
                 log.debug("%s: adding connection for %s", self.name, device_name)
-                add_connection_from_ksdata(
+                new_connections = create_connections_from_ksdata(
                     nm_client,
                     network_data,
                     device_name,
-                    activate=network_data.activate,
-                    ifname_option_values=self._ifname_option_values
+                    self._ifname_option_values
                 )
+                for connection, dev_name in new_connections:
+                    connections.append(
+                        (ADD_CONNECTION, device_name, connection, dev_name, network_data.activate)
+                    )
 
+        self._apply_connections(nm_client, connections)
         return applied_devices
 
+    def _apply_connections(self, nm_client, connections):
+        """Add and update the connections in the order of their dependencies.
+
+        Controllers and standalone connections are committed first, ports
+        and VLANs afterwards. The calls of each stage are issued together
+        and awaited with one timeout. The committed connections are then
+        activated in the order of the kickstart.
+
+        :param connections: a list of tuples of the kind of the change
+                            (ADD_CONNECTION or UPDATE_CONNECTION), the configured
+                            device name, the connection, its device name and
+                            the activation flag
+        """
+        start = time.perf_counter()
+        additions = [c[1:] for c in connections if c[0] == ADD_CONNECTION]
+        updates = [c[1:] for c in connections if c[0] == UPDATE_CONNECTION]
+        committed = {}
+        failed = {}
+
+        for is_dependent in (False, True):
+            stage_additions = [a for a in additions if self._is_dependent(a[1]) == is_dependent]
+            stage_updates = [u for u in updates if self._is_dependent(u[1]) == is_dependent]
+
+            if not stage_additions and not stage_updates:
+                continue
+
+            added, updated = commit_connections_sync(
+                nm_client,
+                [connection for _device, connection, _dev_name, _activate in stage_additions],
+                [connection for _device, connection, _dev_name, _activate in stage_updates]
+            )
+
+            for (device_name, connection, _dev_name, _activate), added_connection \
+                    in zip(stage_additions, added):
+                if added_connection:
+                    committed[connection.get_uuid()] = added_connection
+                else:
+                    failed[device_name] = failed.get(device_name, 0) + 1
+
+            for (device_name, connection, _dev_name, _activate), succeeded \
+                    in zip(stage_updates, updated):
+                if succeeded:
+                    committed[connection.get_uuid()] = connection
+                else:
+                    failed[device_name] = failed.get(device_name, 0) + 1
+
+        for _kind, device_name, connection, dev_name, activate in connections:
+            connection = committed.get(connection.get_uuid())
+
+            if connection and activate:
+                log.debug("%s: activating connection %s of device %s",
+                          self.name, connection.get_uuid(), device_name)
+                activate_connection(nm_client, connection, dev_name)
+
+        devices = dict.fromkeys(device_name for _kind, device_name, *_rest in connections)
+
+        for device_name in devices:
+            if device_name in failed:
+                log.warning("%s: %d connections of device %s failed",
+                            self.name, failed[device_name], device_name)
+            else:
+                log.debug("%s: connections of device %s applied", self.name, device_name)
+
+        log.debug("%s: %d connections added and %d updated in %.2f s",
+                  self.name, len(additions), len(updates), time.perf_counter() - start)
+
+    @staticmethod
+    def _is_dependent(connection):
+        """Does the connection depend on another connection?
+
+        Ports depend on their controllers and VLANs on their parent devices.
+        """
+        if connection.get_connection_type() == NM_CONNECTION_TYPE_VLAN:
+            return True
+
+        return bool(connection.get_setting_connection().get_controller())
+
     def _find_initramfs_connection_of_iface(self, nm_client, iface):
         device = nm_client.get_device_by_iface(iface)
         if device:
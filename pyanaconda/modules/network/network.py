@@ -94,12 +94,20 @@ class NetworkService(KickstartService):
         self.capabilities_changed = Signal()
 
         self.connected_changed = Signal()
+
+        self.activated_interfaces_changed = Signal()
+        self._activated_interfaces = []
+        self._nm_watched_connections = set()
+
         # TODO fallback solution - use Gio/GNetworkMonitor ?
         self.nm_client = get_new_nm_client()
         if self.nm_client:
             self.nm_client.connect("notify::%s" % NM.CLIENT_STATE, self._nm_state_changed)
             initial_state = self.nm_client.get_state()
             self.set_connected(self._nm_state_connected(initial_state))
+            self.nm_client.connect("notify::%s" % NM.CLIENT_ACTIVE_CONNECTIONS,
+                                   self._nm_active_connections_changed)
+            self._nm_active_connections_changed()
             self.nm_client.connect("notify::%s" % NM.CLIENT_CAPABILITIES,
                                    self._nm_capabilities_changed)
             nm_capabilities = self.nm_client.get_capabilities()
@@ -374,6 +382,33 @@ class NetworkService(KickstartService):
         log.debug("NeworkManager state changed to %s", state)
         self.set_connected(self._nm_state_connected(state))
 
+    def _nm_active_connections_changed(self, *args):
+        """Watch states of the active connections."""
+        watched_connections = set()
+
+        for ac in self.nm_client.get_active_connections():
+            path = ac.get_path()
+
+            if path not in self._nm_watched_connections:
+                ac.connect("notify::%s" % NM.ACTIVE_CONNECTION_STATE,
+                           self._nm_activated_interfaces_changed)
+
+            watched_connections.add(path)
+
+        self._nm_watched_connections = watched_connections
+        self._nm_activated_interfaces_changed()
+
+    def _nm_activated_interfaces_changed(self, *args):
+        """Emit a signal if the activated interfaces have changed."""
+        interfaces = self.get_activated_interfaces()
+
+        if interfaces == self._activated_interfaces:
+            return
+
+        self._activated_interfaces = interfaces
+        log.debug("Activated interfaces changed to %s", interfaces)
+        self.activated_interfaces_changed.emit(interfaces)
+
     @property
     def disable_ipv6(self):
         """Disable IPv6 on target system."""
@@ -53,6 +53,9 @@ class NetworkInterface(KickstartModuleInterface):
         self.watch_property("Hostname", self.implementation.hostname_changed)
         self.implementation.current_hostname_changed.connect(self.CurrentHostnameChanged)
         self.watch_property("Connected", self.implementation.connected_changed)
+        self.implementation.activated_interfaces_changed.connect(
+            self.ActivatedInterfacesChanged
+        )
         self.implementation.configurations_changed.connect(self._device_configurations_changed)
         self.watch_property("Capabilities", self.implementation.capabilities_changed)
 
@@ -139,6 +142,14 @@ class NetworkInterface(KickstartModuleInterface):
         """
         return self.implementation.get_activated_interfaces()
 
+    @dbus_signal
+    def ActivatedInterfacesChanged(self, interfaces: List[Str]):
+        """Signal change of activated network interfaces.
+
+        :param interfaces: a list of names of devices having active network connection
+        """
+        pass
+
     def InstallNetworkWithTask(self, overwrite: Bool) -> ObjPath:
         """Install network with an installation task.
 
@@ -31,7 +31,12 @@ from pykickstart.constants import BIND_TO_MAC
 from pyanaconda.anaconda_loggers import get_module_logger
 from pyanaconda.core import util
 from pyanaconda.core.dbus import SystemBus
-from pyanaconda.core.glib import GError, create_new_context, sync_call_glib
+from pyanaconda.core.glib import (
+    GError,
+    create_new_context,
+    sync_call_glib,
+    sync_call_glib_many,
+)
 from pyanaconda.modules.network.config_file import is_config_file_for_system
 from pyanaconda.modules.network.constants import (
     CONNECTION_ADDING_TIMEOUT,
@@ -561,90 +566,125 @@ def create_connections_from_ksdata(nm_client, network_data, device_name, ifname_
     return connections
 
 
-def add_connection_from_ksdata(nm_client, network_data, device_name, activate=False,
-                               ifname_option_values=None):
-    """Add NM connection created from kickstart configuration.
+def activate_connection(nm_client, connection, device_name=None):
+    """Activate a connection asynchronously.
 
-    :param network_data: kickstart configuration
-    :type network_data: pykickstart NetworkData
-    :param device_name: name of the device to be configured by kickstart
+    :param nm_client: NetoworkManager client
+    :type nm_client: NM.NMClient
+    :param connection: connection to be activated
+    :type connection: NM.RemoteConnection
+    :param device_name: name of the device to activate the connection with
     :type device_name: str
-    :param activate: activate the added connection
-    :type activate: bool
-    :param ifname_option_values: list of ifname boot option values
-    :type ifname_option_values: list(str)
     """
-    connections = create_connections_from_ksdata(
-        nm_client,
-        network_data,
-        device_name,
-        ifname_option_values
-    )
+    device = None
 
-    for connection, dev_name in connections:
-        log.debug("add connection (activate=%s): %s for %s\n%s",
-                  activate, connection.get_uuid(), dev_name,
-                  connection.to_dbus(NM.ConnectionSerializationFlags.NO_SECRETS))
-        added_connection = add_connection_sync(
-            nm_client,
-            connection
+    if device_name:
+        device = nm_client.get_device_by_iface(device_name)
+        if device:
+            log.debug("activating %s with device %s", connection.get_uuid(), device_name)
+        else:
+            log.debug("activating %s without device specified - device %s not found",
+                      connection.get_uuid(), device_name)
+    else:
+        log.debug("activating %s without device specified", connection.get_uuid())
+
+    nm_client.activate_connection_async(connection, device, None, None)
+
+
+def _get_add_connection_call(nm_client, connection):
+    """Get the asynchronous call that adds a connection with blocked autoconnection.
+
+    :return: a tuple of the call, its finish method and its arguments
+    """
+    return (
+        nm_client.add_connection2,
+        nm_client.add_connection2_finish,
+        (
+            connection.to_dbus(NM.ConnectionSerializationFlags.ALL),
+            (NM.SettingsAddConnection2Flags.TO_DISK |
+             NM.SettingsAddConnection2Flags.BLOCK_AUTOCONNECT),
+            None,
+            False
         )
+    )
 
-        if not added_connection:
-            continue
 
-        if activate:
-            if dev_name:
-                device = nm_client.get_device_by_iface(dev_name)
-                if device:
-                    log.debug("activating with device %s", device.get_iface())
-                else:
-                    log.debug("activating without device specified - device %s not found",
-                              dev_name)
-            else:
-                device = None
-                log.debug("activating without device specified")
-            nm_client.activate_connection_async(added_connection, device, None, None)
+def _get_update_connection_call(connection, save_to_disk=True):
+    """Get the asynchronous call that commits changes with blocked autoconnection.
 
-    return connections
+    :return: a tuple of the call, its finish method and its arguments
+    """
+    flags = NM.SettingsUpdate2Flags.BLOCK_AUTOCONNECT
+    if save_to_disk:
+        flags |= NM.SettingsUpdate2Flags.TO_DISK
+    con2 = NM.SimpleConnection.new_clone(connection)
 
+    return (
+        connection.update2,
+        connection.update2_finish,
+        (
+            con2.to_dbus(NM.ConnectionSerializationFlags.ALL),
+            flags,
+            None
+        )
+    )
 
-def add_connection_sync(nm_client, connection):
-    """Add a connection synchronously.
 
-    Synchronous run is implemented by running a blocking GMainLoop with
-    GMainContext belonging to the nm_client created for the calling Task.
+def commit_connections_sync(nm_client, added_connections, updated_connections):
+    """Add and update connections concurrently.
+
+    The connections are added and their changes are committed with blocked
+    autoconnection. All the calls are issued at once and awaited together
+    with one timeout in a blocking GMainLoop with GMainContext belonging
+    to the nm_client created for the calling Task.
 
     :param nm_client: NetoworkManager client
     :type nm_client: NM.NMClient
-    :param connection: connection to be added
-    :type connection: NM.SimpleConnection
-    :return: added connection or None on timeout
-    :rtype: NM.RemoteConnection
+    :param added_connections: connections to be added
+    :type added_connections: list(NM.SimpleConnection)
+    :param updated_connections: connections with changes to be committed
+    :type updated_connections: list(NM.RemoteConnection)
+    :return: a tuple of added connections or None on failure and of results
+             of the updates, in the order of the given connections
+    :rtype: (list(NM.RemoteConnection), list(bool))
     """
-    result = sync_call_glib(
+    calls = [_get_add_connection_call(nm_client, c) for c in added_connections]
+    calls += [_get_update_connection_call(c) for c in updated_connections]
+
+    results = sync_call_glib_many(
         nm_client.get_main_context(),
-        nm_client.add_connection2,
-        nm_client.add_connection2_finish,
-        CONNECTION_ADDING_TIMEOUT,
-        connection.to_dbus(NM.ConnectionSerializationFlags.ALL),
-        (NM.SettingsAddConnection2Flags.TO_DISK |
-         NM.SettingsAddConnection2Flags.BLOCK_AUTOCONNECT),
-        None,
-        False
+        calls,
+        CONNECTION_ADDING_TIMEOUT
     )
 
-    if result.failed:
-        log.error("adding of a connection %s failed: %s",
-                  connection.get_uuid(),
-                  result.error_message)
-        return None
+    added_results = results[:len(added_connections)]
+    updated_results = results[len(added_connections):]
 
-    con, _res = result.received_data
-    log.debug("connection %s added:\n%s", connection.get_uuid(),
-              connection.to_dbus(NM.ConnectionSerializationFlags.NO_SECRETS))
+    added = []
+    updated = []
 
-    return con
+    for connection, result in zip(added_connections, added_results):
+        if result.failed:
+            log.error("adding of a connection %s failed: %s",
+                      connection.get_uuid(),
+                      result.error_message)
+            added.append(None)
+            continue
+
+        con, _res = result.received_data
+        log.debug("connection %s added:\n%s", connection.get_uuid(),
+                  connection.to_dbus(NM.ConnectionSerializationFlags.NO_SECRETS))
+        added.append(con)
+
+    for connection, result in zip(updated_connections, updated_results):
+        if result.failed:
+            log.error("comitting changes of connection %s failed: %s",
+                      connection.get_uuid(),
+                      result.error_message)
+
+        updated.append(result.succeeded)
+
+    return added, updated
 
 
 def create_port_connection(port_type, port_idx, port, controller, autoconnect, settings=None):
@@ -731,7 +771,7 @@ def bound_hwaddr_of_device(nm_client, device_name, ifname_option_values):
 
 
 def update_connection_from_ksdata(nm_client, connection, network_data, device_name,
-                                  ifname_option_values=None):
+                                  ifname_option_values=None, commit=True):
     """Update NM connection specified by uuid from kickstart configuration.
 
     :param connection: existing NetworkManager connection to be updated
@@ -742,6 +782,8 @@ def update_connection_from_ksdata(nm_client, connection, network_data, device_na
     :type device_name: str
     :param ifname_option_values: list of ifname boot option values
     :type ifname_option_values: list(str)
+    :param commit: commit the changes of the connection
+    :type commit: bool
     """
     log.debug("updating connection %s:\n%s", connection.get_uuid(),
               connection.to_dbus(NM.ConnectionSerializationFlags.NO_SECRETS))
@@ -770,7 +812,8 @@ def update_connection_from_ksdata(nm_client, connection, network_data, device_na
         else:
             bind_connection(nm_client, connection, network_data.bindto, device_name)
 
-    commit_changes_with_autoconnection_blocked(connection, nm_client)
+    if commit:
+        commit_changes_with_autoconnection_blocked(connection, nm_client)
 
     log.debug("updated connection %s:\n%s", connection.get_uuid(),
               connection.to_dbus(NM.ConnectionSerializationFlags.NO_SECRETS))
@@ -1106,19 +1149,17 @@ def commit_changes_with_autoconnection_blocked(connection, nm_client, save_to_di
     :return: on success result of the Update2() call, None of failure
     :rtype: GVariant of type "a{sv}" or None
     """
-    flags = NM.SettingsUpdate2Flags.BLOCK_AUTOCONNECT
-    if save_to_disk:
-        flags |= NM.SettingsUpdate2Flags.TO_DISK
-    con2 = NM.SimpleConnection.new_clone(connection)
+    async_call, async_call_finish, call_args = _get_update_connection_call(
+        connection,
+        save_to_disk
+    )
 
     result = sync_call_glib(
         nm_client.get_main_context(),
-        connection.update2,
-        connection.update2_finish,
+        async_call,
+        async_call_finish,
         CONNECTION_ADDING_TIMEOUT,
-        con2.to_dbus(NM.ConnectionSerializationFlags.ALL),
-        flags,
-        None
+        *call_args
     )
 
     if result.failed:
@@ -0,0 +1,41 @@
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 31 Milk Street #960789 Boston, MA
+# 02196 USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+from pyanaconda.modules.common.task import Task
+
+__all__ = ["PrepareDownloadLocationTaskBase"]
+
+
+class PrepareDownloadLocationTaskBase(Task):
+    """Base class for setting up the download location of a payload.
+
+    Payloads that are downloaded at the same time have to pick their
+    download locations one after another with a shared dictionary of
+    reserved space, so they don't count with the same free space.
+    """
+
+    def __init__(self):
+        """Create a new task."""
+        super().__init__()
+        self._reserved_space = None
+
+    def set_reserved_space(self, reserved_space):
+        """Share the reserved space with other download locations.
+
+        :param reserved_space: a dictionary of mount points and reserved sizes
+        """
+        self._reserved_space = reserved_space
@@ -198,14 +198,28 @@ def _get_biggest_mount_point(mount_points, sufficient):
     return max(sufficient, default=None, key=mount_points.get)
 
 
-def pick_download_location(download_size, install_size, cache_dir_suffix):
+def pick_download_location(download_size, install_size, cache_dir_suffix,
+                           reserved_space=None):
     """Pick a download location
 
-    :param dnf_manager: the DNF manager
+    If the dictionary of reserved space is specified, the space reserved
+    by previously picked download locations is not considered free, and
+    the space required by this download and installation is added to it.
+
+    :param download_size: the download size
+    :param install_size: the installation size
+    :param cache_dir_suffix: a name of the download directory
+    :param reserved_space: a dictionary of mount points and reserved sizes or None
     :return: a path to the download location
     """
     mount_points = get_free_space_map()
 
+    if reserved_space is not None:
+        mount_points = {
+            mount_point: max(size - reserved_space.get(mount_point, Size(0)), Size(0))
+            for mount_point, size in mount_points.items()
+        }
+
     # Try to find mount points that are sufficient for download and install.
     sufficient = _pick_mount_points(
         mount_points,
@@ -237,6 +251,11 @@ def pick_download_location(download_size, install_size, cache_dir_suffix):
     log.info("Mount point %s picked as download location", mount_point)
     location = join_paths(mount_point, cache_dir_suffix)
 
+    if reserved_space is not None:
+        # The packages are always installed to the system root.
+        for path, size in ((mount_point, download_size), (conf.target.system_root, install_size)):
+            reserved_space[path] = reserved_space.get(path, Size(0)) + size
+
     return location
 
 
@@ -17,6 +17,7 @@
 #
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from glob import glob
 
 from pyanaconda.anaconda_loggers import get_module_logger
@@ -27,7 +28,11 @@ from pyanaconda.modules.common.task import Task
 
 log = get_module_logger(__name__)
 
-__all__ = ["CopyDriverDisksFilesTask", "PrepareSystemForInstallationTask"]
+__all__ = [
+    "CopyDriverDisksFilesTask",
+    "PrepareSystemForInstallationTask",
+    "RunInParallelTask",
+]
 
 
 class PrepareSystemForInstallationTask(Task):
@@ -138,3 +143,71 @@ class CopyDriverDisksFilesTask(Task):
                 log.error("failed to copy driver disk files: %s", e.strerror)
                 # XXX TODO: real error handling, as this is probably going to
                 #           prevent boot on some systems
+
+
+class RunInParallelTask(Task):
+    """Run sequences of tasks at the same time.
+
+    Every sequence runs in its own thread and its tasks run one
+    after another. The sequences have to be independent. If one
+    of the sequences fails, the other ones are canceled and the
+    task fails with the first error once all of them are stopped.
+    """
+
+    def __init__(self, name, sequences):
+        """Create a new task.
+
+        :param name: a name of the task
+        :param sequences: a list of lists of tasks
+        """
+        super().__init__()
+        self._name = name
+        self._sequences = [list(tasks) for tasks in sequences if tasks]
+
+    @property
+    def name(self):
+        return self._name
+
+    def cancel(self):
+        """Cancel the task and all its subtasks."""
+        super().cancel()
+
+        for tasks in self._sequences:
+            for task in tasks:
+                task.cancel()
+
+    def run(self):
+        """Run the sequences of tasks."""
+        if not self._sequences:
+            return
+
+        failed = None
+
+        with ThreadPoolExecutor(max_workers=len(self._sequences)) as executor:
+            futures = [
+                executor.submit(self._run_sequence, tasks)
+                for tasks in self._sequences
+            ]
+
+            for future in as_completed(futures):
+                if future.exception():
+                    # Stop the remaining sequences.
+                    failed = future
+                    self.cancel()
+                    break
+
+        if failed:
+            failed.result()
+
+    def _run_sequence(self, tasks):
+        """Run the given tasks one after another."""
+        for task in tasks:
+            if self.check_cancel():
+                return
+
+            task.progress_changed_signal.connect(self._report_subtask_progress)
+            task.run_with_signals()
+
+    def _report_subtask_progress(self, step, message):
+        """Report a progress of a subtask."""
+        self.report_progress(message)
@@ -148,6 +148,7 @@ class DNFModule(PayloadBase):
 
     def _set_dnf_manager(self, dnf_manager):
         """Set the DNF manager of this payload."""
+        self._dnf_manager.cancel_package_prefetch()
         self._dnf_manager = dnf_manager
         log.debug("The DNF manager is set.")
 
@@ -384,8 +385,21 @@ class DNFModule(PayloadBase):
             selection=data,
         )
         task.succeeded_signal.connect(self._refresh_side_payload_selection)
+        task.succeeded_signal.connect(lambda: self._prefetch_packages(task.get_result()))
         return task
 
+    def _prefetch_packages(self, report):
+        """Start a speculative download of the validated selection.
+
+        :param ValidationReport report: a validation report of the selection
+        """
+        location = conf.payload.package_prefetch_location
+
+        if not location or not report.is_valid():
+            return
+
+        self.dnf_manager.start_package_prefetch(location)
+
     def calculate_required_space(self):
         """Calculate space required for the installation.
 
@@ -23,7 +23,9 @@ import re
 import shutil
 import tempfile
 import threading
+import time
 import traceback
+from functools import wraps
 
 import libdnf5
 from blivet.size import Size
@@ -34,6 +36,7 @@ from pyanaconda.core.constants import (
     DNF_DEFAULT_REPO_COST,
     DNF_DEFAULT_RETRIES,
     DNF_DEFAULT_TIMEOUT,
+    THREAD_PACKAGE_PREFETCH,
     URL_TYPE_BASEURL,
     URL_TYPE_METALINK,
     URL_TYPE_MIRRORLIST,
@@ -41,6 +44,7 @@ from pyanaconda.core.constants import (
 from pyanaconda.core.i18n import _
 from pyanaconda.core.path import join_paths
 from pyanaconda.core.payload import ProxyString, ProxyStringError
+from pyanaconda.core.threads import thread_manager
 from pyanaconda.modules.common.errors.installation import PayloadInstallationError
 from pyanaconda.modules.common.errors.payload import (
     UnknownCompsEnvironmentError,
@@ -55,7 +59,10 @@ from pyanaconda.modules.common.structures.packages import PackagesConfigurationD
 from pyanaconda.modules.common.structures.payload import RepoConfigurationData
 from pyanaconda.modules.common.structures.validation import ValidationReport
 from pyanaconda.modules.payloads.constants import DNF_REPO_DIRS
-from pyanaconda.modules.payloads.payload.dnf.download_progress import DownloadProgress
+from pyanaconda.modules.payloads.payload.dnf.download_progress import (
+    DownloadProgress,
+    DownloadTimer,
+)
 from pyanaconda.modules.payloads.payload.dnf.transaction_progress import (
     TransactionProgress,
     process_transaction_progress,
@@ -72,6 +79,12 @@ log = get_module_logger(__name__)
 DNF_CACHE_DIR = '/tmp/dnf.cache'
 DNF_PLUGINCONF_DIR = '/tmp/dnf.pluginconf'
 
+# The subdirectory of the prefetch location owned by the installer.
+DNF_PREFETCH_DIR = 'anaconda-prefetch'
+
+# The delay in seconds before the paused package prefetch is resumed.
+DNF_PREFETCH_RESUME_DELAY = 3
+
 # Bonus to required free space which depends on block size and
 # rpm database size estimation. Every file could be aligned to
 # fragment size so 4KiB * number_of_files should be a worst case
@@ -83,6 +96,39 @@ DNF_PLUGINCONF_DIR = '/tmp/dnf.pluginconf'
 #
 DNF_EXTRA_SIZE_PER_FILE = Size("6 KiB")
 
+# The maximal number of remembered resolutions of software selections.
+DNF_RESOLUTION_CACHE_SIZE = 4
+
+
+def pause_package_prefetch(method):
+    """Pause the package prefetch during the decorated method.
+
+    Use it only for methods that change the DNF base or its download
+    callbacks. The speculative download is stopped before the method
+    is called and resumed with a delay after all paused methods are
+    finished, if the transaction hasn't changed. Read-only queries
+    don't pause the download.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._prefetch_lock:
+            self._prefetch_pauses += 1
+            self._cancel_prefetch_resume()
+
+            if self._stop_package_prefetch():
+                self._prefetch_paused = True
+
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            with self._prefetch_lock:
+                self._prefetch_pauses -= 1
+
+                if not self._prefetch_pauses and self._prefetch_paused:
+                    self._schedule_prefetch_resume()
+
+    return wrapper
+
 
 class DNFManagerError(Exception):
     """General error for the DNF manager."""
@@ -115,6 +161,20 @@ class DNFManager:
         self._repositories_loaded = False
         self._query_environments = None
         self._query_groups = None
+        self._prefetch_location = None
+        self._prefetch_transaction = None
+        self._prefetch_cancelled = threading.Event()
+
+        # Serialize the access to the DNF base with the package prefetch.
+        self._prefetch_lock = threading.RLock()
+        self._prefetch_pauses = 0
+        self._prefetch_paused = False
+        self._prefetch_resume_timer = None
+        self._prefetch_completed = False
+        self._selection_specs = None
+        self._resolutions = {}
+        self._transaction_sizes = (None, None)
+        self._files_numbers = {}
 
     @property
     def _base(self):
@@ -173,6 +233,7 @@ class DNFManager:
         log.debug("The DNF base has been created.")
         return base
 
+    @pause_package_prefetch
     def setup_base(self):
         """Set up the DNF base system.
 
@@ -197,6 +258,7 @@ class DNFManager:
         * Reset all attributes of the DNF manager.
         * The new DNF base will be created on demand.
         """
+        self.cancel_package_prefetch()
         self.__base = None
         self.__goal = None
         self.__goal_skip_unavailable = None
@@ -209,8 +271,13 @@ class DNFManager:
         self._repositories_loaded = False
         self._query_environments = None
         self._query_groups = None
+        self._selection_specs = None
+        self._resolutions = {}
+        self._transaction_sizes = (None, None)
+        self._files_numbers = {}
         log.debug("The DNF base has been reset.")
 
+    @pause_package_prefetch
     def configure_base(self, data: PackagesConfigurationData):
         """Configure the DNF base.
 
@@ -419,6 +486,7 @@ class DNFManager:
         data.description = grp.get_translated_description() or ""
         return data
 
+    @pause_package_prefetch
     def configure_proxy(self, url):
         """Configure the proxy of the DNF base.
 
@@ -483,6 +551,7 @@ class DNFManager:
         variables = self._base.get_vars()
         return variables.substitute(text)
 
+    @pause_package_prefetch
     def configure_substitution(self, release_version):
         """Set up the substitution variables.
 
@@ -501,19 +570,10 @@ class DNFManager:
         :return: a space required by packages
         :rtype: an instance of Size
         """
-        packages_size = Size(0)
-        files_number = 0
-
         if self._transaction is None:
             return Size("3000 MiB")
 
-        for tspkg in self._transaction.get_transaction_packages():
-            # Get a package.
-            package = tspkg.get_package()
-            # Space taken by all files installed by the packages.
-            packages_size += package.get_install_size()
-            # Number of files installed on the system.
-            files_number += len(package.get_files())
+        _download_size, packages_size, files_number = self._get_transaction_sizes()
 
         # Calculate the files size depending on number of files.
         files_size = Size(files_number * DNF_EXTRA_SIZE_PER_FILE)
@@ -533,19 +593,63 @@ class DNFManager:
         if self._transaction is None:
             return Size(0)
 
+        download_size, _packages_size, _files_number = self._get_transaction_sizes()
+
+        # Get the total size. Reserve extra space.
+        total_space = download_size + Size("150 MiB")
+
+        log.info("Total download size: %s", total_space)
+        return total_space
+
+    def _get_transaction_sizes(self):
+        """Get sizes of the current transaction.
+
+        Collect the download size, the install size and the number
+        of files of all packages in one pass. The result is cached
+        for the current transaction.
+
+        :return: a tuple of the download size, the install size and the number of files
+        """
+        transaction, sizes = self._transaction_sizes
+
+        if transaction is self._transaction:
+            return sizes
+
         download_size = Size(0)
+        packages_size = Size(0)
+        files_number = 0
 
-        # Calculate the download size.
         for tspkg in self._transaction.get_transaction_packages():
+            # Get a package.
             package = tspkg.get_package()
+            # Space taken by the package download.
             download_size += package.get_download_size()
+            # Space taken by all files installed by the packages.
+            packages_size += package.get_install_size()
+            # Number of files installed on the system.
+            files_number += self._get_files_number(package)
 
-        # Get the total size. Reserve extra space.
-        total_space = download_size + Size("150 MiB")
+        sizes = (download_size, packages_size, files_number)
+        self._transaction_sizes = (self._transaction, sizes)
+        return sizes
 
-        log.info("Total download size: %s", total_space)
-        return total_space
+    def _get_files_number(self, package):
+        """Get a number of files installed by the package.
 
+        Building the list of files is expensive, so the numbers
+        are remembered for all transactions of the DNF base.
+
+        :param package: a DNF package
+        :return: a number of files
+        """
+        key = (package.get_nevra(), package.get_repo_id())
+
+        if key not in self._files_numbers:
+            self._files_numbers[key] = len(package.get_files())
+
+        return self._files_numbers[key]
+
+    @pause_package_prefetch
     def clear_cache(self):
         """Clear the DNF cache."""
         self.clear_selection()
@@ -589,6 +693,7 @@ class DNFManager:
 
         return [p.get_name() for p in query]
 
+    @pause_package_prefetch
     def apply_specs(self, include_list, exclude_list):
         """Mark packages, groups and modules for installation.
 
@@ -632,8 +737,72 @@ class DNFManager:
             self._goal.add_install(spec, settings)
             self._goal_skip_unavailable.add_install(spec, settings)
 
+        self._selection_specs = (
+            tuple(sorted(set(include_list))),
+            tuple(sorted(set(exclude_list))),
+        )
+
+    def _get_resolution_key(self):
+        """Get a key of the resolution of the current software selection.
+
+        The key identifies the applied specs, the configuration
+        of the DNF base and the state of enabled repositories.
+
+        :return: a hashable key or None
+        """
+        if self._selection_specs is None:
+            return None
+
+        config = self._base.get_config()
+
+        return (
+            self._selection_specs,
+            (
+                config.multilib_policy,
+                config.skip_unavailable,
+                config.skip_broken,
+                config.install_weak_deps,
+            ),
+            tuple(self.enabled_repositories),
+            tuple(sorted(self._md_hashes.items(), key=lambda i: i[0])),
+        )
+
+    def _invalidate_resolutions(self):
+        """Forget all remembered resolutions of software selections."""
+        if self._resolutions:
+            log.debug("Invalidating resolved software selections.")
+
+        self._resolutions = {}
+
+    @pause_package_prefetch
     def resolve_selection(self):
-        """Resolve the software selection."""
+        """Resolve the software selection.
+
+        The result is remembered, so the same selection of the same
+        repositories is not resolved again.
+        """
+        key = self._get_resolution_key()
+
+        if key is not None and key in self._resolutions:
+            log.debug("Reusing the resolved software selection.")
+            self._transaction, report = self._resolutions[key]
+            return ValidationReport.from_structure(ValidationReport.to_structure(report))
+
+        report = self._resolve_selection()
+
+        if key is not None:
+            while len(self._resolutions) >= DNF_RESOLUTION_CACHE_SIZE:
+                self._resolutions.pop(next(iter(self._resolutions)))
+
+            self._resolutions[key] = (
+                self._transaction,
+                ValidationReport.from_structure(ValidationReport.to_structure(report))
+            )
+
+        return report
+
+    def _resolve_selection(self):
+        """Resolve the software selection with DNF."""
         report = ValidationReport()
         messages = []
 
@@ -700,8 +869,10 @@ class DNFManager:
 
     def clear_selection(self):
         """Clear the software selection."""
+        self.cancel_package_prefetch()
         self.__goal = None
         self._transaction = None
+        self._selection_specs = None
         log.debug("The software selection has been cleared.")
 
     @property
@@ -709,6 +880,7 @@ class DNFManager:
         """The location for the package download."""
         return self._download_location
 
+    @pause_package_prefetch
     def set_download_location(self, path):
         """Set up the location for downloading the packages.
 
@@ -717,6 +889,7 @@ class DNFManager:
         self._base.get_config().destdir = path
         self._download_location = path
 
+    @pause_package_prefetch
     def download_packages(self, callback):
         """Download the packages.
 
@@ -747,6 +920,245 @@ class DNFManager:
             msg = "Failed to download the following packages: " + str(e)
             raise PayloadInstallationError(msg) from None
 
+    @property
+    def prefetch_location(self):
+        """The location of the speculative package download."""
+        return self._prefetch_location
+
+    def start_package_prefetch(self, location):
+        """Start a speculative download of the resolved packages.
+
+        The inbound packages of the current transaction are downloaded
+        in the background with a low priority into a dedicated
+        subdirectory of the given location. Packages of a previous
+        transaction that are not needed anymore are removed from the
+        subdirectory, the others are not downloaded again. Other content
+        of the location is never touched.
+
+        The download is canceled if the selection is changed.
+
+        :param location: a path to the prefetch directory
+        """
+        self.cancel_package_prefetch()
+        location = os.path.join(location, DNF_PREFETCH_DIR)
+
+        packages = self._get_download_packages()
+        download_size = self.get_download_size()
+
+        try:
+            os.makedirs(location, exist_ok=True)
+            self._remove_stale_packages(location, packages)
+            free_space = shutil.disk_usage(location).free
+        except OSError as e:
+            log.warning("Failed to prepare the prefetch location %s: %s", location, e)
+            return
+
+        if free_space < download_size:
+            log.info("Not enough space in %s to prefetch packages.", location)
+            return
+
+        with self._prefetch_lock:
+            self._prefetch_location = location
+            self._prefetch_transaction = self._transaction
+
+            if self._prefetch_pauses:
+                # Start the download after the paused methods.
+                self._prefetch_paused = True
+            else:
+                self._start_prefetch_thread()
+
+    def _start_prefetch_thread(self):
+        """Start the thread of the speculative package download."""
+        self._prefetch_cancelled.clear()
+        self._prefetch_completed = False
+
+        thread_manager.add_thread(
+            name=THREAD_PACKAGE_PREFETCH,
+            target=self._prefetch_packages,
+            args=(self._get_download_packages(), self._prefetch_location),
+            fatal=False
+        )
+
+    def _schedule_prefetch_resume(self):
+        """Resume the paused package prefetch later.
+
+        The resume is postponed, so a sequence of paused
+        methods doesn't restart the download after each one.
+        """
+        self._cancel_prefetch_resume()
+        self._prefetch_resume_timer = threading.Timer(
+            DNF_PREFETCH_RESUME_DELAY,
+            self._resume_paused_prefetch
+        )
+        self._prefetch_resume_timer.daemon = True
+        self._prefetch_resume_timer.start()
+
+    def _cancel_prefetch_resume(self):
+        """Cancel the scheduled resume of the package prefetch."""
+        if self._prefetch_resume_timer:
+            self._prefetch_resume_timer.cancel()
+            self._prefetch_resume_timer = None
+
+    def _resume_paused_prefetch(self):
+        """Resume the paused package prefetch if nothing uses the base."""
+        with self._prefetch_lock:
+            if self._prefetch_pauses or not self._prefetch_paused:
+                return
+
+            self._prefetch_resume_timer = None
+            self._prefetch_paused = False
+            self._resume_package_prefetch()
+
+    def _resume_package_prefetch(self):
+        """Resume the paused package prefetch of the current transaction."""
+        if not self._transaction or self._transaction is not self._prefetch_transaction:
+            return
+
+        if self._prefetch_completed or thread_manager.exists(THREAD_PACKAGE_PREFETCH):
+            return
+
+        log.debug("Resuming the package prefetch.")
+        self._start_prefetch_thread()
+
+    def _prefetch_packages(self, packages, location):
+        """Download the packages to the prefetch location.
+
+        The thread never fails, so that waiting for it doesn't
+        raise errors of the download in unrelated callers.
+
+        :param packages: a list of packages to download
+        :param location: a path to the prefetch directory
+        """
+        try:
+            self._download_prefetched_packages(packages, location)
+        except Exception:  # pylint: disable=broad-except
+            log.exception("The package prefetch has failed:")
+
+    def _download_prefetched_packages(self, packages, location):
+        """Download the packages to the prefetch location."""
+        try:
+            # Don't compete with the user interface.
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+        except OSError as e:
+            log.debug("Failed to lower the priority of the prefetch: %s", e)
+
+        progress = DownloadProgress(log.debug, self._prefetch_cancelled.is_set)
+        self._set_download_callbacks(progress)
+
+        # Continue with partially downloaded packages of the paused prefetch.
+        downloader = libdnf5.repo.PackageDownloader(self._base)
+        downloader.set_resume(True)
+
+        for package in packages:
+            downloader.add(package, location)
+
+        log.info("Prefetching %d packages to %s.", len(packages), location)
+
+        try:
+            downloader.download()
+        except (libdnf5.exception.Error, libdnf5.exception.NonLibdnf5Exception) as e:
+            if self._prefetch_cancelled.is_set():
+                log.info("The package prefetch has been canceled.")
+            else:
+                log.warning("Failed to prefetch packages: %s", e)
+
+            return
+
+        self._prefetch_completed = True
+        log.info("The package prefetch has been completed.")
+
+    def cancel_package_prefetch(self):
+        """Cancel the speculative package download.
+
+        Wait for the download to stop. Already downloaded
+        packages are kept in the prefetch location. The
+        download is not resumed.
+        """
+        with self._prefetch_lock:
+            self._prefetch_transaction = None
+            self._prefetch_paused = False
+            self._cancel_prefetch_resume()
+            self._stop_package_prefetch()
+
+    def _stop_package_prefetch(self):
+        """Stop the speculative package download and wait for it.
+
+        :return: True if a running download was stopped, otherwise False
+        """
+        if not thread_manager.exists(THREAD_PACKAGE_PREFETCH):
+            return False
+
+        log.debug("Stopping the package prefetch.")
+        self._prefetch_cancelled.set()
+        thread_manager.wait(THREAD_PACKAGE_PREFETCH)
+        return True
+
+    def collect_prefetched_packages(self, destination):
+        """Move prefetched packages to the download location.
+
+        Only packages of the current transaction are moved. Incomplete
+        packages will be downloaded again, because the downloaded
+        packages are always verified.
+
+        :param destination: a path to the download location
+        """
+        location = self._prefetch_location
+
+        if not location or not os.path.isdir(location):
+            return
+
+        self.cancel_package_prefetch()
+
+        packages = self._get_download_packages()
+        self._remove_stale_packages(location, packages)
+        os.makedirs(destination, exist_ok=True)
+
+        for file_name in self._get_package_files(location, packages):
+            shutil.move(
+                os.path.join(location, file_name),
+                os.path.join(destination, file_name)
+            )
+
+        log.info("Moved prefetched packages from %s to %s.", location, destination)
+
+    @staticmethod
+    def _get_package_files(location, packages=None):
+        """Get names of package files in the given directory.
+
+        Only regular files with the .rpm suffix are considered.
+
+        :param location: a path to the directory with packages
+        :param packages: a list of packages to match or None to match all
+        :return: a list of file names
+        """
+        file_names = None
+
+        if packages is not None:
+            file_names = {os.path.basename(p.get_location()) for p in packages}
+
+        return [
+            entry.name for entry in os.scandir(location)
+            if entry.name.endswith(".rpm")
+            and entry.is_file(follow_symlinks=False)
+            and (file_names is None or entry.name in file_names)
+        ]
+
+    @classmethod
+    def _remove_stale_packages(cls, location, packages):
+        """Remove package files that don't belong to the given packages.
+
+        :param location: a path to the directory with packages
+        :param packages: a list of packages
+        """
+        needed = set(cls._get_package_files(location, packages))
+
+        for file_name in cls._get_package_files(location):
+            if file_name in needed:
+                continue
+
+            log.debug("Removing the stale package %s.", file_name)
+            os.unlink(os.path.join(location, file_name))
+
     def _set_download_callbacks(self, callbacks):
         """Set up the download callbacks."""
         self._base.set_download_callbacks(
@@ -770,6 +1182,7 @@ class DNFManager:
             if libdnf5.base.transaction.transaction_item_action_is_inbound(tspkg.get_action())
         ]
 
+    @pause_package_prefetch
     def install_packages(self, callback, timeout=20):
         """Install the packages.
 
@@ -889,6 +1302,7 @@ class DNFManager:
         except (libdnf5.exception.Error, libdnf5.exception.NonLibdnf5Exception):
             raise UnknownRepositoryError(repo_id) from None
 
+    @pause_package_prefetch
     def add_repository(self, data: RepoConfigurationData):
         """Add a repository.
 
@@ -907,6 +1321,7 @@ class DNFManager:
                 # Reconfigure the existing repository.
                 repo = self._configure_repository(repositories.get(), data)
 
+        self._invalidate_resolutions()
         log.info("Added the '%s' repository: %s", repo.get_id(), repo)
 
     def _configure_repository(self, repo: libdnf5.repo.Repo, data: RepoConfigurationData):
@@ -1038,6 +1453,7 @@ class DNFManager:
 
         return "\n".join(lines)
 
+    @pause_package_prefetch
     def set_repository_enabled(self, repo_id, enabled):
         """Enable or disable the specified repository.
 
@@ -1058,6 +1474,9 @@ class DNFManager:
             repo.disable()
             log.info("The '%s' repository is disabled.", repo_id)
 
+        self._invalidate_resolutions()
+
+    @pause_package_prefetch
     def read_system_repositories(self):
         """Read the system repositories.
 
@@ -1090,6 +1509,7 @@ class DNFManager:
             for repo in repositories:
                 repo.disable()
 
+    @pause_package_prefetch
     def restore_system_repositories(self):
         """Restore the system repositories.
 
@@ -1104,6 +1524,7 @@ class DNFManager:
             except UnknownRepositoryError:
                 log.debug("There is no '%s' repository to enable.", repo_id)
 
+    @pause_package_prefetch
     def load_repositories(self):
         """Load all enabled repositories.
 
@@ -1111,8 +1532,13 @@ class DNFManager:
         process their metadata. It will update the cache that provides
         information about available packages, modules, groups and environments.
 
+        If the persistent metadata cache is configured, reuse metadata of
+        repositories that haven't changed since they were cached.
+
         Can be called only once per each RepoSack.
         """
+        self._restore_metadata_cache()
+
         repo_sack = self._base.get_repo_sack()
         try:
             repo_sack.load_repos(False)
@@ -1120,12 +1546,118 @@ class DNFManager:
             log.warning(str(e))
             raise MetadataError(str(e)) from None
         self._repositories_loaded = True
+        self._invalidate_resolutions()
         log.info("Loaded repositories.")
 
+        self._store_metadata_cache()
+
+    @staticmethod
+    def _get_metadata_cache_dir(repo_id, md_hash):
+        """Get a directory with cached metadata of a repository.
+
+        :param str repo_id: an identifier of a repository
+        :param bytes md_hash: a hash of the repomd.xml file
+        :return: a path to the directory
+        """
+        return os.path.join(
+            conf.payload.dnf_metadata_cache,
+            "{}-{}".format(repo_id, md_hash.hex())
+        )
+
+    def _restore_metadata_cache(self):
+        """Restore metadata of enabled repositories from the persistent cache.
+
+        Copy cached metadata and solv files of repositories with a known
+        repomd.xml file to the DNF cache, so DNF doesn't have to download
+        and parse them again.
+        """
+        if not conf.payload.dnf_metadata_cache:
+            return
+
+        repositories = libdnf5.repo.RepoQuery(self._base)
+        repositories.filter_enabled(True)
+        contents = self._get_repomd_contents(repositories)
+
+        for repo in repositories:
+            repo_id = repo.get_id()
+            content = contents[repo_id]
+
+            if not content:
+                continue
+
+            cache_dir = self._get_metadata_cache_dir(repo_id, calculate_hash(content))
+
+            if not os.path.isdir(cache_dir):
+                log.debug("No cached metadata of the '%s' repository.", repo_id)
+                continue
+
+            try:
+                shutil.copytree(cache_dir, repo.get_cachedir(), dirs_exist_ok=True)
+            except OSError as e:
+                log.warning("Failed to restore cached metadata of the '%s' repository: %s",
+                            repo_id, e)
+                shutil.rmtree(repo.get_cachedir(), ignore_errors=True)
+                continue
+
+            log.debug("Restored cached metadata of the '%s' repository from %s.",
+                      repo_id, cache_dir)
+
+    def _store_metadata_cache(self):
+        """Store metadata of enabled repositories in the persistent cache.
+
+        The metadata are stored by the hash of the loaded repomd.xml file.
+        The directory is created atomically, so the cache can be shared.
+        """
+        if not conf.payload.dnf_metadata_cache:
+            return
+
+        repositories = libdnf5.repo.RepoQuery(self._base)
+        repositories.filter_enabled(True)
+
+        for repo in repositories:
+            repo_id = repo.get_id()
+            repomd_path = os.path.join(repo.get_cachedir(), "repodata", "repomd.xml")
+
+            if not os.path.exists(repomd_path):
+                continue
+
+            with open(repomd_path, encoding="utf-8") as f:
+                cache_dir = self._get_metadata_cache_dir(repo_id, calculate_hash(f.read()))
+
+            if os.path.isdir(cache_dir):
+                continue
+
+            tmp_dir = None
+
+            try:
+                os.makedirs(conf.payload.dnf_metadata_cache, exist_ok=True)
+                tmp_dir = tempfile.mkdtemp(
+                    prefix=".{}-".format(repo_id),
+                    dir=conf.payload.dnf_metadata_cache
+                )
+                shutil.copytree(
+                    repo.get_cachedir(), tmp_dir,
+                    ignore=shutil.ignore_patterns("packages"),
+                    dirs_exist_ok=True
+                )
+                os.rename(tmp_dir, cache_dir)
+            except OSError as e:
+                # Another installation might have stored the same metadata.
+                log.debug("Failed to store metadata of the '%s' repository: %s", repo_id, e)
+
+                if tmp_dir:
+                    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+                continue
+
+            log.debug("Stored metadata of the '%s' repository in %s.", repo_id, cache_dir)
+
+    @pause_package_prefetch
     def load_repomd_hashes(self):
         """Load a hash of the repomd.xml file for each enabled repository."""
         self._md_hashes = self._get_repomd_hashes()
 
+    @pause_package_prefetch
     def verify_repomd_hashes(self):
         """Verify a hash of the repomd.xml file for each enabled repository.
 
@@ -1146,30 +1678,93 @@ class DNFManager:
         repositories.filter_enabled(True)
         md_hashes = {}
 
-        for repo in repositories:
-            content = self._get_repomd_content(repo)
+        for repo_id, content in self._get_repomd_contents(repositories).items():
             md_hash = calculate_hash(content) if content else None
-            md_hashes[repo.get_id()] = md_hash
+            md_hashes[repo_id] = md_hash
 
         log.debug("Loaded repomd.xml hashes: %s", md_hashes)
         return md_hashes
 
-    def _get_repomd_content(self, repo):
-        """Get a content of a repomd.xml file.
+    def _get_repomd_contents(self, repositories):
+        """Get contents of repomd.xml files.
 
-        :param repo: a DNF repo
-        :return: a content of the repomd.xml file
+        Download the repomd.xml files of all repositories at once,
+        so they are fetched in parallel and connections to the same
+        hosts are reused. If a download fails, try the next base URL
+        of the repository in the next round. The duration of every
+        download is logged per repository and base URL.
+
+        :param repositories: a list of DNF repos
+        :return: a dictionary of repo ids and contents of repomd.xml files
         """
-        for baseurl in repo.get_config().baseurl:
-            repomd_file = tempfile.NamedTemporaryFile(prefix="repomd-", delete=True, delete_on_close=False)
-            downloader = libdnf5.repo.FileDownloader(self._base)
-            downloader.add(repo, os.path.join(baseurl, "repodata/repomd.xml"), repomd_file.name)
-            try:
-                downloader.download()
-            except (libdnf5.exception.Error, libdnf5.exception.NonLibdnf5Exception) as e:
-                log.debug("Can't download repomd.xml: %s", str(e))
-                continue
-            with open(repomd_file.name, encoding="utf-8") as f:
-                return f.read()
+        contents = {}
+        pending = []
+
+        for repo in repositories:
+            contents[repo.get_id()] = ""
+            pending.append((repo, list(repo.get_config().baseurl)))
+
+        with tempfile.TemporaryDirectory(prefix="repomd-") as download_dir:
+            downloaded = 0
+
+            while pending:
+                downloads = []
+                downloader = libdnf5.repo.FileDownloader(self._base)
+                downloader.set_fail_fast(False)
+
+                for repo, baseurls in pending:
+                    if not baseurls:
+                        continue
+
+                    url = os.path.join(baseurls.pop(0), "repodata/repomd.xml")
+                    path = os.path.join(download_dir, str(downloaded))
+                    downloader.add(repo, url, path)
+                    downloads.append((repo, baseurls, url, path))
+                    downloaded += 1
+
+                if not downloads:
+                    break
+
+                timer = DownloadTimer()
+                self._set_download_callbacks(timer)
+                start = time.monotonic()
 
-        return ""
+                try:
+                    downloader.download()
+                except (libdnf5.exception.Error, libdnf5.exception.NonLibdnf5Exception) as e:
+                    log.debug("Can't download some of the repomd.xml files: %s", str(e))
+
+                elapsed = time.monotonic() - start
+                log.debug("Downloaded %s repomd.xml files in %.2f s.", len(downloads), elapsed)
+
+                pending = []
+
+                for repo, baseurls, url, path in downloads:
+                    content = self._read_repomd_file(path)
+                    duration = timer.durations.get(url, elapsed)
+
+                    if not content:
+                        log.debug("Can't download %s of the '%s' repository (%.2f s).",
+                                  url, repo.get_id(), duration)
+                        pending.append((repo, baseurls))
+                        continue
+
+                    log.debug("Downloaded %s of the '%s' repository in %.2f s.",
+                              url, repo.get_id(), duration)
+
+                    contents[repo.get_id()] = content
+
+        return contents
+
+    @staticmethod
+    def _read_repomd_file(path):
+        """Read a downloaded repomd.xml file.
+
+        :param path: a path to the file
+        :return: a content of the file or an empty string
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                return f.read()
+        except (OSError, UnicodeDecodeError):
+            return ""
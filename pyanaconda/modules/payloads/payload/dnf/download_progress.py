@@ -25,7 +25,10 @@ from pyanaconda.core.i18n import _
 
 log = get_module_logger(__name__)
 
-__all__ = ["DownloadProgress"]
+__all__ = ["DownloadProgress", "DownloadTimer"]
+
+# Abort the whole download (LR_CB_ABORT of librepo).
+DOWNLOAD_ABORT = 1
 
 
 def paced(fn):
@@ -42,13 +45,15 @@ def paced(fn):
 class DownloadProgress(libdnf5.repo.DownloadCallbacks):
     """The class for receiving information about an ongoing download."""
 
-    def __init__(self, callback):
+    def __init__(self, callback, check_cancel=None):
         """Create a new instance.
 
         :param callback: a progress reporting callback
+        :param check_cancel: a function that returns True to abort the download
         """
         super().__init__()
         self.callback = callback
+        self.check_cancel = check_cancel
         self.user_cb_data_container = []  # Hold references to user_cb_data
         self.last_time = time.time()  # Used to pace _report_progress
         self.total_files = 0
@@ -81,10 +86,13 @@ class DownloadProgress(libdnf5.repo.DownloadCallbacks):
         nevra = self.user_cb_data_container[user_cb_data]
         self.downloads[nevra] = downloaded
 
+        if self.check_cancel and self.check_cancel():
+            return DOWNLOAD_ABORT
+
         if total_to_download > 0:
             self._report_progress()
 
-        return 0  # Not used, but int is expected to be returned.
+        return 0
 
     def end(self, user_cb_data, status, msg):
         """End of download callback.
@@ -124,3 +132,35 @@ class DownloadProgress(libdnf5.repo.DownloadCallbacks):
         )
 
         self.callback(msg)
+
+
+class DownloadTimer(libdnf5.repo.DownloadCallbacks):
+    """The class for measuring durations of individual downloads."""
+
+    def __init__(self):
+        """Create a new instance."""
+        super().__init__()
+        self.user_cb_data_container = []  # Hold descriptions and start times
+        self.durations = {}  # Hold durations of finished downloads in seconds
+
+    def add_new_download(self, user_data, description, total_to_download):
+        """Notify the client that a new download has been created.
+
+        :param user_data: user data entered together with a file to download
+        :param str description: a message describing the file
+        :param float total_to_download: a total number of bytes to download
+        :return: associated user data for the new download
+        """
+        self.user_cb_data_container.append((description, time.monotonic()))
+        return len(self.user_cb_data_container) - 1
+
+    def end(self, user_cb_data, status, msg):
+        """End of download callback.
+
+        :param user_cb_data: associated user data obtained from add_new_download
+        :param status: the transfer status
+        :param msg: the error message in case of error
+        """
+        description, start = self.user_cb_data_container[user_cb_data]
+        self.durations[description] = time.monotonic() - start
+        return 0  # Not used, but int is expected to be returned.
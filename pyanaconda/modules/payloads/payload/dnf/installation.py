@@ -36,6 +36,7 @@ from pyanaconda.modules.common.errors.installation import (
 )
 from pyanaconda.modules.common.structures.packages import PackagesConfigurationData
 from pyanaconda.modules.common.task import Task
+from pyanaconda.modules.payloads.base.installation import PrepareDownloadLocationTaskBase
 from pyanaconda.modules.payloads.base.utils import pick_download_location
 from pyanaconda.modules.payloads.payload.dnf.requirements import (
     apply_requirements,
@@ -173,7 +174,7 @@ class ResolvePackagesTask(CheckPackagesSelectionTask):
         apply_requirements(self._requirements, self._include_list, self._exclude_list)
 
 
-class PrepareDownloadLocationTask(Task):
+class PrepareDownloadLocationTask(PrepareDownloadLocationTaskBase):
     """The installation task for setting up the download location."""
 
     def __init__(self, dnf_manager):
@@ -195,13 +196,15 @@ class PrepareDownloadLocationTask(Task):
         """
         path = pick_download_location(self._dnf_manager.get_download_size(),
                                       self._dnf_manager.get_installation_size(),
-                                      DNF_PACKAGE_CACHE_DIR_SUFFIX)
+                                      DNF_PACKAGE_CACHE_DIR_SUFFIX,
+                                      reserved_space=self._reserved_space)
 
         if os.path.exists(path):
             log.info("Removing existing package download location: %s", path)
             shutil.rmtree(path)
 
         self._dnf_manager.set_download_location(path)
+        self._dnf_manager.collect_prefetched_packages(path)
         return path
 
 
@@ -15,6 +15,9 @@
 # License and may only be used or replicated with the express permission of
 # Red Hat, Inc.
 #
+import time
+from queue import Empty
+
 import libdnf5
 
 from pyanaconda.anaconda_loggers import get_module_logger
@@ -25,35 +28,69 @@ log = get_module_logger(__name__)
 
 __all__ = ["TransactionProgress", "process_transaction_progress"]
 
+# The minimal time between two progress reports in seconds.
+TRANSACTION_PROGRESS_INTERVAL = 0.5
+
+# The number of the slowest steps of the transaction to log.
+TRANSACTION_TIMINGS_LIMIT = 10
+
 
-def process_transaction_progress(queue, callback):
+def process_transaction_progress(queue, callback, interval=TRANSACTION_PROGRESS_INTERVAL):
     """Process the transaction progress.
 
     When the installation works correctly it will end by 'quit' token.
 
+    The progress is reported at most once per the given interval.
+    Only the latest message is reported, the older messages of the
+    same interval are dropped.
+
     :param queue: a process shared queue
     :param callback: a callback for progress reporting
+    :param interval: the minimal time between two reports in seconds
     :raise PayloadInstallationError: if the transaction fails
     """
-    (token, msg) = queue.get()
-
-    while token:
-        if token == 'install':
-            callback(_("Installing {}").format(msg))
+    pending = None
+    reported = None
+
+    while True:
+        timeout = None
+
+        if pending is not None:
+            timeout = max(0, reported + interval - time.monotonic())
+
+        try:
+            (token, msg) = queue.get(timeout=timeout)
+        except Empty:
+            callback(pending)
+            pending, reported = None, time.monotonic()
+            continue
+
+        if not token:
+            break
+        elif token == 'install':
+            pending = _("Installing {}").format(msg)
         elif token == 'configure':
-            callback(_("Configuring {}").format(msg))
+            pending = _("Configuring {}").format(msg)
         elif token == 'log':
             log.info(msg)
         elif token == 'post':
-            callback(_("Performing post-installation setup tasks"))
+            pending = _("Performing post-installation setup tasks")
         elif token == 'quit':
+            if pending is not None:
+                callback(pending)
+
             log.info(msg)
             break  # Installation finished successfully
         elif token == 'error':
             log.error(msg)
             raise PayloadInstallationError("An error occurred during the transaction: " + msg)
 
-        (token, msg) = queue.get()
+        if pending is None:
+            continue
+
+        if reported is None or time.monotonic() - reported >= interval:
+            callback(pending)
+            pending, reported = None, time.monotonic()
 
 
 class TransactionProgress(libdnf5.rpm.TransactionCallbacks):
@@ -68,6 +105,8 @@ class TransactionProgress(libdnf5.rpm.TransactionCallbacks):
         self._queue = queue
         self.installed_amount = 0
         self.installed_total = 0
+        self._started = {}
+        self._timings = []
 
     def before_begin(self, total):
         self.installed_total = total
@@ -77,6 +116,7 @@ class TransactionProgress(libdnf5.rpm.TransactionCallbacks):
         package = item.get_package()
         log.debug("Installing - %s", package.to_string())
         self.installed_amount += 1
+        self._start_timing(("Installing", package.to_string()))
         self._queue.put((
             'install',
             "{name}.{arch} ({amount}/{total})".format(
@@ -87,9 +127,12 @@ class TransactionProgress(libdnf5.rpm.TransactionCallbacks):
             )
         ))
 
+    def install_stop(self, item, amount, total):
+        self._stop_timing(("Installing", item.get_package().to_string()))
+
     def verify_progress(self, amount, total):
+        # The progress of the verification is not reported.
         log.debug("Verify %s/%s", amount, total)
-        self._queue.put(('verify', 'packages'))
 
     def script_start(self, item, nevra, type):  # pylint: disable=redefined-builtin
         log.debug(
@@ -101,8 +144,47 @@ class TransactionProgress(libdnf5.rpm.TransactionCallbacks):
             libdnf5.rpm.to_full_nevra_string(nevra),
             libdnf5.rpm.TransactionCallbacks.script_type_to_string(type)
         )
+        self._start_timing(self._get_script_key(nevra, type))
         self._queue.put(('configure', "%s.%s" % (nevra.get_name(), nevra.get_arch())))
 
+    def script_stop(self, item, nevra, type, return_code):  # pylint: disable=redefined-builtin
+        self._stop_timing(self._get_script_key(nevra, type))
+
+    @staticmethod
+    def _get_script_key(nevra, type):  # pylint: disable=redefined-builtin
+        """Get a key of the timing of the given script."""
+        return (
+            "Running {}".format(libdnf5.rpm.TransactionCallbacks.script_type_to_string(type)),
+            libdnf5.rpm.to_full_nevra_string(nevra)
+        )
+
+    def _start_timing(self, key):
+        """Start to measure the duration of a step of the transaction."""
+        self._started[key] = time.monotonic()
+
+    def _stop_timing(self, key):
+        """Stop to measure the duration of a step of the transaction."""
+        started = self._started.pop(key, None)
+
+        if started is not None:
+            self._timings.append((time.monotonic() - started, key))
+
+    def _report_timings(self):
+        """Report the slowest steps of the transaction."""
+        if not self._timings:
+            return
+
+        timings = sorted(self._timings, key=lambda t: t[0], reverse=True)
+        lines = [
+            "{} {}: {:.2f} s".format(action, nevra, duration)
+            for duration, (action, nevra) in timings[:TRANSACTION_TIMINGS_LIMIT]
+        ]
+
+        self._queue.put((
+            'log',
+            "The slowest steps of the transaction:\n" + "\n".join(lines)
+        ))
+
     def after_complete(self, success):
         log.debug("Done - %s", success)
         self._queue.put(('done', None))
@@ -140,5 +222,6 @@ class TransactionProgress(libdnf5.rpm.TransactionCallbacks):
 
         :param message: the reason why the transaction ended
         """
+        self._report_timings()
         self._queue.put(('quit', message))
         self._queue.close()
@@ -23,3 +23,7 @@ FLATPAK_IMAGE_LAYOUT_VERSION = "1.0.0"
 FLATPAK_MEDIA_TYPE = "application/vnd.oci.image.manifest.v1+json"
 
 FLATPAK_REGISTRY_URL_PATTERN = "{}/index/static?label:org.flatpak.ref:exists=1&architecture={}&tag={}"
+
+# Download of blobs from static sources.
+FLATPAK_DOWNLOAD_WORKERS = 4
+FLATPAK_BLOB_CHUNK_SIZE = 64 * 1024  # in bytes
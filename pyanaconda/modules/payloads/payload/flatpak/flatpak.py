@@ -128,8 +128,8 @@ class FlatpakModule(PayloadBase):
         """Refresh size requirement with task."""
         return CalculateFlatpaksSizeTask(flatpak_manager=self._flatpak_manager)
 
-    def install_with_tasks(self):
-        """Install the payload with tasks."""
+    def download_with_tasks(self):
+        """Download the payload with tasks."""
 
         tasks = [
             PrepareDownloadLocationTask(
@@ -138,6 +138,14 @@ class FlatpakModule(PayloadBase):
             DownloadFlatpaksTask(
                 flatpak_manager=self._flatpak_manager,
             ),
+        ]
+
+        return tasks
+
+    def install_with_tasks(self):
+        """Install the payload with tasks."""
+
+        tasks = [
             InstallFlatpaksTask(
                 flatpak_manager=self._flatpak_manager,
             ),
@@ -21,6 +21,7 @@ import shutil
 
 from pyanaconda.anaconda_loggers import get_module_logger
 from pyanaconda.modules.common.task import Task
+from pyanaconda.modules.payloads.base.installation import PrepareDownloadLocationTaskBase
 from pyanaconda.modules.payloads.base.utils import pick_download_location
 from pyanaconda.modules.payloads.payload.flatpak.flatpak_manager import FlatpakManager
 
@@ -29,7 +30,7 @@ log = get_module_logger(__name__)
 FLATPAK_MIRROR_DIR_SUFFIX = 'flatpak.mirror'
 
 
-class PrepareDownloadLocationTask(Task):
+class PrepareDownloadLocationTask(PrepareDownloadLocationTaskBase):
     """The installation task for setting up the download location."""
 
     def __init__(self, flatpak_manager: FlatpakManager):
@@ -54,7 +55,8 @@ class PrepareDownloadLocationTask(Task):
 
         path = pick_download_location(self._flatpak_manager.download_size,
                                       self._flatpak_manager.install_size,
-                                      FLATPAK_MIRROR_DIR_SUFFIX)
+                                      FLATPAK_MIRROR_DIR_SUFFIX,
+                                      reserved_space=self._reserved_space)
 
         if os.path.exists(path):
             log.info("Removing existing Flatpak download location: %s", path)
@@ -18,9 +18,13 @@
 # Red Hat, Inc.
 #
 
+import hashlib
 import json
 import os
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser, NoSectionError
 from contextlib import contextmanager
 from functools import cached_property
@@ -31,6 +35,7 @@ from urllib.parse import urljoin, urlparse
 import requests
 
 from pyanaconda.anaconda_loggers import get_module_logger
+from pyanaconda.core.configuration.anaconda import conf
 from pyanaconda.core.i18n import _
 from pyanaconda.core.util import requests_session
 from pyanaconda.modules.common.errors.payload import SourceSetupError
@@ -38,6 +43,8 @@ from pyanaconda.modules.common.structures.payload import RepoConfigurationData
 from pyanaconda.modules.common.task.progress import ProgressReporter
 from pyanaconda.modules.payloads.base.utils import get_downloader_for_repo_configuration
 from pyanaconda.modules.payloads.payload.flatpak.constants import (
+    FLATPAK_BLOB_CHUNK_SIZE,
+    FLATPAK_DOWNLOAD_WORKERS,
     FLATPAK_IMAGE_LAYOUT_VERSION,
     FLATPAK_MEDIA_TYPE,
     FLATPAK_REGISTRY_URL_PATTERN,
@@ -245,7 +252,6 @@ class FlatpakStaticSource(FlatpakSource):
         log.debug("Total: download %d, installed %d", download_size, installed_size)
         return download_size, installed_size
 
-    # TODO: To cover this code with unit tests we need to refactor the downloader out of the code
     def download(self, refs, download_location, progress=None):
         if self._is_local:
             return "oci:" + self._url.removeprefix("file://")
@@ -258,27 +264,36 @@ class FlatpakStaticSource(FlatpakSource):
             "manifests": []
         }
 
+        # Images of the same source often share layers, so every blob
+        # is downloaded only once.
+        layers = {}
+
+        for image in self._images:
+            if image.ref not in expanded_refs:
+                continue
+
+            # Expanded refs have all the refs we need for the installation (including runtimes)
+            log.debug("Downloading %s, %s bytes", image.ref, image.download_size)
+
+            manifest_len = self._write_blob(collection_location, image.digest)
+            self._write_blob(collection_location, image.manifest_json["config"]["digest"])
+            index_json["manifests"].append({
+                "mediaType": FLATPAK_MEDIA_TYPE,
+                "digest": image.digest,
+                "size": manifest_len
+            })
+
+            for layer in image.manifest_json["layers"]:
+                layers.setdefault(layer["digest"], image.ref)
+
         with self._downloader() as downloader:
-            for image in self._images:
-                if image.ref in expanded_refs:
-                    # Expanded refs have all the refs we need for the installation (including runtimes)
-                    log.debug("Downloading %s, %s bytes", image.ref, image.download_size)
-                    if progress:
-                        progress.report_progress(_("Downloading {}").format(image.ref))
-
-                    manifest_len = self._download_blob(downloader, collection_location, image.digest)
-                    self._download_blob(downloader,
-                                        collection_location, image.manifest_json["config"]["digest"])
-                    index_json["manifests"].append({
-                        "mediaType": FLATPAK_MEDIA_TYPE,
-                        "digest": image.digest,
-                        "size": manifest_len
-                    })
-
-                    for layer in image.manifest_json["layers"]:
-                        self._download_blob(downloader,
-                                            collection_location, layer["digest"],
-                                            stream=True)
+            def download_layer(digest):
+                if progress:
+                    progress.report_progress(_("Downloading {}").format(layers[digest]))
+
+                self._download_blob(downloader, collection_location, digest)
+
+            self._run_in_parallel(download_layer, layers)
 
         os.makedirs(collection_location, exist_ok=True)
         with open(os.path.join(collection_location, "index.json"), "w") as f:
@@ -293,8 +308,6 @@ class FlatpakStaticSource(FlatpakSource):
 
     @cached_property
     def _images(self) -> List[StaticSourceImage]:
-        result = []
-
         with self._downloader() as downloader:
             url = self._url + "/index.json"
             response = downloader(url)
@@ -303,55 +316,207 @@ class FlatpakStaticSource(FlatpakSource):
             response.raise_for_status()
             index_json = response.json()
 
-            for manifest in index_json.get("manifests", ()):
-                if manifest.get("mediaType") == FLATPAK_MEDIA_TYPE:
-                    digest = manifest["digest"]
-                    manifest_json = self._get_json(downloader, manifest["digest"])
-                    config_json = self._get_json(downloader, manifest_json["config"]["digest"])
-                    result.append(StaticSourceImage(digest, manifest_json, config_json))
+            digests = [
+                manifest["digest"] for manifest in index_json.get("manifests", ())
+                if manifest.get("mediaType") == FLATPAK_MEDIA_TYPE
+            ]
 
-        return result
+            manifests = self._run_in_parallel(
+                lambda digest: self._get_json(downloader, digest),
+                digests
+            )
+            configs = self._run_in_parallel(
+                lambda manifest_json: self._get_json(downloader, manifest_json["config"]["digest"]),
+                manifests
+            )
+
+        return [
+            StaticSourceImage(digest, manifest_json, config_json)
+            for digest, manifest_json, config_json in zip(digests, manifests, configs)
+        ]
+
+    @staticmethod
+    def _run_in_parallel(function, items):
+        """Call the function for every item with a bounded number of workers.
+
+        :param function: a function that takes one item
+        :param items: an iterable of items
+        :return: a list of results in the order of the items
+        """
+        items = list(items)
+
+        if len(items) <= 1:
+            return [function(item) for item in items]
+
+        workers = min(FLATPAK_DOWNLOAD_WORKERS, len(items))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(function, items))
 
     def _blob_url(self, digest):
+        return self._url + "/blobs/sha256/" + self._get_blob_hash(digest)
+
+    @staticmethod
+    def _get_blob_hash(digest):
+        """Get the hexadecimal sha256 hash of the blob from its digest."""
         if not digest.startswith("sha256:"):
             raise RuntimeError("Only SHA-256 digests are supported")
-        return self._url + "/blobs/sha256/" + digest[7:]
+
+        return digest[7:]
+
+    @staticmethod
+    def _check_blob_hash(digest, checksum):
+        """Check the calculated sha256 hash of the blob.
+
+        :param digest: the expected digest of the blob
+        :param checksum: a hashlib object with the content of the blob
+        :raise: SourceSetupError if the hash doesn't match
+        """
+        if checksum.hexdigest() != FlatpakStaticSource._get_blob_hash(digest):
+            raise SourceSetupError(
+                "The Flatpak blob {} has an invalid checksum.".format(digest)
+            )
+
+    @property
+    def _blob_cache_dir(self):
+        """Directory of the on-disk cache of blobs, or None if disabled."""
+        cache_dir = conf.payload.flatpak_blob_cache
+
+        if not cache_dir:
+            return None
+
+        return os.path.join(cache_dir, "sha256")
+
+    def _get_cached_blob_path(self, digest):
+        """Get a path of the blob in the on-disk cache.
+
+        :return: a path to an existing file or None
+        """
+        cache_dir = self._blob_cache_dir
+
+        if not cache_dir:
+            return None
+
+        path = os.path.join(cache_dir, self._get_blob_hash(digest))
+
+        if not os.path.isfile(path):
+            return None
+
+        log.debug("Using the cached Flatpak blob %s.", digest)
+        return path
 
     def _get_blob(self, downloader, digest) -> bytes:
         result = self._cached_blobs.get(digest)
         if result:
             return result
 
-        response = downloader(self._blob_url(digest))
-        response.raise_for_status()
+        path = self._get_cached_blob_path(digest)
+
+        if path:
+            with open(path, "rb") as f:
+                result = f.read()
+        else:
+            response = downloader(self._blob_url(digest))
+            response.raise_for_status()
+            result = response.content
 
-        self._cached_blobs[digest] = result = response.content
+            self._check_blob_hash(digest, hashlib.sha256(result))
+            self._store_blob(digest, result)
+
+        self._cached_blobs[digest] = result
         return result
 
-    def _download_blob(self, downloader, download_location, digest, stream=False):
-        if not digest.startswith("sha256:"):
-            raise RuntimeError("Only SHA-256 digests are supported")
+    def _store_blob(self, digest, blob):
+        """Store the content of the blob in the on-disk cache if enabled."""
+        cache_dir = self._blob_cache_dir
+
+        if not cache_dir:
+            return
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as f:
+            f.write(blob)
+
+        os.replace(f.name, os.path.join(cache_dir, self._get_blob_hash(digest)))
+
+    def _write_blob(self, download_location, digest):
+        """Write a blob with the manifest or the config to the download location.
 
+        :return: a size of the blob
+        """
+        blob = self._cached_blobs[digest]
+
+        with open(self._get_blob_path(download_location, digest), "wb") as f:
+            f.write(blob)
+
+        return len(blob)
+
+    def _get_blob_path(self, download_location, digest):
+        """Get a path of the blob in the download location."""
         blobs_dir = os.path.join(download_location, "blobs/sha256/")
         os.makedirs(blobs_dir, exist_ok=True)
+        return os.path.join(blobs_dir, self._get_blob_hash(digest))
 
-        path = os.path.join(blobs_dir, digest[7:])
-        with open(path, "wb") as f:
-            if stream:
-                response = downloader(self._blob_url(digest), stream=True)
-                response.raise_for_status()
-                size = 0
+    def _download_blob(self, downloader, download_location, digest):
+        """Download a layer to the download location.
+
+        The layer is taken from the on-disk cache if possible. Otherwise,
+        it is streamed to a temporary file and its sha256 hash is checked
+        before the file is moved to the cache or the download location.
+
+        :return: a size of the blob
+        """
+        path = self._get_blob_path(download_location, digest)
+        cached_path = self._get_cached_blob_path(digest)
+
+        if cached_path:
+            self._link_or_copy(cached_path, path)
+            return os.path.getsize(path)
+
+        target_dir = self._blob_cache_dir or os.path.dirname(path)
+        os.makedirs(target_dir, exist_ok=True)
+
+        response = downloader(self._blob_url(digest), stream=True)
+        response.raise_for_status()
+
+        checksum = hashlib.sha256()
+        size = 0
+
+        with tempfile.NamedTemporaryFile(dir=target_dir, delete=False) as f:
+            try:
                 while True:
-                    chunk = response.raw.read(64*1024)
+                    chunk = response.raw.read(FLATPAK_BLOB_CHUNK_SIZE)
                     if not chunk:
                         break
                     size += len(chunk)
+                    checksum.update(chunk)
                     f.write(chunk)
-                return size
-            else:
-                blob = self._get_blob(downloader, digest)
-                f.write(blob)
-                return len(blob)
+
+                self._check_blob_hash(digest, checksum)
+            except BaseException:
+                os.unlink(f.name)
+                raise
+
+        if not self._blob_cache_dir:
+            os.replace(f.name, path)
+            return size
+
+        cached_path = os.path.join(target_dir, self._get_blob_hash(digest))
+        os.replace(f.name, cached_path)
+        self._link_or_copy(cached_path, path)
+        return size
+
+    @staticmethod
+    def _link_or_copy(source, target):
+        """Create a hard link of the file, or copy it to other file systems."""
+        if os.path.lexists(target):
+            os.unlink(target)
+
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(source, target)
 
     def _get_json(self, session, digest):
         return json.loads(self._get_blob(session, digest))
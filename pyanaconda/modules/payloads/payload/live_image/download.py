@@ -0,0 +1,453 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 31 Milk Street #960789 Boston, MA
+# 02196 USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from pyanaconda.anaconda_loggers import get_module_logger
+from pyanaconda.core.constants import (
+    IMAGE_DOWNLOAD_CHUNK_SIZE,
+    IMAGE_DOWNLOAD_MIN_SEGMENT_SIZE,
+    IMAGE_DOWNLOAD_RETRIES,
+    IMAGE_DOWNLOAD_SEGMENTS,
+    NETWORK_CONNECTION_TIMEOUT,
+)
+from pyanaconda.core.i18n import _
+from pyanaconda.modules.payloads.payload.live_image.download_progress import (
+    DownloadProgress,
+)
+
+log = get_module_logger(__name__)
+
+__all__ = ["ImageDownloader", "ImageSegment"]
+
+
+class IncompleteDownloadError(requests.exceptions.RequestException):
+    """The response has ended before the requested data."""
+
+
+# Errors after which the download can be resumed.
+RESUMABLE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.Timeout,
+    IncompleteDownloadError,
+)
+
+
+class ImageSegment:
+    """A byte range of the downloaded image."""
+
+    def __init__(self, start, end, offset=None):
+        """Create a new segment.
+
+        :param int start: the first byte of the segment
+        :param int end: the last byte of the segment
+        :param int offset: the next byte to download
+        """
+        self.start = start
+        self.end = end
+        self.offset = start if offset is None else offset
+
+    @property
+    def done(self):
+        """Is the segment downloaded?"""
+        return self.offset > self.end
+
+    @property
+    def downloaded_size(self):
+        """The downloaded size of the segment in bytes."""
+        return self.offset - self.start
+
+    def __repr__(self):
+        return "ImageSegment({}, {}, {})".format(self.start, self.end, self.offset)
+
+
+class ImageDownloader:
+    """Downloader of remote images.
+
+    If the server supports range requests, the image is downloaded
+    in several segments in parallel. The state of the segments is
+    stored next to the downloaded file, so an interrupted download
+    can be resumed. Otherwise, the image is streamed to the file.
+
+    Only a chunk per connection is kept in memory at any time.
+
+    If a hash algorithm is specified, the checksum of the image is
+    calculated during the download, so the image doesn't have to be
+    read again to verify it.
+    """
+
+    def __init__(self, session, url, download_path, callback, proxies=None, verify=True,
+                 segments=IMAGE_DOWNLOAD_SEGMENTS, hash_algorithm=None):
+        """Create a new downloader.
+
+        :param session: a requests session
+        :param str url: an URL of the image
+        :param str download_path: a path to the downloaded image
+        :param callback: a function for the progress reporting
+        :param dict proxies: a dictionary of proxies
+        :param bool verify: should we verify the SSL certificate?
+        :param int segments: a maximal number of parallel segments
+        :param str hash_algorithm: a name of the hash algorithm or None
+        """
+        self._session = session
+        self._url = url
+        self._download_path = download_path
+        self._state_path = download_path + ".state"
+        self._callback = callback
+        self._proxies = proxies or {}
+        self._verify = verify
+        self._max_segments = max(segments, 1)
+        self._lock = threading.Lock()
+        self._aborted = threading.Event()
+        self._progress = None
+        self._downloaded_size = 0
+        self._segments = []
+        self._hasher = hashlib.new(hash_algorithm) if hash_algorithm else None
+        self._hash_lock = threading.Lock()
+        self._hashed_size = 0
+
+    @property
+    def checksum(self):
+        """The checksum of the downloaded image.
+
+        :return: a hex digest or None if not calculated
+        """
+        if not self._hasher:
+            return None
+
+        return self._hasher.hexdigest()
+
+    def download(self):
+        """Download the image.
+
+        :raise: RequestException on failure
+        """
+        response = self._send_request()
+        total_size = self._get_content_length(response)
+
+        if self._can_download_in_segments(response, total_size):
+            response.close()
+            self._download_in_segments(total_size)
+        else:
+            self._download_stream(response, total_size)
+
+    def _send_request(self, headers=None):
+        """Send a GET request to the image URL."""
+        kwargs = {}
+
+        if headers:
+            kwargs["headers"] = headers
+
+        response = self._session.get(
+            url=self._url,
+            proxies=self._proxies,
+            verify=self._verify,
+            stream=True,
+            timeout=NETWORK_CONNECTION_TIMEOUT,
+            **kwargs
+        )
+        response.raise_for_status()
+        return response
+
+    def _send_range_request(self, start, end):
+        """Send a GET request for the given byte range."""
+        response = self._send_request(
+            headers={"Range": "bytes={}-{}".format(start, end)}
+        )
+
+        if response.status_code != 206:
+            response.close()
+            raise requests.exceptions.RequestException(
+                "The server doesn't support range requests."
+            )
+
+        return response
+
+    @staticmethod
+    def _get_content_length(response):
+        """Get the content length value."""
+        return int(response.headers.get("content-length") or 0)
+
+    @staticmethod
+    def _accepts_ranges(response):
+        """Does the server accept range requests?"""
+        return response.headers.get("accept-ranges", "").strip().lower() == "bytes"
+
+    def _can_download_in_segments(self, response, total_size):
+        """Should we download the image in segments?"""
+        return self._max_segments > 1 \
+            and self._accepts_ranges(response) \
+            and total_size >= 2 * IMAGE_DOWNLOAD_MIN_SEGMENT_SIZE
+
+    def _download_stream(self, response, total_size):
+        """Download the image as a single stream."""
+        if not total_size:
+            log.warning(
+                "content-length header is missing for the installation "
+                "image, download progress reporting will not be available"
+            )
+            self._callback(_("Downloading {}").format(self._url))
+        else:
+            self._progress = DownloadProgress(
+                url=self._url,
+                callback=self._callback,
+                total_size=total_size,
+            )
+            self._progress.start()
+
+        resumable = total_size and self._accepts_ranges(response)
+        segment = ImageSegment(0, total_size - 1)
+        attempt = 0
+
+        with open(self._download_path, "wb") as image_file:
+            while True:
+                try:
+                    self._write_stream(response, image_file, segment)
+                    break
+                except RESUMABLE_ERRORS as e:
+                    attempt += 1
+
+                    if not resumable or attempt > IMAGE_DOWNLOAD_RETRIES:
+                        raise
+
+                    log.warning("Resuming the download at %s: %s", segment.offset, e)
+                    response = self._send_range_request(segment.offset, segment.end)
+
+        if self._progress:
+            self._progress.end()
+
+        log.debug("Downloaded %s.", self._url)
+
+    def _write_stream(self, response, image_file, segment):
+        """Write the content of the response to the file."""
+        for chunk in response.iter_content(IMAGE_DOWNLOAD_CHUNK_SIZE):
+            if not chunk:
+                continue
+
+            image_file.write(chunk)
+            segment.offset += len(chunk)
+
+            if self._hasher:
+                self._hasher.update(chunk)
+
+            if self._progress:
+                self._progress.update(segment.offset)
+
+        if not segment.done:
+            raise IncompleteDownloadError(
+                "The response has ended at {} of {}.".format(segment.offset, segment.end)
+            )
+
+    def _download_in_segments(self, total_size):
+        """Download the image in parallel segments."""
+        self._segments = self._load_segments(total_size)
+        resumed = bool(self._segments)
+
+        if not resumed:
+            self._segments = self._split_segments(total_size)
+
+        self._downloaded_size = sum(s.downloaded_size for s in self._segments)
+        pending = [s for s in self._segments if not s.done]
+
+        log.debug(
+            "Downloading %s in %s segments (%s pending).",
+            self._url, len(self._segments), len(pending)
+        )
+
+        self._progress = DownloadProgress(
+            url=self._url,
+            callback=self._callback,
+            total_size=total_size,
+        )
+        self._progress.start()
+        self._progress.update(self._downloaded_size)
+
+        flags = os.O_RDWR | os.O_CREAT | (0 if resumed else os.O_TRUNC)
+        fd = os.open(self._download_path, flags, 0o644)
+
+        try:
+            os.ftruncate(fd, total_size)
+            self._save_segments(total_size)
+
+            with ThreadPoolExecutor(max_workers=max(len(pending), 1)) as executor:
+                futures = [
+                    executor.submit(self._download_segment, fd, segment)
+                    for segment in pending
+                ]
+
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    self._aborted.set()
+                    raise
+
+            self._update_checksum(fd, total_size, blocking=True)
+        finally:
+            os.close(fd)
+            self._save_segments(total_size)
+
+        self._remove_segments()
+        self._progress.end()
+        log.debug("Downloaded %s.", self._url)
+
+    def _split_segments(self, total_size):
+        """Split the image into segments."""
+        count = min(self._max_segments, total_size // IMAGE_DOWNLOAD_MIN_SEGMENT_SIZE)
+        count = max(count, 1)
+        size = total_size // count
+        segments = []
+
+        for i in range(count):
+            start = i * size
+            end = total_size - 1 if i == count - 1 else start + size - 1
+            segments.append(ImageSegment(start, end))
+
+        return segments
+
+    def _download_segment(self, fd, segment):
+        """Download one segment of the image."""
+        attempt = 0
+
+        while not segment.done and not self._aborted.is_set():
+            try:
+                response = self._send_range_request(segment.offset, segment.end)
+                self._write_segment(response, fd, segment)
+            except RESUMABLE_ERRORS as e:
+                attempt += 1
+
+                if attempt > IMAGE_DOWNLOAD_RETRIES:
+                    raise
+
+                log.warning("Resuming the download of %s: %s", segment, e)
+
+    def _write_segment(self, response, fd, segment):
+        """Write the content of the response to the segment."""
+        with response:
+            for chunk in response.iter_content(IMAGE_DOWNLOAD_CHUNK_SIZE):
+                if self._aborted.is_set():
+                    return
+
+                if not chunk:
+                    continue
+
+                chunk = chunk[:segment.end + 1 - segment.offset]
+                os.pwrite(fd, chunk, segment.offset)
+                segment.offset += len(chunk)
+                self._update_progress(len(chunk))
+                self._update_checksum(fd, self._get_contiguous_size())
+
+                if segment.done:
+                    return
+
+        if not self._aborted.is_set():
+            raise IncompleteDownloadError(
+                "The response has ended at {} of {}.".format(segment.offset, segment.end)
+            )
+
+    def _update_progress(self, size):
+        """Update the download progress of all segments."""
+        with self._lock:
+            self._downloaded_size += size
+            self._progress.update(self._downloaded_size)
+
+    def _get_contiguous_size(self):
+        """Get the size of the downloaded beginning of the image."""
+        for segment in self._segments:
+            if not segment.done:
+                return segment.offset
+
+        return self._segments[-1].end + 1
+
+    def _update_checksum(self, fd, size, blocking=False):
+        """Hash the downloaded beginning of the image.
+
+        The segments are downloaded in parallel, but the data have to
+        be hashed in order. Hash the data that follow the already hashed
+        data, while they are still in the page cache. If another thread
+        is already hashing, don't wait for it unless blocking is set.
+
+        :param fd: a file descriptor of the image
+        :param int size: a size of the data that can be hashed
+        :param bool blocking: should we wait for the hash lock?
+        """
+        if not self._hasher:
+            return
+
+        if not self._hash_lock.acquire(blocking=blocking):
+            return
+
+        try:
+            while self._hashed_size < size:
+                length = min(IMAGE_DOWNLOAD_CHUNK_SIZE, size - self._hashed_size)
+                data = os.pread(fd, length, self._hashed_size)
+
+                if not data:
+                    raise OSError("Unexpected end of the downloaded image.")
+
+                self._hasher.update(data)
+                self._hashed_size += len(data)
+        finally:
+            self._hash_lock.release()
+
+    def _load_segments(self, total_size):
+        """Load segments of an interrupted download.
+
+        :return: a list of segments or an empty list
+        """
+        if not os.path.exists(self._state_path) or not os.path.exists(self._download_path):
+            return []
+
+        try:
+            with open(self._state_path) as f:
+                state = json.load(f)
+
+            if state["url"] != self._url or state["size"] != total_size:
+                return []
+
+            segments = [ImageSegment(*values) for values in state["segments"]]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            log.warning("Failed to load the state of the download: %s", e)
+            return []
+
+        log.info("Resuming the download of %s.", self._url)
+        return segments
+
+    def _save_segments(self, total_size):
+        """Save the state of the segments."""
+        state = {
+            "url": self._url,
+            "size": total_size,
+            "segments": [[s.start, s.end, s.offset] for s in self._segments]
+        }
+
+        with open(self._state_path + ".tmp", "w") as f:
+            json.dump(state, f)
+
+        os.replace(self._state_path + ".tmp", self._state_path)
+
+    def _remove_segments(self):
+        """Remove the state of the segments."""
+        if os.path.exists(self._state_path):
+            os.unlink(self._state_path)
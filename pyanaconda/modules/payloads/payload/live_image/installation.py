@@ -18,27 +18,40 @@
 import glob
 import hashlib
 import os
+import re
 import stat
+from contextlib import contextmanager
+from tarfile import TarError
+from threading import Event
 
 import blivet.util
 import requests
 
 from pyanaconda.anaconda_loggers import get_module_logger
-from pyanaconda.core.constants import NETWORK_CONNECTION_TIMEOUT
+from pyanaconda.core.configuration.anaconda import conf
+from pyanaconda.core.constants import (
+    IMAGE_CHECKSUM_BLOCK_SIZE,
+    INSTALLATION_PROGRESS_INTERVAL,
+    THREAD_LIVE_PROGRESS,
+)
 from pyanaconda.core.i18n import _
 from pyanaconda.core.path import join_paths
 from pyanaconda.core.string import lower_ascii
+from pyanaconda.core.threads import thread_manager
 from pyanaconda.core.util import execReadlines, execWithRedirect, requests_session
 from pyanaconda.modules.common.errors.installation import PayloadInstallationError
 from pyanaconda.modules.common.structures.live_image import LiveImageConfigurationData
 from pyanaconda.modules.common.task import Task
-from pyanaconda.modules.payloads.payload.live_image.download_progress import (
-    DownloadProgress,
-)
+from pyanaconda.modules.payloads.payload.live_image.download import ImageDownloader
 from pyanaconda.modules.payloads.payload.live_image.installation_progress import (
     InstallationProgress,
 )
-from pyanaconda.modules.payloads.payload.live_image.utils import get_proxies_from_option
+from pyanaconda.modules.payloads.payload.live_image.tar_extraction import TarExtractor
+from pyanaconda.modules.payloads.payload.live_image.tree_copy import TreeCopier
+from pyanaconda.modules.payloads.payload.live_image.utils import (
+    get_proxies_from_option,
+    get_tar_compression_option,
+)
 
 log = get_module_logger(__name__)
 
@@ -58,12 +71,25 @@ class DownloadImageTask(Task):
         self._proxy = configuration.proxy
         self._ssl_verify = configuration.ssl_verification_enabled
         self._download_path = download_path
+        self._hash_algorithm = "sha256" if configuration.checksum else None
+        self._checksum = None
 
     @property
     def name(self):
         """Name of the task."""
         return "Download an image"
 
+    @property
+    def checksum(self):
+        """The checksum of the downloaded image.
+
+        The checksum is calculated during the download if the
+        configuration specifies a checksum to verify.
+
+        :return: a sha256 hex digest or None
+        """
+        return self._checksum
+
     def run(self):
         """Run the task.
 
@@ -81,11 +107,17 @@ class DownloadImageTask(Task):
 
         with requests_session() as session:
             try:
-                # Send a GET request to the image URL.
-                response = self._send_request(session)
-
-                # Download the image to a file.
-                self._download_image(response)
+                downloader = ImageDownloader(
+                    session=session,
+                    url=self._url,
+                    download_path=self._download_path,
+                    callback=self.report_progress,
+                    proxies=get_proxies_from_option(self._proxy),
+                    verify=self._ssl_verify,
+                    hash_algorithm=self._hash_algorithm,
+                )
+                downloader.download()
+                self._checksum = downloader.checksum
 
             except requests.exceptions.RequestException as e:
                 raise PayloadInstallationError(
@@ -94,86 +126,22 @@ class DownloadImageTask(Task):
 
         return self._download_path
 
-    def _send_request(self, session):
-        """Send a GET request to the image URL."""
-        proxies = get_proxies_from_option(
-            self._proxy
-        )
-        response = session.get(
-            url=self._url,
-            proxies=proxies,
-            verify=self._ssl_verify,
-            stream=True,
-            timeout=NETWORK_CONNECTION_TIMEOUT,
-        )
-        response.raise_for_status()
-        return response
-
-    def _download_image(self, response):
-        """Download the image to a file."""
-        # Handle no content length header.
-        if not self._get_content_length(response):
-            download = self._direct_download
-        else:
-            download = self._stream_download
-
-        # Download the image to a file.
-        with open(self._download_path, "wb") as image_file:
-            download(response, image_file)
-
-    def _get_content_length(self, response):
-        """Get the content length value."""
-        return response.headers.get('content-length')
-
-    def _direct_download(self, response, image_file):
-        """Download the image at once."""
-        log.warning(
-            "content-length header is missing for the installation "
-            "image, download progress reporting will not be available"
-        )
-
-        self.report_progress(_("Downloading {}").format(self._url))
-        image_file.write(response.content)
-        log.debug("Downloaded %s.", self._url)
-
-    def _stream_download(self, response, image_file):
-        """Download the image in 1 MB chunks."""
-        total_size = int(self._get_content_length(response))
-
-        progress = DownloadProgress(
-            url=self._url,
-            callback=self.report_progress,
-            total_size=total_size,
-        )
-
-        progress.start()
-        downloaded_size = 0
-
-        for chunks in response.iter_content(1024 * 1024):
-            if not chunks:
-                continue
-
-            image_file.write(chunks)
-            image_file.flush()
-
-            downloaded_size += len(chunks)
-            progress.update(downloaded_size)
-
-        progress.end()
-
 
 class VerifyImageChecksumTask(Task):
     """Task to verify the checksum of the downloaded image."""
 
-    def __init__(self, configuration: LiveImageConfigurationData, image_path):
+    def __init__(self, configuration: LiveImageConfigurationData, image_path,
+                 image_checksum=None):
         """Create a new task.
 
         :param configuration: a configuration of a remote image
         :type configuration: an instance of LiveImageConfigurationData
         :param image_path: a path to the image
+        :param image_checksum: a sha256 checksum calculated during the download or None
         """
         super().__init__()
         self._image_path = image_path
+        self._image_checksum = image_checksum
         self._checksum = configuration.checksum
 
     @property
@@ -188,7 +156,10 @@ class VerifyImageChecksumTask(Task):
 
         self.report_progress(_("Checking image checksum"))
         expected_checksum = self._normalize_checksum(self._checksum)
-        calculated_checksum = self._calculate_checksum(self._image_path)
+        calculated_checksum = self._image_checksum
+
+        if not calculated_checksum:
+            calculated_checksum = self._calculate_checksum(self._image_path)
 
         if expected_checksum != calculated_checksum:
             log.error("'%s' does not match '%s'", calculated_checksum, expected_checksum)
@@ -203,15 +174,20 @@ class VerifyImageChecksumTask(Task):
 
     @staticmethod
     def _calculate_checksum(file_path):
-        """Calculate the file checksum."""
+        """Calculate the file checksum.
+
+        Read the file in one pass into a large reusable buffer.
+        """
         sha256 = hashlib.sha256()
+        buffer = bytearray(IMAGE_CHECKSUM_BLOCK_SIZE)
+        view = memoryview(buffer)
 
-        with open(file_path, "rb") as f:
+        with open(file_path, "rb", buffering=0) as f:
             while True:
-                data = f.read(1024 * 1024)
-                if not data:
+                size = f.readinto(buffer)
+                if not size:
                     break
-                sha256.update(data)
+                sha256.update(view[:size])
 
         checksum = sha256.hexdigest()
         log.debug("sha256 of %s: %s", file_path, checksum)
@@ -325,32 +301,51 @@ class InstallFromTarTask(Task):
         return "Install the payload from a tarball"
 
     @property
-    def _installation_size(self):
-        """The installation size of the archive.
-
-        Use 2x the archive's size to estimate the size of the install.
-
-        :return: a size in bytes
-        """
-        return os.stat(self._tarfile)[stat.ST_SIZE] * 2
+    def _excludes(self):
+        """Patterns of members that shouldn't be installed."""
+        return [
+            "./dev/*",
+            "./proc/*",
+            "./tmp/*",
+            "./sys/*",
+            "./run/*",
+            "./boot/*rescue*",
+            "./boot/loader",
+            "./boot/efi/loader",
+            "./etc/machine-id",
+            "./etc/machine-info",
+        ]
 
     def run(self):
-        """Run the task."""
-        with self._monitor_progress():
-            self._install_tar()
+        """Run the task.
 
-    def _monitor_progress(self):
-        """Get a progress monitor."""
-        return InstallationProgress(
-            sysroot=self._sysroot,
+        :return: a list of kernel versions if collected during the installation
+        """
+        progress = InstallationProgress(
+            total_size=os.stat(self._tarfile)[stat.ST_SIZE],
             callback=self.report_progress,
-            installation_size=self._installation_size,
         )
 
-    def _install_tar(self):
+        progress.start()
+
+        if conf.payload.native_tar_extraction:
+            result = self._extract_tar(progress)
+        else:
+            self._install_tar(progress)
+            result = None
+
+        progress.end()
+        return result
+
+    def _install_tar(self, progress):
         """Run installation of the payload from a tarball.
 
         Preserve ACL's, xattrs, and SELinux context.
+
+        The tarball is passed to the standard input of tar, so the
+        progress can be counted from the offset of the read tarball.
+
+        :param progress: an instance of InstallationProgress
         """
         cmd = "tar"
         args = [
@@ -359,26 +354,75 @@ class InstallFromTarTask(Task):
             "--acls",
             "--xattrs",
             "--xattrs-include", "*",
-            "--exclude", "./dev/*",
-            "--exclude", "./proc/*",
-            "--exclude", "./tmp/*",
-            "--exclude", "./sys/*",
-            "--exclude", "./run/*",
-            "--exclude", "./boot/*rescue*",
-            "--exclude", "./boot/loader",
-            "--exclude", "./boot/efi/loader",
-            "--exclude", "./etc/machine-id",
-            "--exclude", "./etc/machine-info",
-            "-xaf", self._tarfile,
-            "-C", self._sysroot
         ]
 
+        for pattern in self._excludes:
+            args.extend(["--exclude", pattern])
+
+        compression = get_tar_compression_option(self._tarfile)
+
+        if compression:
+            args.append(compression)
+
+        args.extend([
+            "-xf", "-",
+            "-C", self._sysroot
+        ])
+
         try:
-            execWithRedirect(cmd, args)
+            with open(self._tarfile, "rb") as f:
+                with self._monitor_offset(f, progress):
+                    execWithRedirect(cmd, args, stdin=f)
         except (OSError, RuntimeError) as e:
             msg = "Failed to install tar: {}".format(e)
             raise PayloadInstallationError(msg) from None
 
+    @contextmanager
+    def _monitor_offset(self, f, progress):
+        """Monitor the offset of the given file in a separate thread.
+
+        :param f: a file object shared with the tar process
+        :param progress: an instance of InstallationProgress
+        """
+        finished = Event()
+
+        def _monitor():
+            while not finished.wait(INSTALLATION_PROGRESS_INTERVAL):
+                progress.update(os.lseek(f.fileno(), 0, os.SEEK_CUR))
+
+        thread_manager.add_thread(
+            name=THREAD_LIVE_PROGRESS,
+            target=_monitor
+        )
+
+        try:
+            yield
+        finally:
+            finished.set()
+            thread_manager.wait(THREAD_LIVE_PROGRESS)
+
+    def _extract_tar(self, progress):
+        """Extract the tarball in one streaming pass.
+
+        Collect the kernel version list and report the progress
+        from the processed size of the tarball.
+
+        :param progress: an instance of InstallationProgress
+        :return: a list of kernel versions
+        """
+        extractor = TarExtractor(
+            tarfile_path=self._tarfile,
+            target=self._sysroot,
+            excludes=self._excludes,
+            callback=progress.update,
+        )
+
+        try:
+            return extractor.extract()
+        except (OSError, TarError) as e:
+            msg = "Failed to install tar: {}".format(e)
+            raise PayloadInstallationError(msg) from None
+
 
 class InstallFromImageTask(Task):
     """Task to install the payload from image."""
@@ -393,15 +437,74 @@ class InstallFromImageTask(Task):
         self._sysroot = sysroot
         self._mount_point = mount_point
         self._log_rsync = False
-        self._rsync_progress = ""
+        self._progress = None
 
     @property
     def name(self):
         """The name of the task."""
         return "Install the payload from image"
 
+    @property
+    def _excludes(self):
+        """Patterns of paths that shouldn't be copied by the native copier.
+
+        The FAT file system of /boot/efi and the paths that fail with
+        rsync on KIWI-built images are handled in the same pass.
+        """
+        return [
+            "/dev/",
+            "/proc/",
+            "/tmp/*",
+            "/sys/",
+            "/run/",
+            "/boot/*rescue*",
+            "/boot/loader/",
+            "/boot/efi/loader/",
+            "/etc/machine-id",
+            "/etc/machine-info",
+        ]
+
     def run(self):
-        """Run installation of the payload from image.
+        """Run installation of the payload from image."""
+        # Force write everything to disk.
+        self.report_progress(_("Synchronizing writes to disk"))
+        os.sync()
+
+        if conf.payload.native_image_copy:
+            self._copy_image()
+        else:
+            self._install_image()
+
+    def _copy_image(self):
+        """Copy the mounted image with the native tree copier.
+
+        Preserve permissions, owners, groups, ACL's, xattrs, times,
+        symlinks and hardlinks. Go recursively, include devices and
+        special files. Don't cross file system boundaries.
+        """
+        progress = InstallationProgress(
+            total_size=0,
+            callback=self.report_progress,
+        )
+
+        copier = TreeCopier(
+            source=self._mount_point,
+            target=self._sysroot,
+            excludes=self._excludes,
+            callback=progress.update,
+        )
+
+        try:
+            progress.start()
+            copier.copy()
+        except OSError as e:
+            msg = "Failed to install image: {}".format(e)
+            raise PayloadInstallationError(msg) from None
+
+        progress.end()
+
+    def _install_image(self):
+        """Copy the mounted image with the rsync tool.
 
         Preserve permissions, owners, groups, ACL's, xattrs, times,
         symlinks and hardlinks. Go recursively, include devices and
@@ -410,10 +513,6 @@ class InstallFromImageTask(Task):
         Use a trailing slash on the source directory to copy the content
         instead of the directory itself. See `man rsync`.
         """
-        # Force write everything to disk.
-        self.report_progress(_("Synchronizing writes to disk"))
-        os.sync()
-
         # Copy the mounted image to storage
         cmd = "rsync"
         args = [
@@ -440,8 +539,13 @@ class InstallFromImageTask(Task):
             self._sysroot
         ]
 
+        self._progress = InstallationProgress(
+            total_size=0,
+            callback=self.report_progress,
+        )
+
         try:
-            self.report_progress(_("Installing software..."))
+            self._progress.start()
             for line in execReadlines(cmd, args):
                 self._parse_rsync_update(line)
 
@@ -449,6 +553,8 @@ class InstallFromImageTask(Task):
             msg = "Failed to install image: {}".format(e)
             raise PayloadInstallationError(msg) from None
 
+        self._progress.end()
+
         if os.path.exists(os.path.join(self._mount_point, "boot/efi")):
             # Handle /boot/efi separately due to FAT filesystem limitations
             # FAT cannot support permissions, ownership, symlinks, hard links,
@@ -503,8 +609,9 @@ class InstallFromImageTask(Task):
            devel-tools/modify_install_iso/lib/__init__.py
                    601.673  98%   14,32MB/s    0:00:00 (xfr#618, to-chk=3/858)
 
-           We are interested only in the second field of the last line, which holds the total
-           progress as a percentage, including the % sign. Unfortunately, rsync writes individual
+           We are interested only in the first two fields of the last line, which hold the total
+           number of transferred bytes and the total progress as a percentage. The total size
+           of the transfer is estimated from them. Unfortunately, rsync writes individual
            file progress on the same line by overwriting it (essentially prints \r and the string
            again), and after the transfer overwrites the same line with global progress.
 
@@ -531,15 +638,15 @@ class InstallFromImageTask(Task):
             return
 
         try:
-            # second field has global progress
-            str_pct = line.split()[1]
-            if self._rsync_progress == str_pct:
-                return
-            self._rsync_progress = str_pct
-            log.debug("rsync progress: %s", self._rsync_progress)
-            self.report_progress(_("Installing software {}").format(self._rsync_progress))
-        except IndexError:
-            pass
+            # first field has transferred bytes, second field has global progress
+            fields = line.split()
+            processed_size = int(re.sub(r"\D", "", fields[0]))
+            pct = int(fields[1].rstrip("%"))
+        except (IndexError, ValueError):
+            return
+
+        total_size = processed_size * 100 // pct if pct else None
+        self._progress.update(processed_size, total_size)
 
 
 class RemoveImageTask(Task):
@@ -15,130 +15,157 @@
 # License and may only be used or replicated with the express permission of
 # Red Hat, Inc.
 #
-import os
 import time
+from collections import namedtuple
+from threading import Lock
 
 from blivet.size import Size
 
 from pyanaconda.anaconda_loggers import get_module_logger
-from pyanaconda.core.constants import THREAD_LIVE_PROGRESS
+from pyanaconda.core.constants import INSTALLATION_PROGRESS_INTERVAL
 from pyanaconda.core.i18n import _
-from pyanaconda.core.path import join_paths
-from pyanaconda.core.threads import thread_manager
-from pyanaconda.modules.common.constants.objects import DEVICE_TREE
-from pyanaconda.modules.common.constants.services import STORAGE
-from pyanaconda.modules.common.structures.storage import DeviceData
-from pyanaconda.modules.common.task.cancellable import Cancellable
 
 log = get_module_logger(__name__)
 
-__all__ = ["InstallationProgress"]
+__all__ = ["InstallationProgress", "InstallationStatus"]
 
+InstallationStatus = namedtuple("InstallationStatus", [
+    "processed_size",
+    "total_size",
+    "percentage",
+    "throughput",
+    "eta",
+])
 
-class InstallationProgress(Cancellable):
-    """Progress monitor of the image installation."""
+InstallationStatus.__doc__ = """Status of the image installation.
 
-    def __init__(self, sysroot, installation_size, callback):
-        """Create a new installation progress.
-
-        :param sysroot: a path to the system root
-        :param installation_size: a size of the installed payload
-        :param callback: a function for the progress reporting
-        """
-        super().__init__()
-        self._sysroot = sysroot
-        self._installation_size = installation_size
-        self._callback = callback
-        self._thread_name = THREAD_LIVE_PROGRESS
-
-    def __enter__(self):
-        """Start to monitor the progress."""
-        # Start the thread.
-        thread_manager.add_thread(
-            name=self._thread_name,
-            target=self._monitor_progress
-        )
-
-    def __exit__(self, _exc_type, _exc_val, _exc_tb):
-        """Stop to monitor the progress."""
-        # Cancel the progress reporting.
-        self.cancel()
-
-        # Wait for the thread to finish.
-        thread_manager.wait(self._thread_name)
-
-    def _monitor_progress(self):
-        """Monitor the amount of disk space used on the target and source."""
-        log.debug("Installing %s.", Size(self._installation_size))
+:param processed_size: a number of processed bytes
+:param total_size: a total number of bytes or 0 if unknown
+:param percentage: a percentage of the processed bytes
+:param throughput: an average number of processed bytes per second
+:param eta: an estimated number of remaining seconds or None
+"""
 
-        # Force write everything to disk.
-        self._callback(_("Synchronizing writes to disk"))
-        os.sync()
 
-        # Calculate the starting size used by the system.
-        mount_points = self._get_mount_points_to_count()
-        starting_size = self._calculate_used_size(mount_points)
-        log.debug("Used %s by %s.", Size(starting_size), ", ".join(mount_points))
+class InstallationProgress:
+    """Progress of the image installation counted in processed bytes.
 
-        pct = 0
-        last_pct = -1
+    The numbers are provided by the installation pipeline itself,
+    for example by the rsync progress output or by the offset of
+    the installed tarball. The progress is reported at most once
+    per interval, and only if the percentage changes.
 
-        while pct < 100 and not self.check_cancel():
-            # Calculate the installed size used by the system.
-            current_size = self._calculate_used_size(mount_points)
-            installed_size = current_size - starting_size
+    This is a thread safe class.
+    """
 
-            # Report the progress message.
-            pct = min(int(100 * installed_size / self._installation_size), 100)
-
-            if pct != last_pct:
-                log.debug("Installed %s (%s%%)", Size(installed_size), pct)
-                self._callback(_("Installing software {}%").format(pct))
-
-            last_pct = pct
-            time.sleep(0.777)
-
-    def _get_mount_points_to_count(self):
-        """Get mount points in the device tree, which should be queried for capacity.
+    def __init__(self, total_size, callback, interval=INSTALLATION_PROGRESS_INTERVAL):
+        """Create a new installation progress.
 
-        :return: a list of mount points
+        :param total_size: a total number of bytes or 0 if unknown
+        :param callback: a function for the progress reporting
+        :param interval: a minimal interval between two reports in seconds
         """
-        device_tree = STORAGE.get_proxy(DEVICE_TREE)
-        mount_points = device_tree.GetMountPoints()
-
-        result = []
-        counted_btrfs_volumes = []
-
-        for path, device_id in mount_points.items():
-            dev_data = DeviceData.from_structure(device_tree.GetDeviceData(device_id))
-
-            if dev_data.type != "btrfs subvolume":
-                # not btrfs subvolume, so just take it as is
-                result.append(join_paths(self._sysroot, path))
-            else:
-                # For BTRFS, add only one mount-pointed subvolume per volume.
-                # That's because statvfs reports free/used as aggregate across the whole volume.
-                ancestors = device_tree.GetAncestors([device_id])
-                for ancestor in ancestors:
-                    anc_data = DeviceData.from_structure(device_tree.GetDeviceData(ancestor))
-                    if anc_data.type == "btrfs volume" and ancestor not in counted_btrfs_volumes:
-                        result.append(join_paths(self._sysroot, path))
-                        counted_btrfs_volumes.append(ancestor)
-
-        return result
-
-    def _calculate_used_size(self, mount_points):
-        """Calculate the total used size of the mount points.
-
-        :return: a size in bytes
+        self._lock = Lock()
+        self._callback = callback
+        self._interval = interval
+        self._total_size = total_size
+        self._processed_size = 0
+        self._start_time = None
+        self._last_time = None
+        self._last_pct = -1
+        self._finished = False
+
+    @property
+    def status(self):
+        """The current status of the installation.
+
+        :return: an instance of InstallationStatus
+        """
+        with self._lock:
+            return self._get_status(time.monotonic())
+
+    def start(self):
+        """Start the installation progress."""
+        with self._lock:
+            self._processed_size = 0
+            self._start_time = time.monotonic()
+            self._last_time = None
+            self._last_pct = -1
+            self._finished = False
+            self._report_progress(force=True)
+
+    def update(self, processed_size, total_size=None):
+        """Update the installation progress.
+
+        :param processed_size: a total number of processed bytes
+        :param total_size: a new total number of bytes or None
         """
-        total = 0
+        with self._lock:
+            if total_size is not None:
+                self._total_size = total_size
 
-        for path in mount_points:
-            if not os.path.exists(path):
-                continue
+            self._processed_size = processed_size
+            self._report_progress()
 
-            stat = os.statvfs(path)
-            total += stat.f_frsize * (stat.f_blocks - stat.f_bfree)
+    def add(self, size):
+        """Add processed bytes to the installation progress.
 
-        return total
+        :param size: a number of newly processed bytes
+        """
+        with self._lock:
+            self._processed_size += size
+            self._report_progress()
+
+    def end(self):
+        """Finish the installation progress."""
+        with self._lock:
+            self._processed_size = max(self._processed_size, self._total_size)
+            self._finished = True
+            self._report_progress(force=True)
+
+    def _get_status(self, now):
+        """Calculate the status of the installation."""
+        processed = self._processed_size
+        total = self._total_size
+        pct = min(int(100 * processed / total), 100) if total else 0
+
+        if self._finished:
+            pct = 100
+
+        elapsed = now - self._start_time if self._start_time is not None else 0
+        throughput = processed / elapsed if elapsed > 0 else 0
+        eta = None
+
+        if total and throughput:
+            eta = max(total - processed, 0) / throughput
+
+        return InstallationStatus(processed, total, pct, throughput, eta)
+
+    def _report_progress(self, force=False):
+        """Report the progress if it should be reported."""
+        if self._start_time is None:
+            self._start_time = time.monotonic()
+
+        now = time.monotonic()
+        status = self._get_status(now)
+
+        if status.percentage == self._last_pct:
+            return
+
+        if not force and self._last_time is not None \
+                and now - self._last_time < self._interval \
+                and status.percentage < 100:
+            return
+
+        self._last_pct = status.percentage
+        self._last_time = now
+
+        log.debug(
+            "Installed %s of %s (%s%%, %s/s, ETA %s s)",
+            Size(status.processed_size),
+            Size(status.total_size),
+            status.percentage,
+            Size(int(status.throughput)),
+            "unknown" if status.eta is None else int(status.eta),
+        )
+        self._callback(_("Installing software {}%").format(status.percentage))
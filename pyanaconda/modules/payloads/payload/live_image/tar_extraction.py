@@ -0,0 +1,501 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 31 Milk Street #960789 Boston, MA
+# 02196 USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import fnmatch
+import grp
+import os
+import posixpath
+import pwd
+import re
+import stat
+import struct
+import subprocess
+import tarfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pyanaconda.anaconda_loggers import get_module_logger
+from pyanaconda.core.constants import (
+    IMAGE_EXTRACTION_BUFFER_SIZE,
+    IMAGE_EXTRACTION_MAX_PENDING,
+    IMAGE_EXTRACTION_WORKERS,
+)
+from pyanaconda.modules.payloads.payload.live_image.utils import (
+    get_kernel_version_list_from_names,
+)
+
+log = get_module_logger(__name__)
+
+__all__ = ["TarExtractor", "convert_acl_text"]
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Tags and permissions of POSIX ACL entries. See acl(5).
+ACL_XATTR_VERSION = 2
+ACL_UNDEFINED_ID = 0xFFFFFFFF
+ACL_TAGS = {
+    "user": (0x01, 0x02),
+    "group": (0x04, 0x08),
+    "mask": (0x10, 0x10),
+    "other": (0x20, 0x20),
+}
+
+
+def convert_acl_text(text):
+    """Convert the text form of an ACL to the value of the ACL xattr.
+
+    The text form is stored in the SCHILY.acl.* pax headers, for example:
+
+        user::rw-,user:joe:r--:1001,group::r--,mask::r--,other::r--
+
+    :param str text: a text form of the ACL
+    :return: a value of the system.posix_acl_* xattr
+    :raise: ValueError if the text is not valid
+    """
+    entries = []
+
+    for item in filter(None, text.replace("\n", ",").split(",")):
+        fields = item.strip().split(":")
+
+        if len(fields) < 3 or fields[0] not in ACL_TAGS:
+            raise ValueError("Invalid ACL entry: {}".format(item))
+
+        tag_name, qualifier, perms = fields[:3]
+        obj_tag, named_tag = ACL_TAGS[tag_name]
+
+        if not qualifier:
+            tag, entry_id = obj_tag, ACL_UNDEFINED_ID
+        else:
+            tag, entry_id = named_tag, _resolve_acl_qualifier(tag_name, qualifier, fields[3:])
+
+        permissions = sum(
+            bit for flag, bit in (("r", 4), ("w", 2), ("x", 1)) if flag in perms
+        )
+        entries.append((tag, permissions, entry_id))
+
+    entries.sort(key=lambda e: (e[0], e[2]))
+    data = struct.pack("<I", ACL_XATTR_VERSION)
+
+    for tag, permissions, entry_id in entries:
+        data += struct.pack("<HHI", tag, permissions, entry_id)
+
+    return data
+
+
+def _resolve_acl_qualifier(tag_name, qualifier, extra_fields):
+    """Get a numeric id of the ACL qualifier."""
+    # Prefer the numeric id stored by star and GNU tar.
+    if extra_fields and extra_fields[0].isdigit():
+        return int(extra_fields[0])
+
+    if qualifier.isdigit():
+        return int(qualifier)
+
+    try:
+        if tag_name == "user":
+            return pwd.getpwnam(qualifier).pw_uid
+        return grp.getgrnam(qualifier).gr_gid
+    except KeyError:
+        raise ValueError("Unknown ACL qualifier: {}".format(qualifier)) from None
+
+
+class TarExtractor:
+    """Streaming extractor of tarballs.
+
+    The tarball is read in one pass. Regular files are written by
+    a pool of workers, other members are created by the reading
+    thread. Metadata of directories are applied at the end.
+
+    Owners are kept numeric, and ACLs, xattrs and SELinux contexts
+    stored in the pax headers are restored.
+
+    Supported compressions are gzip, bzip2, xz and zstd. The zstd
+    stream is decompressed by the zstd tool.
+    """
+
+    def __init__(self, tarfile_path, target, excludes=(), callback=None,
+                 workers=IMAGE_EXTRACTION_WORKERS):
+        """Create a new extractor.
+
+        :param str tarfile_path: a path to the tarball
+        :param str target: a path to the target directory
+        :param excludes: a list of glob patterns of members to exclude
+        :param callback: a function called with processed and total bytes of the tarball
+        :param int workers: a number of parallel writers
+        """
+        self._tarfile_path = tarfile_path
+        self._target = os.path.abspath(target)
+        self._real_target = os.path.realpath(target)
+        self._safe_directories = set()
+        self._exclude_regex = None
+
+        if excludes:
+            self._exclude_regex = re.compile(
+                "|".join(fnmatch.translate(p) for p in excludes)
+            )
+
+        self._callback = callback
+        self._workers = max(workers, 1)
+        self._pending = threading.BoundedSemaphore(IMAGE_EXTRACTION_MAX_PENDING)
+        self._writes = {}
+        self._directories = []
+        self._names = []
+        self._errors = []
+        self._failed_xattrs = 0
+        self._lock = threading.Lock()
+        self._is_root = os.geteuid() == 0
+
+    def extract(self):
+        """Extract the tarball.
+
+        :return: a list of kernel versions found in the tarball
+        :raise: OSError or TarError on failure
+        """
+        total_size = os.path.getsize(self._tarfile_path)
+
+        with open(self._tarfile_path, "rb", buffering=0) as f:
+            with self._open_stream(f) as (stream, process):
+                with ThreadPoolExecutor(max_workers=self._workers) as executor:
+                    try:
+                        self._extract_members(stream, executor, f, total_size)
+                    finally:
+                        self._wait_for_writes()
+
+                self._check_process(process)
+
+        self._apply_directories()
+
+        if self._failed_xattrs:
+            log.warning("Failed to set %s extended attributes.", self._failed_xattrs)
+
+        if self._errors:
+            raise self._errors[0]
+
+        return get_kernel_version_list_from_names(self._names)
+
+    def _open_stream(self, f):
+        """Open the stream of the tarball."""
+        magic = f.read(len(ZSTD_MAGIC))
+        f.seek(0)
+
+        if magic == ZSTD_MAGIC:
+            return _ZstdStream(f)
+
+        return _PythonStream(f)
+
+    @staticmethod
+    def _check_process(process):
+        """Check the decompression process."""
+        if not process:
+            return
+
+        # Read the rest of the output, so the process can finish.
+        while process.stdout.read(IMAGE_EXTRACTION_BUFFER_SIZE):
+            pass
+
+        if process.wait() != 0:
+            raise OSError("zstd exited with {}".format(process.returncode))
+
+    def _extract_members(self, stream, executor, f, total_size):
+        """Extract members of the tarball."""
+        last_offset = -1
+
+        with tarfile.open(fileobj=stream, mode="r|*") as archive:
+            for member in archive:
+                self._names.append(member.name)
+                self._extract_member(archive, member, executor)
+
+                offset = os.lseek(f.fileno(), 0, os.SEEK_CUR)
+
+                if self._callback and offset != last_offset:
+                    self._callback(offset, total_size)
+                    last_offset = offset
+
+                if self._errors:
+                    break
+
+        if self._callback:
+            self._callback(total_size, total_size)
+
+    def _is_excluded(self, name):
+        """Should the member be excluded?
+
+        Match the patterns like tar does by default: after any slash
+        in the name, and also against the leading directories.
+        """
+        if not self._exclude_regex:
+            return False
+
+        components = name.rstrip("/").split("/")
+
+        for start in range(len(components)):
+            for end in range(start + 1, len(components) + 1):
+                if self._exclude_regex.match("/".join(components[start:end])):
+                    return True
+
+        return False
+
+    def _get_target_path(self, name):
+        """Get a safe path of the member in the target directory.
+
+        The path is not safe if its parent directory resolves outside
+        of the target directory, for example because of a symlink
+        created by a previous member.
+        """
+        name = posixpath.normpath(name.lstrip("/"))
+
+        if name in (".", "") or name == ".." or name.startswith("../"):
+            return None
+
+        path = os.path.join(self._target, name)
+
+        if not self._is_safe_directory(os.path.dirname(path)):
+            log.warning("Skipping %s. The path leads outside of the target.", name)
+            return None
+
+        return path
+
+    def _is_safe_directory(self, path):
+        """Does the directory resolve inside the target directory?"""
+        if path in self._safe_directories:
+            return True
+
+        real_path = os.path.realpath(path)
+
+        if real_path != self._real_target \
+                and not real_path.startswith(self._real_target + os.sep):
+            return False
+
+        self._safe_directories.add(path)
+        return True
+
+    def _extract_member(self, archive, member, executor):
+        """Extract one member."""
+        if self._is_excluded(member.name):
+            return
+
+        path = self._get_target_path(member.name)
+
+        if not path:
+            return
+
+        if member.isdir():
+            if not self._is_safe_directory(path):
+                log.warning("Skipping %s. The path leads outside of the target.", member.name)
+                return
+
+            os.makedirs(path, exist_ok=True)
+            self._directories.append((path, member))
+            return
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._remove_existing(path)
+
+        if member.isreg():
+            self._extract_file(archive, member, path, executor)
+        elif member.issym():
+            # The new symlink can change the resolution of directories.
+            self._safe_directories.clear()
+            os.symlink(member.linkname, path)
+            self._apply_metadata(path, member)
+        elif member.islnk():
+            self._extract_hardlink(member, path)
+        elif member.ischr() or member.isblk() or member.isfifo():
+            self._extract_special(member, path)
+        else:
+            log.debug("Skipping unsupported member %s.", member.name)
+
+    def _remove_existing(self, path):
+        """Remove an existing file that would be replaced."""
+        self._wait_for_write(path)
+
+        if os.path.lexists(path) and not os.path.isdir(path):
+            os.unlink(path)
+
+    def _extract_file(self, archive, member, path, executor):
+        """Extract a regular file.
+
+        Small files are read to memory and written by the pool
+        of workers. Big files are written by the current thread.
+        """
+        source = archive.extractfile(member)
+
+        if member.size > IMAGE_EXTRACTION_BUFFER_SIZE:
+            with open(path, "wb") as f:
+                while True:
+                    data = source.read(IMAGE_EXTRACTION_BUFFER_SIZE)
+                    if not data:
+                        break
+                    f.write(data)
+
+            self._apply_metadata(path, member)
+            return
+
+        data = source.read()
+        self._pending.acquire()
+
+        future = executor.submit(self._write_file, path, data, member)
+        future.add_done_callback(lambda _f: self._pending.release())
+
+        with self._lock:
+            self._writes[path] = future
+
+    def _write_file(self, path, data, member):
+        """Write a regular file."""
+        try:
+            with open(path, "wb") as f:
+                f.write(data)
+
+            self._apply_metadata(path, member)
+        except OSError as e:
+            with self._lock:
+                self._errors.append(e)
+
+    def _wait_for_write(self, path):
+        """Wait for a pending write of the given path."""
+        with self._lock:
+            future = self._writes.pop(path, None)
+
+        if future:
+            future.result()
+
+    def _wait_for_writes(self):
+        """Wait for all pending writes."""
+        with self._lock:
+            futures = list(self._writes.values())
+            self._writes.clear()
+
+        for future in futures:
+            future.result()
+
+    def _extract_hardlink(self, member, path):
+        """Extract a hard link."""
+        source = self._get_target_path(member.linkname)
+
+        if not source:
+            raise OSError("Invalid hard link {} to {}".format(member.name, member.linkname))
+
+        self._wait_for_write(source)
+        os.link(source, path, follow_symlinks=False)
+
+    def _extract_special(self, member, path):
+        """Extract a device or a FIFO."""
+        if member.isfifo():
+            os.mkfifo(path)
+        else:
+            mode = stat.S_IFCHR if member.ischr() else stat.S_IFBLK
+            os.mknod(path, mode | member.mode, os.makedev(member.devmajor, member.devminor))
+
+        self._apply_metadata(path, member)
+
+    def _apply_directories(self):
+        """Apply metadata of directories.
+
+        Do it from the deepest directories, so the modification
+        times are not changed by the extraction of the content.
+        """
+        for path, member in sorted(self._directories, key=lambda d: d[0], reverse=True):
+            self._apply_metadata(path, member)
+
+    def _apply_metadata(self, path, member):
+        """Apply metadata of the member to the path."""
+        is_link = member.issym()
+
+        if self._is_root:
+            os.chown(path, member.uid, member.gid, follow_symlinks=False)
+
+        if not is_link:
+            os.chmod(path, member.mode)
+
+        self._apply_xattrs(path, member)
+        os.utime(path, (member.mtime, member.mtime), follow_symlinks=False)
+
+    def _apply_xattrs(self, path, member):
+        """Apply extended attributes, ACLs and the SELinux context."""
+        for key, value in member.pax_headers.items():
+            try:
+                name, data = self._get_xattr(key, value)
+
+                if not name:
+                    continue
+
+                os.setxattr(path, name, data, follow_symlinks=False)
+            except (OSError, ValueError) as e:
+                log.debug("Failed to set %s of %s: %s", key, path, e)
+
+                with self._lock:
+                    self._failed_xattrs += 1
+
+    @staticmethod
+    def _get_xattr(key, value):
+        """Get an extended attribute from the pax header.
+
+        :return: a tuple with a name and a value or (None, None)
+        """
+        if key.startswith("SCHILY.xattr."):
+            return key[len("SCHILY.xattr."):], value.encode("utf-8", "surrogateescape")
+
+        if key == "RHT.security.selinux":
+            return "security.selinux", value.encode("utf-8", "surrogateescape")
+
+        if key == "SCHILY.acl.access":
+            return "system.posix_acl_access", convert_acl_text(value)
+
+        if key == "SCHILY.acl.default":
+            return "system.posix_acl_default", convert_acl_text(value)
+
+        return None, None
+
+
+class _PythonStream:
+    """A tarball stream decompressed by the tarfile module."""
+
+    def __init__(self, f):
+        self._file = f
+
+    def __enter__(self):
+        return self._file, None
+
+    def __exit__(self, *args):
+        pass
+
+
+class _ZstdStream:
+    """A tarball stream decompressed by the zstd tool.
+
+    The tool shares the file offset with us, so the progress
+    can be still calculated from the tarball file.
+    """
+
+    def __init__(self, f):
+        self._file = f
+        self._process = None
+
+    def __enter__(self):
+        self._process = subprocess.Popen(  # pylint: disable=consider-using-with
+            ["zstd", "-dcq"],
+            stdin=self._file,
+            stdout=subprocess.PIPE,
+        )
+        return self._process.stdout, self._process
+
+    def __exit__(self, *args):
+        self._process.stdout.close()
+
+        if self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
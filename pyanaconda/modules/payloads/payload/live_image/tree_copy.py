@@ -0,0 +1,531 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 31 Milk Street #960789 Boston, MA
+# 02196 USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import errno
+import fcntl
+import os
+import re
+import stat
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from blivet.size import Size
+
+from pyanaconda.anaconda_loggers import get_module_logger
+from pyanaconda.core.constants import IMAGE_COPY_CHUNK_SIZE, IMAGE_COPY_WORKERS
+
+log = get_module_logger(__name__)
+
+__all__ = ["CopyStatistics", "TreeCopier"]
+
+# The FICLONE ioctl. See ioctl_ficlone(2).
+FICLONE = 0x40049409
+
+# Errors of file systems that don't support the operation, for example FAT.
+UNSUPPORTED_ERRORS = (
+    errno.EPERM,
+    errno.EINVAL,
+    errno.ENOTSUP,
+    errno.EOPNOTSUPP,
+    errno.ENOSYS,
+    errno.EMLINK,
+)
+
+# Errors of unavailable kernel copy methods.
+COPY_FALLBACK_ERRORS = (
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOTTY,
+    errno.ENOTSUP,
+    errno.EOPNOTSUPP,
+    errno.ENOSYS,
+    errno.EBADF,
+)
+
+CopyStatistics = namedtuple("CopyStatistics", [
+    "files",
+    "size",
+    "duration",
+    "skipped",
+    "failed_metadata",
+])
+
+CopyStatistics.__doc__ = """Statistics of the copied tree.
+
+:param files: a number of copied files
+:param size: a number of copied bytes
+:param duration: a duration of the copying in seconds
+:param skipped: a number of entries unsupported by the target
+:param failed_metadata: a number of metadata that failed to be applied
+"""
+
+
+def _translate_pattern(pattern):
+    """Translate an rsync-like pattern to a regular expression.
+
+    Wildcards don't match slashes. A trailing slash matches
+    only directories.
+
+    :return: a tuple of a compiled regex and a directory flag
+    """
+    dir_only = pattern.endswith("/")
+    regex = ""
+
+    for c in pattern.strip("/"):
+        if c == "*":
+            regex += "[^/]*"
+        elif c == "?":
+            regex += "[^/]"
+        else:
+            regex += re.escape(c)
+
+    return re.compile(regex + r"\Z"), dir_only
+
+
+class TreeCopier:
+    """Parallel copier of directory trees.
+
+    The source tree is scanned first, so the total size is known
+    in advance. Then the directories are created and their content
+    is copied by a pool of workers, one directory at a time. Hard
+    links and metadata of directories are applied at the end.
+
+    The file data are cloned or copied in the kernel if the target
+    file system allows it. Owners are kept numeric, and permissions,
+    times, ACLs, xattrs and SELinux contexts are preserved. The copy
+    doesn't cross file system boundaries of the source.
+
+    Operations unsupported by the target file system, for example
+    symlinks and xattrs on FAT, are skipped and counted.
+    """
+
+    def __init__(self, source, target, excludes=(), callback=None,
+                 workers=IMAGE_COPY_WORKERS):
+        """Create a new copier.
+
+        The exclude patterns are anchored at the source directory,
+        for example "/tmp/*" or "/dev/".
+
+        :param str source: a path to the source directory
+        :param str target: a path to the target directory
+        :param excludes: a list of patterns of paths to exclude
+        :param callback: a function called with copied and total bytes
+        :param int workers: a number of parallel workers
+        """
+        self._source = os.path.abspath(source)
+        self._target = os.path.abspath(target)
+        self._excludes = [_translate_pattern(p) for p in excludes]
+        self._callback = callback
+        self._workers = max(workers, 1)
+        self._lock = threading.Lock()
+        self._is_root = os.geteuid() == 0
+        self._can_clone = True
+        self._can_copy_range = True
+
+        # Results of the scan.
+        self._directories = []
+        self._entries = {}
+        self._links = []
+        self._total_size = 0
+
+        # Statistics of the copy.
+        self._copied_size = 0
+        self._copied_files = 0
+        self._skipped = 0
+        self._failed_metadata = 0
+        self._duration = 0
+
+    @property
+    def statistics(self):
+        """Statistics of the copied tree.
+
+        :return: an instance of CopyStatistics
+        """
+        with self._lock:
+            return CopyStatistics(
+                files=self._copied_files,
+                size=self._copied_size,
+                duration=self._duration,
+                skipped=self._skipped,
+                failed_metadata=self._failed_metadata,
+            )
+
+    def copy(self):
+        """Copy the tree.
+
+        :raise: OSError on failure
+        """
+        start = time.monotonic()
+
+        self._scan()
+        self._report_progress(0)
+
+        for path, st in self._directories:
+            self._create_directory(path, st)
+
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            futures = [
+                executor.submit(self._copy_entries, path, entries)
+                for path, entries in self._entries.items()
+            ]
+
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        for source, path in self._links:
+            self._copy_link(source, path)
+
+        for path, st in reversed(self._directories):
+            self._apply_metadata(path, st, self._get_source_path(path))
+
+        self._duration = time.monotonic() - start
+        self._log_statistics()
+
+    def _is_excluded(self, path, is_dir):
+        """Should the relative path be excluded?"""
+        for regex, dir_only in self._excludes:
+            if dir_only and not is_dir:
+                continue
+
+            if regex.match(path):
+                return True
+
+        return False
+
+    def _get_source_path(self, path):
+        """Get an absolute path in the source directory."""
+        return os.path.join(self._source, path)
+
+    def _get_target_path(self, path):
+        """Get an absolute path in the target directory."""
+        return os.path.join(self._target, path)
+
+    def _scan(self):
+        """Scan the source tree.
+
+        Collect directories in the order of creation, the content
+        of every directory and hard links of already seen files.
+        """
+        root = os.lstat(self._source)
+        inodes = {}
+        stack = [""]
+
+        self._directories.append(("", root))
+
+        while stack:
+            directory = stack.pop()
+            entries = []
+
+            with os.scandir(self._get_source_path(directory)) as it:
+                for entry in it:
+                    path = os.path.join(directory, entry.name)
+                    st = entry.stat(follow_symlinks=False)
+                    is_dir = stat.S_ISDIR(st.st_mode)
+
+                    if self._is_excluded(path, is_dir):
+                        continue
+
+                    if is_dir:
+                        self._directories.append((path, st))
+
+                        # Don't cross file system boundaries.
+                        if st.st_dev == root.st_dev:
+                            stack.append(path)
+
+                        continue
+
+                    if stat.S_ISREG(st.st_mode) and st.st_nlink > 1:
+                        key = (st.st_dev, st.st_ino)
+
+                        if key in inodes:
+                            self._links.append((inodes[key], path))
+                            continue
+
+                        inodes[key] = path
+
+                    if stat.S_ISREG(st.st_mode):
+                        self._total_size += st.st_size
+
+                    entries.append((path, st))
+
+            if entries:
+                self._entries[directory] = entries
+
+    def _report_progress(self, size):
+        """Report the copied size."""
+        with self._lock:
+            self._copied_size += size
+            copied_size = self._copied_size
+
+        if self._callback:
+            self._callback(copied_size, self._total_size)
+
+    def _count_file(self):
+        """Count a copied file."""
+        with self._lock:
+            self._copied_files += 1
+
+    def _skip(self, path, error):
+        """Skip an entry unsupported by the target."""
+        log.debug("Skipping %s: %s", path, error)
+
+        with self._lock:
+            self._skipped += 1
+
+    def _create_directory(self, path, st):
+        """Create a directory in the target."""
+        target = self._get_target_path(path)
+
+        try:
+            os.mkdir(target, stat.S_IMODE(st.st_mode) | stat.S_IRWXU)
+        except FileExistsError:
+            if not os.path.isdir(target) or os.path.islink(target):
+                os.unlink(target)
+                os.mkdir(target, stat.S_IMODE(st.st_mode) | stat.S_IRWXU)
+
+    def _copy_entries(self, directory, entries):
+        """Copy the content of a directory."""
+        for path, st in entries:
+            if stat.S_ISREG(st.st_mode):
+                self._copy_file(path, st)
+            elif stat.S_ISLNK(st.st_mode):
+                self._copy_symlink(path, st)
+            else:
+                self._copy_special(path, st)
+
+    def _replace(self, function, target):
+        """Create the target with the function, replace an existing file."""
+        try:
+            return function()
+        except FileExistsError:
+            os.unlink(target)
+            return function()
+
+    def _copy_file(self, path, st):
+        """Copy a regular file."""
+        source = self._get_source_path(path)
+        target = self._get_target_path(path)
+
+        src_fd = os.open(source, os.O_RDONLY | os.O_NOFOLLOW)
+
+        try:
+            dst_fd = self._replace(
+                lambda: os.open(target, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600),
+                target
+            )
+
+            try:
+                self._copy_data(src_fd, dst_fd, st.st_size)
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+        self._apply_metadata(path, st, source)
+        self._count_file()
+
+    def _copy_data(self, src_fd, dst_fd, size):
+        """Copy the file data.
+
+        Try to clone the data first, then to copy them in the kernel
+        and finally to copy them in user space.
+        """
+        if not size:
+            return
+
+        if self._can_clone and self._clone_data(src_fd, dst_fd):
+            self._report_progress(size)
+            return
+
+        if self._can_copy_range and self._copy_data_range(src_fd, dst_fd):
+            return
+
+        self._copy_data_buffered(src_fd, dst_fd)
+
+    def _clone_data(self, src_fd, dst_fd):
+        """Clone the file data with a reflink."""
+        try:
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+            return True
+        except OSError as e:
+            if e.errno not in COPY_FALLBACK_ERRORS:
+                raise
+
+            # Cloning between these file systems is not possible.
+            self._can_clone = False
+            return False
+
+    def _copy_data_range(self, src_fd, dst_fd):
+        """Copy the file data in the kernel."""
+        while True:
+            try:
+                copied = os.copy_file_range(src_fd, dst_fd, IMAGE_COPY_CHUNK_SIZE)
+            except OSError as e:
+                if e.errno not in COPY_FALLBACK_ERRORS:
+                    raise
+
+                # The offsets of the file descriptors are updated,
+                # so the fallback can continue from them.
+                self._can_copy_range = False
+                return False
+
+            if not copied:
+                return True
+
+            self._report_progress(copied)
+
+    def _copy_data_buffered(self, src_fd, dst_fd):
+        """Copy the file data in user space."""
+        while True:
+            data = os.read(src_fd, IMAGE_COPY_CHUNK_SIZE)
+
+            if not data:
+                return
+
+            view = memoryview(data)
+
+            while view:
+                view = view[os.write(dst_fd, view):]
+
+            self._report_progress(len(data))
+
+    def _copy_symlink(self, path, st):
+        """Copy a symbolic link."""
+        source = self._get_source_path(path)
+        target = self._get_target_path(path)
+        link = os.readlink(source)
+
+        try:
+            self._replace(lambda: os.symlink(link, target), target)
+        except OSError as e:
+            if e.errno not in UNSUPPORTED_ERRORS:
+                raise
+
+            self._skip(path, e)
+            return
+
+        self._apply_metadata(path, st, source)
+        self._count_file()
+
+    def _copy_special(self, path, st):
+        """Copy a device, a FIFO or a socket."""
+        source = self._get_source_path(path)
+        target = self._get_target_path(path)
+
+        try:
+            self._replace(lambda: os.mknod(target, st.st_mode, st.st_rdev), target)
+        except OSError as e:
+            if e.errno not in UNSUPPORTED_ERRORS:
+                raise
+
+            self._skip(path, e)
+            return
+
+        self._apply_metadata(path, st, source)
+        self._count_file()
+
+    def _copy_link(self, source_path, path):
+        """Copy a hard link.
+
+        Copy the file instead if the target doesn't support hard links.
+        """
+        source = self._get_target_path(source_path)
+        target = self._get_target_path(path)
+
+        try:
+            self._replace(lambda: os.link(source, target), target)
+        except OSError as e:
+            if e.errno not in UNSUPPORTED_ERRORS:
+                raise
+
+            log.debug("Copying %s instead of a hard link: %s", path, e)
+            st = os.lstat(self._get_source_path(path))
+            self._total_size += st.st_size
+            self._copy_file(path, st)
+            return
+
+        self._count_file()
+
+    def _apply_metadata(self, path, st, source):
+        """Apply metadata of the source to the target."""
+        target = self._get_target_path(path)
+        is_link = stat.S_ISLNK(st.st_mode)
+
+        if self._is_root:
+            self._try_metadata(path, os.chown, target, st.st_uid, st.st_gid,
+                               follow_symlinks=False)
+
+        if not is_link:
+            self._try_metadata(path, os.chmod, target, stat.S_IMODE(st.st_mode))
+
+        self._apply_xattrs(path, source, target)
+        self._try_metadata(path, os.utime, target, ns=(st.st_atime_ns, st.st_mtime_ns),
+                           follow_symlinks=False)
+
+    def _apply_xattrs(self, path, source, target):
+        """Apply extended attributes, ACLs and the SELinux context."""
+        try:
+            names = os.listxattr(source, follow_symlinks=False)
+        except OSError as e:
+            if e.errno not in UNSUPPORTED_ERRORS:
+                raise
+            return
+
+        for name in names:
+            value = os.getxattr(source, name, follow_symlinks=False)
+            self._try_metadata(path, os.setxattr, target, name, value,
+                               follow_symlinks=False)
+
+    def _try_metadata(self, path, function, *args, **kwargs):
+        """Apply metadata if the target supports them."""
+        try:
+            function(*args, **kwargs)
+        except OSError as e:
+            if e.errno not in UNSUPPORTED_ERRORS:
+                raise
+
+            log.debug("Failed to apply metadata of %s: %s", path, e)
+
+            with self._lock:
+                self._failed_metadata += 1
+
+    def _log_statistics(self):
+        """Log statistics of the copy."""
+        statistics = self.statistics
+        duration = max(statistics.duration, 0.001)
+
+        log.info(
+            "Copied %s files (%s) in %.1f s: %d files/s, %s/s.",
+            statistics.files,
+            Size(statistics.size),
+            statistics.duration,
+            statistics.files / duration,
+            Size(int(statistics.size / duration)),
+        )
+
+        if statistics.skipped:
+            log.warning("Skipped %s entries unsupported by the target.", statistics.skipped)
+
+        if statistics.failed_metadata:
+            log.warning("Failed to apply %s metadata.", statistics.failed_metadata)
@@ -23,11 +23,28 @@ from pyanaconda.modules.payloads.base.utils import sort_kernel_version_list
 
 log = get_module_logger(__name__)
 
+# Magic numbers of compressed tarballs and options of the tar tool.
+TAR_COMPRESSION_OPTIONS = [
+    (b"\x1f\x8b", "--gzip"),
+    (b"BZh", "--bzip2"),
+    (b"\xfd7zXZ\x00", "--xz"),
+    (b"\x28\xb5\x2f\xfd", "--zstd"),
+]
+
 
 def get_kernel_version_list_from_tar(tarfile_path):
     with tarfile.open(tarfile_path) as archive:
         names = archive.getnames()
 
+    return get_kernel_version_list_from_names(names)
+
+
+def get_kernel_version_list_from_names(names):
+    """Get a list of kernel versions from names of tarball members.
+
+    :param names: a list of member names
+    :return: a sorted list of kernel versions
+    """
     # Strip out vmlinuz- from the names
     kernel_version_list = [
         n.split("/")[-1][8:] for n in names
@@ -38,6 +55,25 @@ def get_kernel_version_list_from_tar(tarfile_path):
     return kernel_version_list
 
 
+def get_tar_compression_option(tarfile_path):
+    """Get the tar option for the compression of the given tarball.
+
+    The tar tool doesn't detect the compression of a tarball
+    read from the standard input, so it has to be specified.
+
+    :param tarfile_path: a path to the tarball
+    :return: a tar option or None if the tarball is not compressed
+    """
+    with open(tarfile_path, "rb") as f:
+        header = f.read(8)
+
+    for magic, option in TAR_COMPRESSION_OPTIONS:
+        if header.startswith(magic):
+            return option
+
+    return None
+
+
 def get_local_image_path_from_url(url):
     image_path = ""
     if url.startswith("file://"):
@@ -226,6 +226,17 @@ class PayloadBase(KickstartBaseModule, Publishable, metaclass=ABCMeta):
         """
         return []
 
+    def download_with_tasks(self):
+        """Download the payload.
+
+        The tasks don't modify the target system, so they can
+        run during the installation of another payload. They
+        always run before the tasks of install_with_tasks.
+
+        :return: list of tasks
+        """
+        return []
+
     @abstractmethod
     def install_with_tasks(self):
         """Install the payload.
@@ -24,10 +24,12 @@ from pyanaconda.core.signal import Signal
 from pyanaconda.modules.common.base import KickstartService
 from pyanaconda.modules.common.constants.services import PAYLOADS
 from pyanaconda.modules.common.containers import TaskContainer
+from pyanaconda.modules.payloads.base.installation import PrepareDownloadLocationTaskBase
 from pyanaconda.modules.payloads.constants import PayloadType
 from pyanaconda.modules.payloads.installation import (
     CopyDriverDisksFilesTask,
     PrepareSystemForInstallationTask,
+    RunInParallelTask,
 )
 from pyanaconda.modules.payloads.kickstart import PayloadKickstartSpecification
 from pyanaconda.modules.payloads.payload.factory import PayloadFactory
@@ -198,13 +200,52 @@ class PayloadsService(KickstartService):
             )
         ]
 
-        tasks += self.active_payload.install_with_tasks()
+        main_tasks = self.active_payload.download_with_tasks()
+        main_tasks += self.active_payload.install_with_tasks()
 
-        if self.active_payload.side_payload:
-            tasks += self.active_payload.side_payload.install_with_tasks()
+        side_payload = self.active_payload.side_payload
+
+        if not side_payload:
+            tasks += main_tasks
+        elif conf.payload.pipelined_installation:
+            # Pick the download locations one after another, so they
+            # don't count with the same free space.
+            reserved_space = {}
+            main_setup, main_tasks = self._split_download_setup(main_tasks, reserved_space)
+            side_setup, side_tasks = self._split_download_setup(
+                side_payload.download_with_tasks(), reserved_space
+            )
+            tasks += main_setup + side_setup
+
+            # Download the side payload during the installation
+            # of the main payload.
+            tasks.append(RunInParallelTask(
+                name="Install the payload",
+                sequences=[main_tasks, side_tasks]
+            ))
+            tasks += side_payload.install_with_tasks()
+        else:
+            tasks += main_tasks
+            tasks += side_payload.download_with_tasks()
+            tasks += side_payload.install_with_tasks()
 
         return tasks
 
+    @staticmethod
+    def _split_download_setup(tasks, reserved_space):
+        """Split tasks after the task that prepares the download location.
+
+        :param tasks: a list of tasks
+        :param reserved_space: a dictionary of mount points and reserved sizes
+        :return: a tuple of lists of the setup tasks and the remaining tasks
+        """
+        for index, task in enumerate(tasks):
+            if isinstance(task, PrepareDownloadLocationTaskBase):
+                task.set_reserved_space(reserved_space)
+                return tasks[:index + 1], tasks[index + 1:]
+
+        return [], tasks
+
     def post_install_with_tasks(self):
         """Return a list of post-installation tasks.
 
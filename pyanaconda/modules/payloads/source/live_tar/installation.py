@@ -58,7 +58,6 @@ class InstallLiveTarTask(Task):
         :return: a list of kernel versions
         """
         self._set_up_tarball()
-        self._collect_kernels()
         self._install_tarball()
         self._tear_down_tarball()
 
@@ -77,17 +76,27 @@ class InstallLiveTarTask(Task):
 
         task = VerifyImageChecksumTask(
             configuration=self._configuration,
-            image_path=self._tarball_path
+            image_path=self._tarball_path,
+            image_checksum=task.checksum,
         )
         self._run_task(task)
 
     def _install_tarball(self):
-        """Install the content of the tarball."""
+        """Install the content of the tarball.
+
+        Collect the kernel version list if the installation
+        task doesn't provide it.
+        """
         task = InstallFromTarTask(
             sysroot=self._sysroot,
             tarfile=self._tarball_path
         )
-        self._run_task(task)
+        kernel_version_list = self._run_task(task)
+
+        if kernel_version_list is None:
+            self._collect_kernels()
+        else:
+            self._kernel_version_list = kernel_version_list
 
     def _collect_kernels(self):
         """Collect the kernel version list."""
@@ -0,0 +1,102 @@
+#
+# Cache of the device tree data
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 31 Milk Street #960789 Boston, MA
+# 02196 USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+from blivet import callbacks as blivet_callbacks
+
+from pyanaconda.anaconda_loggers import get_module_logger
+
+log = get_module_logger(__name__)
+
+__all__ = ["DeviceDataCache"]
+
+
+class DeviceDataCache:
+    """Cache of data of devices and their formats.
+
+    The cached data are valid for one generation of device trees.
+    The generation changes when an action is added or removed, when
+    a device or a format is added or removed, and when a storage
+    model is replaced. Changes of devices that are not tracked by
+    Blivet have to invalidate the cache explicitly.
+    """
+
+    # The generation is shared by all caches.
+    _generation = 0
+
+    def __init__(self):
+        self._data = {}
+        self._data_generation = self._generation
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def invalidate(cls, **kwargs):
+        """Invalidate data of all caches.
+
+        The method accepts arguments of Blivet callbacks.
+        """
+        cls._generation += 1
+
+    @property
+    def hits(self):
+        """Number of requests answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """Number of requests that had to collect the data."""
+        return self._misses
+
+    def get(self, key, collect):
+        """Get the cached data.
+
+        :param key: a key of the data, for example a device ID
+        :param collect: a function that collects the data if they are not cached
+        :return: the data
+        """
+        if self._data_generation != self._generation:
+            self._data.clear()
+            self._data_generation = self._generation
+
+        if key in self._data:
+            self._hits += 1
+            return self._data[key]
+
+        self._misses += 1
+        data = collect()
+
+        # Don't cache the data if the tree has changed in the meantime.
+        if self._data_generation == self._generation:
+            self._data[key] = data
+
+        return data
+
+
+# Invalidate the caches on changes of the device trees.
+for _callback_list in (
+        blivet_callbacks.callbacks.action_added,
+        blivet_callbacks.callbacks.action_removed,
+        blivet_callbacks.callbacks.device_added,
+        blivet_callbacks.callbacks.device_removed,
+        blivet_callbacks.callbacks.format_added,
+        blivet_callbacks.callbacks.format_removed,
+        blivet_callbacks.callbacks.parent_added,
+        blivet_callbacks.callbacks.parent_removed,
+        blivet_callbacks.callbacks.attribute_changed):
+    _callback_list.add(DeviceDataCache.invalidate)
@@ -22,6 +22,7 @@ from dasbus.server.publishable import Publishable
 from pyanaconda.anaconda_loggers import get_module_logger
 from pyanaconda.core.dbus import DBus
 from pyanaconda.modules.common.constants.objects import DEVICE_TREE
+from pyanaconda.modules.storage.devicetree.cache import DeviceDataCache
 from pyanaconda.modules.storage.devicetree.devicetree_interface import (
     DeviceTreeInterface,
 )
@@ -44,3 +45,8 @@ class DeviceTreeModule(StorageSubscriberModule, DeviceTreeViewer, DeviceTreeHand
     def publish(self):
         """Publish the module."""
         DBus.publish_object(DEVICE_TREE.object_path, self.for_publication())
+
+    def on_storage_changed(self, storage):
+        """Keep the instance of the current storage."""
+        super().on_storage_changed(storage)
+        DeviceDataCache.invalidate()
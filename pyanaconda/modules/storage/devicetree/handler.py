@@ -26,6 +26,7 @@ from pyanaconda.modules.common.errors.storage import (
     MountFilesystemError,
     UnknownDeviceError,
 )
+from pyanaconda.modules.storage.devicetree.cache import DeviceDataCache
 from pyanaconda.modules.storage.devicetree.populate import FindDevicesTask
 from pyanaconda.modules.storage.devicetree.rescue import (
     FindExistingSystemsTask,
@@ -110,7 +111,11 @@ class DeviceTreeHandler(ABC):
         :return: True if success, otherwise False
         """
         device = self._get_device(device_id)
-        return unlock_device(self.storage, device, passphrase)
+
+        try:
+            return unlock_device(self.storage, device, passphrase)
+        finally:
+            DeviceDataCache.invalidate()
 
     def find_unconfigured_luks(self):
         """Find all unconfigured LUKS devices.
@@ -132,6 +137,7 @@ class DeviceTreeHandler(ABC):
         device = self._get_device(device_id)
         device.format.passphrase = passphrase
         self.storage.save_passphrase(device)
+        DeviceDataCache.invalidate()
 
     def get_device_mount_options(self, device_id):
         """Get mount options of the specified device.
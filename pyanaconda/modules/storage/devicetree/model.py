@@ -19,6 +19,7 @@
 #
 import logging
 
+from blivet import util as blivet_util
 from blivet.blivet import Blivet
 from blivet.devicelibs.crypto import DEFAULT_LUKS_VERSION
 from blivet.devices import BTRFSSubVolumeDevice
@@ -33,6 +34,7 @@ from pyanaconda.core.path import set_system_root
 from pyanaconda.core.product import get_product_short_name
 from pyanaconda.modules.common.constants.services import NETWORK
 from pyanaconda.modules.storage.bootloader import BootLoaderFactory
+from pyanaconda.modules.storage.devicetree.cache import DeviceDataCache
 from pyanaconda.modules.storage.devicetree.fsset import FSSet
 from pyanaconda.modules.storage.devicetree.root import find_existing_installations
 from pyanaconda.modules.storage.devicetree.utils import (
@@ -304,6 +306,9 @@ class InstallerStorage(Blivet):
         self.roots = find_existing_installations(self.devicetree)
         self.dump_state("initial")
 
+        # The protection of devices is not tracked by Blivet.
+        DeviceDataCache.invalidate()
+
     def _mark_protected_devices(self):
         """Mark protected devices.
 
@@ -385,6 +390,9 @@ class InstallerStorage(Blivet):
         # Update the list.
         self.protected_devices = protected_names
 
+        # The protection of devices is not tracked by Blivet.
+        DeviceDataCache.invalidate()
+
     def _mark_protected_device(self, device, include_subtree=False):
         """Mark a device as protected.
 
@@ -547,15 +555,25 @@ class InstallerStorage(Blivet):
 
         self.fsset.set_fstab_swaps(devices)
 
+    def __deepcopy__(self, memo):
+        """Create a deep copy of the storage model without the roots.
+
+        The roots would drag along copies of devices that are not
+        in the tree. Use the copy method to get proper copies of them.
+        """
+        new = blivet_util.variable_copy(self, memo, omit=('roots',))
+        new.roots = []
+        return new
+
     def copy(self):
         """Create a copy of the storage model."""
         log.debug("Creating a copy of the storage model.")
 
-        # Create a copy of the Blivet object.
+        # Create a copy of the Blivet object without the roots.
         new = super().copy()
 
         # Create proper copies of the collected installation roots.
-        new.roots = [root.copy(storage=new) for root in new.roots]
+        new.roots = [root.copy(storage=new) for root in self.roots]
 
         log.debug("Finished a copy of the storage model.")
         return new
@@ -407,24 +407,37 @@ class Root:
     def copy(self, storage):
         """Create a copy with devices of the given storage model.
 
+        The devices are not copied. They are replaced with devices
+        of the given storage model that have the same IDs.
+
         :param InstallerStorage storage: a storage model
         :return Root: a copy of this root object
         """
-        new_root = copy.deepcopy(self)
+        devicetree = storage.devicetree
+        devices = {
+            d.id: d for d in devicetree._devices + devicetree._hidden
+            if getattr(d, "complete", True)
+        }
 
         def _get_device(d):
-            return storage.devicetree.get_device_by_id(d.id, hidden=True)
+            return devices.get(d.id)
+
+        new_mounts = {}
+        new_mountopts = {}
+
+        for mount_point, device in self._mounts.items():
+            new_device = _get_device(device)
+
+            if not mount_point or not new_device:
+                continue
 
-        def _get_mount(i):
-            m, d = i[0], _get_device(i[1])
-            return (m, d) if m and d else None
+            new_mounts[mount_point] = new_device
 
-        def _get_mount_opt(i):
-            m, d = i[0], _get_device(i[1])
-            return (m, self._mountopts[m]) if m and d and m in self._mountopts else None
+            if mount_point in self._mountopts:
+                new_mountopts[mount_point] = self._mountopts[mount_point]
 
-        new_root._devices = list(filter(None, map(_get_device, new_root._devices)))
-        new_root._mounts = dict(filter(None, map(_get_mount, new_root._mounts.items())))
-        new_root._mountopts = dict(filter(None, map(_get_mount_opt,
-                                                    new_root._mounts.items())))
+        new_root = copy.copy(self)
+        new_root._devices = list(filter(None, map(_get_device, self._devices)))
+        new_root._mounts = new_mounts
+        new_root._mountopts = new_mountopts
         return new_root
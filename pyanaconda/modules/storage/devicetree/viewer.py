@@ -31,6 +31,7 @@ from pyanaconda.modules.common.structures.storage import (
     DeviceActionData,
     DeviceData,
     DeviceFormatData,
+    DeviceTreeData,
     MountPointConstraintsData,
     OSData,
 )
@@ -40,6 +41,7 @@ from pyanaconda.modules.storage.constants import (
     WINDOWS_PARTITION_TYPES,
     WINDOWS_PARTITION_TYPES_EXPECTED_FS,
 )
+from pyanaconda.modules.storage.devicetree.cache import DeviceDataCache
 from pyanaconda.modules.storage.devicetree.utils import (
     get_required_device_size,
     get_supported_filesystems,
@@ -59,6 +61,10 @@ MAC_OS = "Mac OS"
 class DeviceTreeViewer(ABC):
     """The viewer of the device tree."""
 
+    def __init__(self):
+        super().__init__()
+        self._data_cache = DeviceDataCache()
+
     @property
     @abstractmethod
     def storage(self):
@@ -68,6 +74,14 @@ class DeviceTreeViewer(ABC):
         """
         return None
 
+    @property
+    def data_cache(self):
+        """The cache of the device and format data.
+
+        :return: an instance of DeviceDataCache
+        """
+        return self._data_cache
+
     def get_root_device(self):
         """Get the root device.
 
@@ -113,6 +127,18 @@ class DeviceTreeViewer(ABC):
     def get_device_data(self, device_id):
         """Get the device data.
 
+        :param device_id: a device ID
+        :return: an instance of DeviceData
+        :raise: UnknownDeviceError if the device is not found
+        """
+        return self._data_cache.get(
+            ("device", device_id),
+            partial(self._get_device_data, device_id)
+        )
+
+    def _get_device_data(self, device_id):
+        """Collect the device data.
+
         :param device_id: a device ID
         :return: an instance of DeviceData
         :raise: UnknownDeviceError if the device is not found
@@ -140,6 +166,27 @@ class DeviceTreeViewer(ABC):
         data.attrs = self._prune_attributes(data.attrs)
         return data
 
+    def get_devices_data(self, device_ids):
+        """Get data of the specified devices.
+
+        :param device_ids: a list of device IDs
+        :return: a list of DeviceData instances
+        :raise: UnknownDeviceError if a device is not found
+        """
+        return list(map(self.get_device_data, device_ids))
+
+    def get_device_tree_data(self):
+        """Get data of all devices in the device tree.
+
+        :return: an instance of DeviceTreeData
+        """
+        device_ids = self.get_devices()
+
+        data = DeviceTreeData()
+        data.devices = self.get_devices_data(device_ids)
+        data.formats = self.get_formats_data(device_ids)
+        return data
+
     def _set_device_data(self, device, data):
         """Set data for a device of any type."""
         data.device_id = device.device_id
@@ -213,8 +260,19 @@ class DeviceTreeViewer(ABC):
         :param device_name: a name of the device
         :return: an instance of DeviceFormatData
         """
-        device = self._get_device(device_id)
-        return self._get_format_data(device.format)
+        return self._data_cache.get(
+            ("format", device_id),
+            lambda: self._get_format_data(self._get_device(device_id).format)
+        )
+
+    def get_formats_data(self, device_ids):
+        """Get data of formats of the specified devices.
+
+        :param device_ids: a list of device IDs
+        :return: a list of DeviceFormatData instances
+        :raise: UnknownDeviceError if a device is not found
+        """
+        return list(map(self.get_format_data, device_ids))
 
     def _get_format_data(self, fmt):
         """Get the format data.
@@ -487,6 +545,17 @@ class DeviceTreeViewer(ABC):
         disks = self._get_devices(disk_ids)
         return self.storage.get_disk_free_space(disks).get_bytes()
 
+    def get_disks_free_space(self, disk_ids):
+        """Get free space on each of the given disks.
+
+        :param disk_ids: a list of disk IDs
+        :return: a dictionary of disk IDs and sizes in bytes
+        """
+        return {
+            disk.device_id: self.storage.get_disk_free_space([disk]).get_bytes()
+            for disk in self._get_devices(disk_ids)
+        }
+
     def get_disk_reclaimable_space(self, disk_ids):
         """Get total reclaimable space on the given disks.
 
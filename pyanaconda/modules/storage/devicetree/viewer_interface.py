@@ -26,6 +26,7 @@ from pyanaconda.modules.common.structures.storage import (
     DeviceActionData,
     DeviceData,
     DeviceFormatData,
+    DeviceTreeData,
     MountPointConstraintsData,
     OSData,
 )
@@ -83,6 +84,25 @@ class DeviceTreeViewerInterface(InterfaceTemplate):
         """
         return DeviceData.to_structure(self.implementation.get_device_data(device_id))
 
+    def GetDevicesData(self, device_ids: List[Str]) -> List[Structure]:
+        """Get data of the specified devices.
+
+        :param device_ids: a list of device IDs
+        :return: a list of structures with device data
+        :raise: UnknownDeviceError if a device is not found
+        """
+        return DeviceData.to_structure_list(self.implementation.get_devices_data(device_ids))
+
+    def GetDeviceTreeData(self) -> Structure:
+        """Get data of all devices in the device tree.
+
+        Return a snapshot with data of the devices and their
+        formats, so the whole tree can be read in one call.
+
+        :return: a structure with device tree data
+        """
+        return DeviceTreeData.to_structure(self.implementation.get_device_tree_data())
+
     def GetFormatData(self, device_id: Str) -> Structure:
         """Get the device format data.
 
@@ -95,6 +115,17 @@ class DeviceTreeViewerInterface(InterfaceTemplate):
         """
         return DeviceFormatData.to_structure(self.implementation.get_format_data(device_id))
 
+    def GetFormatsData(self, device_ids: List[Str]) -> List[Structure]:
+        """Get data of formats of the specified devices.
+
+        :param device_ids: a list of device IDs
+        :return: a list of structures with format data
+        :raise: UnknownDeviceError if a device is not found
+        """
+        return DeviceFormatData.to_structure_list(
+            self.implementation.get_formats_data(device_ids)
+        )
+
     def GetFormatTypeData(self, name: Str) -> Structure:
         """Get the format type data.
 
@@ -182,6 +213,17 @@ class DeviceTreeViewerInterface(InterfaceTemplate):
         """
         return self.implementation.get_disk_free_space(disk_ids)
 
+    def GetDisksFreeSpace(self, disk_ids: List[Str]) -> Dict[Str, UInt64]:
+        """Get free space on each of the given disks.
+
+        Calculates free space available for use per disk,
+        so the space of many disks can be read in one call.
+
+        :param disk_ids: a list of disk IDs
+        :return: a dictionary of disk IDs and sizes in bytes
+        """
+        return self.implementation.get_disks_free_space(disk_ids)
+
     def GetDiskReclaimableSpace(self, disk_ids: List[Str]) -> UInt64:
         """Get total reclaimable space on the given disks.
 
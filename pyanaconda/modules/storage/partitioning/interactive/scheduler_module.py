@@ -23,6 +23,7 @@ from blivet.size import Size
 from pyanaconda.anaconda_loggers import get_module_logger
 from pyanaconda.modules.common.structures.validation import ValidationReport
 from pyanaconda.modules.storage.devicetree import DeviceTreeModule
+from pyanaconda.modules.storage.devicetree.cache import DeviceDataCache
 from pyanaconda.modules.storage.partitioning.interactive import utils
 from pyanaconda.modules.storage.partitioning.interactive.add_device import AddDeviceTask
 from pyanaconda.modules.storage.partitioning.interactive.change_device import (
@@ -321,7 +322,11 @@ class DeviceTreeSchedulerModule(DeviceTreeModule):
         :raise: StorageConfigurationError if the device cannot be created
         """
         task = AddDeviceTask(self.storage, request)
-        task.run()
+
+        try:
+            task.run()
+        finally:
+            DeviceDataCache.invalidate()
 
     def change_device(self, request, original_request):
         """Change a device in the storage model.
@@ -334,7 +339,12 @@ class DeviceTreeSchedulerModule(DeviceTreeModule):
         """
         device = self._get_device(request.device_spec)
         task = ChangeDeviceTask(self.storage, device, request, original_request)
-        task.run()
+
+        # Some attributes of the device are changed without actions.
+        try:
+            task.run()
+        finally:
+            DeviceDataCache.invalidate()
 
     def reset_device(self, device_id):
         """Reset the specified device in the storage model.
@@ -345,7 +355,11 @@ class DeviceTreeSchedulerModule(DeviceTreeModule):
         :raise: StorageConfigurationError in case of failure
         """
         device = self._get_device(device_id)
-        utils.reset_device(self.storage, device)
+
+        try:
+            utils.reset_device(self.storage, device)
+        finally:
+            DeviceDataCache.invalidate()
 
     def destroy_device(self, device_id):
         """Destroy the specified device in the storage model.
@@ -354,7 +368,11 @@ class DeviceTreeSchedulerModule(DeviceTreeModule):
         :raise: StorageConfigurationError in case of failure
         """
         device = self._get_device(device_id)
-        utils.destroy_device(self.storage, device)
+
+        try:
+            utils.destroy_device(self.storage, device)
+        finally:
+            DeviceDataCache.invalidate()
 
     def schedule_partitions_with_task(self, request):
         """Schedule the partitioning actions.
@@ -365,4 +383,6 @@ class DeviceTreeSchedulerModule(DeviceTreeModule):
         :param: a partitioning request
         :return: a task
         """
-        return InteractiveAutoPartitioningTask(self.storage, request)
+        task = InteractiveAutoPartitioningTask(self.storage, request)
+        task.stopped_signal.connect(DeviceDataCache.invalidate)
+        return task
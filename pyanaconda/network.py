@@ -26,12 +26,14 @@ import threading
 import time
 
 import gi
+from dasbus.client.proxy import disconnect_proxy
 from dasbus.typing import get_native
 
 from pyanaconda.anaconda_loggers import get_module_logger
 from pyanaconda.core import constants, util
 from pyanaconda.core.configuration.anaconda import conf
 from pyanaconda.core.constants import TIME_SOURCE_SERVER
+from pyanaconda.core.glib import create_main_loop, create_new_context, timeout_source_new
 from pyanaconda.core.i18n import _
 from pyanaconda.core.kernel import kernel_arguments
 from pyanaconda.core.path import make_directories
@@ -40,6 +42,7 @@ from pyanaconda.core.regexes import (
     IPV6_ADDRESS_IN_DRACUT_IP_OPTION,
     MAC_OCTET,
 )
+from pyanaconda.core.threads import thread_manager
 from pyanaconda.modules.common.constants.objects import FCOE
 from pyanaconda.modules.common.constants.services import NETWORK, STORAGE, TIMEZONE
 from pyanaconda.modules.common.structures.network import NetworkDeviceInfo
@@ -387,34 +390,133 @@ def wait_for_connected_NM(timeout=constants.NETWORK_CONNECTION_TIMEOUT, only_con
     else:
         log.debug("waiting for connected NM, timeout=%d", timeout)
 
-    i = 0
-    while i < timeout:
-        i += constants.NETWORK_CONNECTED_CHECK_INTERVAL
-        time.sleep(constants.NETWORK_CONNECTED_CHECK_INTERVAL)
-        if network_proxy.Connected:
-            log.debug("NM connected, waited %d seconds", i)
+    def _check(proxy):
+        if proxy.Connected:
             return True
-        elif only_connecting:
-            if not network_proxy.IsConnecting():
-                break
 
-    log.debug("NM not connected, waited %d seconds", i)
+        return only_connecting and not proxy.IsConnecting()
+
+    _done, waited = _wait_for_network(_check, timeout)
+
+    if network_proxy.Connected:
+        log.debug("NM connected, waited %.2f seconds", waited)
+        return True
+
+    log.debug("NM not connected, waited %.2f seconds", waited)
     return False
 
 
 def wait_for_network_devices(devices, timeout=constants.NETWORK_CONNECTION_TIMEOUT):
     """Wait for network devices to be activated with a connection."""
     devices = set(devices)
-    i = 0
     log.debug("waiting for connection of devices %s for iscsi", devices)
-    while i < timeout:
-        network_proxy = NETWORK.get_proxy()
-        activated_devices = network_proxy.GetActivatedInterfaces()
-        if not devices - set(activated_devices):
+
+    def _check(proxy):
+        return not devices - set(proxy.GetActivatedInterfaces())
+
+    activated, waited = _wait_for_network(_check, timeout)
+
+    if activated:
+        log.debug("devices %s connected, waited %.2f seconds", devices, waited)
+    else:
+        log.debug("devices %s not connected, waited %.2f seconds", devices, waited)
+
+    return activated
+
+
+def _wait_for_network(check, timeout):
+    """Wait until the given check of the network state passes.
+
+    Threads wait for signals of the Network module and check the state
+    as soon as it changes. The main thread polls the module instead,
+    because the signals might be delivered only from its main loop.
+
+    :param check: a function with a proxy of the Network module that returns a bool
+    :param timeout: timeout in seconds
+    :return: a tuple with the result of the last check and the waited time in seconds
+    """
+    start = time.perf_counter()
+
+    if thread_manager.in_main_thread():
+        result = _poll_network(check, timeout)
+    else:
+        result = _wait_for_network_signals(check, timeout)
+
+    return result, time.perf_counter() - start
+
+
+def _poll_network(check, timeout):
+    """Poll the Network module until the check passes.
+
+    :param check: a function with a proxy of the Network module that returns a bool
+    :param timeout: timeout in seconds
+    :return: the result of the last check
+    """
+    network_proxy = NETWORK.get_proxy()
+    end = time.perf_counter() + timeout
+
+    while not check(network_proxy):
+        if time.perf_counter() >= end:
+            return False
+
+        time.sleep(constants.NETWORK_CONNECTED_CHECK_INTERVAL)
+
+    return True
+
+
+def _wait_for_network_signals(check, timeout):
+    """Wait for signals of the Network module until the check passes.
+
+    Run a loop of a new main context of the current thread. The signals
+    are subscribed in this context, so they are delivered to the loop.
+    The state is still checked once per second in case a signal is lost.
+
+    :param check: a function with a proxy of the Network module that returns a bool
+    :param timeout: timeout in seconds
+    :return: the result of the last check
+    """
+    context = create_new_context()
+    loop = create_main_loop(context)
+    sources = []
+
+    def _add_timeout(interval, function):
+        source = timeout_source_new(int(interval * 1000))
+        source.set_callback(function)
+        source.attach(context)
+        sources.append(source)
+
+    def _quit(*args):
+        loop.quit()
+        return False
+
+    def _on_changed(*args):
+        if check(network_proxy):
+            loop.quit()
+
+        return True
+
+    context.push_thread_default()
+    network_proxy = NETWORK.get_proxy()
+
+    try:
+        network_proxy.PropertiesChanged.connect(_on_changed)
+        network_proxy.ActivatedInterfacesChanged.connect(_on_changed)
+
+        if check(network_proxy):
             return True
-        i += 1
-        time.sleep(1)
-    return False
+
+        _add_timeout(constants.NETWORK_STATE_CHECK_INTERVAL, _on_changed)
+        _add_timeout(timeout, _quit)
+
+        loop.run()
+        return check(network_proxy)
+    finally:
+        disconnect_proxy(network_proxy)
+
+        for source in sources:
+            source.destroy()
+
+        context.pop_thread_default()
 
 
 def wait_for_connecting_NM_thread():
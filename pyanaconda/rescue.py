@@ -53,7 +53,7 @@ from pyanaconda.modules.common.structures.reboot import RebootData
 from pyanaconda.modules.common.structures.rescue import RescueData
 from pyanaconda.modules.common.structures.storage import (
     DeviceData,
-    DeviceFormatData,
+    DeviceTreeData,
     OSData,
 )
 from pyanaconda.modules.common.task import sync_run_task
@@ -292,15 +292,15 @@ class Rescue:
         """
         device_ids = []
 
-        for device_id in self._device_tree_proxy.GetDevices():
-            format_data = DeviceFormatData.from_structure(
-                self._device_tree_proxy.GetFormatData(device_id)
-            )
+        tree_data = DeviceTreeData.from_structure(
+            self._device_tree_proxy.GetDeviceTreeData()
+        )
 
+        for device_data, format_data in zip(tree_data.devices, tree_data.formats):
             if format_data.type != "luks":
                 continue
 
-            device_ids.append(device_id)
+            device_ids.append(device_data.device_id)
 
         return device_ids
 
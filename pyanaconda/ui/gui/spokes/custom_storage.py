@@ -452,13 +452,41 @@ class CustomPartitioningSpoke(NormalSpoke, StorageCheckHandler):
             )
             ui_roots.insert(0, new_root)
 
+        # Get data of all devices with selectors in one call.
+        selectors_data = self._get_selectors_data(ui_roots, unused_devices)
+
         # Add root pages.
         for root in ui_roots:
-            self._add_root_page(root)
+            self._add_root_page(root, selectors_data)
 
         # Add the unknown page.
         if unused_devices:
-            self._add_unknown_page(unused_devices)
+            self._add_unknown_page(unused_devices, selectors_data)
+
+    def _get_selectors_data(self, roots, unused_devices):
+        """Get data of devices that will have mount point selectors.
+
+        :param roots: a list of OSData
+        :param unused_devices: a list of device IDs
+        :return: a dictionary of device IDs and tuples of device and format data
+        """
+        device_ids = list(unused_devices)
+
+        for root in roots:
+            device_ids.extend(root.mount_points.values())
+            device_ids.extend(root.devices)
+
+        # Remove duplicates and keep the order.
+        device_ids = list(dict.fromkeys(device_ids))
+
+        devices_data = DeviceData.from_structure_list(
+            self._device_tree.GetDevicesData(device_ids)
+        )
+        formats_data = DeviceFormatData.from_structure_list(
+            self._device_tree.GetFormatsData(device_ids)
+        )
+
+        return dict(zip(device_ids, zip(devices_data, formats_data)))
 
     def _add_initial_page(self, reuse_existing=False):
         page = CreateNewPage(
@@ -475,7 +503,7 @@ class CustomPartitioningSpoke(NormalSpoke, StorageCheckHandler):
         self._partitionsNotebook.set_current_page(NOTEBOOK_LABEL_PAGE)
         self._set_page_label_text()
 
-    def _add_root_page(self, root: OSData):
+    def _add_root_page(self, root: OSData, selectors_data):
         page = Page(root.os_name)
         self._accordion.add_page(page, cb=self.on_page_clicked)
 
@@ -483,6 +511,7 @@ class CustomPartitioningSpoke(NormalSpoke, StorageCheckHandler):
             selector = MountPointSelector()
             self._update_selector(
                 selector,
+                selectors_data[device_id],
                 device_id=device_id,
                 root_name=root.os_name,
                 mount_point=mount_point
@@ -498,6 +527,7 @@ class CustomPartitioningSpoke(NormalSpoke, StorageCheckHandler):
             selector = MountPointSelector()
             self._update_selector(
                 selector,
+                selectors_data[device_id],
                 device_id=device_id,
                 root_name=root.os_name
             )
@@ -505,18 +535,19 @@ class CustomPartitioningSpoke(NormalSpoke, StorageCheckHandler):
 
         page.show_all()
 
-    def _add_unknown_page(self, devices):
+    def _add_unknown_page(self, devices, selectors_data):
         page = UnknownPage(_("Unknown"))
         self._accordion.add_page(page, cb=self.on_page_clicked)
 
         for device_id in sorted(devices):
             selector = MountPointSelector()
-            self._update_selector(selector, device_id)
+            self._update_selector(selector, selectors_data[device_id], device_id)
             page.add_selector(selector, self.on_selector_clicked)
 
         page.show_all()
 
-    def _update_selector(self, selector, device_id="", root_name="", mount_point=""):
+    def _update_selector(self, selector, selector_data, device_id="", root_name="",
+                         mount_point=""):
         if not selector:
             return
 
@@ -526,13 +557,7 @@ class CustomPartitioningSpoke(NormalSpoke, StorageCheckHandler):
         if not root_name:
             root_name = selector.root_name
 
-        device_data = DeviceData.from_structure(
-            self._device_tree.GetDeviceData(device_id)
-        )
-
-        format_data = DeviceFormatData.from_structure(
-            self._device_tree.GetFormatData(device_id)
-        )
+        device_data, format_data = selector_data
 
         mount_point = self._get_mount_point_description(
             mount_point, format_data
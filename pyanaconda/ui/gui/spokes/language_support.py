@@ -177,7 +177,7 @@ class LangsupportSpoke(NormalSpoke, LangLocaleHandler):
             return Pango.Weight.NORMAL.real
 
     def _is_lang_selected(self, lang):
-        lang_locales = set(localization.get_language_locales(lang))
+        lang_locales = set(self._get_language_locales(lang))
         return not lang_locales.isdisjoint(self._selected_locales)
 
     def _mark_selected_language_bold(self, column, renderer, model, itr, user_data=None):
@@ -93,14 +93,14 @@ class SelectedDisksDialog(GUIObject):
         return rc
 
     def _update_disks(self):
-        for disk_id in self._disks:
-            device_data = DeviceData.from_structure(
-                self._device_tree.GetDeviceData(disk_id)
-            )
-
-            device_free_space = self._device_tree.GetDiskFreeSpace(
-                [disk_id]
-            )
+        disks_data = DeviceData.from_structure_list(
+            self._device_tree.GetDevicesData(self._disks)
+        )
+
+        disks_free_space = self._device_tree.GetDisksFreeSpace(self._disks)
+
+        for disk_id, device_data in zip(self._disks, disks_data):
+            device_free_space = disks_free_space[disk_id]
 
             self._store.append([
                 False,
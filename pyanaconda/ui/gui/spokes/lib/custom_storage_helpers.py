@@ -444,13 +444,14 @@ class DisksDialog(GUIObject):
                                               "If you select multiple, only 1 drive will be used."))
 
     def _populate_disks(self):
-        for disk_id in self._disks:
-            device_data = DeviceData.from_structure(
-                self._device_tree.GetDeviceData(disk_id)
-            )
-            device_free_space = self._device_tree.GetDiskFreeSpace(
-                [disk_id]
-            )
+        disks_data = DeviceData.from_structure_list(
+            self._device_tree.GetDevicesData(self._disks)
+        )
+
+        disks_free_space = self._device_tree.GetDisksFreeSpace(self._disks)
+
+        for disk_id, device_data in zip(self._disks, disks_data):
+            device_free_space = disks_free_space[disk_id]
             self._store.append([
                 "{} ({})".format(
                     device_data.description,
@@ -554,13 +555,14 @@ class ContainerDialog(GUIObject, GUIDialogInputCheckHandler):
         self._dialog_label.set_text(dialog_text)
 
     def _populate_disks(self):
-        for disk_id in self._disks:
-            device_data = DeviceData.from_structure(
-                self._device_tree.GetDeviceData(disk_id)
-            )
-            device_free_space = self._device_tree.GetDiskFreeSpace(
-                [disk_id]
-            )
+        disks_data = DeviceData.from_structure_list(
+            self._device_tree.GetDevicesData(self._disks)
+        )
+
+        disks_free_space = self._device_tree.GetDisksFreeSpace(self._disks)
+
+        for disk_id, device_data in zip(self._disks, disks_data):
+            device_free_space = disks_free_space[disk_id]
             self._store.append([
                 "{} ({})".format(
                     device_data.description,
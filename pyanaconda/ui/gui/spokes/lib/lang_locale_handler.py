@@ -28,6 +28,7 @@ import gi
 
 from pyanaconda import localization
 from pyanaconda.core.string import strip_accents
+from pyanaconda.modules.common.structures.language import LanguageData, LocaleData
 from pyanaconda.ui.gui.utils import (
     override_cell_property,
     set_treeview_selection,
@@ -60,6 +61,10 @@ class LangLocaleHandler(metaclass=ABCMeta):
         self._localeView = None
         self._localeStore = None
         self._localeSelection = None
+        self._l12_module = None
+
+        # data of locales of all available languages
+        self._locales_data = {}
 
         self._right_arrow = None
         self._left_arrow = None
@@ -84,12 +89,19 @@ class LangLocaleHandler(metaclass=ABCMeta):
                                "pixbuf", self._render_lang_selected)
 
         # fill the list with available translations
-        langs = localization.get_available_translations()
-
-        for lang in langs:
+        languages = LanguageData.from_structure_list(
+            self._l12_module.GetLanguagesData()
+        )
+        self._locales_data = {
+            lang: LocaleData.from_structure_list(locales)
+            for lang, locales in self._l12_module.GetLocalesData().items()
+        }
+
+        for data in languages:
             self._add_language(self._languageStore,
-                               localization.get_native_name(lang),
-                               localization.get_english_name(lang), lang)
+                               data.native_name,
+                               data.english_name,
+                               data.language_id)
 
         # make filtering work
         self._languageStoreFilter.set_visible_func(self._matches_entry, None)
@@ -161,21 +173,29 @@ class LangLocaleHandler(metaclass=ABCMeta):
 
         return (lang_itr, locale_itr)
 
+    def _get_language_locales(self, lang):
+        """Get locales available for the given language."""
+        if lang in self._locales_data:
+            return [data.locale_id for data in self._locales_data[lang]]
+
+        return localization.get_language_locales(lang)
+
     def _refresh_locale_store(self, lang):
         """Refresh the localeStore with locales for the given language."""
 
         self._localeStore.clear()
-        locales = localization.get_language_locales(lang)
+        locales = self._locales_data[lang]
 
-        for locale in locales:
+        for data in locales:
+            locale = data.locale_id
             if self._only_existing_locales and not localization.locale_has_translation(locale):
                 continue
             self._add_locale(self._localeStore,
-                             localization.get_native_name(locale),
+                             data.native_name,
                              locale)
 
         # select the first locale (with the highest rank)
-        set_treeview_selection(self._localeView, locales[0], col=1)
+        set_treeview_selection(self._localeView, locales[0].locale_id, col=1)
 
     def on_lang_selection_changed(self, selection):
         (store, selected) = selection.get_selected_rows()
@@ -424,20 +424,21 @@ class StorageSpoke(NormalSpoke, StorageCheckHandler):
         # of them, we do not display them in the box by default.  Instead, only
         # those selected in the filter UI are displayed.  This means refresh
         # needs to know to create and destroy overviews as appropriate.
-        for disk_id in self._available_disks:
+        disks_data = DeviceData.from_structure_list(
+            self._device_tree.GetDevicesData(self._available_disks)
+        )
+        disks_free_space = self._device_tree.GetDisksFreeSpace(self._available_disks)
 
-            # Get the device data.
-            device_data = DeviceData.from_structure(
-                self._device_tree.GetDeviceData(disk_id)
-            )
+        for disk_id, device_data in zip(self._available_disks, disks_data):
+            free_space = disks_free_space[disk_id]
 
             if is_local_disk(device_data.type):
                 # Add all available local disks.
-                self._add_disk_overview(device_data, self._local_disks_box)
+                self._add_disk_overview(device_data, free_space, self._local_disks_box)
 
             elif disk_id in self._selected_disks:
                 # Add only selected advanced disks.
-                self._add_disk_overview(device_data, self._specialized_disks_box)
+                self._add_disk_overview(device_data, free_space, self._specialized_disks_box)
 
         # update the selections in the ui
         for overview in self.local_overviews + self.advanced_overviews:
@@ -481,7 +482,7 @@ class StorageSpoke(NormalSpoke, StorageCheckHandler):
             target=self._initialize
         )
 
-    def _add_disk_overview(self, device_data, box):
+    def _add_disk_overview(self, device_data, free_space, box):
         if device_data.type == "dm-multipath":
             # We don't want to display the whole huge WWID for a multipath device.
             wwn = device_data.attrs.get("wwn", "")
@@ -498,7 +499,6 @@ class StorageSpoke(NormalSpoke, StorageCheckHandler):
             description = device_data.description
 
         kind = "drive-removable-media" if device_data.removable else "drive-harddisk"
-        free_space = self._device_tree.GetDiskFreeSpace([device_data.device_id])
         serial_number = device_data.attrs.get("serial") or None
 
         overview = AnacondaWidgets.DiskOverview(
@@ -25,6 +25,7 @@ from simpleline.render.widgets import TextWidget
 from pyanaconda import localization
 from pyanaconda.core.i18n import N_, _
 from pyanaconda.modules.common.constants.services import LOCALIZATION
+from pyanaconda.modules.common.structures.language import LanguageData, LocaleData
 from pyanaconda.modules.common.util import is_module_available
 from pyanaconda.ui.categories.localization import LocalizationCategory
 from pyanaconda.ui.common import FirstbootSpokeMixIn
@@ -68,15 +69,24 @@ class LangSpoke(FirstbootSpokeMixIn, NormalTUISpoke):
         self.initialize_start()
         self._container = None
 
-        self._langs = [localization.get_english_name(lang)
-                       for lang in localization.get_available_translations()]
-        self._langs_and_locales = dict((localization.get_english_name(lang), lang)
-                                       for lang in localization.get_available_translations())
-        self._locales = dict((lang, localization.get_language_locales(lang))
-                             for lang in self._langs_and_locales.values())
-
         self._l12_module = LOCALIZATION.get_proxy()
 
+        languages = LanguageData.from_structure_list(
+            self._l12_module.GetLanguagesData()
+        )
+        locales = {
+            lang: LocaleData.from_structure_list(data)
+            for lang, data in self._l12_module.GetLocalesData().items()
+        }
+
+        self._langs = [data.english_name for data in languages]
+        self._langs_and_locales = dict((data.english_name, data.language_id)
+                                       for data in languages)
+        self._locales = dict((lang, [data.locale_id for data in locales[lang]])
+                             for lang in self._langs_and_locales.values())
+        self._locale_names = dict((data.locale_id, data.english_name)
+                                  for items in locales.values() for data in items)
+
         self._selected = self._l12_module.Language
         self.initialize_done()
 
@@ -107,7 +117,7 @@ class LangSpoke(FirstbootSpokeMixIn, NormalTUISpoke):
         if args:
             self.window.add(TextWidget(_("Available locales")))
             for locale in args:
-                widget = TextWidget(localization.get_english_name(locale))
+                widget = TextWidget(self._locale_names[locale])
                 self._container.add(widget, self._set_locales_callback, locale)
         else:
             self.window.add(TextWidget(_("Available languages")))
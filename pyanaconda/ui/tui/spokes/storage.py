@@ -229,9 +229,14 @@ class StorageSpoke(NormalTUISpoke):
         # Create a new container.
         self._container = ListColumnContainer(1, spacing=1)
 
+        # get data of all disks in one call
+        disks_data = DeviceData.from_structure_list(
+            self._device_tree.GetDevicesData(self._available_disks)
+        )
+
         # loop through the disks and present them.
-        for disk_name in self._available_disks:
-            disk_info = self._format_disk_info(disk_name)
+        for disk_name, disk_data in zip(self._available_disks, disks_data):
+            disk_info = self._format_disk_info(disk_data)
             c = CheckboxWidget(title=disk_info, completed=(disk_name in self._selected_disks))
             self._container.add(c, self._update_disk_list_callback, disk_name)
 
@@ -256,17 +261,15 @@ class StorageSpoke(NormalTUISpoke):
         self._select_all = False
         self._update_disk_list(disk)
 
-    def _format_disk_info(self, disk):
+    def _format_disk_info(self, data):
         """ Some specialized disks are difficult to identify in the storage
             spoke, so add and return extra identifying information about them.
 
             Since this is going to be ugly to do within the confines of the
             CheckboxWidget, pre-format the display string right here.
-        """
-        data = DeviceData.from_structure(
-            self._device_tree.GetDeviceData(disk)
-        )
 
+            :param data: an instance of DeviceData
+        """
         # show this info for all disks
         format_str = "{}: {} ({})".format(
             data.attrs.get("model", "DISK"),
@@ -0,0 +1,167 @@
+#!/usr/bin/python3
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 31 Milk Street #960789 Boston, MA
+# 02196 USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+"""Benchmark of the download and verification of live images.
+
+Measure the throughput of:
+
+    local   the checksum calculation of a local image
+    remote  the download of an image from a local HTTP server with
+            the checksum calculated during the download
+
+Run it in the unit test environment from the root of the repository:
+
+    python3 -m tests.benchmark_tests.live_image_checksum --size 1024
+"""
+import argparse
+import os
+import re
+import tempfile
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from pyanaconda.modules.payloads.payload.live_image.download import ImageDownloader
+from pyanaconda.modules.payloads.payload.live_image.installation import (
+    VerifyImageChecksumTask,
+)
+from tests.benchmark_tests.utils import measure, print_report
+
+
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+    """HTTP request handler with support for byte ranges."""
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        size = os.path.getsize(path)
+        match = re.match(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+
+        start, end = 0, size - 1
+
+        if match:
+            start, end = int(match.group(1)), int(match.group(2))
+            self.send_response(206)
+            self.send_header("Content-Range", "bytes {}-{}/{}".format(start, end, size))
+        else:
+            self.send_response(200)
+
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(end + 1 - start))
+        self.end_headers()
+
+        f = open(path, "rb")
+        f.seek(start)
+        self.range_length = end + 1 - start
+        return f
+
+    def copyfile(self, source, outputfile):
+        remaining = self.range_length
+
+        try:
+            while remaining > 0:
+                data = source.read(min(remaining, 1024 * 1024))
+                if not data:
+                    break
+                outputfile.write(data)
+                remaining -= len(data)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client doesn't need the rest of the content.
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+def create_image(path, size):
+    """Create a random image of the given size in bytes."""
+    with open(path, "wb") as f:
+        for _i in range(size // (1024 * 1024)):
+            f.write(os.urandom(1024 * 1024))
+
+
+def benchmark_local(image_path):
+    """Calculate the checksum of a local image."""
+    VerifyImageChecksumTask._calculate_checksum(image_path)
+
+
+def benchmark_remote(url, download_path, segments):
+    """Download an image and calculate the checksum."""
+    with requests.Session() as session:
+        downloader = ImageDownloader(
+            session=session,
+            url=url,
+            download_path=download_path,
+            callback=lambda msg: None,
+            segments=segments,
+            hash_algorithm="sha256",
+        )
+        downloader.download()
+
+    os.unlink(download_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=512, help="size of the image in MiB")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs")
+    args = parser.parse_args()
+
+    size = args.size * 1024 * 1024
+    rows = []
+
+    with tempfile.TemporaryDirectory(dir="/var/tmp") as d:
+        image_path = os.path.join(d, "source.img")
+        create_image(image_path, size)
+
+        handler = partial(RangeRequestHandler, directory=d)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = "http://127.0.0.1:{}/source.img".format(server.server_address[1])
+
+        cases = [
+            ("local", partial(benchmark_local, image_path)),
+            ("remote (1 segment)", partial(
+                benchmark_remote, url, os.path.join(d, "target.img"), 1
+            )),
+            ("remote (4 segments)", partial(
+                benchmark_remote, url, os.path.join(d, "target.img"), 4
+            )),
+        ]
+
+        for name, function in cases:
+            best, median = measure(function, args.repeat)
+            rows.append([
+                name,
+                "{:.3f}".format(best),
+                "{:.3f}".format(median),
+                "{:.2f}".format(size / best / 1024 ** 3),
+            ])
+
+        server.shutdown()
+
+    print_report(
+        "Live image checksum ({} MiB)".format(args.size),
+        ["path", "best [s]", "median [s]", "GiB/s"],
+        rows
+    )
+
+
+if __name__ == "__main__":
+    main()
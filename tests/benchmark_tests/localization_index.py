@@ -0,0 +1,145 @@
+#!/usr/bin/python3
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 31 Milk Street #960789 Boston, MA
+# 02196 USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+"""Benchmark of the population of the localization spokes.
+
+Measure the time of the data requested by the language spoke (all
+languages and their locales) and the keyboard spoke (all layouts):
+
+    legacy  the data collected on every request
+    cold    the first requests served by a new localization index
+    warm    the next requests served by the localization index
+
+Run it in the unit test environment from the root of the repository:
+
+    python3 -m tests.benchmark_tests.localization_index --repeat 3
+"""
+import argparse
+import statistics
+import time
+
+from pyanaconda.localization import (
+    _build_layout_infos,
+    _get_layout_variant_description,
+    get_available_translations,
+    get_common_keyboard_layouts,
+    get_common_languages,
+    get_english_name,
+    get_language_locales,
+    get_native_name,
+    layout_supports_ascii,
+)
+from pyanaconda.modules.localization.index import LocalizationIndex
+from tests.benchmark_tests.utils import measure, print_report
+
+
+def populate_languages_legacy():
+    """Collect the data of the language spoke without the index."""
+    for language in get_available_translations():
+        get_english_name(language)
+        get_native_name(language)
+
+        for locale in get_language_locales(language):
+            get_english_name(locale)
+            get_native_name(locale)
+
+
+def populate_keyboards_legacy():
+    """Collect the data of the keyboard spoke without the index."""
+    layout_infos = _build_layout_infos()
+    common_keyboards = get_common_keyboard_layouts()
+    common_languages = [get_english_name(lang) for lang in get_common_languages()]
+
+    layouts = []
+
+    for name, info in layout_infos.items():
+        is_common_lang = any(entry.split('; ')[0] in common_languages for entry in info.langs)
+        layouts.append((
+            name,
+            _get_layout_variant_description(name, layout_infos, True, True),
+            name.replace(" ", "") in common_keyboards and is_common_lang,
+            layout_supports_ascii(name.replace(" ", "")),
+        ))
+
+    return layouts
+
+
+def populate_languages(index):
+    """Collect the data of the language spoke from the index."""
+    for language in index.languages:
+        index.get_language_data(language)
+
+        for locale in index.get_language_locales(language):
+            index.get_locale_data(locale)
+
+
+def populate_keyboards(index):
+    """Collect the data of the keyboard spoke from the index."""
+    index.get_keyboard_layouts()
+
+
+def measure_cold(function, repeat):
+    """Measure the first calls of a new index."""
+    times = []
+
+    for _i in range(repeat):
+        index = LocalizationIndex()
+        start = time.perf_counter()
+        function(index)
+        times.append(time.perf_counter() - start)
+
+    return min(times), statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs")
+    args = parser.parse_args()
+
+    index = LocalizationIndex()
+    rows = []
+
+    cases = [
+        ("languages", populate_languages_legacy, populate_languages),
+        ("keyboards", populate_keyboards_legacy, populate_keyboards),
+    ]
+
+    for spoke, legacy, function in cases:
+        results = [
+            ("legacy", measure(legacy, args.repeat)),
+            ("cold", measure_cold(function, args.repeat)),
+            ("warm", measure(lambda: function(index), args.repeat)),
+        ]
+
+        for name, (best, median) in results:
+            rows.append([
+                spoke,
+                name,
+                "{:.3f}".format(best),
+                "{:.3f}".format(median),
+            ])
+
+    print_report(
+        "Population of the localization spokes",
+        ["spoke", "method", "best [s]", "median [s]"],
+        rows
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/python3
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 31 Milk Street #960789 Boston, MA
+# 02196 USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+"""Benchmark of copies of the storage model.
+
+Measure the time and the peak memory of:
+
+    blivet  the copy of the Blivet object only
+    legacy  the copy of the Blivet object and deep copies of the roots
+    copy    the copy of the storage model used by partitioning modules
+
+Run it in the unit test environment from the root of the repository:
+
+    python3 -m tests.benchmark_tests.storage_copy --devices 100 500 1000
+"""
+import argparse
+import copy
+import tracemalloc
+
+from blivet import Blivet
+from blivet.devices import StorageDevice
+from blivet.formats import get_format
+from blivet.size import Size
+
+from pyanaconda.modules.storage.devicetree import create_storage
+from pyanaconda.modules.storage.devicetree.root import Root
+from tests.benchmark_tests.utils import measure, print_report
+
+
+def create_model(devices, roots):
+    """Create a storage model with the given number of devices and roots."""
+    storage = create_storage()
+
+    for i in range(devices):
+        device = StorageDevice(
+            "dev{}".format(i),
+            size=Size("10 GiB"),
+            fmt=get_format("ext4", exists=True, device="/dev/dev{}".format(i)),
+            exists=True
+        )
+        storage.devicetree._add_device(device)
+
+    all_devices = storage.devicetree.devices
+    step = max(1, len(all_devices) // max(1, roots))
+
+    for i in range(roots):
+        devices = all_devices[i * step:(i + 1) * step]
+        storage.roots.append(Root(
+            name="Linux {}".format(i),
+            devices=devices,
+            mounts={"/mnt/{}".format(d.name): d for d in devices},
+        ))
+
+    return storage
+
+
+def copy_blivet(storage):
+    """Copy only the Blivet object."""
+    return Blivet.copy(storage)
+
+
+def copy_legacy(storage):
+    """Copy the storage model with deep copies of the roots."""
+    new = Blivet.copy(storage)
+
+    for root in new.roots:
+        # The old implementation deep-copied every root again.
+        copy.deepcopy(root)
+
+    new.roots = [root.copy(storage=new) for root in new.roots]
+    return new
+
+
+def copy_storage(storage):
+    """Copy the storage model."""
+    return storage.copy()
+
+
+def measure_memory(function):
+    """Measure the peak memory of the given function in MiB."""
+    tracemalloc.start()
+
+    try:
+        function()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak / 1024 ** 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, nargs="+", default=[100, 500, 1000],
+                        help="numbers of devices")
+    parser.add_argument("--roots", type=int, default=4, help="number of roots")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs")
+    args = parser.parse_args()
+
+    cases = [
+        ("blivet", copy_blivet),
+        ("legacy", copy_legacy),
+        ("copy", copy_storage),
+    ]
+
+    rows = []
+
+    for devices in args.devices:
+        storage = create_model(devices, args.roots)
+
+        for name, function in cases:
+            best, median = measure(lambda: function(storage), args.repeat)
+            memory = measure_memory(lambda: function(storage))
+            rows.append([
+                devices,
+                name,
+                "{:.3f}".format(best),
+                "{:.3f}".format(median),
+                "{:.1f}".format(memory),
+            ])
+
+    print_report(
+        "Storage model copy ({} roots)".format(args.roots),
+        ["devices", "method", "best [s]", "median [s]", "peak [MiB]"],
+        rows
+    )
+
+
+if __name__ == "__main__":
+    main()
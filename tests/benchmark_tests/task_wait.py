@@ -0,0 +1,118 @@
+#!/usr/bin/python3
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 31 Milk Street #960789 Boston, MA
+# 02196 USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+"""Benchmark of synchronous runs of tasks.
+
+Measure the wall-clock time of a queue of short tasks run one
+after another from a thread with:
+
+    polling  the check of the IsRunning property every 0.1 s
+    signal   the wait for the Stopped signal of the task
+
+Run it in the unit test environment from the root of the repository:
+
+    python3 -m tests.benchmark_tests.task_wait --tasks 50 --duration 0.01
+"""
+import argparse
+import threading
+import time
+
+from pyanaconda.core.glib import create_main_loop, idle_add
+from pyanaconda.modules.common.task import Task, TaskInterface, sync_run_task
+from tests.benchmark_tests.utils import measure, print_report
+
+
+class SleepingTask(Task):
+    """A task that sleeps for the given time."""
+
+    def __init__(self, duration):
+        super().__init__()
+        self._duration = duration
+
+    @property
+    def name(self):
+        return "Sleep"
+
+    def run(self):
+        time.sleep(self._duration)
+
+
+def poll_task(task_proxy):
+    """Run a task with the check of the IsRunning property."""
+    task_proxy.Start()
+
+    while task_proxy.IsRunning:
+        time.sleep(0.1)
+
+    task_proxy.Finish()
+
+
+def run_queue(run_task, tasks, duration):
+    """Run a queue of tasks from a thread with a running main loop."""
+    loop = create_main_loop()
+
+    def _run():
+        try:
+            for _i in range(tasks):
+                run_task(TaskInterface(SleepingTask(duration)))
+        finally:
+            idle_add(loop.quit)
+
+    threading.Thread(target=_run).start()
+    loop.run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, nargs="+", default=[10, 50],
+                        help="numbers of tasks in the queue")
+    parser.add_argument("--duration", type=float, default=0.01,
+                        help="duration of a task in seconds")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs")
+    args = parser.parse_args()
+
+    cases = [
+        ("polling", poll_task),
+        ("signal", sync_run_task),
+    ]
+
+    rows = []
+
+    for tasks in args.tasks:
+        for name, function in cases:
+            best, median = measure(
+                lambda: run_queue(function, tasks, args.duration),
+                args.repeat
+            )
+            rows.append([
+                tasks,
+                name,
+                "{:.3f}".format(best),
+                "{:.3f}".format(median),
+                "{:.3f}".format(tasks * args.duration),
+            ])
+
+    print_report(
+        "Synchronous runs of tasks ({} s per task)".format(args.duration),
+        ["tasks", "method", "best [s]", "median [s]", "work [s]"],
+        rows
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 31 Milk Street #960789 Boston, MA
+# 02196 USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import statistics
+import time
+
+__all__ = ["measure", "print_report"]
+
+
+def measure(function, repeat=3):
+    """Measure the wall-clock time of the given function.
+
+    :param function: a function without arguments
+    :param int repeat: a number of runs
+    :return: a tuple with the best and the median time in seconds
+    """
+    times = []
+
+    for _i in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return min(times), statistics.median(times)
+
+
+def print_report(title, header, rows):
+    """Print a table with results of a benchmark.
+
+    :param str title: a title of the report
+    :param header: a list of column names
+    :param rows: a list of rows
+    """
+    rows = [[str(value) for value in row] for row in rows]
+    widths = [max(len(str(h)), *(len(r[i]) for r in rows)) for i, h in enumerate(header)]
+
+    print(title)
+    print("  ".join(h.ljust(w) for h, w in zip(header, widths)))
+    print("  ".join("-" * w for w in widths))
+
+    for row in rows:
+        print("  ".join(v.ljust(w) for v, w in zip(row, widths)))
+
+    print()
@@ -781,6 +781,15 @@ class MiscTests(unittest.TestCase):
         assert util.restorecon(["bar"], root="/root", skip_nonexistent=False)
         exec_mock.assert_called_once_with("restorecon", ["-r", "bar"], root="/root")
 
+        # don't descend into directories
+        exec_mock.reset_mock()
+        assert util.restorecon(["bar"], root="/root", skip_nonexistent=True, recursive=False)
+        exec_mock.assert_called_once_with("restorecon", ["-i", "bar"], root="/root")
+
+        exec_mock.reset_mock()
+        assert util.restorecon(["bar"], root="/root", recursive=False)
+        exec_mock.assert_called_once_with("restorecon", ["bar"], root="/root")
+
         # missing restorecon
         exec_mock.reset_mock()
         exec_mock.side_effect = FileNotFoundError
@@ -49,6 +49,7 @@ class BossInterfaceTestCase(unittest.TestCase):
         observer = Mock(
             service_name=service_name,
             is_service_available=available,
+            is_service_reachable=available,
             proxy=proxy,
         )
 
@@ -17,6 +17,7 @@
 #
 
 import os
+import threading
 import unittest
 from contextlib import contextmanager
 from unittest.mock import Mock, patch
@@ -271,8 +272,63 @@ class KickstartManagerTestCase(unittest.TestCase):
         assert error.line_number == 41
         assert error.message == "Mocked parse error: \"PARSE_ERROR\" found"
 
+        assert set(report.parse_times) == {"1", "2", "3"}
         assert manager.generate_kickstart() == self._m123_kickstart
 
+    def test_distribute_in_parallel(self):
+        manager = KickstartManager()
+
+        # Every module waits for the others to read the kickstart.
+        barrier = threading.Barrier(3, timeout=5)
+        module1 = ParallelTestModule(barrier, commands=["network", "firewall"])
+        module2 = ParallelTestModule(barrier, addons=["pony"])
+        module3 = ParallelTestModule(barrier, sections=["packages"])
+
+        manager.on_module_observers_changed([
+            self._get_module_observer("3", module3),
+            self._get_module_observer("1", module1),
+            self._get_module_observer("2", module2),
+        ])
+
+        with self._create_ks_files(self._kickstart_include) as filename:
+            report = manager.read_kickstart_file(filename)
+
+        assert module1.kickstart == self._m1_kickstart
+        assert module2.kickstart == self._m2_kickstart
+        assert module3.kickstart == self._m3_kickstart
+
+        # The messages are in the order of the observers.
+        messages = report.get_messages()
+        assert [m.module_name for m in messages] == ["3", "1"]
+        assert set(report.parse_times) == {"1", "2", "3"}
+
+    def test_start_lazy_modules_in_parallel(self):
+        manager = KickstartManager()
+
+        # Every module waits for the others to provide the handled kickstart.
+        barrier = threading.Barrier(3, timeout=5)
+        modules = [
+            LazyTestModule(barrier, commands=["network", "firewall"]),
+            LazyTestModule(barrier, addons=["pony"]),
+            LazyTestModule(barrier, sections=["packages"]),
+        ]
+
+        observers = []
+
+        for name, module in zip(["1", "2", "3"], modules):
+            observer = ModuleObserver(Mock(), name, is_lazy=True)
+            observer._proxy = module
+            observers.append(observer)
+
+        manager.on_module_observers_changed(observers)
+
+        with self._create_ks_files(self._kickstart_include) as filename:
+            manager.read_kickstart_file(filename)
+
+        assert modules[0].kickstart == self._m1_kickstart
+        assert modules[1].kickstart == self._m2_kickstart
+        assert modules[2].kickstart == self._m3_kickstart
+
     def test_nothing_to_parse(self):
         ks_content = ""
         manager = KickstartManager()
@@ -514,3 +570,28 @@ class TestModule:
     def GenerateKickstart(self):
         """Mock generating a kickstart."""
         return self.kickstart
+
+
+class ParallelTestModule(TestModule):
+
+    def __init__(self, barrier, **kwargs):
+        super().__init__(**kwargs)
+        self._barrier = barrier
+
+    def ReadKickstart(self, kickstart):
+        """Mock parsing that waits for other modules."""
+        self._barrier.wait()
+        return super().ReadKickstart(kickstart)
+
+
+class LazyTestModule(TestModule):
+
+    def __init__(self, barrier, **kwargs):
+        super().__init__(**kwargs)
+        self._barrier = barrier
+
+    @property
+    def KickstartCommands(self):
+        """Mock the start of the module that waits for other modules."""
+        self._barrier.wait()
+        return self.kickstart_commands
@@ -23,7 +23,10 @@ from dasbus.constants import DBUS_FLAG_NONE, DBUS_START_REPLY_SUCCESS
 from dasbus.error import DBusError
 
 from pyanaconda.modules.boss.module_manager import ModuleManager
-from pyanaconda.modules.boss.module_manager.start_modules import StartModulesTask
+from pyanaconda.modules.boss.module_manager.start_modules import (
+    StartModulesTask,
+    WarmUpModulesTask,
+)
 from pyanaconda.modules.common.errors.module import UnavailableModuleError
 
 
@@ -206,6 +209,117 @@ class ModuleManagerTestCase(unittest.TestCase):
         task._callbacks.put((None, fake_callbacks))
         assert task.run() == []
 
+    @patch("dasbus.client.observer.Gio")
+    def test_start_lazy_modules(self, gio):
+        """Start lazy modules."""
+        service_names = [
+            "org.fedoraproject.Anaconda.Modules.A",
+            "org.fedoraproject.Anaconda.Modules.B",
+            "org.fedoraproject.Anaconda.Modules.C",
+        ]
+
+        task = StartModulesTask(
+            message_bus=self._message_bus,
+            activatable=service_names,
+            forbidden=[],
+            optional=[],
+            lazy=["org.fedoraproject.Anaconda.Modules.B"]
+        )
+
+        observers = self._check_started_modules(task, service_names)
+        assert [o.is_lazy for o in observers] == [False, True, False]
+        assert observers[1].is_service_available is False
+        assert observers[1].is_service_reachable is True
+
+        bus_proxy = self._message_bus.proxy
+        started = [c.args[0] for c in bus_proxy.StartServiceByName.call_args_list]
+        assert started == [
+            "org.fedoraproject.Anaconda.Modules.A",
+            "org.fedoraproject.Anaconda.Modules.C",
+        ]
+
+        # Warm up the lazy modules.
+        bus_proxy.StartServiceByName.reset_mock()
+        task = WarmUpModulesTask(self._message_bus, [observers[1]], [])
+        self._check_started_modules(task, ["org.fedoraproject.Anaconda.Modules.B"])
+
+        started = [c.args[0] for c in bus_proxy.StartServiceByName.call_args_list]
+        assert started == ["org.fedoraproject.Anaconda.Modules.B"]
+        assert observers[1].is_service_available is True
+
+    def test_warm_up_failed_modules(self):
+        """Remove lazy modules that failed to start."""
+        observers = [Mock(is_lazy=False), Mock(is_lazy=True), Mock(is_lazy=True)]
+        self._manager.set_module_observers(observers)
+
+        self._manager._modules_warmed_up_callback(observers[1:], observers[2:])
+        assert self._manager.module_observers == [observers[0], observers[2]]
+
+    def test_warm_up_required_module_failed(self):
+        """Fail to warm up a required lazy module."""
+        service_names = [
+            "org.fedoraproject.Anaconda.Modules.A",
+            "org.fedoraproject.Anaconda.Modules.B",
+        ]
+
+        task = StartModulesTask(self._message_bus, service_names, [], [], lazy=service_names)
+        observers = task.run()
+
+        task = WarmUpModulesTask(self._message_bus, observers, [])
+
+        def call():
+            raise DBusError("Fake error!")
+
+        def fake_callbacks(fake_observer):
+            for observer in task._module_observers:
+                task._start_service_by_name_callback(call, observer)
+
+        task._callbacks.put((None, fake_callbacks))
+
+        with self.assertLogs(level="ERROR") as cm:
+            assert task.run() == []
+
+        assert "The required module org.fedoraproject.Anaconda.Modules.A" in cm.output[0]
+
+    def test_warm_up_task_failed(self):
+        """Remove lazy modules that are not available after a failed warm-up."""
+        observers = [
+            Mock(is_lazy=False),
+            Mock(is_lazy=True, is_service_available=True),
+            Mock(is_lazy=True, is_service_available=False),
+        ]
+        self._manager.set_module_observers(observers)
+
+        with self.assertLogs(level="ERROR"):
+            self._manager._modules_warm_up_failed_callback(observers[1:])
+
+        assert self._manager.module_observers == observers[:2]
+
+    def test_set_modules_locale(self):
+        """Set locale of modules."""
+        observers = [
+            Mock(is_lazy=False, is_service_available=True, is_service_reachable=True),
+            Mock(is_lazy=True, is_service_available=True, is_service_reachable=True),
+            Mock(is_lazy=True, is_service_available=False, is_service_reachable=True),
+        ]
+        self._manager.set_module_observers(observers)
+
+        # The lazy module that isn't running yet is not started.
+        self._manager.set_modules_locale("cs_CZ.UTF-8")
+        observers[0].proxy.SetLocale.assert_called_once_with("cs_CZ.UTF-8")
+        observers[1].proxy.SetLocale.assert_called_once_with("cs_CZ.UTF-8")
+        observers[2].proxy.SetLocale.assert_not_called()
+
+        # The locale is set once the module is available.
+        self._manager._lazy_module_available_callback(observers[2])
+        observers[2].proxy.SetLocale.assert_called_once_with("cs_CZ.UTF-8")
+
+    def test_lazy_module_available_without_locale(self):
+        """Don't set locale of a lazy module if it wasn't requested."""
+        observer = Mock(is_lazy=True)
+        self._manager._lazy_module_available_callback(observer)
+        observer.proxy.SetLocale.assert_not_called()
+
     @patch("dasbus.client.observer.Gio")
     def test_get_service_names(self, gio):
         """Get service names of running modules."""
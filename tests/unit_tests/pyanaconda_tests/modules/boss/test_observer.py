@@ -93,3 +93,21 @@ class ModuleObserverTestCase(unittest.TestCase):
 
         with pytest.raises(DBusObserverError):
             observer.proxy.DoSomething()
+
+    def test_lazy_module_observer(self):
+        """Test the observer of a lazy module."""
+        dbus = Mock()
+        observer = ModuleObserver(dbus, "my.test.module", is_lazy=True)
+
+        # Setup the observer.
+        self._setup_observer(observer)
+        assert observer.is_lazy is True
+        assert observer.is_service_reachable is True
+
+        # Access the proxy of the service started on demand.
+        observer.proxy.DoSomething()
+        dbus.get_proxy.assert_called_once_with("my.test.module", "/my/test/module")
+
+        # Service available.
+        self._make_service_available(observer)
+        assert observer.is_service_reachable is True
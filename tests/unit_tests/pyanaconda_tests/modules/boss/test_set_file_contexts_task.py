@@ -15,11 +15,37 @@
 # License and may only be used or replicated with the express permission of
 # Red Hat, Inc.
 #
+import os
+import tempfile
+import time
 import unittest
-from unittest.mock import patch
+from unittest.mock import call, patch
 
+from pyanaconda.core.path import make_directories, touch
 from pyanaconda.modules.boss.installation import SetContextsTask
 
+DIRS_TO_RELABEL = [
+    "/boot",
+    "/dev",
+    "/etc",
+    "/lib64",
+    "/root",
+    "/usr/lib",
+    "/usr/lib64",
+    "/var/cache/yum",
+    "/var/home",
+    "/var/lib",
+    "/var/lock",
+    "/var/log",
+    "/var/media",
+    "/var/mnt",
+    "/var/opt",
+    "/var/roothome",
+    "/var/run",
+    "/var/spool",
+    "/var/srv"
+]
+
 
 class SetContextsTaskTest(unittest.TestCase):
     @patch("pyanaconda.modules.boss.installation.restorecon")
@@ -30,34 +56,113 @@ class SetContextsTaskTest(unittest.TestCase):
             task.run()
 
         restore_mock.assert_called_once_with(
-            [
-                "/boot",
-                "/dev",
-                "/etc",
-                "/lib64",
-                "/root",
-                "/usr/lib",
-                "/usr/lib64",
-                "/var/cache/yum",
-                "/var/home",
-                "/var/lib",
-                "/var/lock",
-                "/var/log",
-                "/var/media",
-                "/var/mnt",
-                "/var/opt",
-                "/var/roothome",
-                "/var/run",
-                "/var/spool",
-                "/var/srv"
-            ],
+            DIRS_TO_RELABEL,
             root="/somewhere",
-            skip_nonexistent=True
+            skip_nonexistent=True,
+            recursive=False
         )
 
         logs = "\n".join(cm.output)
         assert "restorecon was not installed" not in logs
 
+    @patch("pyanaconda.modules.boss.installation.restorecon")
+    def test_run_shards(self, restore_mock):
+        """Test SetContextsTask with shards."""
+        with tempfile.TemporaryDirectory() as sysroot:
+            make_directories(sysroot + "/etc/a")
+            touch(sysroot + "/etc/b")
+            touch(sysroot + "/etc/c")
+            make_directories(sysroot + "/usr/lib/x")
+            make_directories(sysroot + "/var")
+            os.symlink("../run", sysroot + "/var/run")
+
+            task = SetContextsTask(sysroot, workers=2)
+            task.run()
+
+        assert restore_mock.call_count == 4
+        restore_mock.assert_has_calls([
+            call(DIRS_TO_RELABEL, root=sysroot, skip_nonexistent=True, recursive=False),
+            call(["/etc/a", "/etc/c"], root=sysroot, skip_nonexistent=True),
+            call(["/etc/b"], root=sysroot, skip_nonexistent=True),
+            call(["/usr/lib/x"], root=sysroot, skip_nonexistent=True),
+        ], any_order=True)
+
+    @patch("pyanaconda.modules.boss.installation.restorecon")
+    def test_run_changed_files(self, restore_mock):
+        """Test SetContextsTask with changed files only."""
+        with tempfile.TemporaryDirectory() as sysroot:
+            make_directories(sysroot + "/etc/a")
+            touch(sysroot + "/etc/a/old")
+            make_directories(sysroot + "/usr/lib")
+            touch(sysroot + "/usr/lib/old")
+
+            # Make sure the timestamps differ.
+            time.sleep(0.1)
+            changed_since = time.time()
+            time.sleep(0.1)
+
+            touch(sysroot + "/etc/a/new")
+            touch(sysroot + "/etc/new")
+
+            task = SetContextsTask(sysroot, changed_since=changed_since, workers=1)
+            task.run()
+
+        assert restore_mock.call_count == 2
+        restore_mock.assert_any_call(
+            DIRS_TO_RELABEL, root=sysroot, skip_nonexistent=True, recursive=False
+        )
+
+        paths = []
+
+        for c in restore_mock.call_args_list[1:]:
+            assert c.kwargs == {"root": sysroot, "skip_nonexistent": True, "recursive": False}
+            paths.extend(c.args[0])
+
+        # The directory /etc/a is changed by the new file.
+        assert sorted(paths) == ["/etc/a", "/etc/a/new", "/etc/new"]
+
+    @patch("pyanaconda.modules.boss.installation.restorecon")
+    def test_run_extra_paths(self, restore_mock):
+        """Test SetContextsTask with files written before the payload."""
+        with tempfile.TemporaryDirectory() as sysroot:
+            make_directories(sysroot + "/etc/pki")
+            touch(sysroot + "/etc/resolv.conf")
+            touch(sysroot + "/etc/pki/ca.pem")
+            make_directories(sysroot + "/var")
+            os.symlink("../run", sysroot + "/var/run")
+
+            # Find the files written before the payload.
+            extra_paths = SetContextsTask(sysroot).find_files()
+            assert extra_paths == [
+                "/etc",
+                "/etc/pki",
+                "/etc/pki/ca.pem",
+                "/etc/resolv.conf",
+                "/var/run",
+            ]
+
+            # Make sure the timestamps differ.
+            time.sleep(0.1)
+            changed_since = time.time()
+            time.sleep(0.1)
+
+            touch(sysroot + "/etc/new")
+
+            task = SetContextsTask(
+                sysroot,
+                changed_since=changed_since,
+                extra_paths=extra_paths,
+                workers=1
+            )
+            task.run()
+
+        assert restore_mock.call_count == 3
+        restore_mock.assert_has_calls([
+            call(DIRS_TO_RELABEL, root=sysroot, skip_nonexistent=True, recursive=False),
+            call(["/etc/new"], root=sysroot, skip_nonexistent=True, recursive=False),
+            call(extra_paths, root=sysroot, skip_nonexistent=True, recursive=False),
+        ])
+
     @patch("pyanaconda.core.util.execWithRedirect")
     def test_restorecon_missing(self, exec_mock):
         """Test SetContextsTask with missing restorecon."""
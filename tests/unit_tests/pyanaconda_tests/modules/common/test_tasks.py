@@ -15,16 +15,19 @@
 # License and may only be used or replicated with the express permission of
 # Red Hat, Inc.
 #
+import threading
 import unittest
-from time import sleep
+from time import perf_counter, sleep
 from unittest.mock import Mock
 
 import pytest
 from dasbus.server.interface import dbus_class
 from dasbus.typing import *  # pylint: disable=wildcard-import
 
+from pyanaconda.core.glib import create_main_loop, idle_add, timeout_add_seconds
 from pyanaconda.modules.common.errors.task import NoResultError
 from pyanaconda.modules.common.task import (
+    TASK_CHECK_INTERVAL,
     Task,
     TaskInterface,
     async_run_task,
@@ -372,6 +375,52 @@ class TaskInterfaceTestCase(unittest.TestCase):
         with pytest.raises(TaskFailedException):
             sync_run_task(self.task_interface)
 
+    def _run_in_thread(self, function):
+        """Run the function in a thread while the main loop is running."""
+        loop = create_main_loop()
+        results = []
+
+        def _run():
+            try:
+                results.append(function())
+            except Exception as e:  # pylint: disable=broad-except
+                results.append(e)
+            finally:
+                idle_add(loop.quit)
+
+        timeout_add_seconds(self.TIMEOUT, loop.quit)
+        threading.Thread(target=_run).start()
+        loop.run()
+
+        assert len(results) == 1
+        return results[0]
+
+    def test_sync_run_in_thread(self):
+        """Run a task synchronously in a thread."""
+        self._set_up_task(self.FailingTask())
+        callback = Mock()
+
+        start = perf_counter()
+        result = self._run_in_thread(
+            lambda: sync_run_task(self.task_interface, callback=callback)
+        )
+
+        assert isinstance(result, TaskFailedException)
+        assert perf_counter() - start < TASK_CHECK_INTERVAL
+        self._check_task_signals(failed=True, succeeded=False)
+
+    def test_wait_for_task_in_thread(self):
+        """Wait for a task in a thread."""
+        self._set_up_task(self.SimpleTask())
+        self.task_interface.Start()
+
+        result = self._run_in_thread(
+            lambda: wait_for_task(self.task_interface, timeout=self.TIMEOUT / 2)
+        )
+
+        assert result is None
+        self._check_task_signals()
+
     def test_async_run(self):
         """Run a task asynchronously."""
         self._set_up_task(self.FailingTask())
@@ -0,0 +1,126 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 31 Milk Street #960789 Boston, MA
+# 02196 USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import unittest
+from unittest.mock import patch
+
+import pytest
+
+from pyanaconda.localization import InvalidLocaleSpec, LayoutInfo
+from pyanaconda.modules.localization.index import LocalizationIndex
+
+
+class LocalizationIndexTestCase(unittest.TestCase):
+    """Test the localization index."""
+
+    def setUp(self):
+        self.index = LocalizationIndex()
+
+    @patch("pyanaconda.modules.localization.index.get_available_translations")
+    def test_languages(self, translations_mock):
+        """Test the languages."""
+        translations_mock.return_value = iter(["en", "cs"])
+
+        assert self.index.languages == ["en", "cs"]
+        assert self.index.languages == ["en", "cs"]
+        translations_mock.assert_called_once_with(None)
+
+    @patch("pyanaconda.modules.localization.index.get_native_name")
+    @patch("pyanaconda.modules.localization.index.get_english_name")
+    def test_language_data(self, english_mock, native_mock):
+        """Test the language data."""
+        english_mock.return_value = "Czech"
+        native_mock.return_value = "Čeština"
+
+        for _i in range(2):
+            data = self.index.get_language_data("cs")
+            assert data.language_id == "cs"
+            assert data.english_name == "Czech"
+            assert data.native_name == "Čeština"
+
+        english_mock.assert_called_once_with("cs")
+        native_mock.assert_called_once_with("cs")
+
+    def test_invalid_language_data(self):
+        """Test the data of an invalid language."""
+        with pytest.raises(InvalidLocaleSpec):
+            self.index.get_language_data("")
+
+        with pytest.raises(InvalidLocaleSpec):
+            self.index.get_locale_data("")
+
+    @patch("pyanaconda.modules.localization.index.get_language_locales")
+    def test_language_locales(self, locales_mock):
+        """Test the locales of a language."""
+        locales_mock.return_value = ["cs_CZ.UTF-8"]
+
+        locales = self.index.get_language_locales("cs")
+        assert locales == ["cs_CZ.UTF-8"]
+
+        # The index is not changed by the caller.
+        locales.append("en_US.UTF-8")
+        assert self.index.get_language_locales("cs") == ["cs_CZ.UTF-8"]
+        locales_mock.assert_called_once_with("cs")
+
+    @patch("pyanaconda.modules.localization.index.layout_supports_ascii")
+    @patch("pyanaconda.modules.localization.index.get_common_languages")
+    @patch("pyanaconda.modules.localization.index.get_common_keyboard_layouts")
+    @patch("pyanaconda.modules.localization.index._build_layout_infos")
+    def test_keyboard_layouts(self, infos_mock, common_mock, languages_mock, ascii_mock):
+        """Test the keyboard layouts."""
+        languages_mock.return_value = ["ru"]
+        infos_mock.return_value = {
+            "cz": LayoutInfo(["Czech"], "Czech"),
+            "cz (qwerty)": LayoutInfo(["Czech"], "Czech (QWERTY)"),
+            "ru": LayoutInfo(["Russian"], "Russian"),
+        }
+        common_mock.return_value = ["cz", "ru"]
+        ascii_mock.side_effect = lambda layout: layout != "ru"
+
+        for _i in range(2):
+            layouts = self.index.get_keyboard_layouts()
+            assert [layout.layout_id for layout in layouts] == ["cz", "cz (qwerty)", "ru"]
+            assert [layout.langs for layout in layouts] == [["Czech"], ["Czech"], ["Russian"]]
+            assert [layout.supports_ascii for layout in layouts] == [True, True, False]
+            assert [layout.is_common for layout in layouts] == [False, False, True]
+
+        infos_mock.assert_called_once_with()
+        common_mock.assert_called_once_with()
+        assert ascii_mock.call_count == 3
+
+    @patch.dict("os.environ", {"LANG": "en_US.UTF-8"})
+    @patch("pyanaconda.modules.localization.index._get_layout_variant_description")
+    @patch("pyanaconda.modules.localization.index._build_layout_infos")
+    def test_layout_variant_description(self, infos_mock, description_mock):
+        """Test the descriptions of keyboard layouts."""
+        infos_mock.return_value = {"cz": LayoutInfo(["Czech"], "Czech")}
+        description_mock.return_value = "Czech"
+
+        assert self.index.get_layout_variant_description("cz") == "Czech"
+        assert self.index.get_layout_variant_description("cz") == "Czech"
+        description_mock.assert_called_once_with("cz", infos_mock.return_value, True, True)
+
+        # Translated descriptions depend on the language.
+        with patch.dict("os.environ", {"LANG": "cs_CZ.UTF-8"}):
+            description_mock.return_value = "Čeština"
+            assert self.index.get_layout_variant_description("cz") == "Čeština"
+            assert self.index.get_layout_variant_description("cz", xlated=False) == "Čeština"
+
+        description_mock.return_value = "Czech"
+        assert self.index.get_layout_variant_description("cz", xlated=False) == "Čeština"
+        assert self.index.get_layout_variant_description("cz") == "Czech"
+        assert description_mock.call_count == 3
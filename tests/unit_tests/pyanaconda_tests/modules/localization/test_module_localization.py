@@ -197,6 +197,34 @@ class LocalizationInterfaceTestCase(unittest.TestCase):
         }
         assert data == english
 
+    def test_languages_data(self):
+        """Test the GetLanguagesData method."""
+        languages = list(self.localization_interface.GetLanguages())
+        languages_data = self.localization_interface.GetLanguagesData()
+
+        assert len(languages_data) == len(languages)
+        assert languages_data == [
+            self.localization_interface.GetLanguageData(language_id)
+            for language_id in languages
+        ]
+
+    def test_locales_data(self):
+        """Test the GetLocalesData method."""
+        languages = list(self.localization_interface.GetLanguages())
+        locales_data = self.localization_interface.GetLocalesData()
+
+        assert list(locales_data.keys()) == languages
+
+        for language_id in languages:
+            assert locales_data[language_id] == [
+                self.localization_interface.GetLocaleData(locale_id)
+                for locale_id in self.localization_interface.GetLocales(language_id)
+            ]
+
+        english = LocaleData.from_structure_list(locales_data["en"])
+        assert english[0].locale_id == "en_US.UTF-8"
+        assert english[0].english_name == "English (United States)"
+
     def test_locales(self):
         locales = list(self.localization_interface.GetLocales("en"))
         get_locale_data = self.localization_interface.GetLocaleData
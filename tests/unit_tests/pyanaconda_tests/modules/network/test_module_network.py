@@ -22,7 +22,7 @@ import shutil
 import tempfile
 import unittest
 from textwrap import dedent
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 import gi
 import pytest
@@ -37,6 +37,7 @@ from pyanaconda.core.constants import (
     NETWORK_CAPABILITY_TEAM,
 )
 from pyanaconda.core.kernel import KernelArguments
+from pyanaconda.core.kickstart.commands import NetworkData
 from pyanaconda.modules.common.constants.objects import FIREWALL
 from pyanaconda.modules.common.constants.services import NETWORK
 from pyanaconda.modules.common.errors.installation import (
@@ -290,6 +291,46 @@ class NetworkInterfaceTestCase(unittest.TestCase):
         self.callback.assert_called_with(NETWORK.interface_name, {'Connected': True}, [])
         assert not self.network_interface.IsConnecting()
 
+    def test_activated_interfaces_changed(self):
+        """Test the ActivatedInterfacesChanged signal."""
+        callback = Mock()
+        self.network_interface.ActivatedInterfacesChanged.connect(callback)
+
+        device = Mock()
+        device.get_ip_iface.return_value = "ens3"
+
+        ac = Mock()
+        ac.get_path.return_value = "/org/freedesktop/NetworkManager/ActiveConnection/1"
+        ac.get_state.return_value = NM.ActiveConnectionState.ACTIVATING
+        ac.get_devices.return_value = [device]
+
+        nm_client = Mock()
+        nm_client.get_active_connections.return_value = [ac]
+        self.network_module.nm_client = nm_client
+
+        # A new active connection is watched.
+        self.network_module._nm_active_connections_changed()
+        ac.connect.assert_called_once_with(
+            "notify::state", self.network_module._nm_activated_interfaces_changed
+        )
+        callback.assert_not_called()
+
+        # The connection is activated.
+        ac.get_state.return_value = NM.ActiveConnectionState.ACTIVATED
+        self.network_module._nm_activated_interfaces_changed()
+        callback.assert_called_once_with(["ens3"])
+        callback.reset_mock()
+
+        # Nothing has changed.
+        self.network_module._nm_active_connections_changed()
+        ac.connect.assert_called_once()
+        callback.assert_not_called()
+
+        # The connection is deactivated.
+        nm_client.get_active_connections.return_value = []
+        self.network_module._nm_active_connections_changed()
+        callback.assert_called_once_with([])
+
     def test_capabilities_default(self):
         """Test getting capabilities does not fail."""
         assert self.network_interface.Capabilities == []
@@ -972,6 +1013,185 @@ class PersistInitramfsConfigTaskTestCase(unittest.TestCase):
         assert set(result) == set(['bond0', 'enp2s0'])
 
 
+class ApplyKickstartTaskTestCase(unittest.TestCase):
+    """Test the task for application of kickstart network configuration."""
+
+    def _create_connection(self, uuid, con_type="802-3-ethernet", controller=None):
+        connection = Mock()
+        connection.get_uuid.return_value = uuid
+        connection.get_id.return_value = uuid
+        connection.get_interface_name.return_value = uuid
+        connection.get_connection_type.return_value = con_type
+        connection.get_setting_connection.return_value.get_controller.return_value = controller
+        return connection
+
+    def _get_nm_client_mock(self, initramfs_connections):
+        def _get_device_by_iface(iface):
+            device = Mock()
+            device.get_available_connections.return_value = [
+                c for c in initramfs_connections if c.get_uuid() == iface
+            ]
+            return device
+
+        nm_client = Mock()
+        nm_client.get_device_by_iface.side_effect = _get_device_by_iface
+        return nm_client
+
+    def _run_task(self, nm_client, network_data, connections, results):
+        task = ApplyKickstartTask(
+            network_data=network_data,
+            supported_devices=[],
+            capabilities=[],
+            bootif=None,
+            ifname_option_values=[]
+        )
+
+        with patch("pyanaconda.modules.network.initialization.get_device_name_from_network_data") \
+                as get_device_name, \
+                patch("pyanaconda.modules.network.initialization.create_connections_from_ksdata") \
+                as create_connections, \
+                patch("pyanaconda.modules.network.initialization.update_connection_from_ksdata") \
+                as update_connection, \
+                patch("pyanaconda.modules.network.initialization.commit_connections_sync") \
+                as commit_connections, \
+                patch("pyanaconda.modules.network.initialization.activate_connection") \
+                as activate_connection:
+
+            get_device_name.side_effect = lambda _c, data, _d, _b: data.device
+            create_connections.side_effect = lambda _c, data, _n, _v: connections[data.device]
+            commit_connections.side_effect = results
+
+            applied_devices = task._run(nm_client)
+
+        return applied_devices, update_connection, commit_connections, activate_connection
+
+    def test_no_data(self):
+        """Test the task without kickstart data."""
+        task = ApplyKickstartTask([], [], [], None, [])
+        assert task._run(Mock()) == []
+
+    def test_staged_application(self):
+        """Test the application in the order of dependencies."""
+        bond = self._create_connection("bond0", con_type="bond")
+        port1 = self._create_connection("bond0-port1", controller="bond0")
+        port2 = self._create_connection("bond0-port2", controller="bond0")
+        vlan = self._create_connection("ens4.10", con_type="vlan")
+        ens3 = self._create_connection("ens3")
+        ens5 = self._create_connection("ens5")
+
+        nm_client = self._get_nm_client_mock([ens5])
+        network_data = [
+            NetworkData(device="bond0", activate=True),
+            NetworkData(device="ens3", activate=True),
+            NetworkData(device="ens4.10", activate=False),
+            NetworkData(device="ens5", activate=True),
+        ]
+        connections = {
+            "bond0": [(bond, None), (port1, "ens1"), (port2, "ens2")],
+            "ens3": [(ens3, "ens3")],
+            "ens4.10": [(vlan, None)],
+        }
+        added_bond, added_port1, added_port2 = Mock(), Mock(), Mock()
+        added_vlan, added_ens3 = Mock(), Mock()
+        results = [
+            ([added_bond, added_ens3], [True]),
+            ([added_port1, added_port2, added_vlan], []),
+        ]
+
+        applied_devices, update_connection, commit_connections, activate_connection = \
+            self._run_task(nm_client, network_data, connections, results)
+
+        assert applied_devices == ["bond0", "ens3", "ens4.10", "ens5"]
+
+        update_connection.assert_called_once_with(
+            nm_client,
+            ens5,
+            network_data[3],
+            "ens5",
+            ifname_option_values=[],
+            commit=False
+        )
+
+        assert commit_connections.call_count == 2
+        commit_connections.assert_any_call(nm_client, [bond, ens3], [ens5])
+        commit_connections.assert_any_call(nm_client, [port1, port2, vlan], [])
+
+        assert activate_connection.call_count == 5
+        activate_connection.assert_any_call(nm_client, ens5, "ens5")
+        activate_connection.assert_any_call(nm_client, added_bond, None)
+        activate_connection.assert_any_call(nm_client, added_port1, "ens1")
+        activate_connection.assert_any_call(nm_client, added_port2, "ens2")
+        activate_connection.assert_any_call(nm_client, added_ens3, "ens3")
+
+    def test_activation_order(self):
+        """Test the activation in the order of the kickstart."""
+        ens3 = self._create_connection("ens3")
+        ens4 = self._create_connection("ens4")
+        ens5 = self._create_connection("ens5")
+        bond = self._create_connection("bond0", con_type="bond")
+        port1 = self._create_connection("bond0-port1", controller="bond0")
+
+        nm_client = self._get_nm_client_mock([ens3, ens5])
+        network_data = [
+            NetworkData(device="ens3", activate=True),
+            NetworkData(device="bond0", activate=True),
+            NetworkData(device="ens5", activate=True),
+            NetworkData(device="ens4", activate=True),
+        ]
+        connections = {
+            "bond0": [(bond, None), (port1, "ens1")],
+            "ens4": [(ens4, "ens4")],
+        }
+        added_bond, added_port1, added_ens4 = Mock(), Mock(), Mock()
+        results = [
+            ([added_bond, added_ens4], [True, True]),
+            ([added_port1], []),
+        ]
+
+        applied_devices, _update_connection, commit_connections, activate_connection = \
+            self._run_task(nm_client, network_data, connections, results)
+
+        assert applied_devices == ["ens3", "bond0", "ens5", "ens4"]
+        commit_connections.assert_any_call(nm_client, [bond, ens4], [ens3, ens5])
+
+        assert activate_connection.mock_calls == [
+            call(nm_client, ens3, "ens3"),
+            call(nm_client, added_bond, None),
+            call(nm_client, added_port1, "ens1"),
+            call(nm_client, ens5, "ens5"),
+            call(nm_client, added_ens4, "ens4"),
+        ]
+
+    def test_failed_application(self):
+        """Test the application with failed connections."""
+        bond = self._create_connection("bond0", con_type="bond")
+        port1 = self._create_connection("bond0-port1", controller="bond0")
+        port2 = self._create_connection("bond0-port2", controller="bond0")
+        ens5 = self._create_connection("ens5")
+
+        nm_client = self._get_nm_client_mock([ens5])
+        network_data = [
+            NetworkData(device="bond0", activate=True),
+            NetworkData(device="ens5", activate=True),
+        ]
+        connections = {
+            "bond0": [(bond, None), (port1, "ens1"), (port2, "ens2")],
+        }
+        added_bond, added_port2 = Mock(), Mock()
+        results = [
+            ([added_bond], [False]),
+            ([None, added_port2], []),
+        ]
+
+        applied_devices, _update_connection, _commit_connections, activate_connection = \
+            self._run_task(nm_client, network_data, connections, results)
+
+        assert applied_devices == ["bond0", "ens5"]
+        assert activate_connection.call_count == 2
+        activate_connection.assert_any_call(nm_client, added_bond, None)
+        activate_connection.assert_any_call(nm_client, added_port2, "ens2")
+
+
 class FirewallInterfaceTestCase(unittest.TestCase):
     """Test DBus interface of the Firewall module."""
 
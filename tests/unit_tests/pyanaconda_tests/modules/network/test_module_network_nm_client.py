@@ -26,7 +26,12 @@ from unittest.mock import Mock, call, patch
 import gi
 import pytest
 
-from pyanaconda.core.glib import MainContext, sync_call_glib
+from pyanaconda.core.glib import (
+    MainContext,
+    sync_call_glib,
+    sync_call_glib_many,
+    timeout_source_new,
+)
 from pyanaconda.core.kickstart.commands import NetworkData
 from pyanaconda.modules.network.constants import (
     NM_CONNECTION_TYPE_BOND,
@@ -1111,6 +1116,72 @@ class NMClientTestCase(unittest.TestCase):
         thread.start()
         thread.join()
 
+    def test_sync_call_glib_many(self):
+        mainctx = MainContext.new()
+        mainctx.push_thread_default()
+
+        timeout = 1
+        attributes = "*"
+        flags = Gio.FileQueryInfoFlags.NONE
+        io_priority = 1
+
+        # Test no calls
+        assert sync_call_glib_many(mainctx, [], timeout) == []
+
+        # Test successful and failed runs
+        files = [
+            Gio.file_new_for_path("/usr"),
+            Gio.file_new_for_path("/nowaythiscanbeonyourfilesystem"),
+            Gio.file_new_for_path("/etc"),
+        ]
+        calls = [
+            (f.query_info_async, f.query_info_finish, (attributes, flags, io_priority))
+            for f in files
+        ]
+        results = sync_call_glib_many(mainctx, calls, timeout)
+
+        assert len(results) == 3
+        assert results[0].succeeded is True
+        assert results[0].received_data.get_name() == "usr"
+        assert results[1].failed is True
+        assert results[1].error_message != ""
+        assert results[1].received_data is None
+        assert results[1].timeout is False
+        assert results[2].succeeded is True
+        assert results[2].received_data.get_name() == "etc"
+
+        # Test timeout
+        def _file_query_info_async_with_delay(*args, cancellable, callback):
+            def _query_info():
+                Gio.File.query_info_async(*args, cancellable, callback)
+                return False
+
+            source = timeout_source_new((timeout + 1) * 1000)
+            source.set_callback(_query_info)
+            source.attach(mainctx)
+
+        _file_query_info_async_with_delay.get_symbol = lambda: "_file_query_info_async_with_delay"
+
+        file = files[0]
+        calls = [
+            (f.query_info_async, f.query_info_finish, (attributes, flags, io_priority))
+            for f in files[:1]
+        ]
+        calls.append((
+            _file_query_info_async_with_delay,
+            file.query_info_finish,
+            (file, attributes, flags, io_priority)
+        ))
+        results = sync_call_glib_many(mainctx, calls, timeout)
+
+        assert results[0].succeeded is True
+        assert results[0].timeout is False
+        assert results[1].succeeded is False
+        assert results[1].error_message == "g-io-error-quark: Operation was cancelled (19)"
+        assert results[1].timeout is True
+
+        mainctx.pop_thread_default()
+
     @patch("pyanaconda.modules.network.nm_client.NM.SettingIP4Config.new")
     @patch("pyanaconda.modules.network.nm_client.NM.SettingIP6Config.new")
     def _dns_ksdata_to_ip_sets(self, ipv4_search, ipv6_search, ipv4_ignoreauto, ipv6_ignoreauto,
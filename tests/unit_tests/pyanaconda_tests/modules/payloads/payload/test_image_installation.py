@@ -15,143 +15,151 @@
 # License and may only be used or replicated with the express permission of
 # Red Hat, Inc.
 #
-import os
-import tempfile
-import time
+import itertools
+import threading
 import unittest
 from unittest.mock import Mock, call, patch
 
-from pyanaconda.core.path import join_paths
-from pyanaconda.modules.common.constants.objects import DEVICE_TREE
-from pyanaconda.modules.common.constants.services import STORAGE
-from pyanaconda.modules.common.structures.storage import DeviceData
 from pyanaconda.modules.payloads.payload.live_image.installation_progress import (
     InstallationProgress,
+    InstallationStatus,
 )
-from tests.unit_tests.pyanaconda_tests import patch_dbus_get_proxy_with_cache
 
 
+@patch("pyanaconda.modules.payloads.payload.live_image.installation_progress.time")
 class InstallationProgressTestCase(unittest.TestCase):
     """Test the installation progress of the image installation."""
 
-    @patch("os.statvfs")
-    @patch_dbus_get_proxy_with_cache
-    def test_canceled_progress(self, proxy_getter, statvfs_mock):
+    def test_finished_progress(self, mocked_time):
+        """Test the finished installation progress."""
+        mocked_time.monotonic.side_effect = itertools.count()
+        callback = Mock()
+
+        progress = InstallationProgress(total_size=100, callback=callback)
+        progress.start()
+
+        for size in range(0, 101, 25):
+            progress.update(size)
+
+        progress.end()
+
+        assert callback.call_args_list == [
+            call("Installing software 0%"),
+            call("Installing software 25%"),
+            call("Installing software 50%"),
+            call("Installing software 75%"),
+            call("Installing software 100%"),
+        ]
+
+    def test_canceled_progress(self, mocked_time):
         """Test the canceled installation progress."""
+        mocked_time.monotonic.side_effect = itertools.count()
         callback = Mock()
 
-        with tempfile.TemporaryDirectory() as sysroot:
-            os.mkdir(join_paths(sysroot, "/boot"))
-            os.mkdir(join_paths(sysroot, "/home"))
-
-            device_tree = STORAGE.get_proxy(DEVICE_TREE)
-            device_tree.GetMountPoints.return_value = {
-                "/": "dev1",
-                "/boot": "dev2",
-                "/home": "dev3",
-            }
-            device_tree.GetDeviceData.return_value = DeviceData.to_structure(DeviceData())
-
-            statvfs_mock.return_value = \
-                Mock(f_frsize=1024, f_blocks=150, f_bfree=100)
-
-            progress = InstallationProgress(
-                sysroot=sysroot,
-                callback=callback,
-                installation_size=1024 * 100
-            )
-
-            with progress:
-                time.sleep(2)
-
-        expected = [
-            call("Synchronizing writes to disk"),
-            call("Installing software 0%")
+        progress = InstallationProgress(total_size=100, callback=callback)
+        progress.start()
+        progress.update(0)
+
+        assert callback.call_args_list == [
+            call("Installing software 0%"),
         ]
-        assert callback.call_args_list == expected
 
-    @patch("time.sleep")
-    @patch("os.statvfs")
-    @patch_dbus_get_proxy_with_cache
-    def test_finished_progress(self, proxy_getter, statvfs_mock, sleep_mock):
-        """Test the finished installation progress."""
+    def test_rate_limited_progress(self, mocked_time):
+        """Test the rate limit of the installation progress."""
+        mocked_time.monotonic.return_value = 10
         callback = Mock()
 
-        with tempfile.TemporaryDirectory() as sysroot:
-            device_tree = STORAGE.get_proxy(DEVICE_TREE)
-            device_tree.GetMountPoints.return_value = {
-                "/": "dev1",
-                "/boot": "dev2",
-                "/home": "dev3",
-            }
-            device_tree.GetDeviceData.return_value = DeviceData.to_structure(DeviceData())
-
-            statvfs_mock.side_effect = [
-                Mock(f_frsize=1024, f_blocks=150, f_bfree=125),
-                Mock(f_frsize=1024, f_blocks=150, f_bfree=100),
-                Mock(f_frsize=1024, f_blocks=150, f_bfree=75),
-                Mock(f_frsize=1024, f_blocks=150, f_bfree=45),
-                Mock(f_frsize=1024, f_blocks=150, f_bfree=25),
-                Mock(f_frsize=1024, f_blocks=150, f_bfree=0),
-            ]
-
-            progress = InstallationProgress(
-                sysroot=sysroot,
-                callback=callback,
-                installation_size=1024 * 100
-            )
-
-            progress._monitor_progress()
-
-        expected = [
-            call("Synchronizing writes to disk"),
-            call("Installing software 25%"),
-            call("Installing software 50%"),
-            call("Installing software 80%"),
+        progress = InstallationProgress(total_size=100, callback=callback, interval=1)
+        progress.start()
+
+        # Too soon.
+        progress.update(10)
+        progress.update(20)
+
+        # The interval has passed.
+        mocked_time.monotonic.return_value = 11
+        progress.update(30)
+
+        # The end is always reported.
+        progress.update(100)
+
+        assert callback.call_args_list == [
+            call("Installing software 0%"),
+            call("Installing software 30%"),
             call("Installing software 100%"),
         ]
-        assert callback.call_args_list == expected
-
-    @patch_dbus_get_proxy_with_cache
-    def test_btrfs_mountpoint_selection(self, proxy_getter):
-        """Test installation progress calculation with btrfs."""
-
-        def get_device_data(device):
-            data = DeviceData()
-            if device in ("root-btrfs-one", "home-btrfs-one"):
-                data.type = "btrfs subvolume"
-            elif device == "btrfs-one":
-                data.type = "btrfs volume"
-            return DeviceData.to_structure(data)
-
-        def get_device_ancestors(devices):
-            ancestors = {
-                "root-btrfs-one": ["btrfs-one", "dev1-disk", "dev2-disk"],
-                "dev2": ["dev2-disk"],
-                "home-btrfs-one": ["dev1-disk", "dev2-disk", "btrfs-one"],
-            }
-            return ancestors[devices[0]]
 
+        # Nothing has changed.
+        progress.end()
+        assert callback.call_count == 3
+
+    def test_unknown_total_size(self, mocked_time):
+        """Test the installation progress with unknown total size."""
+        mocked_time.monotonic.side_effect = itertools.count()
         callback = Mock()
 
-        device_tree = STORAGE.get_proxy(DEVICE_TREE)
-        device_tree.GetMountPoints.return_value = {
-            "/": "root-btrfs-one",
-            "/boot": "dev2",
-            "/home": "home-btrfs-one",
-        }
-        device_tree.GetDeviceData = Mock(wraps=get_device_data)
-        device_tree.GetAncestors = Mock(wraps=get_device_ancestors)
-
-        progress = InstallationProgress(
-            sysroot="/somewhere",
-            callback=callback,
-            installation_size=1024 * 100
+        progress = InstallationProgress(total_size=0, callback=callback)
+        progress.start()
+        progress.update(50)
+        progress.update(60, total_size=120)
+        progress.end()
+
+        assert callback.call_args_list == [
+            call("Installing software 0%"),
+            call("Installing software 50%"),
+            call("Installing software 100%"),
+        ]
+
+    def test_status(self, mocked_time):
+        """Test the status of the installation progress."""
+        mocked_time.monotonic.return_value = 0
+        progress = InstallationProgress(total_size=1000, callback=Mock())
+        progress.start()
+
+        mocked_time.monotonic.return_value = 2
+        progress.add(200)
+        progress.add(200)
+
+        assert progress.status == InstallationStatus(
+            processed_size=400,
+            total_size=1000,
+            percentage=40,
+            throughput=200,
+            eta=3,
         )
 
-        mount_points = progress._get_mount_points_to_count()
+    def test_status_not_started(self, mocked_time):
+        """Test the status of the installation progress without data."""
+        mocked_time.monotonic.return_value = 0
+        progress = InstallationProgress(total_size=0, callback=Mock())
+
+        assert progress.status == InstallationStatus(
+            processed_size=0,
+            total_size=0,
+            percentage=0,
+            throughput=0,
+            eta=None,
+        )
 
-        assert mount_points == [
-            "/somewhere/",
-            "/somewhere/boot",
-        ]
+    def test_concurrent_progress(self, mocked_time):
+        """Test the installation progress updated from more threads."""
+        mocked_time.monotonic.side_effect = itertools.count()
+        callback = Mock()
+
+        progress = InstallationProgress(total_size=4000, callback=callback)
+        progress.start()
+
+        def _add():
+            for _i in range(1000):
+                progress.add(1)
+
+        threads = [threading.Thread(target=_add) for _i in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert progress.status.processed_size == 4000
+        assert callback.call_args_list[-1] == call("Installing software 100%")
@@ -67,6 +67,7 @@ from pyanaconda.modules.common.structures.packages import (
     PackagesSelectionData,
 )
 from pyanaconda.modules.common.structures.payload import RepoConfigurationData
+from pyanaconda.modules.common.structures.validation import ValidationReport
 from pyanaconda.modules.common.task.task_interface import ValidationTaskInterface
 from pyanaconda.modules.payloads.constants import SourceState, SourceType
 from pyanaconda.modules.payloads.kickstart import PayloadKickstartSpecification
@@ -1264,6 +1265,36 @@ class DNFModuleTestCase(unittest.TestCase):
         space_getter.return_value = Size("1 MiB")
         assert self.module.calculate_required_space() == 1048576
 
+    @patch("pyanaconda.modules.payloads.payload.dnf.dnf.conf")
+    def test_prefetch_packages(self, conf):
+        """Test the speculative package prefetch."""
+        dnf_manager = Mock(spec=DNFManager)
+        self.module._dnf_manager = dnf_manager
+
+        task = self.module.validate_packages_selection_with_task(PackagesSelectionData())
+        report = ValidationReport()
+        task._set_result(report)
+
+        # The prefetch is disabled.
+        conf.payload.package_prefetch_location = ""
+        task.succeeded_signal.emit()
+        dnf_manager.start_package_prefetch.assert_not_called()
+
+        # The selection is not valid.
+        conf.payload.package_prefetch_location = "/tmp/prefetch"
+        report.error_messages = ["Error!"]
+        task.succeeded_signal.emit()
+        dnf_manager.start_package_prefetch.assert_not_called()
+
+        # The selection is valid.
+        report.error_messages = []
+        task.succeeded_signal.emit()
+        dnf_manager.start_package_prefetch.assert_called_once_with("/tmp/prefetch")
+
+        # Cancel the prefetch of a replaced DNF manager.
+        self.module._set_dnf_manager(Mock(spec=DNFManager))
+        dnf_manager.cancel_package_prefetch.assert_called_once_with()
+
     def test_get_kernel_version_list(self):
         """Test the get_kernel_version_list method."""
         with pytest.raises(UnavailableValueError):
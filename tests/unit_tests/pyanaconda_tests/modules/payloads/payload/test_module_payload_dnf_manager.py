@@ -18,6 +18,7 @@
 import os
 import subprocess
 import unittest
+from queue import Queue
 from tempfile import TemporaryDirectory
 from textwrap import dedent
 from unittest.mock import Mock, call, patch
@@ -42,10 +43,18 @@ from pyanaconda.modules.common.errors.payload import (
 from pyanaconda.modules.common.structures.comps import CompsEnvironmentData, CompsGroupData
 from pyanaconda.modules.common.structures.packages import PackagesConfigurationData
 from pyanaconda.modules.common.structures.payload import RepoConfigurationData
+from pyanaconda.modules.common.structures.validation import ValidationReport
 from pyanaconda.modules.payloads.payload.dnf.dnf_manager import (
+    DNF_PREFETCH_RESUME_DELAY,
     DNFManager,
     MetadataError,
 )
+from pyanaconda.modules.payloads.payload.dnf.download_progress import DownloadTimer
+from pyanaconda.modules.payloads.payload.dnf.transaction_progress import (
+    TransactionProgress,
+    process_transaction_progress,
+)
+from pyanaconda.modules.payloads.payload.dnf.utils import calculate_hash
 
 
 class DNF5TestCase(unittest.TestCase):
@@ -259,6 +268,42 @@ class DNFManagerTestCase(unittest.TestCase):
         size = self.dnf_manager.get_download_size()
         assert size == Size("450 MiB")
 
+    def test_get_transaction_sizes(self):
+        """Test the cache of transaction sizes."""
+        transaction = self._get_transaction()
+        self.dnf_manager._transaction = transaction
+
+        assert self.dnf_manager.get_download_size() == Size("450 MiB")
+        assert self.dnf_manager.get_installation_size() > Size(0)
+        assert self.dnf_manager.get_download_size() == Size("450 MiB")
+        assert transaction.get_transaction_packages.call_count == 1
+
+        packages = [t.get_package() for t in transaction.get_transaction_packages()]
+
+        for package in packages:
+            package.get_files.assert_called_once_with()
+
+        # Count files of the same packages only once.
+        transaction = self._get_transaction()
+        self.dnf_manager._transaction = transaction
+
+        for tspkg, package in zip(transaction.get_transaction_packages(), packages):
+            tspkg.get_package.return_value = package
+
+        self.dnf_manager.get_installation_size()
+        assert transaction.get_transaction_packages.call_count == 2
+
+        for package in packages:
+            package.get_files.assert_called_once_with()
+
+        # Count files again after the reset.
+        self.dnf_manager.reset_base()
+        self.dnf_manager._transaction = transaction
+        self.dnf_manager.get_installation_size()
+
+        for package in packages:
+            assert package.get_files.call_count == 2
+
     def _get_transaction(self, packages=2):
         """Create a mocked DNF transaction with some packages."""
         tspkgs = []
@@ -358,6 +403,57 @@ class DNFManagerTestCase(unittest.TestCase):
         ]
         assert report.warning_messages == []
 
+    def test_resolve_selection_cache(self):
+        """Test the cache of resolved software selections."""
+        self.dnf_manager.setup_base()
+
+        def _resolve(include_list):
+            self.dnf_manager.clear_selection()
+            self.dnf_manager.apply_specs(include_list=include_list, exclude_list=[])
+            return self.dnf_manager.resolve_selection()
+
+        # Resolve a new selection.
+        with patch.object(DNFManager, "_resolve_selection") as resolve:
+            resolve.return_value = ValidationReport()
+            resolve.return_value.warning_messages = ["Warning!"]
+
+            report = _resolve(["p1", "p2"])
+            assert report.warning_messages == ["Warning!"]
+            assert resolve.call_count == 1
+
+            # Reuse the resolution of the same selection.
+            report.warning_messages.append("Changed!")
+            report = _resolve(["p2", "p1", "p1"])
+            assert report.warning_messages == ["Warning!"]
+            assert resolve.call_count == 1
+
+            # Resolve a different selection.
+            _resolve(["p1"])
+            assert resolve.call_count == 2
+
+            # Resolve the selection again after a repository change.
+            data = RepoConfigurationData()
+            data.name = "r1"
+            self.dnf_manager.add_repository(data)
+            _resolve(["p1"])
+            assert resolve.call_count == 3
+
+            # Forget old resolutions.
+            for i in range(2, 6):
+                _resolve(["p{}".format(i)])
+
+            assert resolve.call_count == 7
+            assert len(self.dnf_manager._resolutions) == 4
+
+            _resolve(["p1"])
+            assert resolve.call_count == 8
+
+            # Resolve the selection again after a reset.
+            self.dnf_manager.reset_base()
+            self.dnf_manager.setup_base()
+            _resolve(["p1"])
+            assert resolve.call_count == 9
+
     def test_clear_selection(self):
         """Test the clear_selection method."""
         self.dnf_manager.setup_base()
@@ -527,7 +623,8 @@ class DNFManagerTestCase(unittest.TestCase):
 
         self.dnf_manager.install_packages(calls.append)
 
-        assert calls == [
+        # The progress is paced, so some messages can be dropped.
+        messages = [
             'Installing p1.x86_64 (1/3)',
             'Configuring p1.x86_64',
             'Installing p2.x86_64 (2/3)',
@@ -539,6 +636,63 @@ class DNFManagerTestCase(unittest.TestCase):
             'Configuring p3.x86_64'
         ]
 
+        assert calls[0] == messages[0]
+        assert calls[-1] == messages[-1]
+        assert set(calls) <= set(messages)
+
+    @patch("pyanaconda.modules.payloads.payload.dnf.transaction_progress.time")
+    def test_process_transaction_progress(self, mocked_time):
+        """Test the process_transaction_progress function."""
+        mocked_time.monotonic.side_effect = [0, 0, 0.1, 0.2, 0.6, 0.6, 0.7, 0.8, 0.9]
+
+        queue = Queue()
+        queue.put(('install', 'p1.x86_64 (1/2)'))
+        queue.put(('configure', 'p1.x86_64'))
+        queue.put(('verify', 'packages'))
+        queue.put(('install', 'p2.x86_64 (2/2)'))
+        queue.put(('log', 'Message'))
+        queue.put(('configure', 'p2.x86_64'))
+        queue.put(('quit', 'DNF quit'))
+
+        calls = []
+        process_transaction_progress(queue, calls.append, interval=0.5)
+
+        assert calls == [
+            'Installing p1.x86_64 (1/2)',
+            'Installing p2.x86_64 (2/2)',
+            'Configuring p2.x86_64',
+        ]
+
+    def test_transaction_progress_timings(self):
+        """Test the timings of the transaction progress."""
+        queue = Mock()
+        progress = TransactionProgress(queue)
+        item = self._get_transaction_item("p1")
+        script = libdnf5.rpm.TransactionCallbacks.ScriptType_POST_INSTALL
+
+        progress.before_begin(1)
+        progress.install_start(item, 0)
+        progress.install_stop(item, 0, 0)
+        progress.script_start(item, item.nevra, script)
+        progress.script_stop(item, item.nevra, script, 0)
+        progress.quit("DNF quit")
+
+        (token, msg), _kwargs = queue.put.call_args_list[-2]
+        assert token == "log"
+
+        lines = msg.splitlines()
+        assert lines[0] == "The slowest steps of the transaction:"
+        assert len(lines) == 3
+        assert any(line.startswith("Installing p1-1.2-3.x86_64: ") for line in lines)
+
+        prefix = "Running {} {}: ".format(
+            libdnf5.rpm.TransactionCallbacks.script_type_to_string(script),
+            libdnf5.rpm.to_full_nevra_string(item.nevra)
+        )
+        assert any(line.startswith(prefix) for line in lines)
+
+        queue.put.assert_called_with(('quit', "DNF quit"))
+
     def _get_transaction_item(self, name, action=libdnf5.transaction.TransactionItemAction_INSTALL):
         """Get a mocked package of the specified name."""
         package = Mock(spec=libdnf5.transaction.Package)
@@ -751,6 +905,198 @@ class DNFManagerTestCase(unittest.TestCase):
         self.dnf_manager.reset_base()
         assert self.dnf_manager.download_location is None
 
+    def _get_prefetch_transaction(self, *file_names):
+        """Create a mocked DNF transaction with packages of the given files."""
+        tspkgs = []
+
+        for file_name in file_names:
+            pkg = Mock(spec=libdnf5.rpm.Package)
+            pkg.get_location.return_value = "Packages/" + file_name
+            pkg.get_download_size.return_value = 100
+
+            tspkg = Mock(spec=libdnf5.base.TransactionPackage)
+            tspkg.get_package.return_value = pkg
+            tspkg.get_action.return_value = libdnf5.transaction.TransactionItemAction_INSTALL
+            tspkgs.append(tspkg)
+
+        transaction = Mock(spec=libdnf5.base.Transaction)
+        transaction.get_transaction_packages.return_value = tspkgs
+        return transaction
+
+    @patch("pyanaconda.modules.payloads.payload.dnf.dnf_manager.thread_manager")
+    def test_start_package_prefetch(self, thread_manager):
+        """Test the start_package_prefetch method."""
+        thread_manager.exists.return_value = False
+        self.dnf_manager._transaction = self._get_prefetch_transaction("a.rpm", "b.rpm")
+
+        with TemporaryDirectory() as d:
+            location = os.path.join(d, "anaconda-prefetch")
+            os.makedirs(location)
+            os.makedirs(os.path.join(location, "data"))
+
+            for path in ["data.rpm", "notes.txt"]:
+                with open(os.path.join(d, path), "w") as f:
+                    f.write("")
+
+            for file_name in ["a.rpm", "old.rpm", "notes.txt"]:
+                with open(os.path.join(location, file_name), "w") as f:
+                    f.write("")
+
+            self.dnf_manager.start_package_prefetch(d)
+
+            assert sorted(os.listdir(d)) == ["anaconda-prefetch", "data.rpm", "notes.txt"]
+            assert sorted(os.listdir(location)) == ["a.rpm", "data", "notes.txt"]
+            assert self.dnf_manager.prefetch_location == location
+
+        thread_manager.add_thread.assert_called_once()
+        kwargs = thread_manager.add_thread.call_args.kwargs
+        assert kwargs["name"] == "AnaPackagePrefetchThread"
+        assert kwargs["args"][1] == location
+        assert len(kwargs["args"][0]) == 2
+
+    @patch("pyanaconda.modules.payloads.payload.dnf.dnf_manager.thread_manager")
+    def test_cancel_package_prefetch(self, thread_manager):
+        """Test the cancel_package_prefetch method."""
+        thread_manager.exists.return_value = False
+        self.dnf_manager.cancel_package_prefetch()
+        assert not self.dnf_manager._prefetch_cancelled.is_set()
+        thread_manager.wait.assert_not_called()
+
+        thread_manager.exists.return_value = True
+        self.dnf_manager.clear_selection()
+        assert self.dnf_manager._prefetch_cancelled.is_set()
+        thread_manager.wait.assert_called_once_with("AnaPackagePrefetchThread")
+
+    @patch("pyanaconda.modules.payloads.payload.dnf.dnf_manager.threading.Timer")
+    @patch("pyanaconda.modules.payloads.payload.dnf.dnf_manager.thread_manager")
+    def test_pause_package_prefetch(self, thread_manager, timer):
+        """Test the pause of the package prefetch during changes of the base."""
+        transaction = self._get_prefetch_transaction("a.rpm")
+        self.dnf_manager._transaction = transaction
+        self.dnf_manager._prefetch_transaction = transaction
+        self.dnf_manager._prefetch_location = "/tmp/prefetch"
+
+        # No running prefetch.
+        thread_manager.exists.return_value = False
+        self.dnf_manager.set_download_location("/my/location")
+        thread_manager.wait.assert_not_called()
+        timer.assert_not_called()
+
+        # Read-only queries don't pause the running prefetch.
+        thread_manager.exists.return_value = True
+        self.dnf_manager.get_download_size()
+        self.dnf_manager.substitute("$basearch")
+        thread_manager.wait.assert_not_called()
+
+        # The running prefetch is stopped and resumed with a delay.
+        thread_manager.exists.side_effect = [True, False]
+        self.dnf_manager.set_download_location("/my/location")
+        thread_manager.wait.assert_called_once_with("AnaPackagePrefetchThread")
+        thread_manager.add_thread.assert_not_called()
+
+        timer.assert_called_once_with(
+            DNF_PREFETCH_RESUME_DELAY,
+            self.dnf_manager._resume_paused_prefetch
+        )
+        timer.return_value.start.assert_called_once_with()
+
+        # The scheduled resume is canceled by another pause.
+        thread_manager.exists.side_effect = None
+        thread_manager.exists.return_value = False
+        self.dnf_manager.set_download_location("/my/location")
+        timer.return_value.cancel.assert_called_once_with()
+        assert timer.call_count == 2
+
+        self.dnf_manager._resume_paused_prefetch()
+        thread_manager.add_thread.assert_called_once()
+        assert thread_manager.add_thread.call_args.kwargs["args"][1] == "/tmp/prefetch"
+
+        # The prefetch of a different transaction is not resumed.
+        thread_manager.reset_mock()
+        thread_manager.exists.side_effect = [True, False]
+        self.dnf_manager._transaction = self._get_prefetch_transaction("b.rpm")
+        self.dnf_manager.set_download_location("/my/location")
+        self.dnf_manager._resume_paused_prefetch()
+        thread_manager.wait.assert_called_once_with("AnaPackagePrefetchThread")
+        thread_manager.add_thread.assert_not_called()
+
+        # The completed prefetch is not resumed.
+        thread_manager.reset_mock()
+        thread_manager.exists.side_effect = [True, False]
+        self.dnf_manager._transaction = transaction
+        self.dnf_manager._prefetch_completed = True
+        self.dnf_manager.set_download_location("/my/location")
+        self.dnf_manager._resume_paused_prefetch()
+        thread_manager.add_thread.assert_not_called()
+
+        # The canceled prefetch is not resumed.
+        thread_manager.reset_mock()
+        thread_manager.exists.side_effect = None
+        thread_manager.exists.return_value = True
+        self.dnf_manager._prefetch_completed = False
+        self.dnf_manager._prefetch_transaction = transaction
+        self.dnf_manager.cancel_package_prefetch()
+        thread_manager.exists.return_value = False
+        self.dnf_manager.set_download_location("/my/location")
+        self.dnf_manager._resume_paused_prefetch()
+        thread_manager.add_thread.assert_not_called()
+
+    @patch("pyanaconda.modules.payloads.payload.dnf.dnf_manager.threading.Timer")
+    @patch("pyanaconda.modules.payloads.payload.dnf.dnf_manager.thread_manager")
+    def test_start_paused_package_prefetch(self, thread_manager, timer):
+        """Test the start of the package prefetch during changes of the base."""
+        thread_manager.exists.return_value = False
+        self.dnf_manager._transaction = self._get_prefetch_transaction("a.rpm")
+
+        with TemporaryDirectory() as d:
+            self.dnf_manager._prefetch_pauses = 1
+            self.dnf_manager.start_package_prefetch(d)
+            thread_manager.add_thread.assert_not_called()
+
+            self.dnf_manager._prefetch_pauses = 0
+            self.dnf_manager.set_download_location("/my/location")
+            thread_manager.add_thread.assert_not_called()
+
+            self.dnf_manager._resume_paused_prefetch()
+            thread_manager.add_thread.assert_called_once()
+
+    @patch.object(DNFManager, "_download_prefetched_packages")
+    def test_failed_package_prefetch(self, download):
+        """Test the failed package prefetch."""
+        download.side_effect = RuntimeError("Fake error!")
+
+        with self.assertLogs(level="ERROR") as cm:
+            self.dnf_manager._prefetch_packages([], "/tmp/prefetch")
+
+        assert any("The package prefetch has failed" in line for line in cm.output)
+
+    @patch("pyanaconda.modules.payloads.payload.dnf.dnf_manager.thread_manager")
+    def test_collect_prefetched_packages(self, thread_manager):
+        """Test the collect_prefetched_packages method."""
+        thread_manager.exists.return_value = False
+
+        with TemporaryDirectory() as d:
+            location = os.path.join(d, "prefetch")
+            destination = os.path.join(d, "download")
+
+            # No prefetch.
+            self.dnf_manager.collect_prefetched_packages(destination)
+            assert not os.path.exists(destination)
+
+            # Some prefetched packages.
+            os.makedirs(location)
+
+            for file_name in ["a.rpm", "old.rpm", "notes.txt"]:
+                with open(os.path.join(location, file_name), "w") as f:
+                    f.write("")
+
+            self.dnf_manager._prefetch_location = location
+            self.dnf_manager._transaction = self._get_prefetch_transaction("a.rpm", "b.rpm")
+            self.dnf_manager.collect_prefetched_packages(destination)
+
+            assert os.listdir(location) == ["notes.txt"]
+            assert os.listdir(destination) == ["a.rpm"]
+
     def test_is_package_available(self):
         """Test the is_package_available method."""
         self.dnf_manager.setup_base()
@@ -1580,6 +1926,57 @@ class DNFManagerReposTestCase(unittest.TestCase):
                 'r4': None,
             }
 
+    def test_load_repomd_hashes_in_rounds(self):
+        """Test the load_repomd_hashes method with one downloader per round."""
+        with TemporaryDirectory() as d:
+            self._add_repository("r1", repo_dir=os.path.join(d, "r1"))
+            self._add_repository("r2", repo_dir=os.path.join(d, "r2"))
+            self._add_repository(
+                repo_id="r3",
+                baseurl=["file://nonexistent/1"],
+                repo_dir=os.path.join(d, "r3"),
+            )
+
+            self.dnf_manager.load_repositories()
+
+            with patch.object(libdnf5.repo, "FileDownloader",
+                              wraps=libdnf5.repo.FileDownloader) as downloader:
+                self.dnf_manager.load_repomd_hashes()
+
+            # All repositories in the first round, r3 in the second one.
+            assert downloader.call_count == 2
+
+            for repo_id in ("r1", "r2", "r3"):
+                path = os.path.join(d, repo_id, "repodata", "repomd.xml")
+
+                with open(path) as f:
+                    md_hash = calculate_hash(f.read())
+
+                assert self.dnf_manager._md_hashes[repo_id] == md_hash
+
+    @patch("pyanaconda.modules.payloads.payload.dnf.download_progress.time.monotonic")
+    def test_download_timer(self, monotonic):
+        """Test the DownloadTimer class."""
+        timer = DownloadTimer()
+
+        monotonic.return_value = 10
+        first = timer.add_new_download(None, "http://a/repodata/repomd.xml", -1)
+        monotonic.return_value = 11
+        second = timer.add_new_download(None, "http://b/repodata/repomd.xml", -1)
+
+        monotonic.return_value = 12.5
+        status = libdnf5.repo.DownloadCallbacks.TransferStatus_ERROR
+        assert timer.end(second, status, "Error!") == 0
+
+        monotonic.return_value = 14
+        status = libdnf5.repo.DownloadCallbacks.TransferStatus_SUCCESSFUL
+        assert timer.end(first, status, "") == 0
+
+        assert timer.durations == {
+            "http://a/repodata/repomd.xml": 4,
+            "http://b/repodata/repomd.xml": 1.5,
+        }
+
     def test_verify_repomd_hashes(self):
         """Test the verify_repomd_hashes method."""
         with TemporaryDirectory() as d:
@@ -1610,3 +2007,44 @@ class DNFManagerReposTestCase(unittest.TestCase):
             # Test the base reset.
             self.dnf_manager.reset_base()
             assert self.dnf_manager.verify_repomd_hashes() is False
+
+    @patch("pyanaconda.modules.payloads.payload.dnf.dnf_manager.conf")
+    def test_metadata_cache(self, conf):
+        """Test the persistent metadata cache."""
+        with TemporaryDirectory() as d, TemporaryDirectory() as cache:
+            conf.payload.dnf_metadata_cache = cache
+            repo_dir = os.path.join(d, "r1")
+
+            # Store the metadata in the cache.
+            self._add_repository(repo_id="r1", repo_dir=repo_dir)
+            self.dnf_manager.load_repositories()
+
+            with open(os.path.join(repo_dir, "repodata", "repomd.xml")) as f:
+                md_hash = calculate_hash(f.read())
+
+            cache_dir = os.path.join(cache, "r1-" + md_hash.hex())
+            assert os.listdir(cache) == [os.path.basename(cache_dir)]
+            assert os.path.exists(os.path.join(cache_dir, "repodata", "repomd.xml"))
+
+            # Restore the metadata from the cache.
+            self.dnf_manager.clear_cache()
+            self.dnf_manager.setup_base()
+            repo = self._add_repository(repo_id="r1", baseurl=["file://" + repo_dir])
+            assert not os.path.exists(repo.get_cachedir())
+
+            self.dnf_manager._restore_metadata_cache()
+            assert os.path.exists(os.path.join(repo.get_cachedir(), "repodata", "repomd.xml"))
+
+            self.dnf_manager.load_repositories()
+            assert os.listdir(cache) == [os.path.basename(cache_dir)]
+
+            # Don't restore metadata of a changed repository.
+            with open(os.path.join(repo_dir, "repodata", "repomd.xml"), 'w') as f:
+                f.write("Different metadata for r1.")
+
+            self.dnf_manager.clear_cache()
+            self.dnf_manager.setup_base()
+            repo = self._add_repository(repo_id="r1", baseurl=["file://" + repo_dir])
+
+            self.dnf_manager._restore_metadata_cache()
+            assert not os.path.exists(repo.get_cachedir())
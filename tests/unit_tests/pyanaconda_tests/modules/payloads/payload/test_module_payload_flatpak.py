@@ -175,12 +175,18 @@ class FlatpakModuleTestCase(unittest.TestCase):
         with pytest.raises(UnavailableValueError):
             self.module.get_kernel_version_list()
 
+    def test_download_with_tasks(self):
+        """Test the Flatpak download_with_tasks method."""
+        tasks = self.module.download_with_tasks()
+        check_instances(tasks, [
+            PrepareDownloadLocationTask,
+            DownloadFlatpaksTask,
+        ])
+
     def test_install_with_tasks(self):
         """Test the Flatpak install_with_tasks method."""
         tasks = self.module.install_with_tasks()
         check_instances(tasks, [
-            PrepareDownloadLocationTask,
-            DownloadFlatpaksTask,
             InstallFlatpaksTask,
             CleanUpDownloadLocationTask,
         ])
@@ -17,8 +17,14 @@
 #
 # Red Hat Author(s): Jiri Konecny <jkonecny@redhat.com>
 #
+import hashlib
+import io
+import json
+import os
 import ssl
+import tempfile
 import unittest
+from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import MagicMock, PropertyMock, patch
 from urllib.parse import urlparse
@@ -26,6 +32,7 @@ from urllib.parse import urlparse
 import pytest
 import requests
 
+from pyanaconda.modules.common.errors.payload import SourceSetupError
 from pyanaconda.modules.common.structures.payload import RepoConfigurationData
 from pyanaconda.modules.payloads.payload.flatpak.source import (
     FlatpakRegistrySource,
@@ -206,6 +213,165 @@ class FlatpakStaticSourceTestCase(unittest.TestCase):
         assert installed_size == 40
 
 
+class FlatpakStaticSourceDownloadTestCase(unittest.TestCase):
+    """Test the download of FlatpakStaticSource of the Flatpak module."""
+
+    def setUp(self):
+        self.blobs = {}
+        self.requests = []
+
+    def _add_blob(self, content):
+        """Add a blob to the fake remote source."""
+        digest = "sha256:" + hashlib.sha256(content).hexdigest()
+        self.blobs[digest[7:]] = content
+        return digest
+
+    def _add_image(self, ref, layers):
+        """Add an image with the given layers to the fake remote source."""
+        config = self._add_blob(json.dumps({
+            "config": {
+                "Labels": {
+                    "org.flatpak.ref": ref,
+                    "org.flatpak.installed-size": "100",
+                }
+            }
+        }).encode())
+
+        manifest = self._add_blob(json.dumps({
+            "config": {"digest": config},
+            "layers": [{"digest": digest, "size": "10"} for digest in layers],
+        }).encode())
+
+        return {
+            "mediaType": "application/vnd.oci.image.manifest.v1+json",
+            "digest": manifest,
+        }
+
+    def _get(self, url, stream=False):
+        """Fake the requests.Session.get method."""
+        self.requests.append(url)
+        response = MagicMock()
+        response.status_code = 200
+
+        if url.endswith("/index.json"):
+            response.json.return_value = self.index
+        else:
+            content = self.blobs[url.rsplit("/", 1)[-1]]
+            response.content = content
+            response.raw = io.BytesIO(content)
+
+        return response
+
+    @contextmanager
+    def _downloader(self):
+        yield self._get
+
+    def _create_source(self):
+        data = RepoConfigurationData()
+        data.url = "http://server/repo"
+
+        source = FlatpakStaticSource(data)
+        source._downloader = self._downloader
+        return source
+
+    def _prepare_source(self):
+        """Prepare a source with two images sharing a layer."""
+        shared = self._add_blob(b"shared layer")
+        app = self._add_blob(b"app layer")
+
+        self.index = {"manifests": [
+            self._add_image("app/org.example.App/x86_64/stable", [shared, app]),
+            self._add_image("runtime/org.example.Platform/x86_64/stable", [shared]),
+        ]}
+
+        return shared, app
+
+    def _count_requests(self, digest):
+        return len([url for url in self.requests if url.endswith(digest[7:])])
+
+    @patch("pyanaconda.modules.payloads.payload.flatpak.source.conf")
+    def test_download(self, conf_mock):
+        """Test the download of a remote static source."""
+        conf_mock.payload.flatpak_blob_cache = ""
+        shared, app = self._prepare_source()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            source = self._create_source()
+            ret = source.download(
+                refs=["app/org.example.App/x86_64/stable",
+                      "runtime/org.example.Platform/x86_64/stable"],
+                download_location=tmp
+            )
+
+            location = os.path.join(tmp, "Flatpaks")
+            assert ret == "oci:" + location
+
+            blobs = os.listdir(os.path.join(location, "blobs", "sha256"))
+            assert sorted(blobs) == sorted(self.blobs)
+
+            for name in blobs:
+                with open(os.path.join(location, "blobs", "sha256", name), "rb") as f:
+                    assert f.read() == self.blobs[name]
+
+            with open(os.path.join(location, "index.json")) as f:
+                index_json = json.load(f)
+
+            assert len(index_json["manifests"]) == 2
+
+        # Every blob is downloaded only once.
+        assert self._count_requests(shared) == 1
+        assert self._count_requests(app) == 1
+
+    @patch("pyanaconda.modules.payloads.payload.flatpak.source.conf")
+    def test_download_invalid_checksum(self, conf_mock):
+        """Test the download of a layer with an invalid checksum."""
+        conf_mock.payload.flatpak_blob_cache = ""
+        _shared, app = self._prepare_source()
+        self.blobs[app[7:]] = b"corrupted layer"
+
+        with tempfile.TemporaryDirectory() as tmp:
+            source = self._create_source()
+
+            with pytest.raises(SourceSetupError) as cm:
+                source.download(
+                    refs=["app/org.example.App/x86_64/stable"],
+                    download_location=tmp
+                )
+
+            assert "invalid checksum" in str(cm.value)
+
+            blobs = os.listdir(os.path.join(tmp, "Flatpaks", "blobs", "sha256"))
+            assert app[7:] not in blobs
+            assert not [name for name in blobs if name not in self.blobs]
+
+    @patch("pyanaconda.modules.payloads.payload.flatpak.source.conf")
+    def test_download_blob_cache(self, conf_mock):
+        """Test the on-disk cache of blobs."""
+        self._prepare_source()
+        refs = ["app/org.example.App/x86_64/stable"]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            conf_mock.payload.flatpak_blob_cache = os.path.join(tmp, "cache")
+
+            source = self._create_source()
+            source.download(refs, os.path.join(tmp, "first"))
+
+            cached = os.listdir(os.path.join(tmp, "cache", "sha256"))
+            assert sorted(cached) == sorted(self.blobs)
+
+            # The second installation downloads only the index.
+            self.requests.clear()
+            source = self._create_source()
+            source.download(refs, os.path.join(tmp, "second"))
+
+            assert self.requests == ["http://server/repo/Flatpaks/index.json"]
+
+            location = os.path.join(tmp, "second", "Flatpaks", "blobs", "sha256")
+            for name in os.listdir(location):
+                with open(os.path.join(location, name), "rb") as f:
+                    assert f.read() == self.blobs[name]
+
+
 class FlatpakRegistrySourceTestCase(unittest.TestCase):
     """Test FlatpakRegistrySource of the Flatpak module."""
 
@@ -78,7 +78,9 @@ class PrepareDownloadLocationTaskTestCase(unittest.TestCase):
 
         assert path == "/result/path"
         flatpak_manager.calculate_size.assert_called_once()
-        pick_download_location.assert_called_once_with(10, 20, 'flatpak.mirror')
+        pick_download_location.assert_called_once_with(
+            10, 20, 'flatpak.mirror', reserved_space=None
+        )
         shutil_mock.rmtree.assert_called_once_with("/result/path")
         flatpak_manager.set_download_location.assert_called_once_with("/result/path")
 
@@ -93,7 +95,9 @@ class PrepareDownloadLocationTaskTestCase(unittest.TestCase):
         path = task.run()
 
         assert path == "/result/path"
-        pick_download_location.assert_called_once_with(10, 20, 'flatpak.mirror')
+        pick_download_location.assert_called_once_with(
+            10, 20, 'flatpak.mirror', reserved_space=None
+        )
         shutil_mock.rmtree.assert_not_called()
         flatpak_manager.set_download_location.assert_called_once_with("/result/path")
 
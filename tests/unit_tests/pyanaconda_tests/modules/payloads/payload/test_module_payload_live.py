@@ -17,11 +17,21 @@
 #
 # Red Hat Author(s): Jiri Konecny <jkonecny@redhat.com>
 #
+import errno
+import hashlib
+import io
+import itertools
 import os
+import shutil
+import stat
+import struct
+import subprocess
+import tarfile
 import tempfile
+import threading
 import unittest
 from contextlib import contextmanager
-from unittest.mock import MagicMock, Mock, call, patch
+from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 import pytest
 import requests
@@ -31,6 +41,10 @@ from pyanaconda.core.configuration.anaconda import conf
 from pyanaconda.core.path import join_paths, touch
 from pyanaconda.modules.common.errors.installation import PayloadInstallationError
 from pyanaconda.modules.common.structures.live_image import LiveImageConfigurationData
+from pyanaconda.modules.payloads.payload.live_image.download import (
+    ImageDownloader,
+    IncompleteDownloadError,
+)
 from pyanaconda.modules.payloads.payload.live_image.download_progress import (
     DownloadProgress,
 )
@@ -42,6 +56,11 @@ from pyanaconda.modules.payloads.payload.live_image.installation import (
     RemoveImageTask,
     VerifyImageChecksumTask,
 )
+from pyanaconda.modules.payloads.payload.live_image.tar_extraction import (
+    TarExtractor,
+    convert_acl_text,
+)
+from pyanaconda.modules.payloads.payload.live_image.tree_copy import TreeCopier
 from pyanaconda.modules.payloads.payload.live_os.utils import get_kernel_version_list
 
 
@@ -170,13 +189,105 @@ class InstallFromImageTaskTestCase(unittest.TestCase):
         msg = "Failed to install image: Fake!"
         assert str(cm.value) == msg
 
+    @patch("pyanaconda.modules.payloads.payload.live_image.installation_progress.time")
+    @patch("pyanaconda.modules.payloads.payload.live_image.installation.os.sync")
+    @patch("pyanaconda.modules.payloads.payload.live_image.installation.execReadlines")
+    def test_install_image_task_progress(self, exec_readlines, os_sync, mocked_time):
+        """Test the progress of an installation from an image."""
+        mocked_time.monotonic.side_effect = itertools.count()
+        reader = self._make_reader(0)
+        reader.__iter__.return_value = [
+            "etc/hostname",
+            "        100.000   0%  10,00MB/s    0:00:10 (xfr#1, to-chk=9/10)",
+            "\r        500,000  50%  10,00MB/s    0:00:05 (xfr#5, to-chk=5/10)",
+            "        500,000  50%  10,00MB/s    0:00:05 (xfr#5, to-chk=5/10)",
+            "        invalid  line (xfr#5, to-chk=5/10)",
+            "      1,000,000 100%  10,00MB/s    0:00:00 (xfr#10, to-chk=0/10)",
+            "",
+            "Number of files: 10",
+        ]
+        exec_readlines.return_value = reader
+        callback = Mock()
+
+        with tempfile.TemporaryDirectory() as mount_point:
+            task = InstallFromImageTask(
+                sysroot="/mnt/root",
+                mount_point=mount_point
+            )
+            task.progress_changed_signal.connect(callback)
+            task.run()
+
+        assert callback.mock_calls == [
+            call(0, "Synchronizing writes to disk"),
+            call(0, "Installing software 0%"),
+            call(0, "Installing software 50%"),
+            call(0, "Installing software 100%"),
+        ]
+
+
+    @patch("pyanaconda.modules.payloads.payload.live_image.installation.conf")
+    @patch("pyanaconda.modules.payloads.payload.live_image.installation.os.sync")
+    @patch("pyanaconda.modules.payloads.payload.live_image.installation.execWithRedirect")
+    @patch("pyanaconda.modules.payloads.payload.live_image.installation.execReadlines")
+    def test_install_image_task_native(self, exec_readlines, exec_with_redirect, os_sync,
+                                       mocked_conf):
+        """Test installation from an image with the native copier."""
+        mocked_conf.payload.native_image_copy = True
+        callback = Mock()
+
+        with tempfile.TemporaryDirectory() as d:
+            mount_point = join_paths(d, "image")
+            sysroot = join_paths(d, "sysroot")
+
+            os.makedirs(join_paths(mount_point, "boot/efi/loader"))
+            os.makedirs(join_paths(mount_point, "boot/efi/EFI"))
+            os.makedirs(join_paths(mount_point, "etc/sysconfig"))
+            os.makedirs(join_paths(mount_point, "proc/1"))
+            touch(join_paths(mount_point, "boot/efi/EFI/grub.cfg"))
+            touch(join_paths(mount_point, "boot/efi/loader/entry.conf"))
+            touch(join_paths(mount_point, "etc/sysconfig/network"))
+            touch(join_paths(mount_point, "etc/machine-id"))
+
+            task = InstallFromImageTask(
+                sysroot=sysroot,
+                mount_point=mount_point
+            )
+            task.progress_changed_signal.connect(callback)
+            task.run()
+
+            assert os.path.exists(join_paths(sysroot, "boot/efi/EFI/grub.cfg"))
+            assert os.path.exists(join_paths(sysroot, "etc/sysconfig/network"))
+            assert not os.path.exists(join_paths(sysroot, "boot/efi/loader"))
+            assert not os.path.exists(join_paths(sysroot, "etc/machine-id"))
+            assert not os.path.exists(join_paths(sysroot, "proc"))
+
+        exec_readlines.assert_not_called()
+        exec_with_redirect.assert_not_called()
+        assert callback.mock_calls[-1] == call(0, "Installing software 100%")
+
+    @patch("pyanaconda.modules.payloads.payload.live_image.installation.conf")
+    @patch("pyanaconda.modules.payloads.payload.live_image.installation.os.sync")
+    def test_install_image_task_native_failed(self, os_sync, mocked_conf):
+        """Test installation from a missing image with the native copier."""
+        mocked_conf.payload.native_image_copy = True
+
+        with tempfile.TemporaryDirectory() as d:
+            task = InstallFromImageTask(
+                sysroot=join_paths(d, "sysroot"),
+                mount_point=join_paths(d, "image")
+            )
+
+            with pytest.raises(PayloadInstallationError) as cm:
+                task.run()
+
+        assert str(cm.value).startswith("Failed to install image: ")
+
 
 class InstallFromTarTaskTestCase(unittest.TestCase):
     """Test the InstallFromTarTask class."""
 
-    @patch("pyanaconda.modules.payloads.payload.live_image.installation.os.sync")
     @patch("pyanaconda.modules.payloads.payload.live_image.installation.execWithRedirect")
-    def test_install_tar_task(self, exec_with_redirect, os_sync):
+    def test_install_tar_task(self, exec_with_redirect):
         """Test installation from a tarball."""
         exec_with_redirect.return_value = 0
 
@@ -203,13 +314,42 @@ class InstallFromTarTaskTestCase(unittest.TestCase):
             "--exclude", "./boot/efi/loader",
             "--exclude", "./etc/machine-id",
             "--exclude", "./etc/machine-info",
-            "-xaf", f.name,
+            "-xf", "-",
             "-C", "/mnt/root"
-        ])
+        ], stdin=ANY)
 
-    @patch("pyanaconda.modules.payloads.payload.live_image.installation.os.sync")
     @patch("pyanaconda.modules.payloads.payload.live_image.installation.execWithRedirect")
-    def test_install_tar_task_failed_exception(self, exec_with_redirect, os_sync):
+    def test_install_tar_task_compressed(self, exec_with_redirect):
+        """Test installation from a compressed tarball."""
+        exec_with_redirect.return_value = 0
+        callback = Mock()
+
+        with tempfile.TemporaryDirectory() as d:
+            tarball = join_paths(d, "test.tar.xz")
+
+            with tarfile.open(tarball, "w:xz") as tar:
+                _add_tar_member(tar, "./etc/hostname", b"host")
+
+            task = InstallFromTarTask(
+                sysroot="/mnt/root",
+                tarfile=tarball
+            )
+            task.progress_changed_signal.connect(callback)
+            task.run()
+
+        args = exec_with_redirect.call_args[0][1]
+        assert args[-5:] == ["--xz", "-xf", "-", "-C", "/mnt/root"]
+
+        stdin = exec_with_redirect.call_args[1]["stdin"]
+        assert stdin.name == tarball
+
+        assert callback.mock_calls == [
+            call(0, "Installing software 0%"),
+            call(0, "Installing software 100%"),
+        ]
+
+    @patch("pyanaconda.modules.payloads.payload.live_image.installation.execWithRedirect")
+    def test_install_tar_task_failed_exception(self, exec_with_redirect):
         """Test installation from a tarball with an exception."""
         exec_with_redirect.side_effect = OSError("Fake!")
 
@@ -225,6 +365,441 @@ class InstallFromTarTaskTestCase(unittest.TestCase):
         msg = "Failed to install tar: Fake!"
         assert str(cm.value) == msg
 
+    @patch("pyanaconda.modules.payloads.payload.live_image.installation.conf")
+    @patch("pyanaconda.modules.payloads.payload.live_image.installation.execWithRedirect")
+    def test_install_tar_task_native(self, exec_with_redirect, mocked_conf):
+        """Test installation from a tarball with the native extraction."""
+        mocked_conf.payload.native_tar_extraction = True
+        callback = Mock()
+
+        with tempfile.TemporaryDirectory() as d:
+            tarball = join_paths(d, "test.tar.gz")
+            sysroot = join_paths(d, "sysroot")
+
+            with tarfile.open(tarball, "w:gz") as tar:
+                _add_tar_member(tar, "./etc/hostname", b"host")
+                _add_tar_member(tar, "./etc/machine-id", b"id")
+                _add_tar_member(tar, "./boot/vmlinuz-6.1.0", b"kernel")
+
+            task = InstallFromTarTask(
+                sysroot=sysroot,
+                tarfile=tarball
+            )
+            task.progress_changed_signal.connect(callback)
+
+            assert task.run() == ["6.1.0"]
+            assert os.path.exists(join_paths(sysroot, "etc/hostname"))
+            assert os.path.exists(join_paths(sysroot, "boot/vmlinuz-6.1.0"))
+            assert not os.path.exists(join_paths(sysroot, "etc/machine-id"))
+
+        exec_with_redirect.assert_not_called()
+        assert callback.mock_calls[0] == call(0, "Installing software 0%")
+        assert callback.mock_calls[-1] == call(0, "Installing software 100%")
+
+    @patch("pyanaconda.modules.payloads.payload.live_image.installation.conf")
+    def test_install_tar_task_native_failed(self, mocked_conf):
+        """Test the native extraction of an invalid tarball."""
+        mocked_conf.payload.native_tar_extraction = True
+
+        with tempfile.NamedTemporaryFile("w") as f:
+            f.write("INVALID")
+            f.flush()
+
+            task = InstallFromTarTask(
+                sysroot="/mnt/root",
+                tarfile=f.name
+            )
+
+            with pytest.raises(PayloadInstallationError) as cm:
+                task.run()
+
+        assert str(cm.value).startswith("Failed to install tar:")
+
+
+def _add_tar_member(tar, name, content=None, **kwargs):
+    """Add a member to the tarball."""
+    info = tarfile.TarInfo(name)
+    info.mtime = 1000
+
+    for key, value in kwargs.items():
+        setattr(info, key, value)
+
+    if content is None:
+        tar.addfile(info)
+        return
+
+    info.size = len(content)
+    tar.addfile(info, io.BytesIO(content))
+
+
+class TarExtractorTestCase(unittest.TestCase):
+    """Test the TarExtractor class."""
+
+    def _create_tar(self, path, mode="w"):
+        """Create a tarball with different members."""
+        with tarfile.open(path, mode, format=tarfile.PAX_FORMAT) as tar:
+            _add_tar_member(tar, "./", type=tarfile.DIRTYPE, mode=0o755)
+            _add_tar_member(tar, "./etc", type=tarfile.DIRTYPE, mode=0o750)
+            _add_tar_member(tar, "./etc/hostname", b"host", mode=0o644)
+            _add_tar_member(tar, "./etc/big", b"x" * 4096, mode=0o600)
+            _add_tar_member(tar, "./etc/link", type=tarfile.SYMTYPE, linkname="hostname")
+            _add_tar_member(tar, "./etc/hard", type=tarfile.LNKTYPE, linkname="./etc/hostname")
+            _add_tar_member(tar, "./dev/null", type=tarfile.CHRTYPE, devmajor=1, devminor=3)
+            _add_tar_member(tar, "./boot/loader/entry.conf", b"entry")
+            _add_tar_member(tar, "./boot/vmlinuz-6.2.0", b"kernel")
+            _add_tar_member(tar, "./boot/vmlinuz-6.1.0", b"kernel")
+            _add_tar_member(tar, "./boot/vmlinuz-0-rescue-123", b"kernel")
+            _add_tar_member(tar, "../escape", b"escape")
+
+    def _extract(self, mode):
+        """Extract a tarball created with the given mode."""
+        callback = Mock()
+
+        with tempfile.TemporaryDirectory() as d:
+            tarball = join_paths(d, "test.tar")
+            target = join_paths(d, "sysroot")
+            self._create_tar(tarball, mode)
+
+            extractor = TarExtractor(
+                tarfile_path=tarball,
+                target=target,
+                excludes=["./dev/*", "./boot/*rescue*", "./boot/loader"],
+                callback=callback,
+            )
+
+            with patch(
+                "pyanaconda.modules.payloads.payload.live_image.tar_extraction."
+                "IMAGE_EXTRACTION_BUFFER_SIZE", 1024
+            ):
+                kernels = extractor.extract()
+
+            self._check_content(d, target)
+            size = os.path.getsize(tarball)
+
+        assert kernels == ["6.1.0", "6.2.0"]
+        assert callback.mock_calls[-1] == call(size, size)
+
+    def _check_content(self, directory, target):
+        """Check the extracted content."""
+        with open(join_paths(target, "etc/hostname"), "rb") as f:
+            assert f.read() == b"host"
+
+        with open(join_paths(target, "etc/big"), "rb") as f:
+            assert f.read() == b"x" * 4096
+
+        assert os.readlink(join_paths(target, "etc/link")) == "hostname"
+        assert os.path.samefile(
+            join_paths(target, "etc/hostname"),
+            join_paths(target, "etc/hard")
+        )
+
+        assert os.stat(join_paths(target, "etc")).st_mode & 0o777 == 0o750
+        assert os.stat(join_paths(target, "etc/big")).st_mode & 0o777 == 0o600
+        assert os.stat(join_paths(target, "etc/hostname")).st_mtime == 1000
+
+        assert os.path.exists(join_paths(target, "boot/vmlinuz-6.2.0"))
+        assert not os.path.exists(join_paths(target, "boot/vmlinuz-0-rescue-123"))
+        assert not os.path.exists(join_paths(target, "boot/loader"))
+        assert not os.path.exists(join_paths(target, "dev/null"))
+        assert not os.path.exists(join_paths(directory, "escape"))
+
+    def test_extract(self):
+        """Extract an uncompressed tarball."""
+        self._extract("w")
+
+    def test_extract_gzip(self):
+        """Extract a gzip tarball."""
+        self._extract("w:gz")
+
+    def test_extract_xz(self):
+        """Extract a xz tarball."""
+        self._extract("w:xz")
+
+    @pytest.mark.skipif(not shutil.which("zstd"), reason="The zstd tool is not available.")
+    def test_extract_zstd(self):
+        """Extract a zstd tarball."""
+        with tempfile.TemporaryDirectory() as d:
+            tarball = join_paths(d, "test.tar")
+            target = join_paths(d, "sysroot")
+            self._create_tar(tarball)
+
+            subprocess.run(["zstd", "-q", "--rm", tarball], check=True)
+
+            extractor = TarExtractor(
+                tarfile_path=tarball + ".zst",
+                target=target,
+                excludes=["./dev/*", "./boot/*rescue*", "./boot/loader"],
+            )
+
+            assert extractor.extract() == ["6.1.0", "6.2.0"]
+            self._check_content(d, target)
+
+    def test_extract_symlink_escape(self):
+        """Don't extract members through symlinks that lead outside of the target."""
+        with tempfile.TemporaryDirectory() as d:
+            tarball = join_paths(d, "test.tar")
+            target = join_paths(d, "sysroot")
+            outside = join_paths(d, "outside")
+            os.makedirs(outside)
+
+            with tarfile.open(tarball, "w", format=tarfile.PAX_FORMAT) as tar:
+                _add_tar_member(tar, "./usr/lib64", type=tarfile.DIRTYPE, mode=0o755)
+                _add_tar_member(tar, "./lib64", type=tarfile.SYMTYPE, linkname="usr/lib64")
+                _add_tar_member(tar, "./lib64/ok", b"ok")
+                _add_tar_member(tar, "./abs", type=tarfile.SYMTYPE, linkname=outside)
+                _add_tar_member(tar, "./abs/file", b"escape")
+                _add_tar_member(tar, "./abs/dir", type=tarfile.DIRTYPE, mode=0o755)
+                _add_tar_member(tar, "./abs", type=tarfile.DIRTYPE, mode=0o777)
+                _add_tar_member(tar, "./up", type=tarfile.SYMTYPE, linkname="../outside")
+                _add_tar_member(tar, "./up/file2", b"escape")
+                _add_tar_member(tar, "./hard", type=tarfile.LNKTYPE, linkname="./abs/file")
+
+            extractor = TarExtractor(tarfile_path=tarball, target=target)
+
+            with pytest.raises(OSError):
+                extractor.extract()
+
+            with open(join_paths(target, "usr/lib64/ok"), "rb") as f:
+                assert f.read() == b"ok"
+
+            assert os.listdir(outside) == []
+            assert os.stat(outside).st_mode & 0o777 != 0o777
+
+    def test_extract_failed(self):
+        """Extract an invalid tarball."""
+        with tempfile.TemporaryDirectory() as d:
+            tarball = join_paths(d, "test.tar.gz")
+
+            with open(tarball, "wb") as f:
+                f.write(b"INVALID")
+
+            extractor = TarExtractor(
+                tarfile_path=tarball,
+                target=join_paths(d, "sysroot"),
+            )
+
+            with pytest.raises(tarfile.TarError):
+                extractor.extract()
+
+    def test_convert_acl_text(self):
+        """Test the conversion of ACLs."""
+        value = convert_acl_text(
+            "user::rw-,user:joe:r--:1001,group::r--,group:42:rwx,mask::r-x,other::---"
+        )
+
+        assert value == struct.pack(
+            "<IHHIHHIHHIHHIHHIHHI", 2,
+            0x01, 6, 0xFFFFFFFF,
+            0x02, 4, 1001,
+            0x04, 4, 0xFFFFFFFF,
+            0x08, 7, 42,
+            0x10, 5, 0xFFFFFFFF,
+            0x20, 0, 0xFFFFFFFF,
+        )
+
+        with pytest.raises(ValueError):
+            convert_acl_text("invalid::rwx")
+
+
+class TreeCopierTestCase(unittest.TestCase):
+    """Test the TreeCopier class."""
+
+    EXCLUDES = ["/dev/", "/tmp/*", "/boot/*rescue*", "/boot/efi/loader/"]
+
+    def _create_tree(self, source):
+        """Create a tree with different entries."""
+        os.makedirs(join_paths(source, "etc/empty"))
+        os.makedirs(join_paths(source, "dev"))
+        os.makedirs(join_paths(source, "tmp/cache"))
+        os.makedirs(join_paths(source, "boot/efi/loader"))
+        os.makedirs(join_paths(source, "boot/efi/EFI"))
+
+        self._write(join_paths(source, "etc/hostname"), b"host", 0o644)
+        self._write(join_paths(source, "etc/big"), b"x" * 4096, 0o600)
+        self._write(join_paths(source, "dev/null"), b"")
+        self._write(join_paths(source, "tmp/file"), b"tmp")
+        self._write(join_paths(source, "boot/vmlinuz-6.1.0"), b"kernel")
+        self._write(join_paths(source, "boot/vmlinuz-0-rescue-123"), b"kernel")
+        self._write(join_paths(source, "boot/efi/loader/entry.conf"), b"entry")
+        self._write(join_paths(source, "boot/efi/EFI/grub.cfg"), b"grub")
+
+        os.symlink("hostname", join_paths(source, "etc/link"))
+        os.link(join_paths(source, "etc/hostname"), join_paths(source, "etc/hard"))
+        os.mkfifo(join_paths(source, "etc/fifo"))
+
+        os.chmod(join_paths(source, "etc"), 0o750)
+        os.utime(join_paths(source, "etc"), (2000, 2000))
+
+    @staticmethod
+    def _write(path, content, mode=0o644):
+        """Write a file."""
+        with open(path, "wb") as f:
+            f.write(content)
+
+        os.chmod(path, mode)
+        os.utime(path, (1000, 1000))
+
+    def _check_tree(self, target):
+        """Check the copied tree."""
+        with open(join_paths(target, "etc/hostname"), "rb") as f:
+            assert f.read() == b"host"
+
+        with open(join_paths(target, "etc/big"), "rb") as f:
+            assert f.read() == b"x" * 4096
+
+        with open(join_paths(target, "boot/efi/EFI/grub.cfg"), "rb") as f:
+            assert f.read() == b"grub"
+
+        assert os.readlink(join_paths(target, "etc/link")) == "hostname"
+        assert os.path.isdir(join_paths(target, "etc/empty"))
+        assert os.path.exists(join_paths(target, "etc/hard"))
+        assert stat.S_ISFIFO(os.lstat(join_paths(target, "etc/fifo")).st_mode)
+
+        assert os.stat(join_paths(target, "etc")).st_mode & 0o777 == 0o750
+        assert os.stat(join_paths(target, "etc")).st_mtime == 2000
+        assert os.stat(join_paths(target, "etc/big")).st_mode & 0o777 == 0o600
+        assert os.stat(join_paths(target, "etc/hostname")).st_mtime == 1000
+
+        assert os.path.exists(join_paths(target, "boot/vmlinuz-6.1.0"))
+        assert os.path.isdir(join_paths(target, "tmp"))
+        assert not os.path.exists(join_paths(target, "tmp/file"))
+        assert not os.path.exists(join_paths(target, "tmp/cache"))
+        assert not os.path.exists(join_paths(target, "boot/vmlinuz-0-rescue-123"))
+        assert not os.path.exists(join_paths(target, "boot/efi/loader"))
+        assert not os.path.exists(join_paths(target, "dev"))
+
+    def _copy(self, source, target, **kwargs):
+        """Copy the tree."""
+        copier = TreeCopier(
+            source=source,
+            target=target,
+            excludes=self.EXCLUDES,
+            **kwargs
+        )
+        copier.copy()
+        return copier
+
+    def test_copy(self):
+        """Copy a tree."""
+        callback = Mock()
+
+        with tempfile.TemporaryDirectory() as d:
+            source = join_paths(d, "source")
+            target = join_paths(d, "target")
+            self._create_tree(source)
+
+            copier = self._copy(source, target, callback=callback)
+            self._check_tree(target)
+
+            assert os.path.samefile(
+                join_paths(target, "etc/hostname"),
+                join_paths(target, "etc/hard")
+            )
+
+        size = 4 + 4096 + 6 + 4
+        assert callback.mock_calls[0] == call(0, size)
+        assert callback.mock_calls[-1] == call(size, size)
+
+        statistics = copier.statistics
+        assert statistics.files == 7
+        assert statistics.size == size
+        assert statistics.skipped == 0
+
+    def test_copy_xattrs(self):
+        """Copy extended attributes."""
+        with tempfile.TemporaryDirectory() as d:
+            source = join_paths(d, "source")
+            target = join_paths(d, "target")
+            self._create_tree(source)
+
+            try:
+                os.setxattr(join_paths(source, "etc/hostname"), "user.test", b"value")
+            except OSError:
+                self.skipTest("Extended attributes are not supported.")
+
+            self._copy(source, target)
+            value = os.getxattr(join_paths(target, "etc/hostname"), "user.test")
+
+        assert value == b"value"
+
+    @patch("pyanaconda.modules.payloads.payload.live_image.tree_copy.os.copy_file_range")
+    @patch("pyanaconda.modules.payloads.payload.live_image.tree_copy.fcntl.ioctl")
+    def test_copy_fallback(self, ioctl, copy_file_range):
+        """Copy a tree without cloning and copying in the kernel."""
+        ioctl.side_effect = OSError(errno.EXDEV, "Fake!")
+        copy_file_range.side_effect = OSError(errno.ENOSYS, "Fake!")
+
+        with tempfile.TemporaryDirectory() as d:
+            source = join_paths(d, "source")
+            target = join_paths(d, "target")
+            self._create_tree(source)
+
+            self._copy(source, target, workers=1)
+            self._check_tree(target)
+
+        # The unavailable methods are tried only once.
+        ioctl.assert_called_once()
+        copy_file_range.assert_called_once()
+
+    def test_copy_unsupported(self):
+        """Copy a tree to a target without links and special files."""
+        error = OSError(errno.EPERM, "Fake!")
+
+        with tempfile.TemporaryDirectory() as d:
+            source = join_paths(d, "source")
+            target = join_paths(d, "target")
+            self._create_tree(source)
+
+            with patch("os.symlink", side_effect=error):
+                with patch("os.link", side_effect=error):
+                    with patch("os.mknod", side_effect=error):
+                        copier = self._copy(source, target)
+
+            # The hard link is copied as a regular file.
+            with open(join_paths(target, "etc/hard"), "rb") as f:
+                assert f.read() == b"host"
+
+            assert not os.path.samefile(
+                join_paths(target, "etc/hostname"),
+                join_paths(target, "etc/hard")
+            )
+
+            assert not os.path.lexists(join_paths(target, "etc/link"))
+            assert not os.path.lexists(join_paths(target, "etc/fifo"))
+
+        assert copier.statistics.skipped == 2
+
+    def test_copy_existing(self):
+        """Copy a tree over an existing tree."""
+        with tempfile.TemporaryDirectory() as d:
+            source = join_paths(d, "source")
+            target = join_paths(d, "target")
+            self._create_tree(source)
+
+            os.makedirs(join_paths(target, "etc"))
+            self._write(join_paths(target, "etc/hostname"), b"old content")
+            os.symlink("invalid", join_paths(target, "etc/big"))
+            os.mkfifo(join_paths(target, "etc/link"))
+
+            self._copy(source, target)
+            self._check_tree(target)
+
+    @patch("pyanaconda.modules.payloads.payload.live_image.tree_copy.os.getxattr")
+    @patch("pyanaconda.modules.payloads.payload.live_image.tree_copy.os.listxattr")
+    def test_copy_failed(self, listxattr, getxattr):
+        """Copy a tree with an unexpected error."""
+        listxattr.return_value = ["user.test"]
+        getxattr.side_effect = OSError(errno.EIO, "Fake!")
+
+        with tempfile.TemporaryDirectory() as d:
+            source = join_paths(d, "source")
+            self._create_tree(source)
+
+            with pytest.raises(OSError) as cm:
+                self._copy(source, join_paths(d, "target"))
+
+        assert cm.value.errno == errno.EIO
+
 
 class VerifyImageChecksumTestCase(unittest.TestCase):
     """Test the VerifyImageChecksumTask class."""
@@ -291,6 +866,42 @@ class VerifyImageChecksumTestCase(unittest.TestCase):
         msg = "Checksum of the image does not match."
         assert str(cm.value) == msg
 
+    def test_verify_calculated_checksum(self):
+        """Test the verification of a checksum calculated during the download."""
+        self.data.checksum = \
+            "7190E29480A9081FD917E33990F00098" \
+            "DD9FBD348BC52B0775780348BDA3A617"
+
+        task = VerifyImageChecksumTask(
+            configuration=self.data,
+            image_path="/nonexistent/image",
+            image_checksum="7190e29480a9081fd917e33990f00098"
+                           "dd9fbd348bc52b0775780348bda3a617",
+        )
+
+        with self.assertLogs(level="DEBUG") as cm:
+            task.run()
+
+        msg = "Checksum of the image does match."
+        assert msg in "\n".join(cm.output)
+
+    def test_verify_wrong_calculated_checksum(self):
+        """Test the verification of a wrong checksum calculated during the download."""
+        self.data.checksum = "incorrect"
+
+        task = VerifyImageChecksumTask(
+            configuration=self.data,
+            image_path="/nonexistent/image",
+            image_checksum="7190e29480a9081fd917e33990f00098"
+                           "dd9fbd348bc52b0775780348bda3a617",
+        )
+
+        with pytest.raises(PayloadInstallationError) as cm:
+            task.run()
+
+        msg = "Checksum of the image does not match."
+        assert str(cm.value) == msg
+
 
 class DownloadProgressTestCase(unittest.TestCase):
     """Test the DownloadProgress class."""
@@ -326,6 +937,7 @@ class DownloadImageTaskTestCase(unittest.TestCase):
         self.data = LiveImageConfigurationData()
         self.callback = Mock()
         self.directory = None
+        self.task = None
 
     @contextmanager
     def _create_directory(self):
@@ -354,12 +966,12 @@ class DownloadImageTaskTestCase(unittest.TestCase):
 
     def _run_task(self):
         """Run the task."""
-        task = DownloadImageTask(
+        self.task = DownloadImageTask(
             configuration=self.data,
             download_path=self.download_path
         )
-        task.progress_changed_signal.connect(self.callback)
-        return task.run()
+        self.task.progress_changed_signal.connect(self.callback)
+        return self.task.run()
 
     def _download_local_file_as_remote(self, set_content_length):
         """Run the task with a local file as a remote."""
@@ -398,6 +1010,20 @@ class DownloadImageTaskTestCase(unittest.TestCase):
             0, 'Downloading {}'.format(self.data.url)
         )
 
+    def test_local_file_as_remote_checksum(self):
+        """Calculate the checksum of a downloaded file."""
+        self.data.checksum = "7190e29480a9081fd917e33990f00098"
+        self._download_local_file_as_remote(set_content_length=True)
+
+        expected = hashlib.sha256()
+        expected.update(b"\0" * (1024 * 1024 * 4 - 1) + b"1")
+        assert self.task.checksum == expected.hexdigest()
+
+    def test_local_file_as_remote_no_checksum(self):
+        """Don't calculate the checksum of a downloaded file."""
+        self._download_local_file_as_remote(set_content_length=True)
+        assert self.task.checksum is None
+
     def test_local_file_as_remote_stream(self):
         """Download a local file as a remote stream."""
         self._download_local_file_as_remote(set_content_length=True)
@@ -416,7 +1042,7 @@ class DownloadImageTaskTestCase(unittest.TestCase):
         session = session_getter.return_value.__enter__.return_value
         response = session.get.return_value
         response.headers = {}
-        response.content = b"CONTENT"
+        response.iter_content.return_value = [b"CON", b"", b"TENT"]
 
         # Run the task.
         with self._create_directory():
@@ -462,6 +1088,190 @@ class DownloadImageTaskTestCase(unittest.TestCase):
             assert str(cm.value) == "Error while downloading the image: Fake!"
 
 
+class FakeResponse:
+    """Fake response of a server with support for range requests."""
+
+    def __init__(self, content, status_code=200, broken=False, truncated=False):
+        self.headers = {
+            "content-length": str(len(content)),
+            "accept-ranges": "bytes",
+        }
+        self.status_code = status_code
+        self._content = content
+        self._broken = broken
+        self._truncated = truncated
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self._content), chunk_size):
+            if self._broken and i >= len(self._content) // 2:
+                raise requests.exceptions.ConnectionError("Fake!")
+
+            if self._truncated and i >= len(self._content) // 2:
+                return
+
+            yield self._content[i:i + chunk_size]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class FakeRangeSession:
+    """Fake session of a server with support for range requests."""
+
+    def __init__(self, content, failures=0, truncations=0):
+        self._content = content
+        self._failures = failures
+        self._truncations = truncations
+        self._lock = threading.Lock()
+        self.ranges = []
+
+    def get(self, url, proxies, verify, stream, timeout, headers=None):
+        with self._lock:
+            broken = self._failures > 0
+            self._failures -= 1
+
+        if headers:
+            with self._lock:
+                truncated = self._truncations > 0
+                self._truncations -= 1
+
+        if not headers:
+            return FakeResponse(self._content, broken=broken)
+
+        start, end = headers["Range"].removeprefix("bytes=").split("-")
+        start, end = int(start), int(end)
+
+        with self._lock:
+            self.ranges.append((start, end))
+
+        return FakeResponse(
+            self._content[start:end + 1],
+            status_code=206,
+            broken=broken,
+            truncated=truncated
+        )
+
+
+@patch("pyanaconda.modules.payloads.payload.live_image.download.IMAGE_DOWNLOAD_CHUNK_SIZE", 16)
+@patch("pyanaconda.modules.payloads.payload.live_image.download.IMAGE_DOWNLOAD_MIN_SEGMENT_SIZE", 64)
+class ImageDownloaderTestCase(unittest.TestCase):
+    """Test the ImageDownloader class."""
+
+    def setUp(self):
+        """Set up the test."""
+        self.content = bytes(range(256)) * 2
+        self.callback = Mock()
+
+    def _download(self, session, download_path, segments=4):
+        """Download the fake image."""
+        downloader = ImageDownloader(
+            session=session,
+            url="http://source",
+            download_path=download_path,
+            callback=self.callback,
+            segments=segments,
+            hash_algorithm="sha256",
+        )
+        downloader.download()
+
+        with open(download_path, "rb") as f:
+            assert f.read() == self.content
+
+        assert downloader.checksum == hashlib.sha256(self.content).hexdigest()
+
+        assert not os.path.exists(download_path + ".state")
+
+    def test_download_segments(self):
+        """Download an image in parallel segments."""
+        session = FakeRangeSession(self.content)
+
+        with tempfile.TemporaryDirectory() as d:
+            self._download(session, join_paths(d, "image"))
+
+        assert sorted(session.ranges) == [
+            (0, 127), (128, 255), (256, 383), (384, 511)
+        ]
+
+        assert self.callback.mock_calls[-1] == call(
+            "Downloading http://source (100%)"
+        )
+
+    def test_download_single_segment(self):
+        """Download an image with disabled segments."""
+        session = FakeRangeSession(self.content)
+
+        with tempfile.TemporaryDirectory() as d:
+            self._download(session, join_paths(d, "image"), segments=1)
+
+        assert session.ranges == []
+
+    def test_resume_segments(self):
+        """Resume interrupted segments."""
+        session = FakeRangeSession(self.content, failures=3)
+
+        with tempfile.TemporaryDirectory() as d:
+            self._download(session, join_paths(d, "image"))
+
+        assert len(session.ranges) == 6
+
+    def test_resume_stream(self):
+        """Resume an interrupted stream."""
+        session = FakeRangeSession(self.content, failures=1)
+
+        with tempfile.TemporaryDirectory() as d:
+            self._download(session, join_paths(d, "image"), segments=1)
+
+        assert session.ranges == [(256, 511)]
+
+    def test_resume_truncated_segments(self):
+        """Resume segments with truncated responses."""
+        session = FakeRangeSession(self.content, truncations=2)
+
+        with tempfile.TemporaryDirectory() as d:
+            self._download(session, join_paths(d, "image"))
+
+        assert len(session.ranges) == 6
+
+    @patch("pyanaconda.modules.payloads.payload.live_image.download.IMAGE_DOWNLOAD_RETRIES", 2)
+    def test_truncated_segments_failed(self):
+        """Fail on segments with repeatedly truncated responses."""
+        session = FakeRangeSession(self.content, truncations=100)
+
+        with tempfile.TemporaryDirectory() as d:
+            with pytest.raises(IncompleteDownloadError):
+                self._download(session, join_paths(d, "image"))
+
+        # Every segment is requested only up to the limit of retries.
+        assert len(session.ranges) <= 4 * 3
+
+    @patch("pyanaconda.modules.payloads.payload.live_image.download.IMAGE_DOWNLOAD_RETRIES", 0)
+    def test_resume_interrupted_download(self):
+        """Resume a download of a previous run."""
+        with tempfile.TemporaryDirectory() as d:
+            download_path = join_paths(d, "image")
+            session = FakeRangeSession(self.content, failures=5)
+
+            with pytest.raises(requests.exceptions.ConnectionError):
+                self._download(session, download_path)
+
+            assert os.path.exists(download_path + ".state")
+
+            session = FakeRangeSession(self.content)
+            self._download(session, download_path)
+
+        # The downloaded parts are not downloaded again.
+        assert sum(end + 1 - start for start, end in session.ranges) < len(self.content)
+
+
 class MountImageTaskTestCase(unittest.TestCase):
     """Test the MountImageTask class."""
 
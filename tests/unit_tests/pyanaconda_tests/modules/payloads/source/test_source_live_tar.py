@@ -184,3 +184,17 @@ class LiveTarInstallationTestCase(unittest.TestCase):
             '5.8.16-200.fc32.x86_64',
             '5.8.18-200.fc32.x86_64',
         ]
+
+
+class LiveTarNativeInstallationTestCase(LiveTarInstallationTestCase):
+    """Test the live tar installation with the native extraction."""
+
+    def setUp(self):
+        """Set up the test."""
+        super().setUp()
+        self._conf_patcher = patch(
+            "pyanaconda.modules.payloads.payload.live_image.installation.conf"
+        )
+        mocked_conf = self._conf_patcher.start()
+        mocked_conf.payload.native_tar_extraction = True
+        self.addCleanup(self._conf_patcher.stop)
@@ -124,6 +124,34 @@ class PayloadBaseUtilsTest(TestCase):
         msg = "Not enough disk space to download the packages; size 100 B."
         assert str(cm.value) == msg
 
+    @patch("pyanaconda.modules.payloads.base.utils.get_free_space_map")
+    def test_pick_download_location_reserved_space(self, free_space_getter):
+        """Test the pick_download_location function with reserved space."""
+        free_space_getter.return_value = {
+            "/var/tmp": Size(150),
+            "/mnt/sysroot": Size(1000),
+        }
+        reserved_space = {}
+
+        path = pick_download_location(Size(100), Size(200), "FIRST", reserved_space)
+        assert path == "/var/tmp/FIRST"
+        assert reserved_space == {
+            "/var/tmp": Size(100),
+            "/mnt/sysroot": Size(200),
+        }
+
+        # The rest of /var/tmp is not enough for the second download.
+        path = pick_download_location(Size(100), Size(300), "SECOND", reserved_space)
+        assert path == "/mnt/sysroot/SECOND"
+        assert reserved_space == {
+            "/var/tmp": Size(100),
+            "/mnt/sysroot": Size(600),
+        }
+
+        # The reserved space is not free.
+        with pytest.raises(RuntimeError):
+            pick_download_location(Size(450), Size(0), "THIRD", reserved_space)
+
     @patch("pyanaconda.modules.payloads.base.utils.execWithCapture")
     def test_get_free_space(self, exec_mock):
         """Test the get_free_space function."""
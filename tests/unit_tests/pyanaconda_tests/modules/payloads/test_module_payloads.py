@@ -18,6 +18,7 @@
 # Red Hat Author(s): Jiri Konecny <jkonecny@redhat.com>
 #
 import os
+import threading
 from tempfile import TemporaryDirectory
 from textwrap import dedent
 from unittest import TestCase
@@ -37,10 +38,12 @@ from pyanaconda.modules.payloads.base.initialization import (
     SetUpSourcesTask,
     TearDownSourcesTask,
 )
+from pyanaconda.modules.payloads.base.installation import PrepareDownloadLocationTaskBase
 from pyanaconda.modules.payloads.constants import PayloadType, SourceType
 from pyanaconda.modules.payloads.installation import (
     CopyDriverDisksFilesTask,
     PrepareSystemForInstallationTask,
+    RunInParallelTask,
 )
 from pyanaconda.modules.payloads.payload.dnf.dnf import DNFModule
 from pyanaconda.modules.payloads.payload.live_image.live_image import LiveImageModule
@@ -269,13 +272,84 @@ class PayloadsInterfaceTestCase(TestCase):
             assert tasks[1:] == [task, task1]
 
             payload.side_payload = Mock()
-            payload.side_payload.install_with_tasks.return_value = [task2, task3]
+            payload.side_payload.download_with_tasks.return_value = [task2]
+            payload.side_payload.install_with_tasks.return_value = [task3]
 
             tasks_paths = self.payload_interface.InstallWithTasks()
             tasks = TaskContainer.from_object_path_list(tasks_paths)
             assert isinstance(tasks[0], PrepareSystemForInstallationTask)
             assert tasks[1:] == [task, task1, task2, task3]
 
+    @patch("pyanaconda.modules.payloads.payloads.conf")
+    @patch_dbus_publish_object
+    def test_install_with_tasks_pipelined(self, publisher, mocked_conf):
+        """Test the InstallWithTasks method with a pipelined installation."""
+        mocked_conf.payload.pipelined_installation = True
+        task = create_autospec(Task)
+        task1 = create_autospec(Task)
+        task2 = create_autospec(Task)
+        task3 = create_autospec(Task)
+
+        payload = self.payload_module.create_payload(PayloadType.LIVE_IMAGE)
+        with patch.object(payload, "install_with_tasks") as mock_install_with_tasks:
+            mock_install_with_tasks.return_value = [task, task1]
+            self.payload_module.activate_payload(payload)
+
+            tasks_paths = self.payload_interface.InstallWithTasks()
+            tasks = TaskContainer.from_object_path_list(tasks_paths)
+            assert isinstance(tasks[0], PrepareSystemForInstallationTask)
+            assert tasks[1:] == [task, task1]
+
+            payload.side_payload = Mock()
+            payload.side_payload.download_with_tasks.return_value = [task2]
+            payload.side_payload.install_with_tasks.return_value = [task3]
+
+            tasks_paths = self.payload_interface.InstallWithTasks()
+            tasks = TaskContainer.from_object_path_list(tasks_paths)
+            assert len(tasks) == 3
+            assert isinstance(tasks[0], PrepareSystemForInstallationTask)
+            assert isinstance(tasks[1], RunInParallelTask)
+            assert tasks[1]._sequences == [[task, task1], [task2]]
+            assert tasks[2] == task3
+
+    @patch("pyanaconda.modules.payloads.payloads.conf")
+    @patch_dbus_publish_object
+    def test_install_with_tasks_pipelined_locations(self, publisher, mocked_conf):
+        """Test the pipelined installation with download locations."""
+        mocked_conf.payload.pipelined_installation = True
+        task = create_autospec(Task)
+        task1 = create_autospec(Task)
+        task2 = create_autospec(Task)
+        task3 = create_autospec(Task)
+        main_location = create_autospec(PrepareDownloadLocationTaskBase, instance=True)
+        side_location = create_autospec(PrepareDownloadLocationTaskBase, instance=True)
+
+        payload = self.payload_module.create_payload(PayloadType.LIVE_IMAGE)
+        with patch.object(payload, "install_with_tasks") as mock_install_with_tasks:
+            mock_install_with_tasks.return_value = [task, main_location, task1]
+            self.payload_module.activate_payload(payload)
+
+            payload.side_payload = Mock()
+            payload.side_payload.download_with_tasks.return_value = [side_location, task2]
+            payload.side_payload.install_with_tasks.return_value = [task3]
+
+            tasks_paths = self.payload_interface.InstallWithTasks()
+            tasks = TaskContainer.from_object_path_list(tasks_paths)
+
+        # The download locations are picked before the parallel task.
+        assert len(tasks) == 6
+        assert isinstance(tasks[0], PrepareSystemForInstallationTask)
+        assert tasks[1:4] == [task, main_location, side_location]
+        assert isinstance(tasks[4], RunInParallelTask)
+        assert tasks[4]._sequences == [[task1], [task2]]
+        assert tasks[5] == task3
+
+        # The download locations share the reserved space.
+        main_location.set_reserved_space.assert_called_once_with({})
+        side_location.set_reserved_space.assert_called_once_with({})
+        reserved_space = main_location.set_reserved_space.call_args.args[0]
+        assert side_location.set_reserved_space.call_args.args[0] is reserved_space
+
 
     @patch_dbus_publish_object
     def test_post_install_with_tasks(self, publisher):
@@ -395,6 +469,65 @@ class PrepareSystemForInstallationTaskTestCase(TestCase):
                 assert expected_content == f.read()
 
 
+class RunInParallelTaskTestCase(TestCase):
+
+    def test_run(self):
+        """Test the RunInParallelTask task."""
+        calls = []
+        tasks = [create_autospec(Task) for _ in range(4)]
+
+        for i, task in enumerate(tasks):
+            task.run_with_signals.side_effect = lambda i=i: calls.append(i)
+
+        task = RunInParallelTask("Test", [tasks[:2], [], tasks[2:]])
+        assert task.name == "Test"
+        task.run()
+
+        assert sorted(calls) == [0, 1, 2, 3]
+        assert calls.index(0) < calls.index(1)
+        assert calls.index(2) < calls.index(3)
+
+    def test_run_failed(self):
+        """Test the failed RunInParallelTask task."""
+        tasks = [create_autospec(Task) for _ in range(3)]
+        tasks[0].run_with_signals.side_effect = SourceSetupError("Fake error!")
+
+        task = RunInParallelTask("Test", [tasks[:2], tasks[2:]])
+
+        with pytest.raises(SourceSetupError):
+            task.run()
+
+        tasks[1].run_with_signals.assert_not_called()
+        tasks[2].cancel.assert_called_once_with()
+
+    def test_run_failed_cancel(self):
+        """Test that the failed RunInParallelTask task cancels other sequences."""
+        event = threading.Event()
+        tasks = [create_autospec(Task) for _ in range(3)]
+        tasks[0].run_with_signals.side_effect = SourceSetupError("Fake error!")
+        tasks[1].run_with_signals.side_effect = lambda: event.wait(timeout=10)
+        tasks[1].cancel.side_effect = event.set
+
+        task = RunInParallelTask("Test", [tasks[:1], tasks[1:]])
+
+        with pytest.raises(SourceSetupError, match="Fake error!"):
+            task.run()
+
+        assert event.is_set()
+        assert task.check_cancel() is True
+        tasks[1].cancel.assert_called_once_with()
+        tasks[2].run_with_signals.assert_not_called()
+
+    def test_cancel(self):
+        """Test the cancellation of the RunInParallelTask task."""
+        tasks = [create_autospec(Task) for _ in range(2)]
+        task = RunInParallelTask("Test", [tasks[:1], tasks[1:]])
+        task.cancel()
+
+        for subtask in tasks:
+            subtask.cancel.assert_called_once_with()
+
+
 class PayloadSharedTasksTest(TestCase):
 
     def test_set_up_sources_task(self):
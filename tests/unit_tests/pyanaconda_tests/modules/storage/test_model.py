@@ -15,6 +15,7 @@
 # License and may only be used or replicated with the express permission of
 # Red Hat, Inc.
 #
+import copy
 import unittest
 
 from blivet.devices import StorageDevice
@@ -66,6 +67,26 @@ class InstallerStorageTestCase(unittest.TestCase):
         dev2_copy = storage_copy.devicetree.get_device_by_name("dev2")
         self._check_device_copy(dev2, dev2_copy)
 
+    def test_deepcopy_roots(self):
+        """Test that the deep copy doesn't copy or modify the roots."""
+        dev1 = StorageDevice("dev1")
+        self._add_device(dev1)
+
+        roots = self.storage.roots
+        root1 = Root(name="Linux 1", devices=[dev1], mounts={"/": dev1})
+        roots.append(root1)
+
+        storage_copy = copy.deepcopy(self.storage)
+        assert storage_copy.roots == []
+        assert len(storage_copy.devices) == 1
+
+        storage_copy = self.storage.copy()
+        assert len(storage_copy.roots) == 1
+        assert storage_copy.roots[0] is not root1
+
+        assert self.storage.roots is roots
+        assert self.storage.roots == [root1]
+
     def test_copy_root_no_devices(self):
         """Test the copy method with a root and no devices."""
         root1 = Root(name="Linux 1")
@@ -186,3 +207,35 @@ class InstallerStorageTestCase(unittest.TestCase):
         root2_copy = storage_copy.roots[1]
         assert root2_copy.name == "Linux 2"
         assert len(root2_copy.mountopts) == 1
+
+    def test_copy_root_hidden_devices(self):
+        """Test the copy of a root with hidden devices."""
+        dev1 = StorageDevice("dev1")
+        self._add_device(dev1)
+
+        dev2 = StorageDevice("dev2", exists=True)
+        self._add_device(dev2)
+        self.storage.devicetree.hide(dev2)
+
+        root1 = Root(
+            name="Linux 1",
+            devices=[dev1, dev2],
+            mounts={"/": dev1, "/home": dev2},
+        )
+        self.storage.roots.append(root1)
+
+        storage_copy = self.storage.copy()
+        assert self.storage.roots == [root1]
+        assert root1.devices == [dev1, dev2]
+
+        root1_copy = storage_copy.roots[0]
+        assert root1_copy is not root1
+        assert len(root1_copy.devices) == 2
+
+        dev1_copy, dev2_copy = root1_copy.devices
+        self._check_device_copy(dev1, dev1_copy)
+        self._check_device_copy(dev2, dev2_copy)
+
+        assert dev1_copy in storage_copy.devices
+        assert dev2_copy in storage_copy.devicetree._hidden
+        assert root1_copy.mounts == {"/": dev1_copy, "/home": dev2_copy}
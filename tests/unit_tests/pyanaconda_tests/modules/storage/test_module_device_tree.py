@@ -49,7 +49,9 @@ from pyanaconda.modules.common.errors.storage import (
     UnknownDeviceError,
 )
 from pyanaconda.modules.common.structures.storage import (
+    DeviceData,
     DeviceFormatData,
+    DeviceTreeData,
     MountPointConstraintsData,
 )
 from pyanaconda.modules.storage.devicetree import (
@@ -243,6 +245,97 @@ class DeviceTreeInterfaceTestCase(unittest.TestCase):
         with pytest.raises(UnknownDeviceError):
             self.interface.GetDeviceData("dev1")
 
+    def test_get_devices_data(self):
+        """Test GetDevicesData."""
+        dev1 = DiskDevice("dev1", fmt=get_format("ext4"), size=Size("10 GiB"))
+        self._add_device(dev1)
+
+        dev2 = StorageDevice("dev2", size=Size("5 GiB"), parents=[dev1])
+        self._add_device(dev2)
+
+        assert self.interface.GetDevicesData([]) == []
+
+        data = self.interface.GetDevicesData(["dev2", "dev1"])
+        assert data == [
+            self.interface.GetDeviceData("dev2"),
+            self.interface.GetDeviceData("dev1"),
+        ]
+
+        with pytest.raises(UnknownDeviceError):
+            self.interface.GetDevicesData(["dev1", "dev3"])
+
+    def test_get_device_tree_data(self):
+        """Test GetDeviceTreeData."""
+        dev1 = DiskDevice("dev1", fmt=get_format("ext4"), size=Size("10 GiB"))
+        self._add_device(dev1)
+
+        dev2 = StorageDevice("dev2", fmt=get_format("luks"), size=Size("5 GiB"),
+                             parents=[dev1])
+        self._add_device(dev2)
+
+        data = DeviceTreeData.from_structure(self.interface.GetDeviceTreeData())
+        devices = DeviceData.to_structure_list(data.devices)
+        formats = DeviceFormatData.to_structure_list(data.formats)
+
+        assert [d.device_id for d in data.devices] == self.interface.GetDevices()
+        assert devices == self.interface.GetDevicesData(self.interface.GetDevices())
+        assert formats == self.interface.GetFormatsData(self.interface.GetDevices())
+
+        types = {d.device_id: f.type for d, f in zip(data.devices, data.formats)}
+        assert types == {"dev1": "ext4", "dev2": "luks"}
+
+    def test_device_data_cache(self):
+        """Test the cache of the device and format data."""
+        dev1 = StorageDevice("dev1", fmt=get_format("ext4"), size=Size("10 GiB"))
+        self._add_device(dev1)
+
+        cache = self.module.data_cache
+        assert cache.hits == 0
+        assert cache.misses == 0
+
+        data = self.interface.GetDeviceData("dev1")
+        assert self.interface.GetDeviceData("dev1") == data
+        assert self.interface.GetFormatData("dev1")
+        assert cache.hits == 1
+        assert cache.misses == 2
+
+        # Unknown devices are not cached.
+        with pytest.raises(UnknownDeviceError):
+            self.interface.GetDeviceData("dev2")
+
+        assert cache.misses == 3
+
+        # Adding a device changes the generation.
+        dev2 = StorageDevice("dev2", parents=[dev1], size=Size("1 GiB"))
+        self._add_device(dev2)
+
+        data = DeviceData.from_structure(self.interface.GetDeviceData("dev1"))
+        assert data.children == [dev2.device_id]
+        assert cache.misses == 4
+
+        # Scheduling an action changes the generation.
+        dev3 = StorageDevice("dev3", fmt=get_format("ext4"), size=Size("1 GiB"), exists=True)
+        self._add_device(dev3)
+
+        data = DeviceFormatData.from_structure(self.interface.GetFormatData("dev3"))
+        assert data.type == "ext4"
+        assert cache.misses == 5
+
+        self.storage.format_device(dev3, get_format("xfs"))
+
+        data = DeviceFormatData.from_structure(self.interface.GetFormatData("dev3"))
+        assert data.type == "xfs"
+        assert cache.misses == 6
+
+        # Replacing the storage changes the generation.
+        self.module.on_storage_changed(create_storage())
+
+        with pytest.raises(UnknownDeviceError):
+            self.interface.GetDeviceData("dev1")
+
+        assert cache.hits == 1
+        assert cache.misses == 7
+
     def test_get_dasd_device_data(self):
         """Test GetDeviceData for DASD."""
         self._add_device(DASDDevice(
@@ -459,6 +552,25 @@ class DeviceTreeInterfaceTestCase(unittest.TestCase):
             'attrs': get_variant(Dict[Str, Str], {}),
         }
 
+    def test_get_formats_data(self):
+        """Test GetFormatsData."""
+        dev1 = StorageDevice("dev1", fmt=get_format("ext4"), size=Size("10 GiB"))
+        self._add_device(dev1)
+
+        dev2 = StorageDevice("dev2", fmt=get_format("luks"), size=Size("10 GiB"))
+        self._add_device(dev2)
+
+        assert self.interface.GetFormatsData([]) == []
+
+        data = self.interface.GetFormatsData(["dev1", "dev2"])
+        assert data == [
+            self.interface.GetFormatData("dev1"),
+            self.interface.GetFormatData("dev2"),
+        ]
+
+        with pytest.raises(UnknownDeviceError):
+            self.interface.GetFormatsData(["dev3"])
+
     def test_get_format_type_data(self):
         """Test GetFormatTypeData."""
         assert self.interface.GetFormatTypeData("swap") == {
@@ -688,6 +800,16 @@ class DeviceTreeInterfaceTestCase(unittest.TestCase):
         with pytest.raises(UnknownDeviceError):
             self.interface.GetDiskFreeSpace(["dev1", "dev2", "devX"])
 
+        assert self.interface.GetDisksFreeSpace([]) == {}
+        assert self.interface.GetDisksFreeSpace(["dev1", "dev2", "dev3"]) == {
+            "dev1": Size("4 GiB").get_bytes(),
+            "dev2": Size("4 GiB").get_bytes(),
+            "dev3": 0,
+        }
+
+        with pytest.raises(UnknownDeviceError):
+            self.interface.GetDisksFreeSpace(["dev1", "devX"])
+
     @patch("blivet.formats.disklabel.DiskLabel.get_platform_label_types")
     def test_get_disk_reclaimable_space(self, label_types):
         """Test GetDiskReclaimableSpace."""
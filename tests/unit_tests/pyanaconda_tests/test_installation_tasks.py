@@ -17,9 +17,12 @@
 # subject to the GNU General Public License and may only be used or replicated
 # with the express permission of Red Hat, Inc.
 #
+import threading
 import unittest
 from textwrap import dedent
 
+import pytest
+
 from pyanaconda.installation_tasks import Task, TaskQueue
 
 
@@ -264,3 +267,147 @@ class InstallTasksTestCase(unittest.TestCase):
         assert self._task_completed_count == 4
         assert self._queue_started_count == 3
         assert self._queue_completed_count == 3
+
+    def test_parallel_task_queue(self):
+        """Check that a parallel task queue works correctly."""
+        event = threading.Event()
+        results = []
+
+        def wait_for_event():
+            # This task can finish only if the next task runs at the same time.
+            results.append(("first", event.wait(timeout=10)))
+
+        def set_event():
+            event.set()
+            results.append(("second", True))
+
+        def check_results():
+            results.append(("third", len(results)))
+
+        first = Task("first", wait_for_event, provides=["first"])
+        second = Task("second", set_event)
+        third = Task("third", check_results, requires=["first", "unknown"])
+
+        queue = TaskQueue("queue", parallel=True)
+        queue.append(first)
+        queue.append(second)
+        queue.append(third)
+
+        assert queue.parallel is True
+        assert queue.task_count == 3
+        assert queue.summary == dedent("""
+        Top-level task queue: queue
+        Number of task queues: 0
+        Number of tasks: 3
+        Task & task group listing:
+         Task: first
+         Task: second
+         Task: third
+        """).strip()
+
+        started = []
+        completed = []
+        queue.task_started.connect(lambda task: started.append(task.name))
+        queue.task_completed.connect(lambda task: completed.append(task.name))
+
+        queue.start()
+
+        assert sorted(results) == [("first", True), ("second", True), ("third", 2)]
+        assert started == ["first", "second", "third"]
+        assert completed == ["first", "second", "third"]
+
+    def test_parallel_task_queue_ready_items(self):
+        """Check that a parallel task queue starts all ready items."""
+        event = threading.Event()
+        results = []
+
+        def wait_for_event():
+            # This task can finish only if the last task runs at the same time.
+            results.append(("first", event.wait(timeout=10)))
+
+        def set_event():
+            event.set()
+            results.append(("third", True))
+
+        queue = TaskQueue("queue", parallel=True)
+        queue.append(Task("first", wait_for_event, provides=["first"]))
+        queue.append(Task("second", lambda: results.append(("second", True)), requires=["first"]))
+        queue.append(Task("third", set_event))
+
+        started = []
+        completed = []
+        queue.task_started.connect(lambda task: started.append(task.name))
+        queue.task_completed.connect(lambda task: completed.append(task.name))
+
+        queue.start()
+
+        assert results[0] == ("third", True)
+        assert sorted(results) == [("first", True), ("second", True), ("third", True)]
+        assert started == ["first", "second", "third"]
+        assert completed == ["first", "second", "third"]
+
+    def test_parallel_task_queue_nested_order(self):
+        """Check that a parallel task queue reports nested items in order."""
+        event = threading.Event()
+        results = []
+
+        def wait_for_event():
+            # This task can finish only if the second queue has finished.
+            event.wait(timeout=10)
+            results.append("a2")
+
+        def set_event():
+            results.append("b2")
+            event.set()
+
+        first = TaskQueue("A")
+        first.append(Task("a1", lambda: results.append("a1")))
+        first.append(Task("a2", wait_for_event))
+
+        second = TaskQueue("B")
+        second.append(Task("b1", lambda: results.append("b1")))
+        second.append(Task("b2", set_event))
+
+        queue = TaskQueue("queue", parallel=True)
+        queue.append(first)
+        queue.append(second)
+
+        events = []
+        queue.queue_started.connect(lambda q: events.append(("queue started", q.name)))
+        queue.queue_completed.connect(lambda q: events.append(("queue completed", q.name)))
+
+        for item in first.items + second.items:
+            item.started.connect(lambda t: events.append(("started", t.name)))
+            item.completed.connect(lambda t: events.append(("completed", t.name)))
+
+        queue.start()
+
+        assert results.index("b2") < results.index("a2")
+        assert events == [
+            ("queue started", "A"),
+            ("started", "a1"),
+            ("completed", "a1"),
+            ("started", "a2"),
+            ("completed", "a2"),
+            ("queue completed", "A"),
+            ("queue started", "B"),
+            ("started", "b1"),
+            ("completed", "b1"),
+            ("started", "b2"),
+            ("completed", "b2"),
+            ("queue completed", "B"),
+        ]
+
+    def test_parallel_task_queue_failure(self):
+        """Check that a parallel task queue raises errors of tasks."""
+        def fail():
+            raise RuntimeError("Fake error!")
+
+        queue = TaskQueue("queue", parallel=True)
+        queue.append(Task("fail", fail, provides=["failed"]))
+        queue.append(Task("skip", self._increment_var1, requires=["failed"]))
+
+        with pytest.raises(RuntimeError, match="Fake error!"):
+            queue.start()
+
+        assert self._test_variable1 == 0
@@ -17,8 +17,16 @@
 # Red Hat, Inc.
 
 import unittest
+from unittest.mock import Mock, patch
+
+import gi
+from dasbus.signal import Signal
 
 from pyanaconda import network
+from pyanaconda.core.glib import timeout_source_new
+
+gi.require_version("GLib", "2.0")
+from gi.repository import GLib
 
 
 class NetworkTests(unittest.TestCase):
@@ -262,3 +270,73 @@ class NetworkTests(unittest.TestCase):
         # automatic ip= whith MAC address set
         cmdline = {"ip": "ens3:dhcp::52:54:00:12:34:56"}
         assert network.hostname_from_cmdline(cmdline) == ""
+
+
+class NetworkWaitTests(unittest.TestCase):
+    """Test the waits for the network."""
+
+    def _get_network_proxy(self, interfaces):
+        """Get a proxy of the Network module."""
+        network_proxy = Mock()
+        network_proxy.PropertiesChanged = Signal()
+        network_proxy.ActivatedInterfacesChanged = Signal()
+        network_proxy.GetActivatedInterfaces.side_effect = interfaces
+        return network_proxy
+
+    @patch("pyanaconda.network.NETWORK")
+    @patch("pyanaconda.network.thread_manager")
+    def test_poll_network_devices(self, thread_manager, network_module):
+        """Test the wait for network devices in the main thread."""
+        thread_manager.in_main_thread.return_value = True
+        network_proxy = self._get_network_proxy([[], ["ens3"], ["ens3", "ens4"]])
+        network_module.get_proxy.return_value = network_proxy
+
+        assert network.wait_for_network_devices(["ens3", "ens4"], timeout=5) is True
+        assert network_proxy.GetActivatedInterfaces.call_count == 3
+
+        network_proxy = self._get_network_proxy(lambda: ["ens3"])
+        network_module.get_proxy.return_value = network_proxy
+
+        assert network.wait_for_network_devices(["ens4"], timeout=0.2) is False
+
+    @patch("pyanaconda.network.disconnect_proxy")
+    @patch("pyanaconda.network.NETWORK")
+    @patch("pyanaconda.network.thread_manager")
+    def test_wait_for_network_devices(self, thread_manager, network_module, disconnect_proxy):
+        """Test the wait for signals of network devices."""
+        thread_manager.in_main_thread.return_value = False
+        network_proxy = self._get_network_proxy([[], ["ens3"], ["ens3"]])
+        network_module.get_proxy.return_value = network_proxy
+
+        def _emit(*args):
+            network_proxy.ActivatedInterfacesChanged.emit(["ens3"])
+            return False
+
+        # Emit the signal from the loop of the wait.
+        def _connect(callback):
+            Signal.connect(network_proxy.ActivatedInterfacesChanged, callback)
+            source = timeout_source_new(10)
+            source.set_callback(_emit)
+            source.attach(GLib.MainContext.get_thread_default())
+
+        network_proxy.ActivatedInterfacesChanged.connect = _connect
+
+        with self.assertLogs(level="DEBUG") as cm:
+            assert network.wait_for_network_devices(["ens3"], timeout=5) is True
+
+        assert network_proxy.GetActivatedInterfaces.call_count == 3
+        disconnect_proxy.assert_called_once_with(network_proxy)
+        assert "devices {'ens3'} connected, waited" in "\n".join(cm.output)
+
+    @patch("pyanaconda.network.disconnect_proxy")
+    @patch("pyanaconda.network.NETWORK")
+    @patch("pyanaconda.network.thread_manager")
+    def test_wait_for_network_devices_timeout(self, thread_manager, network_module,
+                                              disconnect_proxy):
+        """Test the timeout of the wait for signals of network devices."""
+        thread_manager.in_main_thread.return_value = False
+        network_proxy = self._get_network_proxy(lambda: [])
+        network_module.get_proxy.return_value = network_proxy
+
+        assert network.wait_for_network_devices(["ens3"], timeout=0.1) is False
+        disconnect_proxy.assert_called_once_with(network_proxy)